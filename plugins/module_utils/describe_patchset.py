@@ -15,13 +15,19 @@ author:
 
 EXAMPLES = r"""
 describe_patchset.py -h
-usage: describe_patchset.py [-h] -d DIRECTORY
+usage: describe_patchset.py [-h] -d DIRECTORY [-c CATALOG] [-p PATCH] [-t TARGET]
 
 Describe patches in Oracle PatchSet
 
 optional arguments:
   -h, --help            show this help message and exit
   -d DIRECTORY, --directory DIRECTORY
+  -c CATALOG, --catalog CATALOG
+                        JSON index of the directory, only new or changed files are parsed again
+  -p PATCH, --patch PATCH
+                        print only entries of this patch number
+  -t TARGET, --target TARGET
+                        print only entries for this target type (oracle_database, has, cluster, ...)
 
 ./describe_patchset.py -d /install/
 PATCHSET:/install/35742441:COMBO OF OJVM RU COMPONENT 19.21.0.0.231017 + GI RU 19.21.0.0.231017
@@ -39,6 +45,9 @@ ONE-OFF:/install/35742441/35642822/35553096:TOMCAT RELEASE UPDATE 19.0.0.0.0 (35
 ONE-OFF:/install/35742441/35642822/33575402:DBWLM RELEASE UPDATE 19.0.0.0.0 (33575402):(cluster,has)
 ONE-OFF:/install/35742441/35648110:OJVM RELEASE UPDATE: 19.21.0.0.231017 (35648110):()
 
+./describe_patchset.py -d /install/ -c /install/.patch_catalog.json -p 35643107 -t oracle_database
+ONE-OFF:/install/p35742441_190000_Linux-x86-64.zip:Database Release Update : 19.21.0.0.231017 (35643107):(cluster,rac_database,oracle_database,has)
+
 ./describe_patchset.py -d $ORACLE_HOME/inventory
 ONE-OFF:/oracle/product/19.21.0.0/db1/inventory/oneoffs/35655527:OCW RELEASE UPDATE 19.21.0.0.0 (35655527):(cluster,rac_database,oracle_database,has)
 ONE-OFF:/oracle/product/19.21.0.0/db1/inventory/oneoffs/35648110:OJVM RELEASE UPDATE: 19.21.0.0.231017 (35648110):()
@@ -51,92 +60,282 @@ ONE-OFF:/oracle/product/19.21.0.0/db1/inventory/oneoffs/35638318:JDK BUNDLE PATC
 
 import os
 import argparse
-import glob
+import json
+import posixpath
 import zipfile
-import tempfile
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 
+# Upper bound of files (mostly patch .zip archives) inspected concurrently while building a catalog
+CATALOG_WORKERS = 8
+CATALOG_VERSION = 1
 
-def parse_patchset(path, archive=None):
-    try:
-        root = ET.parse(path).getroot()
-        patch_number = root.findall("./patch/bug")[0].findall('number')[0].text
-        description = root.findall("./patch/bug")[0].findall('abstract')[0].text
+# Order of entries in the output
+KINDS = ('PATCHSET', 'BUNDLEPART', 'ONE-OFF')
+
+
+def patchset_records(root, path, archive=None):
+    """ PatchSearch.xml, archive is the .zip file the xml was read from """
+    patch_number = root.findall("./patch/bug")[0].findall('number')[0].text
+    description = root.findall("./patch/bug")[0].findall('abstract')[0].text
+    if archive:
+        location = archive
+    else:
+        location = os.path.join(os.path.dirname(path), patch_number)
+        if not os.path.isdir(location):
+            return []
+    return [dict(kind='PATCHSET', location=location, patch_id=patch_number, description=description, targets=[])]
+
+
+def bundle_records(root, path, archive=None, members=None):
+    """ bundle.xml, for an archive path is the name of zip member and members are all names in the zip """
+    retval = []
+    base_dir = posixpath.dirname(path) if archive else os.path.dirname(path)
+    for subpatch in root.findall("./subpatches/subpatch"):
+        targets = []
+        for t in subpatch.findall("./target_types/target_type"):
+            targets.append(t.attrib['type'])
         if archive:
-            print('PATCHSET:%s:%s' % (archive, description))
-            return
-        d = os.path.dirname(path)
-        d = os.path.join(d, patch_number)
-        if os.path.isdir(d):
-            print('PATCHSET:%s:%s' % (d, description))
-            return
-    except:
-        pass
+            d = posixpath.join(base_dir, subpatch.attrib['location'])
+            if not any(m.startswith(d + '/') for m in members):
+                continue
+            location = os.path.join(archive, d)
+        else:
+            location = os.path.join(base_dir, subpatch.attrib['location'])
+            if not os.path.isdir(location):
+                continue
+        retval.append(dict(kind='BUNDLEPART', location=location, patch_id=os.path.basename(location),
+                           description=None, targets=targets))
+    return retval
 
 
-def parse_bundle_patch(path, archive=None):
-    try:
-        retval = []
-        root = ET.parse(path).getroot()
+def oneoff_records(root, path, archive=None):
+    """ oneoff etc/config/inventory.xml """
+    patch = oneoff_patch(root)
+    if not archive:
         base_dir = os.path.dirname(path)
-        for subpatch in root.findall("./subpatches/subpatch"):
-            targets = []
-            for t in subpatch.findall("./target_types/target_type"):
-                targets.append(t.attrib['type'])
-            d = os.path.join(base_dir, subpatch.attrib['location'])
-            if os.path.isdir(d):
-                retval.append(d)
-                print('BUNDLEPART:%s:(%s)' % (d, ','.join(targets)))
-    except:
-        pass
+        base_dir = os.path.dirname(base_dir)
+        base_dir = os.path.dirname(base_dir)
+    else:
+        base_dir = archive
+    return [dict(kind='ONE-OFF', location=base_dir, patch_id=patch['patch_id'] or os.path.basename(base_dir),
+                 description=patch['description'], targets=patch['targets'])]
 
 
-def parse_oneoff_patch(path, archive=None):
+def format_record(record):
+    if record['kind'] == 'PATCHSET':
+        return 'PATCHSET:%s:%s' % (record['location'], record['description'])
+    if record['kind'] == 'BUNDLEPART':
+        return 'BUNDLEPART:%s:(%s)' % (record['location'], ','.join(record['targets']))
+    return 'ONE-OFF:%s:%s:(%s)' % (record['location'], record['description'], ','.join(record['targets']))
+
+
+def oneoff_patch(root):
+    """ patch described by oneoff etc/config/inventory.xml """
+    patch_id = root.find("./patch_id")
+    return dict(patch_id=patch_id.attrib.get('number') if patch_id is not None else None,
+                description=root.findall("./patch_description")[0].text,
+                targets=[t.attrib['type'] for t in root.findall("./targets/target")],
+                bugs=[b.attrib['number'] for b in root.findall("./base_bugs/bug") if 'number' in b.attrib])
+
+
+def inventory_signature(oracle_home):
+    """ (mtime, size) of comps.xml and mtime of oneoffs directory, None when comps.xml can not be read """
+    inventory = os.path.join(oracle_home, 'inventory')
     try:
-        root = ET.parse(path).getroot()
-        description = root.findall("./patch_description")[0].text
-        if not archive:
-            base_dir = os.path.dirname(path)
-            base_dir = os.path.dirname(base_dir)
-            base_dir = os.path.dirname(base_dir)
-        else:
-            base_dir = archive
-        targets = []
-        for t in root.findall("./targets/target"):
-            targets.append(t.attrib['type'])
-        print("ONE-OFF:%s:%s:(%s)" % (base_dir, description, ','.join(targets)))
-    except:
+        st = os.stat(os.path.join(inventory, 'ContentsXML', 'comps.xml'))
+    except (IOError, OSError):
+        return None
+    try:
+        oneoffs = os.stat(os.path.join(inventory, 'oneoffs')).st_mtime_ns
+    except (IOError, OSError):
+        oneoffs = None
+    return (st.st_mtime_ns, st.st_size, oneoffs)
+
+
+def home_inventory_patches(oracle_home):
+    """ patches applied to ORACLE_HOME as recorded in inventory/ContentsXML/comps.xml
+
+    Each ONEOFF element is completed by targets and bugs from inventory/oneoffs/<id>/etc/config/inventory.xml.
+    Returns None when comps.xml can not be parsed.
+    """
+    inventory = os.path.join(oracle_home, 'inventory')
+    try:
+        root = ET.parse(os.path.join(inventory, 'ContentsXML', 'comps.xml')).getroot()
+    except (IOError, OSError, ET.ParseError):
+        return None
+    patches = []
+    for oneoff in root.iter('ONEOFF'):
+        desc = oneoff.find('DESC')
+        patch = dict(patch_id=oneoff.attrib.get('REF_ID'),
+                     description=desc.text.strip() if desc is not None and desc.text else '',
+                     install_time=oneoff.attrib.get('INSTALL_TIME'),
+                     targets=[],
+                     bugs=[b.text.strip() for b in oneoff.findall('./BUG_LIST/BUG') if b.text])
+        location = oneoff.attrib.get('XML_INV_LOC') or os.path.join('oneoffs', patch['patch_id'] or '')
+        try:
+            details = oneoff_patch(ET.parse(os.path.join(inventory, location, 'etc', 'config', 'inventory.xml')).getroot())
+            patch['targets'] = details['targets']
+            patch['bugs'] = patch['bugs'] or details['bugs']
+            patch['description'] = patch['description'] or details['description']
+        except (IOError, OSError, ET.ParseError, IndexError):
+            pass
+        patches.append(patch)
+    return patches
+
+
+# Parsed inventories keyed by ORACLE_HOME: (inventory_signature, patches)
+_inventory_cache = dict()
+
+
+def home_patches(oracle_home):
+    """ cached home_inventory_patches, re-read when comps.xml or oneoffs directory changes """
+    signature = inventory_signature(oracle_home)
+    if signature is None:
+        return None
+    cached = _inventory_cache.get(oracle_home)
+    if cached and cached[0] == signature:
+        return cached[1]
+    patches = home_inventory_patches(oracle_home)
+    if patches is not None:
+        _inventory_cache[oracle_home] = (signature, patches)
+    return patches
+
+
+def xml_kind(path):
+    """ kind of patch metadata file, None for other files """
+    name = os.path.basename(path)
+    if name == 'PatchSearch.xml':
+        return 'PATCHSET'
+    if name == 'bundle.xml':
+        return 'BUNDLEPART'
+    if name == 'inventory.xml' and path.replace(os.sep, '/').endswith('/etc/config/inventory.xml'):
+        return 'ONE-OFF'
+    return None
+
+
+def xml_records(kind, path, root, archive=None, members=None):
+    if kind == 'PATCHSET':
+        return patchset_records(root, path, archive)
+    if kind == 'BUNDLEPART':
+        return bundle_records(root, path, archive, members)
+    return oneoff_records(root, path, archive)
+
+
+def file_records(path):
+    """ records of one patch metadata .xml file, empty list when the file can not be parsed """
+    try:
+        return xml_records(xml_kind(path), path, ET.parse(path).getroot())
+    except Exception:
+        return []
+
+
+def zip_records(path):
+    """ records of patch metadata in a .zip file, members are parsed in memory without extraction """
+    retval = []
+    try:
+        with zipfile.ZipFile(path, "r") as z:
+            members = z.namelist()
+            for name in members:
+                kind = xml_kind('/' + name)
+                if not kind:
+                    continue
+                try:
+                    with z.open(name) as f:
+                        retval.extend(xml_records(kind, name, ET.parse(f).getroot(), archive=path, members=members))
+                except Exception:
+                    pass
+    except (IOError, OSError, zipfile.BadZipfile):
         pass
+    return retval
+
+
+def scan(path):
+    """ yield (path, size, mtime) of patch metadata .xml and .zip files, one os.scandir pass over the tree """
+    stack = [path]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except (IOError, OSError):
+            continue
+        for entry in sorted(entries, key=lambda e: e.name):
+            if entry.name.startswith('.'):
+                continue
+            try:
+                if entry.is_dir():
+                    stack.append(entry.path)
+                elif entry.name.endswith('.zip') or xml_kind(entry.path):
+                    st = entry.stat()
+                    yield entry.path, st.st_size, st.st_mtime_ns
+            except (IOError, OSError):
+                continue
+
+
+def describe_file(path):
+    return zip_records(path) if path.endswith('.zip') else file_records(path)
+
+
+def update_catalog(path, catalog_file=None):
+    """ index of all patch metadata under path {file: {size, mtime, records}}
+
+    Files whose size and mtime match the previous catalog are not parsed again, the others are parsed in parallel.
+    When catalog_file is set, previous catalog is read from it and the new one is saved into it.
+    """
+    previous = dict()
+    if catalog_file:
+        try:
+            with open(catalog_file) as f:
+                catalog = json.load(f)
+            if catalog.get('version') == CATALOG_VERSION and catalog.get('directory') == path:
+                previous = catalog.get('files', dict())
+        except (IOError, OSError, ValueError, AttributeError):
+            pass
+
+    files = dict()
+    changed = []
+    for (name, size, mtime) in scan(path):
+        entry = previous.get(name)
+        if entry and entry['size'] == size and entry['mtime'] == mtime:
+            files[name] = entry
+        else:
+            files[name] = dict(size=size, mtime=mtime, records=[])
+            changed.append(name)
+
+    with ThreadPoolExecutor(max_workers=CATALOG_WORKERS) as executor:
+        for (name, records) in zip(changed, executor.map(describe_file, changed)):
+            files[name]['records'] = records
 
+    catalog = dict(version=CATALOG_VERSION, directory=path, files=files)
+    if catalog_file and (changed or set(previous) != set(files)):
+        tmp = '{}.{}'.format(catalog_file, os.getpid())
+        with open(tmp, 'w') as f:
+            json.dump(catalog, f)
+        os.rename(tmp, catalog_file)
+    return catalog
 
-def parse_zip(path):
-    with zipfile.ZipFile(path, "r") as z:
-        patchset  = [name for name in z.namelist() if name.endswith("PatchSearch.xml")]
-        bundle    = [name for name in z.namelist() if name.endswith("/bundle.xml")]
-        inventory = [name for name in z.namelist() if name.endswith("/etc/config/inventory.xml")]
-        with tempfile.TemporaryDirectory() as tempdir:
-            for f in patchset:
-                f = z.extract(f, tempdir)
-                parse_patchset(f, archive=path)
-            for b in bundle:
-                f = z.extract(b, tempdir)
-                parse_bundle_patch(f, archive=path)
-            for i in inventory:
-                f = z.extract(i, tempdir)
-                parse_oneoff_patch(f, archive=path)
 
-def main(path):
-    for f in glob.glob('%s/**/PatchSearch.xml' % path, recursive=True):
-        parse_patchset(f)
+def find_patch(catalog, patch_id=None, target=None):
+    """ records of the catalog, optionally only for patch_id and/or target type, ordered as printed by main """
+    retval = []
+    for (name, entry) in sorted(catalog['files'].items()):
+        for record in entry['records']:
+            if patch_id and record['patch_id'] != str(patch_id):
+                continue
+            if target and target not in record['targets']:
+                continue
+            kind = KINDS.index(record['kind'])
+            # directories grouped by kind first, then every archive on its own
+            key = (True, name, kind) if name.endswith('.zip') else (False, kind, name)
+            retval.append((key, record))
+    return [r for (_, r) in sorted(retval, key=lambda r: r[0])]
 
-    for f in glob.glob('%s/**/bundle.xml' % path, recursive=True):
-        parse_bundle_patch(f)
 
-    for f in glob.glob('%s/**/etc/config/inventory.xml' % path, recursive=True):
-        parse_oneoff_patch(f)
+def main(path, catalog_file=None, patch_id=None, target=None):
+    catalog = update_catalog(path, catalog_file)
+    for record in find_patch(catalog, patch_id, target):
+        print(format_record(record))
 
-    for f in glob.glob('%s/*.zip' % path, recursive=False):
-        parse_zip(f)
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(
@@ -145,6 +344,9 @@ if __name__ == '__main__':
         epilog='Text at the bottom of help')
 
     parser.add_argument('-d', '--directory', required=True)
+    parser.add_argument('-c', '--catalog', help='JSON index of the directory, only new or changed files are parsed again')
+    parser.add_argument('-p', '--patch', help='print only entries of this patch number')
+    parser.add_argument('-t', '--target', help='print only entries for this target type (oracle_database, has, cluster, ...)')
     args = parser.parse_args()
 
-    main(os.path.abspath(args.directory))
+    main(os.path.abspath(args.directory), args.catalog, args.patch, args.target)
@@ -1,11 +1,204 @@
 
-from .antlr3 import *
-from .antlr3.tree import *
-from .oraclenetservicesv3lexer import *
-from .oraclenetservicesv3parser import *
 import sys
 import os
-import getopt
+import re
+
+
+# Token types of the native tokenizer, names follow OracleNetServicesV3.g
+WORD = 'WORD'
+QUOTED_STRING = 'QUOTED_STRING'
+LEFT_PAREN = 'LEFT_PAREN'
+RIGHT_PAREN = 'RIGHT_PAREN'
+EQUALS = 'EQUALS'
+COMMA = 'COMMA'
+
+# One alternative per lexer rule of OracleNetServicesV3.g, whitespace, newlines and comments are skipped
+_TOKEN_RE = re.compile(r"""
+      (?P<SKIP>[ \t\r]+|\#[^\n]*)
+    | (?P<NEWLINE>\n)
+    | (?P<QUOTED_STRING>'[^']*'|"[^"]*")
+    | (?P<WORD>[A-Za-z0-9/+](?:[A-Za-z0-9<>/.:;\-_$+*&!%?@]|\\[\s\S])*)
+    | (?P<LEFT_PAREN>\()
+    | (?P<RIGHT_PAREN>\))
+    | (?P<EQUALS>=)
+    | (?P<COMMA>,)
+""", re.VERBOSE)
+
+
+class OraToken:
+    """Leaf value of the parse tree, stands for antlr3 CommonTree nodes"""
+    __slots__ = ('type', 'text', 'line', 'start', 'stop')
+
+    def __init__(self, type, text, line, start, stop):
+        self.type = type
+        self.text = text
+        self.line = line
+        self.start = start
+        self.stop = stop
+
+    def toString(self):
+        return self.text
+
+    def __str__(self):
+        return self.text
+
+    def __repr__(self):
+        return 'OraToken(%s, %r, line=%d)' % (self.type, self.text, self.line)
+
+
+# Inside parentheses only these matter to find the end of a top-level parameter
+_NESTED_RE = re.compile(r"""\#[^\n]*|'[^']*'|"[^"]*"|\\[\s\S]|[()\n]""")
+
+
+def tokenize(text, pos=0, end=None, line=1):
+    """Split .ora file content into a list of OraTokens, start/stop are offsets into text"""
+    tokens = []
+    end = len(text) if end is None else end
+    match = _TOKEN_RE.match
+    while pos < end:
+        m = match(text, pos, end)
+        if not m:
+            column = pos - text.rfind('\n', 0, pos) - 1
+            raise ValueError('Lexer error at {}:{}, unexpected character {!r}'.format(line, column, text[pos]))
+        kind = m.lastgroup
+        value = m.group()
+        if kind == 'NEWLINE':
+            line += 1
+        elif kind != 'SKIP':
+            tokens.append(OraToken(kind, value, line, pos, m.end()))
+            if kind == QUOTED_STRING or '\\' in value:
+                line += value.count('\n')
+        pos = m.end()
+    return tokens
+
+
+def scan(text):
+    """Find top-level parameters without building the tree.
+
+    Only the text outside of parentheses is tokenized, nested parts are skipped
+    by matching parentheses, quotes and comments. Returns list of (start, stop, line),
+    character range of each parameter and the line it starts on.
+    """
+    ranges = []
+    pos = 0
+    end = len(text)
+    line = 1
+    depth = 0
+    prev = None
+    current = None
+    last_stop = 0
+    match = _TOKEN_RE.match
+    search = _NESTED_RE.search
+    while pos < end:
+        if depth == 0:
+            m = match(text, pos)
+            if not m:
+                column = pos - text.rfind('\n', 0, pos) - 1
+                raise ValueError('Lexer error at {}:{}, unexpected character {!r}'.format(line, column, text[pos]))
+            kind = m.lastgroup
+            if kind == 'NEWLINE':
+                line += 1
+            elif kind != 'SKIP':
+                if kind == WORD and prev not in (EQUALS, COMMA):
+                    if current is not None:
+                        ranges.append((current[0], last_stop, current[1]))
+                    current = (m.start(), line)
+                elif kind == LEFT_PAREN:
+                    depth = 1
+                elif kind == RIGHT_PAREN:
+                    raise ValueError('Parser error: unbalanced ) at line {}'.format(line))
+                if kind == QUOTED_STRING or kind == WORD:
+                    line += m.group().count('\n')
+                prev = kind
+                last_stop = m.end()
+        else:
+            m = search(text, pos)
+            if not m:
+                raise ValueError('Parser error: missing ) at end of file')
+            t = m.group()
+            if t == '(':
+                depth += 1
+            elif t == ')':
+                depth -= 1
+                if depth == 0:
+                    prev = RIGHT_PAREN
+                    last_stop = m.end()
+            else:
+                line += t.count('\n')
+        pos = m.end()
+    if current is not None:
+        ranges.append((current[0], last_stop, current[1]))
+    return ranges
+
+
+def _expect(tokens, i, types):
+    if i >= len(tokens):
+        raise ValueError('Parser error: unexpected end of file, expecting {}'.format('/'.join(types)))
+    if tokens[i].type not in types:
+        raise ValueError('Parser error: unexpected {!r} at line {}, expecting {}'.format(
+            tokens[i].text, tokens[i].line, '/'.join(types)))
+    return tokens[i]
+
+
+def parse_parameter(tokens, i=0):
+    """Recursive descent for rule: parameter. Returns (OraParameter, index of the next token)"""
+    k = _expect(tokens, i, (WORD,))
+    _expect(tokens, i + 1, (EQUALS,))
+    retval = OraParameter(name=k.text)
+    if retval.name.upper() == "IFILE":
+        raise ValueError("IFILE directive is not supported yet")
+    values = []
+    i += 2
+    t = _expect(tokens, i, (WORD, QUOTED_STRING, LEFT_PAREN))
+    if t.type != LEFT_PAREN:
+        values.append(t)
+        i += 1
+    elif i + 2 < len(tokens) and tokens[i + 1].type == WORD and tokens[i + 2].type == EQUALS:
+        # parameter_list
+        while i < len(tokens) and tokens[i].type == LEFT_PAREN:
+            values.append(tokens[i])
+            child, i = parse_parameter(tokens, i + 1)
+            values.append(child)
+            values.append(_expect(tokens, i, (RIGHT_PAREN,)))
+            i += 1
+    else:
+        # value_list
+        values.append(t)
+        values.append(_expect(tokens, i + 1, (WORD, QUOTED_STRING)))
+        i += 2
+        while _expect(tokens, i, (COMMA, RIGHT_PAREN)).type == COMMA:
+            values.append(tokens[i])
+            values.append(_expect(tokens, i + 1, (WORD, QUOTED_STRING)))
+            i += 2
+        values.append(tokens[i])
+        i += 1
+    retval.values = values
+    retval.lineFrom = k.line
+    retval.lineTo = values[-1].line
+    retval.start = k.start
+    retval.stop = values[-1].stop
+    return retval, i
+
+
+def parse_slice(tokens):
+    """Parse tokens of exactly one top-level parameter"""
+    param, i = parse_parameter(tokens)
+    if i != len(tokens):
+        raise ValueError('Parser error: unexpected {!r} at line {}'.format(tokens[i].text, tokens[i].line))
+    return param
+
+
+def parse_antlr(filename):
+    """Reference parser: top-level OraParameters built by the ANTLR3 generated parser"""
+    from .antlr3 import ANTLRFileStream, CommonTokenStream
+    from .oraclenetservicesv3lexer import oraclenetservicesv3lexer
+    from .oraclenetservicesv3parser import oraclenetservicesv3parser
+    input = ANTLRFileStream(filename)
+    lexer = oraclenetservicesv3lexer(input)
+    tokens = CommonTokenStream(lexer)
+    parser = oraclenetservicesv3parser(tokens)
+    r = parser.configuration_file()
+    return [OraParameter.fromNode(p) for p in (r.tree.children or [])]
 
 
 class OraParameter:
@@ -23,9 +216,12 @@ class OraParameter:
 
     def __init__(self, name):
         self.name = name
+        # Set when the parameter was modified, only such top-level parameters are re-serialised
+        self.dirty = False
 
     @classmethod
     def fromNode(cls, elem):
+        from .oraclenetservicesv3parser import KEYWORD
         retval = cls(name=elem.children[0].toString())
         #
         if retval.name.upper() == "IFILE":
@@ -38,6 +234,8 @@ class OraParameter:
                 retval.values.append(c)
         retval.lineFrom = OraParameter.leftestNode(elem).line
         retval.lineTo   = OraParameter.rightestNode(elem).line
+        retval.start    = OraParameter.leftestNode(elem).start
+        retval.stop     = OraParameter.rightestNode(elem).stop + 1
         return retval
 
     @classmethod
@@ -48,6 +246,9 @@ class OraParameter:
         retval.values.append(value)
         retval.lineFrom = sys.maxsize
         retval.lineTo   = sys.maxsize
+        retval.start    = None
+        retval.stop     = None
+        retval.dirty    = True
         return retval
 
     def setvalue(self, param, value, oldvalue = None):
@@ -56,9 +257,10 @@ class OraParameter:
             if not isinstance(v, OraParameter):
                 continue            
             if v.name.upper() == param.upper() and len(v.values) == 1 and (oldvalue == None or str(v.values[0]) == oldvalue):
-                changed = changed or v.values[0] != value
+                changed = changed or str(v.values[0]) != value
                 v.values[0] = value
-            changed = changed or v.setvalue(param, value, oldvalue)
+            ch = v.setvalue(param, value, oldvalue)
+            changed = changed or ch
         return changed
 
     def deleteparam(self, param):
@@ -135,106 +337,129 @@ class OraParameter:
 
 
 class DotOraFile:
-    
-    def __init__(self, filename):
-        self.lines = [line.rstrip() for line in open(filename)]
-        #
-        input = ANTLRFileStream(filename)
-        lexer = oraclenetservicesv3lexer(input);
-        tokens = CommonTokenStream(lexer);
-        parser = oraclenetservicesv3parser(tokens);
-        r = parser.configuration_file();
-        #
-        if lexer.getNumberOfSyntaxErrors():
-            print >> sys.stderr, "Lexer errors: " + str(lexer.getNumberOfSyntaxErrors())
-        if parser.getNumberOfSyntaxErrors():
-            print >> sys.stderr, "Parser errors: " + str(parser.getNumberOfSyntaxErrors())
-        #
-        self.t = r.tree# get tree from parser
-        #
-        self.params = []    
-        for p in self.t.children:
-            self.params.append(OraParameter.fromNode(p))
-        self.psze = len(self.params)
+    """Parsed .ora file
+
+    The file is tokenized once and split into top-level parameters (aliases), each one
+    remembers its character range in the original text. Aliases are parsed into
+    OraParameter trees only when accessed, and only modified aliases are re-serialised,
+    the rest of the file (including comments and formatting) is written back verbatim.
+    engine -- 'native' (default) or 'antlr', the original ANTLR3 parser kept as reference
+    """
+
+    def __init__(self, filename, engine='native'):
+        with open(filename) as f:
+            self.text = f.read()
+        if engine == 'antlr':
+            self._params = parse_antlr(filename)
+            self._ranges = [None] * len(self._params)
+        else:
+            self._ranges = scan(self.text)
+            self._params = [None] * len(self._ranges)
+        # Upper-cased alias name => positions in self._params
+        self.index = {}
+        for i, r in enumerate(self._ranges):
+            name = self._params[i].name if r is None else _TOKEN_RE.match(self.text, r[0]).group()
+            self.index.setdefault(name.upper(), []).append(i)
+        self.psze = len(self._params)
         self.changed = False
         self.warn = []
 
+    def _param(self, i):
+        p = self._params[i]
+        if p is None:
+            start, stop, line = self._ranges[i]
+            p = self._params[i] = parse_slice(tokenize(self.text, start, stop, line))
+        return p
+
+    @property
+    def params(self):
+        """All top-level parameters, parses the whole file"""
+        for i in range(len(self._params)):
+            self._param(i)
+        return self._params
+
+    def _targets(self, alias):
+        if alias == "@all":
+            return self.params
+        # Match is case sensitive, as it used to be
+        found = [self._param(i) for i in self.index.get(alias.upper(), [])]
+        return [p for p in found + self._params[self.psze:] if p.name == alias]
+
+    def findalias(self, alias):
+        """Return the 1st OraParameter of alias (case insensitive) or None"""
+        found = [self._param(i) for i in self.index.get(alias.upper(), [])]
+        return next((p for p in found + self._params[self.psze:] if p.name and p.name.upper() == alias.upper()), None)
+
+    def _apply(self, alias, func):
+        for p in self._targets(alias):
+            try:
+                if func(p):
+                    p.dirty = True
+                    self.changed = True
+            except ValueError as e:
+                self.warn.append('Alias: {}, {}'.format(p, str(e)))
+
     def setparamvalue(self, alias, param, value, oldvalue=None):
-        for p in self.params:
-            if p.name == alias or alias == "@all":
-                try:
-                    self.changed = self.changed or p.setvalue(param, value, oldvalue)
-                except ValueError as e:
-                    self.warn.append('Alias: {}, {}'.format(p, str(e)))
+        self._apply(alias, lambda p: p.setvalue(param, value, oldvalue))
 
     def deleteparam(self, alias, param):
-        for p in self.params:
-            if p.name == alias or alias == "@all":
-                try:
-                    self.changed = self.changed or p.deleteparam(param)
-                except ValueError as e:
-                    self.warn.append('Alias: {}, {}'.format(p, str(e)))
+        self._apply(alias, lambda p: p.deleteparam(param))
 
     def deleteparampath(self, alias, key):
-        for p in self.params:
-            if p.name == alias or alias == "@all":
-                try:
-                    self.changed = self.changed or p.deleteparampath(key)
-                except ValueError as e:
-                    self.warn.append('Alias: {}, {}'.format(p, str(e)))
+        self._apply(alias, lambda p: p.deleteparampath(key))
 
     def __str__(self):
-        retval = ""
-        lineno = 1
-        params = self.params[:]
-        lines  = self.lines[:]
-        # Process original AST nodes/lines
-        while lineno <= len(lines):
-            if not params or lineno < params[0].lineFrom: 
-                retval+=lines[lineno-1]
-                retval+=os.linesep
-            else:
-                p = params.pop(0)                
-                retval+=str(p)
-                # Now newline after empty string
-                if str(p):
-                    retval+=os.linesep
-                #
-                lineno = p.lineTo
-            lineno+=1
+        retval = []
+        pos = 0
+        # Original parameters, unmodified ones are kept as they are in the file
+        for p in self._params[:self.psze]:
+            if p is None or not p.dirty:
+                continue
+            retval.append(self.text[pos:p.start])
+            s = str(p)
+            retval.append(s)
+            pos = p.stop
+            # Removed parameter, drop the rest of its line if it is empty
+            if not s:
+                eol = self.text.find('\n', pos)
+                eol = len(self.text) if eol < 0 else eol + 1
+                if not self.text[pos:eol].strip():
+                    pos = eol
+        retval.append(self.text[pos:])
         # Process additionally added nodes/lines/aliases
-        while params:
-            p = params.pop(0)                
-            retval+=str(p)                
-            retval+=os.linesep            
-        return retval
+        added = [str(p) for p in self._params[self.psze:] if str(p)]
+        if added and retval[-1] and not retval[-1].endswith('\n'):
+            retval.append(os.linesep)
+        for s in added:
+            retval.append(s)
+            retval.append(os.linesep)
+        return ''.join(retval)
 
     def upsertalias(self, alias, value):
-        try:
-            param = next(p for p in self.params if p.name.upper() == alias.upper())
-        except StopIteration:
+        param = self.findalias(alias)
+        if param is None:
             param = OraParameter.fromString(alias, value)
-            self.params.append(param)
+            self._params.append(param)
+            self.changed = True
+        if param.valuesstr() != value:
+            param.dirty = True
             self.changed = True
-        self.changed = self.changed or param.valuesstr() != value            
         param.values = [value]
 
     def removealias(self, alias):
         # Find proper tns alias 1st
-        try:
-            param = next(p for p in self.params if p.name.upper() == alias.upper())
+        param = self.findalias(alias)
+        if param is not None:
             param.values = []
             param.name = None
+            param.dirty = True
             self.changed = True
-        except StopIteration:
-            pass
 
     def getaliasatribute(self, alias, key):
         # Find proper tns alias 1st
-        try:
-            param = next(p for p in self.params if p.name.upper() == alias.upper())
-        except StopIteration:
-            raise ValueError("Alias: {} not found: {}".format(alias))
+        param = self.findalias(alias)
+        if param is None:
+            raise ValueError("Alias: {} not found".format(alias))
 
         # Traverse lisp-like path
         path = key.split('/')
@@ -247,14 +472,6 @@ class DotOraFile:
                 raise ValueError("Alias: {}, child token not found: {}".format(alias, i))
 
         return child
-        
-    def upsertaliasatribute(self, alias, key, value):
-        for p in self.params:
-            if p.name == alias or alias == "@all":
-                try:
-                    self.changed = self.changed or p.upsertparampath(key, value)
-                except ValueError as e:
-                    self.warn.append('Alias: {}, {}'.format(p, str(e)))
-
-
 
+    def upsertaliasatribute(self, alias, key, value):
+        self._apply(alias, lambda p: p.upsertparampath(key, value))
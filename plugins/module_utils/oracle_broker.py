@@ -0,0 +1,849 @@
+"""
+Optional per-host connection broker for oracleConnection.
+
+Every Ansible task runs in a fresh Python process, so a module can not keep an
+oracledb session open for the next task. When enabled, the first module on the
+host forks a small daemon listening on a Unix socket. The daemon owns pooled
+oracledb sessions keyed by (dsn, user, mode, session_container) and executes
+cursor operations on behalf of the module processes. Sessions idle for longer
+than the idle timeout are closed, and the daemon exits when nothing used it for
+the same period.
+
+The broker is opt-in, set ANSIBLE_ORACLE_BROKER in the task environment:
+
+    environment:
+      ANSIBLE_ORACLE_BROKER: "yes"          # default socket under ~/.ansible
+      # ANSIBLE_ORACLE_BROKER: /run/user/1000/oracle_broker.sock
+      ANSIBLE_ORACLE_BROKER_IDLE_TIMEOUT: 300
+
+Wire protocol is one JSON document per line, one borrowed session per client
+socket. The session is given back to the pool when the client disconnects,
+unless the client may have changed its session state (ALTER SESSION, SET ROLE,
+PL/SQL blocks including execute_ddls batches, procedure calls), then the
+session is closed instead.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import base64
+import datetime
+import decimal
+import fcntl
+import hashlib
+import json
+import os
+import re
+import socket
+import threading
+import time
+
+BROKER_ENV = 'ANSIBLE_ORACLE_BROKER'
+BROKER_IDLE_ENV = 'ANSIBLE_ORACLE_BROKER_IDLE_TIMEOUT'
+DEFAULT_IDLE_TIMEOUT = 300
+# Environment variables which influence where OS authenticated and wallet
+# connections go, they are part of the pool key.
+KEY_ENVIRONMENT = ('ORACLE_SID', 'ORACLE_HOME', 'TNS_ADMIN')
+# Statements which leave or may leave the session in a state the next borrower would not expect,
+# PL/SQL blocks can change anything by EXECUTE IMMEDIATE or DBMS_SESSION
+_DIRTY_PREFIXES = ('ALTER SESSION', 'SET ROLE', 'BEGIN', 'DECLARE', 'CALL')
+_LEADING_COMMENTS = re.compile(r'(?:\s+|--[^\n]*(?:\n|$)|/\*.*?\*/)*', re.S)
+
+
+class BrokerUnavailable(Exception):
+    """Broker can not be reached or can not serve this connection, connect directly."""
+
+
+class BrokerError(object):
+    """Mimics the oracledb _Error object (code, message) for errors raised by the broker."""
+
+    def __init__(self, code=None, message=''):
+        self.code = code
+        self.message = message
+
+    def __str__(self):
+        return self.message
+
+
+def broker_socket_path(params=None, environ=None):
+    """Return broker socket path when the broker is enabled, None otherwise.
+
+    The module parameter 'broker' (when a module declares it) wins over the
+    ANSIBLE_ORACLE_BROKER environment variable.
+    """
+    environ = os.environ if environ is None else environ
+    value = None
+    if params:
+        value = params.get('broker')
+    if value is None:
+        value = environ.get(BROKER_ENV)
+    if value is None or value is False:
+        return None
+    value = str(value).strip()
+    if value.lower() in ('', '0', 'no', 'false', 'off'):
+        return None
+    if value.lower() in ('1', 'yes', 'true', 'on'):
+        return os.path.join(os.path.expanduser('~'), '.ansible', 'oracle_broker', 'broker.sock')
+    return value
+
+
+def broker_idle_timeout(environ=None):
+    environ = os.environ if environ is None else environ
+    try:
+        return int(environ.get(BROKER_IDLE_ENV, DEFAULT_IDLE_TIMEOUT))
+    except ValueError:
+        return DEFAULT_IDLE_TIMEOUT
+
+
+def pool_key(dsn, user, mode, session_container, password=None, environ=None):
+    """Build the pool key, password is only kept as a digest."""
+    environ = os.environ if environ is None else environ
+    secret = hashlib.sha256(('%s\0%s\0%s' % (user or '', password or '', dsn or '')).encode('utf-8')).hexdigest()
+    return {'dsn': dsn,
+            'user': user.upper() if user else user,
+            'mode': mode or 'normal',
+            'session_container': session_container.upper() if session_container else None,
+            'secret': secret,
+            'env': dict((k, environ.get(k)) for k in KEY_ENVIRONMENT)}
+
+
+def _changes_session(request):
+    """True when the request may change session state, the session must not be pooled again then."""
+    if request.get('op') == 'callproc':
+        return True
+    if request.get('op') != 'execute':
+        return False
+    sql = _LEADING_COMMENTS.sub('', request.get('sql') or '', count=1)
+    return sql.upper().startswith(_DIRTY_PREFIXES)
+
+
+def _key_string(key):
+    return json.dumps(key, sort_keys=True)
+
+
+# ---------------------------------------------------------------------------
+# Value (de)serialization
+# ---------------------------------------------------------------------------
+
+def encode_value(value):
+    """Convert a value returned by oracledb into something json can carry."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, decimal.Decimal):
+        return {'__t__': 'decimal', 'v': str(value)}
+    if isinstance(value, datetime.datetime):
+        return {'__t__': 'datetime', 'v': value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {'__t__': 'date', 'v': value.isoformat()}
+    if isinstance(value, datetime.timedelta):
+        return {'__t__': 'timedelta', 'v': value.total_seconds()}
+    if isinstance(value, (bytes, bytearray)):
+        return {'__t__': 'bytes', 'v': base64.b64encode(bytes(value)).decode('ascii')}
+    if isinstance(value, (list, tuple)):
+        return [encode_value(v) for v in value]
+    if isinstance(value, dict):
+        return dict((k, encode_value(v)) for k, v in value.items())
+    if hasattr(value, 'read'):  # LOB
+        return encode_value(value.read())
+    return str(value)
+
+
+def decode_value(value):
+    if isinstance(value, list):
+        return [decode_value(v) for v in value]
+    if not isinstance(value, dict):
+        return value
+    t = value.get('__t__')
+    if t == 'decimal':
+        return decimal.Decimal(value['v'])
+    if t == 'datetime':
+        return datetime.datetime.strptime(value['v'], '%Y-%m-%dT%H:%M:%S.%f' if '.' in value['v'] else '%Y-%m-%dT%H:%M:%S')
+    if t == 'date':
+        return datetime.datetime.strptime(value['v'], '%Y-%m-%d').date()
+    if t == 'timedelta':
+        return datetime.timedelta(seconds=value['v'])
+    if t == 'bytes':
+        return base64.b64decode(value['v'])
+    if t is None:
+        return dict((k, decode_value(v)) for k, v in value.items())
+    return value
+
+
+class _Channel(object):
+    """Newline delimited JSON over a stream socket."""
+
+    def __init__(self, sock):
+        self.sock = sock
+        self.rfile = sock.makefile('rb')
+
+    def send(self, message):
+        self.sock.sendall(json.dumps(message).encode('utf-8') + b'\n')
+
+    def receive(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        return json.loads(line.decode('utf-8'))
+
+    def close(self):
+        try:
+            self.rfile.close()
+        finally:
+            self.sock.close()
+
+
+# ---------------------------------------------------------------------------
+# Server side
+# ---------------------------------------------------------------------------
+
+class BrokerServer(object):
+    """Holds pooled oracledb sessions and serves them over a Unix socket."""
+
+    def __init__(self, socket_path, idle_timeout=DEFAULT_IDLE_TIMEOUT, oracledb_module=None, max_idle_per_key=4):
+        self.socket_path = socket_path
+        self.idle_timeout = idle_timeout
+        self.max_idle_per_key = max_idle_per_key
+        self.oracledb = oracledb_module
+        self.stats = {'hits': 0, 'misses': 0, 'connects': 0, 'discarded': 0, 'reaped': 0, 'requests': 0}
+        self._idle = {}      # key string -> list of [connection, last_used]
+        self._active = 0
+        self._lock = threading.Lock()
+        self._env_lock = threading.Lock()
+        self._thick_home = None
+        self._thick = False
+        self._last_activity = time.time()
+        self._running = False
+        self._sock = None
+
+    def _db(self):
+        if self.oracledb is None:
+            import oracledb
+            self.oracledb = oracledb
+        return self.oracledb
+
+    # -- pool --------------------------------------------------------------
+
+    def _auth_mode(self, mode):
+        if not mode or mode == 'normal':
+            return None
+        db = self._db()
+        return getattr(db, mode.upper(), getattr(db, 'AUTH_MODE_%s' % mode.upper(), None))
+
+    def _init_thick(self, oracle_home):
+        """Load the Oracle Client once, a process can only use one client library."""
+        if self._thick:
+            if (oracle_home or None) != self._thick_home:
+                raise BrokerUnavailable('broker already uses Oracle Client from %s' % self._thick_home)
+            return
+        db = self._db()
+        candidates = []
+        if oracle_home:
+            candidates.append({'lib_dir': os.path.join(oracle_home.rstrip('/'), 'lib')})
+            candidates.append({'lib_dir': oracle_home.rstrip('/')})
+        candidates.append({})
+        for kwargs in candidates:
+            try:
+                db.init_oracle_client(**kwargs)
+            except getattr(db, 'ProgrammingError', ()):
+                pass
+            except db.DatabaseError:
+                continue
+            self._thick = True
+            self._thick_home = oracle_home or None
+            return
+        raise BrokerUnavailable('unable to initialize Oracle Client')
+
+    def _connect(self, key, request):
+        db = self._db()
+        connect = request.get('connect', {})
+        auth_mode = self._auth_mode(key['mode'])
+        with self._env_lock:
+            for name, value in key['env'].items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+            if request.get('thick'):
+                self._init_thick(key['env'].get('ORACLE_HOME'))
+            kwargs = {}
+            if auth_mode is not None:
+                kwargs['mode'] = auth_mode
+            for name in ('user', 'password', 'dsn'):
+                if connect.get(name):
+                    kwargs[name] = connect[name]
+            if connect.get('wallet_connect'):
+                conn = db.connect(connect['wallet_connect'], **kwargs)
+            else:
+                conn = db.connect(**kwargs)
+        conn.autocommit = True
+        if key['session_container']:
+            with conn.cursor() as cursor:
+                cursor.execute('ALTER SESSION SET CONTAINER = %s' % key['session_container'])
+        self.stats['connects'] += 1
+        return conn
+
+    def acquire(self, key, request):
+        """Return (connection, hit) for key, reusing an idle pooled session when possible."""
+        ks = _key_string(key)
+        while True:
+            with self._lock:
+                bucket = self._idle.get(ks) or []
+                entry = bucket.pop() if bucket else None
+            if entry is None:
+                break
+            conn = entry[0]
+            try:
+                conn.ping()
+            except Exception:
+                self._close(conn)
+                with self._lock:
+                    self.stats['discarded'] += 1
+                continue
+            with self._lock:
+                self.stats['hits'] += 1
+            return conn, True
+        conn = self._connect(key, request)
+        with self._lock:
+            self.stats['misses'] += 1
+        return conn, False
+
+    def release(self, key, conn, discard=False):
+        ks = _key_string(key)
+        if not discard:
+            try:
+                conn.rollback()
+                conn.autocommit = True
+            except Exception:
+                discard = True
+        with self._lock:
+            bucket = self._idle.setdefault(ks, [])
+            if not discard and len(bucket) < self.max_idle_per_key:
+                bucket.append([conn, time.time()])
+                return
+            self.stats['discarded'] += 1
+        self._close(conn)
+
+    @staticmethod
+    def _close(conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def reap(self, now=None):
+        """Close sessions which were idle longer than idle_timeout."""
+        now = time.time() if now is None else now
+        expired = []
+        with self._lock:
+            for ks in list(self._idle):
+                keep = []
+                for entry in self._idle[ks]:
+                    if now - entry[1] > self.idle_timeout:
+                        expired.append(entry[0])
+                    else:
+                        keep.append(entry)
+                if keep:
+                    self._idle[ks] = keep
+                else:
+                    del self._idle[ks]
+            self.stats['reaped'] += len(expired)
+        for conn in expired:
+            self._close(conn)
+        return len(expired)
+
+    def snapshot(self):
+        with self._lock:
+            stats = dict(self.stats)
+            stats['idle'] = sum(len(v) for v in self._idle.values())
+            stats['active'] = self._active
+        return stats
+
+    # -- request handling --------------------------------------------------
+
+    def _var_type(self, name):
+        db = self._db()
+        return {'str': str, 'int': int, 'float': float}.get(name, getattr(db, 'NUMBER', float))
+
+    def _bind(self, cursor, value, variables):
+        """Turn a client variable placeholder into a real cursor variable."""
+        if isinstance(value, dict) and value.get('__t__') == 'var':
+            typ = self._var_type(value['type'])
+            if value.get('array'):
+                initial = decode_value(value['value']) if value.get('value') is not None else value['size']
+                if value.get('element_size'):
+                    var = cursor.arrayvar(typ, initial, value['element_size'])
+                else:
+                    var = cursor.arrayvar(typ, initial)
+            else:
+                var = cursor.var(typ)
+                if value.get('value') is not None:
+                    var.setvalue(0, decode_value(value['value']))
+            variables[value['id']] = var
+            return var
+        return decode_value(value)
+
+    def _bind_all(self, cursor, params, variables):
+        if isinstance(params, dict):
+            return dict((k, self._bind(cursor, v, variables)) for k, v in params.items())
+        if isinstance(params, list):
+            return [self._bind(cursor, v, variables) for v in params]
+        return params
+
+    @staticmethod
+    def _var_values(variables):
+        return dict((vid, encode_value(var.getvalue())) for vid, var in variables.items())
+
+    def handle(self, conn, request):
+        """Execute one client operation on the borrowed session."""
+        op = request.get('op')
+        if op == 'execute':
+            variables = {}
+            with conn.cursor() as cursor:
+                for attr in ('arraysize', 'prefetchrows'):
+                    if request.get(attr):
+                        setattr(cursor, attr, request[attr])
+                params = self._bind_all(cursor, request.get('params'), variables)
+                if params is None:
+                    cursor.execute(request['sql'])
+                else:
+                    cursor.execute(request['sql'], params)
+                description = None
+                rows = []
+                if cursor.description:
+                    description = [d[0] for d in cursor.description]
+                    rows = [encode_value(list(r)) for r in cursor.fetchall()]
+                return {'description': description, 'rows': rows, 'rowcount': cursor.rowcount,
+                        'vars': self._var_values(variables)}
+        if op == 'callproc':
+            variables = {}
+            with conn.cursor() as cursor:
+                args = self._bind_all(cursor, request.get('args') or [], variables)
+                cursor.callproc(request['name'], args)
+                return {'vars': self._var_values(variables)}
+        if op == 'commit':
+            conn.commit()
+            return {}
+        if op == 'rollback':
+            conn.rollback()
+            return {}
+        if op == 'autocommit':
+            conn.autocommit = bool(request.get('value'))
+            return {}
+        if op == 'ping':
+            conn.ping()
+            return {}
+        raise ValueError('Unsupported broker operation %s' % op)
+
+    def _error_reply(self, exc):
+        db = self._db()
+        if isinstance(exc, db.DatabaseError) and exc.args:
+            error = exc.args[0]
+            return {'error': {'code': getattr(error, 'code', None), 'message': getattr(error, 'message', str(error))}}
+        return {'error': {'code': None, 'message': str(exc)}}
+
+    def serve_client(self, sock):
+        channel = _Channel(sock)
+        key = conn = None
+        discard = False
+        with self._lock:
+            self._active += 1
+        try:
+            while True:
+                request = channel.receive()
+                if request is None:
+                    break
+                with self._lock:
+                    self.stats['requests'] += 1
+                    self._last_activity = time.time()
+                op = request.get('op')
+                if op == 'stats':
+                    channel.send({'stats': self.snapshot()})
+                    continue
+                if op == 'acquire':
+                    if conn is not None:
+                        channel.send({'error': {'code': None, 'message': 'session already acquired'}})
+                        continue
+                    try:
+                        conn, hit = self.acquire(request['key'], request)
+                        key = request['key']
+                    except BrokerUnavailable as exc:
+                        channel.send({'unavailable': str(exc)})
+                        continue
+                    except Exception as exc:
+                        channel.send(self._error_reply(exc))
+                        continue
+                    channel.send({'hit': hit, 'version': getattr(conn, 'version', None), 'stats': self.snapshot()})
+                    continue
+                if op == 'release':
+                    break
+                if conn is None:
+                    channel.send({'error': {'code': None, 'message': 'no session acquired'}})
+                    continue
+                if _changes_session(request):
+                    discard = True
+                try:
+                    channel.send(self.handle(conn, request))
+                except Exception as exc:
+                    channel.send(self._error_reply(exc))
+        except (IOError, OSError, ValueError):
+            discard = True
+        finally:
+            if conn is not None:
+                self.release(key, conn, discard=discard)
+            with self._lock:
+                self._active -= 1
+                self._last_activity = time.time()
+            channel.close()
+
+    # -- main loop ---------------------------------------------------------
+
+    def bind(self):
+        directory = os.path.dirname(self.socket_path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory, 0o700)
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0o177)
+        try:
+            self._sock.bind(self.socket_path)
+        finally:
+            os.umask(old_umask)
+        self._sock.listen(16)
+        self._sock.settimeout(1.0)
+        self._running = True
+
+    def shutdown(self):
+        self._running = False
+
+    def serve_forever(self):
+        if self._sock is None:
+            self.bind()
+        try:
+            while self._running:
+                try:
+                    client, _ = self._sock.accept()
+                except socket.timeout:
+                    client = None
+                if client is not None:
+                    client.settimeout(None)
+                    worker = threading.Thread(target=self.serve_client, args=(client,))
+                    worker.daemon = True
+                    worker.start()
+                self.reap()
+                with self._lock:
+                    idle_for = time.time() - self._last_activity
+                    active = self._active
+                if not active and idle_for > self.idle_timeout:
+                    break
+        finally:
+            self._running = False
+            self._sock.close()
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
+            with self._lock:
+                pooled = [e[0] for bucket in self._idle.values() for e in bucket]
+                self._idle.clear()
+            for conn in pooled:
+                self._close(conn)
+
+
+def spawn_broker(socket_path, idle_timeout=DEFAULT_IDLE_TIMEOUT, wait=5.0):
+    """Start a detached broker daemon unless one already listens on socket_path.
+
+    A lock file serializes concurrent modules trying to start the broker.
+    """
+    directory = os.path.dirname(socket_path)
+    if directory and not os.path.isdir(directory):
+        os.makedirs(directory, 0o700)
+    with open(socket_path + '.lock', 'a') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        if _probe(socket_path):
+            return True
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - daemon side
+            try:
+                os.setsid()
+                if os.fork() != 0:
+                    os._exit(0)
+                devnull = os.open(os.devnull, os.O_RDWR)
+                for fd in (0, 1, 2):
+                    os.dup2(devnull, fd)
+                os.closerange(3, 256)
+                BrokerServer(socket_path, idle_timeout=idle_timeout).serve_forever()
+            finally:
+                os._exit(0)
+        os.waitpid(pid, 0)
+        deadline = time.time() + wait
+        while time.time() < deadline:
+            if _probe(socket_path):
+                return True
+            time.sleep(0.05)
+    return False
+
+
+def _probe(socket_path):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+        return True
+    except (IOError, OSError):
+        return False
+    finally:
+        sock.close()
+
+
+# ---------------------------------------------------------------------------
+# Client side
+# ---------------------------------------------------------------------------
+
+class BrokerVar(object):
+    """Client side placeholder for cursor.var()/cursor.arrayvar()."""
+
+    _next_id = 0
+
+    def __init__(self, type_name, array=False, value=None, size=None, element_size=None):
+        BrokerVar._next_id += 1
+        self.id = str(BrokerVar._next_id)
+        self.type_name = type_name
+        self.array = array
+        self.value = value
+        self.size = size
+        self.element_size = element_size
+
+    def getvalue(self, pos=0):
+        return self.value
+
+    def setvalue(self, pos, value):
+        self.value = value
+
+    def encode(self):
+        return {'__t__': 'var', 'id': self.id, 'type': self.type_name, 'array': self.array,
+                'value': encode_value(self.value), 'size': self.size, 'element_size': self.element_size}
+
+
+class BrokerCursor(object):
+    """Subset of the oracledb cursor API used by oracleConnection and modules."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.description = None
+        self.rowcount = 0
+        self.arraysize = None
+        self.prefetchrows = None
+        self.rowfactory = None
+        self._rows = []
+        self._pos = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self._rows = []
+
+    def _type_name(self, typ):
+        db = self.connection.oracledb
+        if typ is str or (db is not None and typ is getattr(db, 'STRING', None)):
+            return 'str'
+        if typ is int:
+            return 'int'
+        if typ is float:
+            return 'float'
+        return 'number'
+
+    def var(self, typ, *args, **kwargs):
+        return BrokerVar(self._type_name(typ))
+
+    def arrayvar(self, typ, value, size=None):
+        if isinstance(value, int):
+            return BrokerVar(self._type_name(typ), array=True, size=value, element_size=size)
+        return BrokerVar(self._type_name(typ), array=True, value=list(value), size=len(value), element_size=size)
+
+    @staticmethod
+    def _encode_params(params, variables):
+        def one(value):
+            if isinstance(value, BrokerVar):
+                variables[value.id] = value
+                return value.encode()
+            return encode_value(value)
+        if isinstance(params, dict):
+            return dict((k, one(v)) for k, v in params.items())
+        if isinstance(params, (list, tuple)):
+            return [one(v) for v in params]
+        return params
+
+    @staticmethod
+    def _update_vars(reply, variables):
+        for vid, value in (reply.get('vars') or {}).items():
+            if vid in variables:
+                variables[vid].value = decode_value(value)
+
+    def execute(self, sql, params=None, **kwargs):
+        if kwargs:
+            params = dict(params or {}, **kwargs)
+        variables = {}
+        reply = self.connection.request({'op': 'execute', 'sql': sql,
+                                         'params': self._encode_params(params, variables),
+                                         'arraysize': self.arraysize, 'prefetchrows': self.prefetchrows})
+        self._update_vars(reply, variables)
+        if reply.get('description'):
+            self.description = [(name, None, None, None, None, None, None) for name in reply['description']]
+        else:
+            self.description = None
+        self._rows = [tuple(decode_value(r)) for r in reply.get('rows') or []]
+        self._pos = 0
+        self.rowcount = reply.get('rowcount') or 0
+        return self
+
+    def callproc(self, name, args=None):
+        variables = {}
+        reply = self.connection.request({'op': 'callproc', 'name': name,
+                                         'args': self._encode_params(list(args or []), variables)})
+        self._update_vars(reply, variables)
+        return list(args or [])
+
+    def _row(self, row):
+        return self.rowfactory(*row) if self.rowfactory else row
+
+    def fetchone(self):
+        if self._pos >= len(self._rows):
+            return None
+        row = self._rows[self._pos]
+        self._pos += 1
+        return self._row(row)
+
+    def fetchmany(self, size=None):
+        size = size or self.arraysize or 100
+        rows = self._rows[self._pos:self._pos + size]
+        self._pos += len(rows)
+        return [self._row(r) for r in rows]
+
+    def fetchall(self):
+        rows = self._rows[self._pos:]
+        self._pos = len(self._rows)
+        return [self._row(r) for r in rows]
+
+    def __iter__(self):
+        while True:
+            row = self.fetchone()
+            if row is None:
+                return
+            yield row
+
+
+class BrokerConnection(object):
+    """Borrowed broker session, looks like an oracledb connection to oracleConnection."""
+
+    def __init__(self, socket_path, key, connect=None, thick=False, oracledb_module=None, timeout=None):
+        self.socket_path = socket_path
+        self.key = key
+        self.oracledb = oracledb_module
+        self._autocommit = True
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if timeout:
+            sock.settimeout(timeout)
+        try:
+            sock.connect(socket_path)
+        except (IOError, OSError) as exc:
+            sock.close()
+            raise BrokerUnavailable(str(exc))
+        sock.settimeout(None)
+        self._channel = _Channel(sock)
+        self._channel.send({'op': 'acquire', 'key': key, 'connect': connect or {}, 'thick': thick})
+        reply = self._channel.receive()
+        if reply is None or 'unavailable' in reply:
+            self._channel.close()
+            raise BrokerUnavailable(reply.get('unavailable') if reply else 'broker closed connection')
+        self._raise_error(reply)
+        self.hit = reply.get('hit', False)
+        self.version = reply.get('version')
+        self.stats = reply.get('stats', {})
+
+    def _raise_error(self, reply):
+        if 'error' in reply:
+            error = BrokerError(reply['error'].get('code'), reply['error'].get('message') or '')
+            if self.oracledb is not None:
+                raise self.oracledb.DatabaseError(error)
+            raise Exception(error)
+
+    def request(self, message):
+        try:
+            self._channel.send(message)
+            reply = self._channel.receive()
+        except (IOError, OSError) as exc:
+            reply = {'error': {'code': None, 'message': 'Connection broker failed: %s' % exc}}
+        if reply is None:
+            reply = {'error': {'code': None, 'message': 'Connection broker closed the session'}}
+        self._raise_error(reply)
+        return reply
+
+    def cursor(self):
+        return BrokerCursor(self)
+
+    @property
+    def autocommit(self):
+        return self._autocommit
+
+    @autocommit.setter
+    def autocommit(self, value):
+        if bool(value) != self._autocommit:
+            self.request({'op': 'autocommit', 'value': bool(value)})
+        self._autocommit = bool(value)
+
+    def commit(self):
+        self.request({'op': 'commit'})
+
+    def rollback(self):
+        self.request({'op': 'rollback'})
+
+    def ping(self):
+        self.request({'op': 'ping'})
+
+    def close(self):
+        try:
+            self._channel.send({'op': 'release'})
+        except (IOError, OSError):
+            pass
+        self._channel.close()
+
+
+def broker_stats(socket_path):
+    """Return the hit/miss counters of a running broker, None when it does not run."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except (IOError, OSError):
+        sock.close()
+        return None
+    channel = _Channel(sock)
+    try:
+        channel.send({'op': 'stats'})
+        reply = channel.receive()
+    finally:
+        channel.close()
+    return reply.get('stats') if reply else None
+
+
+def broker_connect(socket_path, key, connect=None, thick=False, oracledb_module=None, idle_timeout=None):
+    """Borrow a session from the broker, starting the broker when it does not run yet.
+
+    Raises BrokerUnavailable when the broker can not be used, callers then
+    connect directly.
+    """
+    if _probe(socket_path):
+        return BrokerConnection(socket_path, key, connect=connect, thick=thick, oracledb_module=oracledb_module)
+    if idle_timeout is None:
+        idle_timeout = broker_idle_timeout()
+    try:
+        started = spawn_broker(socket_path, idle_timeout=idle_timeout)
+    except (IOError, OSError) as exc:
+        raise BrokerUnavailable(str(exc))
+    if not started:
+        raise BrokerUnavailable('connection broker did not start')
+    return BrokerConnection(socket_path, key, connect=connect, thick=thick, oracledb_module=oracledb_module)
@@ -0,0 +1,329 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import os
+import time
+
+# Optional on-disk snapshot of parsed crsctl stat res output, "yes" or path of the snapshot file
+SNAPSHOT_ENV = 'ANSIBLE_ORACLE_CRS_SNAPSHOT'
+SNAPSHOT_TTL_ENV = 'ANSIBLE_ORACLE_CRS_SNAPSHOT_TTL'
+SNAPSHOT_TTL = 15
+SNAPSHOT_VERSION = 1
+
+# Short resource type names used by oracle_crs_* modules
+CRS_RESOURCE_TYPES = {
+    'asm': 'ora.asm.type',
+    'db': 'ora.database.type',
+    'listener': 'ora.listener.type',
+    'service': 'ora.service.type',
+}
+
+# Attributes reported by crsctl stat res -f (-v) per resource instance, all others are resource configuration
+INSTANCE_ATTRIBUTES = frozenset([
+    'CARDINALITY_ID', 'DEGREE_ID', 'ID', 'LAST_SERVER', 'STATE', 'TARGET', 'TARGET_SERVER', 'STATE_DETAILS',
+    'INTERNAL_STATE', 'LAST_STATE_CHANGE', 'LAST_RESTART', 'RESTART_COUNT', 'FAILURE_COUNT', 'CURRENT_RCOUNT',
+    'INCARNATION', 'CREATION_SEED', 'INSTANCE_FAILOVER',
+])
+
+# Instance states srvctl reports as "is running"
+RUNNING_STATES = ('ONLINE', 'INTERMEDIATE')
+
+
+def resource_key(name):
+    """ short lowercase name of a CRS resource, as used by module parameters
+
+    ora.orcl.db -> orcl, ora.LISTENER.lsnr -> listener, ora.orcl.svc1.svc -> orcl.svc1
+    """
+    if name.startswith('ora.'):
+        parts = name[len('ora.'):].split('.')
+        if name.endswith('.svc') and len(parts) > 2:
+            return '{}.{}'.format(parts[0], parts[1]).lower()
+        return parts[0].lower()
+    return name.split('.')[0].lower()
+
+
+def resource_type(rtype):
+    """ full CRS type for a short type name (db, asm, ...), full names are returned unchanged """
+    return CRS_RESOURCE_TYPES.get(rtype, rtype)
+
+
+def split_state(value):
+    """ parse STATE/TARGET value: "ONLINE on rac1, OFFLINE" -> [('ONLINE', 'rac1'), ('OFFLINE', None)] """
+    retval = []
+    for item in value.split(','):
+        item = item.strip()
+        if not item:
+            continue
+        (state, _, server) = item.partition(' on ')
+        retval.append((state.strip(), server.strip() or None))
+    return retval
+
+
+def srvctl_running(stdout):
+    """ scrape srvctl status output, None when neither "is running" nor "is not running" was reported """
+    running = None
+    for line in stdout.splitlines():
+        if 'is not running' in line:
+            running = False
+        if 'is running' in line:
+            running = True
+    return running
+
+
+class CrsResource():
+    """ one CRS resource, configuration attributes and list of its instances (runtime attributes) """
+
+    def __init__(self, name):
+        self.name = name
+        self.key = resource_key(name)
+        self.attributes = dict()
+        self.instances = []
+
+    @property
+    def type(self):
+        return self.attributes.get('TYPE')
+
+    def add_instance(self, attributes):
+        states = split_state(attributes.get('STATE', ''))
+        if len(states) < 2:
+            instance = dict(attributes)
+            if states:
+                (instance['STATE'], server) = states[0]
+                if server:
+                    instance.setdefault('LAST_SERVER', server)
+            self.instances.append(instance)
+            return
+        # plain crsctl stat res output lists all instances on one line
+        targets = [t for (t, _) in split_state(attributes.get('TARGET', ''))]
+        for (i, (state, server)) in enumerate(states):
+            instance = dict(STATE=state)
+            if server:
+                instance['LAST_SERVER'] = server
+            if i < len(targets):
+                instance['TARGET'] = targets[i]
+            self.instances.append(instance)
+
+    def servers(self):
+        return [i['LAST_SERVER'] for i in self.instances if i.get('LAST_SERVER')]
+
+    def running_on(self):
+        return [i.get('LAST_SERVER') for i in self.instances if i.get('STATE') in RUNNING_STATES]
+
+    @property
+    def running(self):
+        """ True when any instance is running, None when the resource state was not reported """
+        if not any('STATE' in i for i in self.instances):
+            return None
+        return bool(self.running_on())
+
+
+class CrsResources():
+    """ In-memory table of CRS resources, indexed by type, name and server
+
+    Built from one crsctl stat res -f call, answers both configuration and runtime state questions,
+    so a module does not need to call crsctl/srvctl per resource.
+    """
+
+    def __init__(self, resources=None):
+        self.resources = dict()   # full NAME -> CrsResource
+        self.by_type = dict()     # TYPE -> {key: CrsResource}
+        self.by_server = dict()   # server -> [CrsResource]
+        for resource in resources or []:
+            self.resources[resource.name] = resource
+        self.reindex()
+
+    @classmethod
+    def from_output(cls, stdout):
+        table = cls()
+        for block in cls.blocks(stdout):
+            table.add_block(block)
+        table.reindex()
+        return table
+
+    @staticmethod
+    def blocks(stdout):
+        """ split crsctl output into lists of (key, value), one list per blank line separated block """
+        block = []
+        for line in stdout.splitlines():
+            (key, sep, value) = line.partition('=')
+            if not sep:
+                if block:
+                    yield block
+                block = []
+                continue
+            block.append((key.strip(), value.strip()))
+        if block:
+            yield block
+
+    def add_block(self, block):
+        name = next((v for (k, v) in block if k == 'NAME'), None)
+        if not name:
+            return
+        resource = self.resources.get(name)
+        if resource is None:
+            resource = CrsResource(name)
+            self.resources[name] = resource
+        instance = dict()
+        for (key, value) in block:
+            if key in INSTANCE_ATTRIBUTES:
+                # -f reports every instance in its own section starting with CARDINALITY_ID
+                if instance and (key == 'CARDINALITY_ID' or key in instance):
+                    resource.add_instance(instance)
+                    instance = dict()
+                if value:
+                    instance[key] = value
+            elif value:
+                resource.attributes.setdefault(key, value)
+        if instance:
+            resource.add_instance(instance)
+
+    def to_list(self):
+        return [dict(name=r.name, attributes=r.attributes, instances=r.instances) for r in self.resources.values()]
+
+    @classmethod
+    def from_list(cls, items):
+        resources = []
+        for item in items:
+            resource = CrsResource(item['name'])
+            resource.attributes = item['attributes']
+            resource.instances = item['instances']
+            resources.append(resource)
+        return cls(resources)
+
+    def reindex(self):
+        self.by_type = dict()
+        self.by_server = dict()
+        for resource in self.resources.values():
+            self.by_type.setdefault(resource.type, dict())[resource.key] = resource
+            for server in set(resource.servers()):
+                self.by_server.setdefault(server, []).append(resource)
+
+    def get(self, rtype, name):
+        """ resource of given type (db, asm, ... or full CRS type) by its short name, None if not registered """
+        return self.by_type.get(resource_type(rtype), dict()).get(name.lower())
+
+    def of_type(self, rtype):
+        return list(self.by_type.get(resource_type(rtype), dict()).values())
+
+    def on_server(self, server):
+        return list(self.by_server.get(server, []))
+
+    def config(self, rtype, name):
+        """ configuration attributes of a resource, empty dict when the resource is not registered """
+        resource = self.get(rtype, name)
+        return dict(resource.attributes) if resource else dict()
+
+    def running(self, rtype, name):
+        """ True/False, None when the resource is missing or its state was not reported """
+        resource = self.get(rtype, name)
+        return resource.running if resource else None
+
+
+def crs_stat_command(crsctl):
+    return [crsctl, 'stat', 'res', '-f']
+
+
+def snapshot_path(params=None, environ=None):
+    """ path of the crsctl snapshot file when the snapshot is enabled, None otherwise
+
+    The module parameter 'crs_snapshot' (when a module declares it) wins over the
+    ANSIBLE_ORACLE_CRS_SNAPSHOT environment variable.
+    """
+    environ = os.environ if environ is None else environ
+    value = None
+    if params:
+        value = params.get('crs_snapshot')
+    if value is None:
+        value = environ.get(SNAPSHOT_ENV)
+    if value is None or value is False:
+        return None
+    value = str(value).strip()
+    if value.lower() in ('', '0', 'no', 'false', 'off'):
+        return None
+    if value.lower() in ('1', 'yes', 'true', 'on'):
+        return os.path.join(os.path.expanduser('~'), '.ansible', 'oracle_cache', 'crs_snapshot.json')
+    return value
+
+
+def snapshot_ttl(environ=None):
+    """ snapshot lifetime in seconds, ANSIBLE_ORACLE_CRS_SNAPSHOT_TTL overrides the default """
+    environ = os.environ if environ is None else environ
+    try:
+        return float(environ.get(SNAPSHOT_TTL_ENV, SNAPSHOT_TTL))
+    except ValueError:
+        return SNAPSHOT_TTL
+
+
+def load_snapshot(path, crsctl, ttl, now=None):
+    """ return CrsResources from the snapshot, None when missing, expired, taken by other crsctl or unreadable """
+    now = time.time() if now is None else now
+    try:
+        with open(path) as f:
+            snapshot = json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get('version') != SNAPSHOT_VERSION:
+        return None
+    if snapshot.get('crsctl') != crsctl or not 0 <= now - snapshot.get('created', 0) < ttl:
+        return None
+    return CrsResources.from_list(snapshot.get('resources', []))
+
+
+def save_snapshot(path, crsctl, table, module=None):
+    """ atomically replace the snapshot file, failures are not fatal """
+    snapshot = dict(version=SNAPSHOT_VERSION, crsctl=crsctl, created=time.time(), resources=table.to_list())
+    tmp = '{}.{}'.format(path, os.getpid())
+    try:
+        directory = os.path.dirname(path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory, 0o700)
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(snapshot, f)
+        os.rename(tmp, path)
+    except (IOError, OSError) as e:
+        if module:
+            module.warn('Can not write CRS snapshot {}: {}'.format(path, e))
+
+
+def invalidate_snapshot(params=None, environ=None):
+    """ drop the snapshot, called before any srvctl/crsctl command changing clusterware resources """
+    path = snapshot_path(params, environ)
+    if path:
+        try:
+            os.unlink(path)
+        except (IOError, OSError):
+            pass
+
+
+def run_change_command(module, command):
+    """ run srvctl/crsctl command changing clusterware resources, returns (rc, stdout, stderr)
+
+    The snapshot is dropped before and after the command, one taken by an other task meanwhile is stale too.
+    """
+    invalidate_snapshot(module.params)
+    try:
+        return module.run_command(command)
+    finally:
+        invalidate_snapshot(module.params)
+
+
+def crs_resources(module, crsctl, **kwargs):
+    """ run crsctl stat res -f once, return parsed CrsResources, kwargs are passed to fail_json
+
+    When the snapshot is enabled a fresh snapshot is used instead of calling crsctl.
+    """
+    path = snapshot_path(module.params)
+    if path:
+        table = load_snapshot(path, crsctl, snapshot_ttl())
+        if table is not None:
+            return table
+    (rc, stdout, stderr) = module.run_command(crs_stat_command(crsctl))
+    if rc or stderr:
+        module.fail_json(msg='Failed command: crsctl stat res -f, {}'.format(stderr), **kwargs)
+    table = CrsResources.from_output(stdout)
+    if path:
+        save_snapshot(path, crsctl, table, module)
+    return table
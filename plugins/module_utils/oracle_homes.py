@@ -2,9 +2,12 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import atexit
 import fcntl
 import os
+import select
 import sys
+import threading
 import pwd
 import subprocess
 import re
@@ -13,11 +16,142 @@ import socket
 from pwd import getpwuid
 from xml.dom import minidom
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
 import json
 
+# Upper bound of concurrent orabase/comps.xml/sqlplus probes during discovery
+DISCOVERY_WORKERS = 8
+
+# Optional on-disk cache of static discovery results, "yes" or path of the cache file
+FACT_CACHE_ENV = 'ANSIBLE_ORACLE_FACT_CACHE'
+FACT_CACHE_VERSION = 1
+
+# Engine used by query_db_status: auto, oracledb or sqlplus
+STATUS_ENGINE_ENV = 'ANSIBLE_ORACLE_STATUS_ENGINE'
+STATUS_PROBE_TIMEOUT = 10
+
+# Status probe helper, runs as ORACLE_HOME owner, one process per (ORACLE_HOME, owner).
+# Reads one JSON request {"sid": ...} per line and answers with one JSON line.
+STATUS_HELPER = r'''
+import json
+import os
+import sys
+
+
+def reply(message):
+    sys.stdout.write(json.dumps(message) + "\n")
+    sys.stdout.flush()
+
+
+try:
+    import oracledb
+except ImportError as e:
+    reply({"error": str(e)})
+    sys.exit(0)
+
+oracle_home = os.environ["ORACLE_HOME"].rstrip("/")
+error = None
+for kwargs in ({"lib_dir": os.path.join(oracle_home, "lib")}, {"lib_dir": oracle_home}, {}):
+    try:
+        oracledb.init_oracle_client(**kwargs)
+        break
+    except oracledb.ProgrammingError:
+        break
+    except Exception as e:
+        error = str(e)
+else:
+    reply({"error": error})
+    sys.exit(0)
+reply({"ready": True})
+
+sql = (
+    "select i.status, d.open_mode, d.database_role,"
+    " (select count(*) from v$archive_dest where status = 'VALID' and target = 'STANDBY') ora_dg_on"
+    " from v$instance i cross join v$database d"
+)
+for line in sys.stdin:
+    os.environ["ORACLE_SID"] = json.loads(line)["sid"]
+    try:
+        conn = oracledb.connect(mode=oracledb.SYSDBA)
+        try:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(sql)
+            except oracledb.DatabaseError:
+                # NOMOUNT instances and ASM do not have v$database
+                cursor.execute("select status from v$instance")
+            columns = [d[0].upper() for d in cursor.description]
+            row = dict((c, None if v is None else str(v)) for (c, v) in zip(columns, cursor.fetchone()))
+        finally:
+            conn.close()
+        reply({"row": row})
+    except Exception as e:
+        reply({"error": str(e)})
+'''
+
+ORA_INST_LOC = '/etc/oraInst.loc'
+ORATAB = '/etc/oratab'
+OCR_LOC = '/etc/oracle/ocr.loc'
+OLR_LOC = '/etc/oracle/olr.loc'
+
+# OracleHomes attributes restored from the cache
+HOST_ATTRIBUTES = ('oracle_restart', 'oracle_crs', 'oracle_standalone', 'oracle_install_type',
+                   'oracle_gi_managed', 'crs_home', 'crsctl', 'ora_inventory')
+
+
+def fact_cache_path(params=None, environ=None):
+    """Return path of the fact cache file when the cache is enabled, None otherwise.
+
+    The module parameter 'fact_cache' (when a module declares it) wins over the
+    ANSIBLE_ORACLE_FACT_CACHE environment variable.
+    """
+    environ = os.environ if environ is None else environ
+    value = None
+    if params:
+        value = params.get('fact_cache')
+    if value is None:
+        value = environ.get(FACT_CACHE_ENV)
+    if value is None or value is False:
+        return None
+    value = str(value).strip()
+    if value.lower() in ('', '0', 'no', 'false', 'off'):
+        return None
+    if value.lower() in ('1', 'yes', 'true', 'on'):
+        return os.path.join(os.path.expanduser('~'), '.ansible', 'oracle_cache', 'oracle_homes.json')
+    return value
+
+
+def status_engine(params=None, environ=None):
+    """ return engine for status probes, module parameter 'status_engine' wins over ANSIBLE_ORACLE_STATUS_ENGINE """
+    environ = os.environ if environ is None else environ
+    value = None
+    if params:
+        value = params.get('status_engine')
+    if not value:
+        value = environ.get(STATUS_ENGINE_ENV) or 'auto'
+    value = value.strip().lower()
+    if value == 'auto':
+        try:
+            return 'oracledb' if find_spec('oracledb') else 'sqlplus'
+        except (ImportError, ValueError):
+            return 'sqlplus'
+    return value
+
+
+def file_signature(path):
+    """ (mtime, inode, size) of a file, None when the file does not exist """
+    try:
+        st = os.stat(path)
+    except (IOError, OSError):
+        return None
+    return [st.st_mtime_ns, st.st_ino, st.st_size]
+
 
 class OracleHomes():
 
+    max_workers = DISCOVERY_WORKERS
+
     def __init__(self, module=None):
         self.facts_item = {}
         self.running_only = False
@@ -35,9 +169,40 @@ class OracleHomes():
         self.crsctl = None
         self.module = module  # possible reference onto AnsibleModule
 
+        params = getattr(module, 'params', None) or {}
+        self.fact_cache = fact_cache_path(params)
+        self.refresh = bool(params.get('refresh'))
+        self.status_engine = status_engine(params)
+        self._status_helpers = {}
+        self._status_lock = threading.Lock()
+        self._status_atexit = False
+        self.cache_hit = False
+        self._cache = self.load_fact_cache()
+        self._cache_dirty = False
+
+        host = self._cache.get('host')
+        if host and host.get('signature') == self.host_signature(host.get('ora_inventory')):
+            for attribute in HOST_ATTRIBUTES:
+                setattr(self, attribute, host.get(attribute))
+            inventory_homes = host.get('inventory_homes', [])
+            self.cache_hit = True
+        else:
+            inventory_homes = self.discover_host()
+            if self.fact_cache:
+                host = dict((attribute, getattr(self, attribute)) for attribute in HOST_ATTRIBUTES)
+                host['inventory_homes'] = inventory_homes
+                host['signature'] = self.host_signature(self.ora_inventory)
+                self._cache['host'] = host
+                self._cache_dirty = True
+
+        self.add_homes(inventory_homes)
+        self.save_fact_cache()
+
+    def discover_host(self):
+        """ read ocr.loc, olr.loc and central inventory, return list of ORACLE_HOMEs from inventory.xml """
         # Check whether CRS/HAS is installed
         try:
-            with open('/etc/oracle/ocr.loc') as f:
+            with open(OCR_LOC) as f:
                 for line in f:
                     if line.startswith('local_only='):
                         (_, local_only,) = line.strip().split('=')
@@ -54,7 +219,7 @@ class OracleHomes():
 
         # Try to detect CRS_HOME
         try:
-            with open('/etc/oracle/olr.loc') as f:
+            with open(OLR_LOC) as f:
                 for line in f:
                     if line.startswith('crs_home='):
                         (_, crs_home,) = line.strip().split('=')
@@ -68,7 +233,7 @@ class OracleHomes():
 
         # Try to parse inventory.xml file to get list of ORACLE_HOMEs
         try:
-            with open('/etc/oraInst.loc') as f:
+            with open(ORA_INST_LOC) as f:
                 for line in f:
                     if line.startswith('inventory_loc='):
                         (_, oraInventory,) = line.strip().split('=')
@@ -77,11 +242,56 @@ class OracleHomes():
             from xml.dom import minidom
             inv_tree = minidom.parse(os.path.join(self.ora_inventory, 'ContentsXML', 'inventory.xml'))
             homes = inv_tree.getElementsByTagName('HOME')
-            for home in homes:
-                # TODO: skip for deleted ORACLE_HOME
-                self.add_home(home.attributes['LOC'].value)
+            # TODO: skip for deleted ORACLE_HOME
+            return [home.attributes['LOC'].value for home in homes]
         except (IOError, OSError, KeyError):
-            pass
+            return []
+
+    @staticmethod
+    def host_signature(ora_inventory):
+        """ signatures of all files discover_host depends on """
+        paths = [ORA_INST_LOC, OCR_LOC, OLR_LOC]
+        if ora_inventory:
+            paths.append(os.path.join(ora_inventory, 'ContentsXML', 'inventory.xml'))
+        return dict((path, file_signature(path)) for path in paths)
+
+    @staticmethod
+    def home_signature(ORACLE_HOME):
+        """ signatures of all files describe_home depends on """
+        paths = [os.path.join(ORACLE_HOME, 'inventory', 'ContentsXML', 'comps.xml'),
+                 os.path.join(ORACLE_HOME, 'install', 'orabasetab')]
+        return dict((path, file_signature(path)) for path in paths)
+
+    def load_fact_cache(self):
+        """ return content of the fact cache, empty dict when disabled, refreshed, missing or unreadable """
+        if not self.fact_cache or self.refresh:
+            return {}
+        try:
+            with open(self.fact_cache) as f:
+                cache = json.load(f)
+        except (IOError, OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict) or cache.get('version') != FACT_CACHE_VERSION:
+            return {}
+        return cache
+
+    def save_fact_cache(self):
+        """ atomically replace the fact cache file, failures are not fatal """
+        if not self.fact_cache or not self._cache_dirty:
+            return
+        self._cache['version'] = FACT_CACHE_VERSION
+        tmp = '{}.{}'.format(self.fact_cache, os.getpid())
+        try:
+            directory = os.path.dirname(self.fact_cache)
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory, 0o700)
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self._cache, f)
+            os.rename(tmp, self.fact_cache)
+            self._cache_dirty = False
+        except (IOError, OSError) as e:
+            self.module_warn('Can not write fact cache {}: {}'.format(self.fact_cache, e))
 
     def module_warn(self, msg):
         if self.module:
@@ -93,10 +303,32 @@ class OracleHomes():
         else:
             sys.exit(1)
 
-    def parse_oratab(self):
+    def parallel_map(self, func, items, as_owner=False):
+        """ apply func on all items using at most max_workers threads, results are returned in order of items
+
+        as_owner: func spawns processes as ORACLE_HOME owner, without user/group Popen arguments (Python < 3.9)
+        this needs preexec_fn which is not safe in threads, items are processed sequentially then
+        """
+        items = list(items)
+        workers = self.max_workers
+        if as_owner and os.getuid() == 0 and sys.version_info < (3, 9):
+            workers = 1
+        if len(items) < 2 or workers < 2:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(workers, len(items))) as pool:
+            return list(pool.map(func, items))
+
+    def read_oratab(self):
+        """ return list of (ORACLE_SID, ORACLE_HOME) from oratab """
+        signature = file_signature(ORATAB)
+        cached = self._cache.get('oratab')
+        if cached and cached.get('signature') == signature:
+            return [tuple(entry) for entry in cached['entries']]
+
+        entries = []
         try:
             # Reads SID and ORACLE_HOME from oratab
-            with open('/etc/oratab', 'r') as oratab:
+            with open(ORATAB, 'r') as oratab:
                 for line in oratab:
                     line = line.strip()
                     if not line:
@@ -105,10 +337,24 @@ class OracleHomes():
                         continue
 
                     ORACLE_SID, ORACLE_HOME, _ = line.split(':')
-                    self.add_sid(ORACLE_SID=ORACLE_SID, ORACLE_HOME=ORACLE_HOME)
+                    entries.append((ORACLE_SID, ORACLE_HOME))
         except FileNotFoundError:
             pass
 
+        if self.fact_cache:
+            self._cache['oratab'] = {'signature': signature, 'entries': entries}
+            self._cache_dirty = True
+        return entries
+
+    def parse_oratab(self):
+        entries = self.read_oratab()
+
+        # add_sid warns about invalid ORACLE_HOMEs
+        self.add_homes([ORACLE_HOME for (_, ORACLE_HOME) in entries], warn=False)
+        for (ORACLE_SID, ORACLE_HOME) in entries:
+            self.add_sid(ORACLE_SID=ORACLE_SID, ORACLE_HOME=ORACLE_HOME)
+        self.save_fact_cache()
+
     def parse_crs_output(self, lines):
         attributes = dict()
         while lines:
@@ -190,6 +436,7 @@ class OracleHomes():
         # It s basically looking up all PMON process IDs and then using /proc/PID/exe link to find out where is the oracle binary of a running process located
         #
         """
+        found = []
         for cmd_line_file in glob.glob('/proc/[0-9]*/cmdline'):
             ORACLE_SID = ORACLE_HOME = None
             try:
@@ -223,7 +470,7 @@ class OracleHomes():
                     if cmd_line.startswith('asm'):
                         dfiltertype = 'ora.asm.type'
                         ORACLE_HOME = self.crs_home
-                        self.add_sid(ORACLE_SID=ORACLE_SID, ORACLE_HOME=ORACLE_HOME, running=True)
+                        found.append(dict(ORACLE_SID=ORACLE_SID, ORACLE_HOME=ORACLE_HOME, running=True))
                         continue
                     dfiltertype = 'ora.database.type'
                     dfilter = '((TYPE = {}) and ((GEN_USR_ORA_INST_NAME = {}) or (USR_ORA_INST_NAME = {}))'. \
@@ -239,11 +486,11 @@ class OracleHomes():
                         db = self.parse_crs_output(lines)
                         if db:
                             ORACLE_HOME = db.ORACLE_HOME
-                            self.add_sid(ORACLE_SID=db.ORACLE_SID,
-                                         ORACLE_HOME=db.ORACLE_HOME,
-                                         DB_UNIQUE_NAME=db.DB_UNIQUE_NAME,
-                                         crsname=db.crsname,
-                                         running=True)
+                            found.append(dict(ORACLE_SID=db.ORACLE_SID,
+                                              ORACLE_HOME=db.ORACLE_HOME,
+                                              DB_UNIQUE_NAME=db.DB_UNIQUE_NAME,
+                                              crsname=db.crsname,
+                                              running=True))
             # ORACLE_HOME was not detected, this script was probably executed with insufficient privileges
             if not ORACLE_HOME:
                 own_uid = os.geteuid()
@@ -256,28 +503,41 @@ class OracleHomes():
                     msg = 'I(uid={}) am not oracle process owner(uid={}) and I am not root'.format(own_uid, ora_uid)
                     self.module_fail_json(msg, changed=False)
 
-            self.add_sid(ORACLE_SID=ORACLE_SID, ORACLE_HOME=ORACLE_HOME, running=True)
+            found.append(dict(ORACLE_SID=ORACLE_SID, ORACLE_HOME=ORACLE_HOME, running=True))
 
+        self.add_found(found)
+
+    def add_found(self, found):
+        """ register discovered SIDs, new ORACLE_HOMEs are described in parallel first """
+        self.add_homes([sid['ORACLE_HOME'] for sid in found], warn=False)
+        for sid in found:
+            self.add_sid(**sid)
+
+    def crs_resources(self, dfiltertype):
+        """ return output lines of crsctl stat res -p for resources of given type """
+        dfilter = '(TYPE = {})'.format(dfiltertype)
+        proc = subprocess.Popen([self.crsctl, 'stat', 'res', '-p', '-w', dfilter], stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE)
+        try:
+            (stdout, stderr) = proc.communicate(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            (stdout, stderr) = proc.communicate()
+        return stdout.decode('utf-8').splitlines()
 
     def list_crs_instances(self):
         if self.crsctl:
-            for dfiltertype in ['ora.database.type', 'ora.asm.type']:# NOTE does not report ORACLE_HOME
-                dfilter = '(TYPE = {})'.format(dfiltertype)
-                proc = subprocess.Popen([self.crsctl, 'stat', 'res', '-p', '-w', dfilter], stdout=subprocess.PIPE,
-                                        stderr=subprocess.PIPE)
-                try:
-                    (stdout, stderr) = proc.communicate(timeout=10)
-                except subprocess.TimeoutExpired:
-                    proc.kill()
-                    (stdout, stderr) = proc.communicate()
-                lines = stdout.decode('utf-8').splitlines()
+            found = []
+            # NOTE does not report ORACLE_HOME
+            for lines in self.parallel_map(self.crs_resources, ['ora.database.type', 'ora.asm.type']):
                 while lines:
                     db = self.parse_crs_output(lines)
                     if db:
-                        self.add_sid(ORACLE_SID=db.ORACLE_SID,
-                                     ORACLE_HOME=db.ORACLE_HOME,
-                                     DB_UNIQUE_NAME=db.DB_UNIQUE_NAME,
-                                     crsname=db.crsname)
+                        found.append(dict(ORACLE_SID=db.ORACLE_SID,
+                                          ORACLE_HOME=db.ORACLE_HOME,
+                                          DB_UNIQUE_NAME=db.DB_UNIQUE_NAME,
+                                          crsname=db.crsname))
+            self.add_found(found)
 
     def base_from_home(self, ORACLE_HOME):
         """ execute $ORACLE_HOME/bin/orabase to get ORACLE_BASE """
@@ -295,40 +555,73 @@ class OracleHomes():
     def _is_valid_oracle_home(self, oracle_home):
         return bool(oracle_home and os.path.isdir(oracle_home))
 
+    def describe_home(self, ORACLE_HOME):
+        """ return ORACLE_BASE, home type and owner of ORACLE_HOME, safe to be called from worker threads """
+        ORACLE_BASE = self.base_from_home(ORACLE_HOME)
+
+        try:
+            inventory_path = os.path.join(ORACLE_HOME, 'inventory', 'ContentsXML', 'comps.xml')
+            inv_tree = minidom.parse(inventory_path)
+            components = inv_tree.getElementsByTagName('COMP')
+            oracle_owner = getpwuid(os.stat(inventory_path).st_uid).pw_name
+            for comp in components:
+                component_name = comp.attributes['NAME'].value
+                if component_name == "oracle.client":
+                    component_name = 'client'
+                    break
+                elif component_name == "oracle.server":
+                    component_name = "server"
+                    break
+                elif component_name == "oracle.crs":
+                    component_name = "crs"
+                    break
+                elif component_name == "oracle.tg":
+                    component_name = "gateway"
+                    break
+        except (IOError, OSError):
+            component_name = 'unknown'
+            oracle_owner = 'unknown'
+        return {'ORACLE_HOME': ORACLE_HOME
+            , 'ORACLE_BASE': ORACLE_BASE
+            , 'home_type': component_name
+            , 'owner': oracle_owner}
+
     def add_home(self, ORACLE_HOME):
         if not self._is_valid_oracle_home(ORACLE_HOME):
             if ORACLE_HOME:
                 self.module_warn('ORACLE_HOME: {} does not have valid directory'.format(ORACLE_HOME))
             return
         if ORACLE_HOME and ORACLE_HOME not in self.homes:
-            ORACLE_BASE = self.base_from_home(ORACLE_HOME)
+            self.add_homes([ORACLE_HOME])
 
-            try:
-                inventory_path = os.path.join(ORACLE_HOME, 'inventory', 'ContentsXML', 'comps.xml')
-                inv_tree = minidom.parse(inventory_path)
-                components = inv_tree.getElementsByTagName('COMP')
-                oracle_owner = getpwuid(os.stat(inventory_path).st_uid).pw_name
-                for comp in components:
-                    component_name = comp.attributes['NAME'].value
-                    if component_name == "oracle.client":
-                        component_name = 'client'
-                        break
-                    elif component_name == "oracle.server":
-                        component_name = "server"
-                        break
-                    elif component_name == "oracle.crs":
-                        component_name = "crs"
-                        break
-                    elif component_name == "oracle.tg":
-                        component_name = "gateway"
-                        break
-            except (IOError, OSError):
-                component_name = 'unknown'
-                oracle_owner = 'unknown'
-            self.homes[ORACLE_HOME] = {'ORACLE_HOME': ORACLE_HOME
-                , 'ORACLE_BASE': ORACLE_BASE
-                , 'home_type': component_name
-                , 'owner': oracle_owner}
+    def add_homes(self, oracle_homes, warn=True):
+        """ add all new ORACLE_HOMEs, orabase and comps.xml probes run in parallel """
+        new_homes = []
+        for ORACLE_HOME in oracle_homes:
+            if ORACLE_HOME in self.homes or ORACLE_HOME in new_homes:
+                continue
+            if not self._is_valid_oracle_home(ORACLE_HOME):
+                if ORACLE_HOME and warn:
+                    self.module_warn('ORACLE_HOME: {} does not have valid directory'.format(ORACLE_HOME))
+                continue
+            new_homes.append(ORACLE_HOME)
+
+        cached_homes = self._cache.setdefault('homes', {})
+        to_describe = []
+        for ORACLE_HOME in new_homes:
+            cached = cached_homes.get(ORACLE_HOME)
+            if cached and cached.get('signature') == self.home_signature(ORACLE_HOME):
+                self.homes[ORACLE_HOME] = cached['home']
+            else:
+                to_describe.append(ORACLE_HOME)
+
+        for home in self.parallel_map(self.describe_home, to_describe):
+            self.homes[home['ORACLE_HOME']] = home
+            if self.fact_cache:
+                cached_homes[home['ORACLE_HOME']] = {'signature': self.home_signature(home['ORACLE_HOME']),
+                                                     'home': home}
+                self._cache_dirty = True
+        self.save_fact_cache()
 
     def add_sid(self, ORACLE_SID, ORACLE_HOME=None, DB_UNIQUE_NAME=None, crsname=None, running=None):
         if not self._is_valid_oracle_home(ORACLE_HOME):
@@ -360,9 +653,8 @@ class OracleHomes():
                 , 'crsname': crsname
                 , 'running': running}
 
-    def query_db_status(self, oracle_owner, oracle_home, oracle_sid):
-        sqlplus_path = os.path.join(oracle_home, 'bin', 'sqlplus')
-        args = [sqlplus_path, '-S', '/', 'as', 'sysdba']
+    def owner_env(self, oracle_owner, oracle_home, oracle_sid=None):
+        """ return (uid, gid, supplementary gids, environment) used to run Oracle tools as oracle_owner """
         pw_record = pwd.getpwnam(oracle_owner)
         user_name = pw_record.pw_name
         user_home_dir = pw_record.pw_dir
@@ -375,12 +667,134 @@ class OracleHomes():
         env['PWD'] = '/'
         env['USER'] = user_name
         env['ORACLE_HOME'] = oracle_home
-        env['ORACLE_SID'] = oracle_sid
+        if oracle_sid:
+            env['ORACLE_SID'] = oracle_sid
+        return user_uid, user_gid, user_gids, env
+
+    def query_db_status(self, oracle_owner, oracle_home, oracle_sid):
+        if self.status_engine == 'oracledb':
+            status = self.query_db_status_oracledb(oracle_owner, oracle_home, oracle_sid)
+            if status is not None:
+                return status
+        return self.query_db_status_sqlplus(oracle_owner, oracle_home, oracle_sid)
+
+    def status_helper(self, oracle_owner, oracle_home):
+        """ return running status helper for (oracle_home, oracle_owner), None when it can not be used
+
+        Only the reservation of the key is done under _status_lock, the helper is started outside of it,
+        concurrent callers for the same key wait until it is started
+        """
+        key = (oracle_home, oracle_owner)
+        with self._status_lock:
+            if key in self._status_helpers:
+                helper = self._status_helpers[key]
+                reserved = False
+            else:
+                helper = self._status_helpers[key] = {'lock': threading.Lock(), 'started': threading.Event()}
+                reserved = True
+            if not self._status_atexit:
+                atexit.register(self.close_status_helpers)
+                self._status_atexit = True
+
+        if not reserved:
+            if helper is None:
+                return None
+            helper['started'].wait()
+            return None if helper.get('dead') else helper
+
+        started = False
+        try:
+            started = self.start_status_helper(helper, oracle_owner, oracle_home)
+        finally:
+            if not started:
+                helper['dead'] = True
+                with self._status_lock:
+                    self._status_helpers[key] = None
+            helper['started'].set()
+        return helper if started else None
+
+    def start_status_helper(self, helper, oracle_owner, oracle_home):
+        """ spawn the helper process as oracle_owner and wait for its ready message """
+        user_uid, user_gid, user_gids, env = self.owner_env(oracle_owner, oracle_home)
+        env['LD_LIBRARY_PATH'] = os.pathsep.join(
+            p for p in [os.path.join(oracle_home, 'lib'), env.get('LD_LIBRARY_PATH')] if p)
+        kwargs = dict(cwd='/', env=env, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        if os.getuid() == 0:
+            kwargs.update(self.owner_popen_kwargs(user_uid, user_gid, user_gids))
+        elif os.getuid() != user_uid:
+            return False
+        try:
+            helper['process'] = subprocess.Popen([sys.executable, '-c', STATUS_HELPER], **kwargs)
+            ready = self.status_helper_read(helper, STATUS_PROBE_TIMEOUT)
+        except (IOError, OSError, ValueError) as e:
+            ready = {'error': str(e)}
+        if not ready.get('ready'):
+            self.module_warn('oracledb status probe not available for {}: {}'.format(oracle_home, ready.get('error')))
+            self.close_status_helper(helper)
+            return False
+        return True
+
+    @staticmethod
+    def status_helper_read(helper, timeout):
+        """ read one JSON reply from the helper, ValueError on timeout or when the helper exited """
+        stdout = helper['process'].stdout
+        ready, _, _ = select.select([stdout], [], [], timeout)
+        if not ready:
+            raise ValueError('timeout')
+        line = stdout.readline()
+        if not line:
+            raise ValueError('status helper exited')
+        return json.loads(line.decode('utf-8'))
+
+    @staticmethod
+    def close_status_helper(helper):
+        process = helper.get('process')
+        if not process:
+            return
+        try:
+            process.stdin.close()
+            process.wait(timeout=5)
+        except (IOError, OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+
+    def close_status_helpers(self):
+        with self._status_lock:
+            for helper in self._status_helpers.values():
+                if helper:
+                    self.close_status_helper(helper)
+            self._status_helpers = {}
+
+    def query_db_status_oracledb(self, oracle_owner, oracle_home, oracle_sid):
+        """ query status over python-oracledb bequeath connection, None when sqlplus has to be used instead """
+        helper = self.status_helper(oracle_owner, oracle_home)
+        if not helper:
+            return None
+        with helper['lock']:
+            if helper.get('dead'):
+                return None
+            try:
+                helper['process'].stdin.write((json.dumps({'sid': oracle_sid}) + '\n').encode('utf-8'))
+                helper['process'].stdin.flush()
+                reply = self.status_helper_read(helper, STATUS_PROBE_TIMEOUT)
+            except (IOError, OSError, ValueError) as e:
+                # hanging or crashed helper, do not reuse it
+                helper['dead'] = True
+                self.close_status_helper(helper)
+                return ['UNKNOWN'] if str(e) == 'timeout' else None
+        if 'row' not in reply:
+            return None
+        return self.db_status(oracle_sid, reply['row'])
+
+    def query_db_status_sqlplus(self, oracle_owner, oracle_home, oracle_sid):
+        sqlplus_path = os.path.join(oracle_home, 'bin', 'sqlplus')
+        args = [sqlplus_path, '-S', '/', 'as', 'sysdba']
+        user_uid, user_gid, user_gids, env = self.owner_env(oracle_owner, oracle_home, oracle_sid)
 
         if os.getuid() == 0:
             process = subprocess.Popen(args,
-                                       preexec_fn=self.demote(user_uid, user_gid, user_gids),
-                                       cwd='/', env=env, stdout=subprocess.PIPE, stdin=subprocess.PIPE)
+                                       cwd='/', env=env, stdout=subprocess.PIPE, stdin=subprocess.PIPE,
+                                       **self.owner_popen_kwargs(user_uid, user_gid, user_gids))
         elif os.getuid() == user_uid:
             process = subprocess.Popen(args,
                                        cwd='/', env=env, stdout=subprocess.PIPE, stdin=subprocess.PIPE)
@@ -427,9 +841,14 @@ class OracleHomes():
         if process.returncode not in (0, None):
             return ['UNKNOWN']
 
+        return self.db_status(oracle_sid, r)
+
+    @staticmethod
+    def db_status(oracle_sid, r):
+        """ map STATUS, OPEN_MODE, ORA_DG_ON values onto status list reported by oracle_oratab """
         status = r.get('STATUS')
-        open_mode = r.get('OPEN_MODE', 'UNKNOWN')
-        dg_on = r.get('ORA_DG_ON', '0')
+        open_mode = r.get('OPEN_MODE') or 'UNKNOWN'
+        dg_on = r.get('ORA_DG_ON') or '0'
 
         if oracle_sid.startswith('+ASM') and status == 'STARTED':
             return ['ASM', 'STARTED']
@@ -451,6 +870,17 @@ class OracleHomes():
             return ['OPEN', open_mode]
         return ['UNKNOWN']
 
+    @classmethod
+    def owner_popen_kwargs(cls, user_uid, user_gid, supplementary_groups):
+        """ Popen arguments running the child as ORACLE_HOME owner
+
+        user/group/extra_groups (Python 3.9+) switch the credentials without running python code
+        between fork and exec, so they can be used from worker threads, preexec_fn can not
+        """
+        if sys.version_info >= (3, 9):
+            return dict(user=user_uid, group=user_gid, extra_groups=supplementary_groups)
+        return dict(preexec_fn=cls.demote(user_uid, user_gid, supplementary_groups))
+
     @staticmethod
     def demote(user_uid, user_gid, supplementary_groups):
         def result():
@@ -470,7 +900,6 @@ def main():
     h.parse_oratab()
 
     for sid in list(h.facts_item):
-        oracle_owner = None
         try:
             sqlplus_path = os.path.join(h.facts_item[sid]['ORACLE_HOME'], 'bin', 'oracle')
             oracle_owner = getpwuid(os.stat(sqlplus_path).st_uid).pw_name
@@ -478,17 +907,22 @@ def main():
         except (OSError, KeyError, TypeError):
             h.facts_item[sid]['owner'] = None
 
-        oracle_owner = h.facts_item[sid].get('owner')
-        if h.facts_item[sid]["running"] and oracle_owner:
-            status = h.query_db_status(oracle_owner=oracle_owner
-                                       , oracle_home=h.facts_item[sid]['ORACLE_HOME']
-                                       , oracle_sid=h.facts_item[sid]['ORACLE_SID'])
-            h.facts_item[sid]['status'] = status
-        elif h.facts_item[sid]["running"]:
+        if h.facts_item[sid]["running"]:
             h.facts_item[sid]['status'] = ['UNKNOWN']
         else:
             h.facts_item[sid]['status'] = ['DOWN']
 
+    # sqlplus status probes run in parallel, each one is bounded by its own timeout
+    probes = [sid for sid in h.facts_item if h.facts_item[sid]["running"] and h.facts_item[sid]['owner']]
+
+    def probe(sid):
+        return h.query_db_status(oracle_owner=h.facts_item[sid]['owner']
+                                 , oracle_home=h.facts_item[sid]['ORACLE_HOME']
+                                 , oracle_sid=h.facts_item[sid]['ORACLE_SID'])
+
+    for sid, status in zip(probes, h.parallel_map(probe, probes, as_owner=True)):
+        h.facts_item[sid]['status'] = status
+
     print(json.dumps(h.facts_item, sort_keys=True, indent=2))
 
 
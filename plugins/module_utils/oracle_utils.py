@@ -2,7 +2,9 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import json
 import re
+import time
 
 from ansible.module_utils.basic import os
 from ansible.module_utils.basic import *
@@ -14,6 +16,13 @@ except ImportError:
 else:
     oracledb_exists = True
 
+try:
+    from .oracle_broker import BrokerUnavailable, broker_connect, broker_socket_path, pool_key
+except ImportError:
+    oracle_broker_exists = False
+else:
+    oracle_broker_exists = True
+
 
 # Mapping from module 'mode' parameter to oracledb auth-mode constants.
 # 'normal' is omitted — it means "no special mode flag".
@@ -145,6 +154,83 @@ def sanitize_string_params(module_params, no_trim=None):
             module_params[key] = value.strip()
 
 
+# Anonymous block used by oracleConnection.execute_ddls(). Statements are executed
+# one after another by EXECUTE IMMEDIATE, errors listed in :ignore are recorded and
+# skipped, the first other error stops the batch and its index is returned in :failed.
+EXECUTE_DDLS_BLOCK = """
+DECLARE
+    TYPE str_array IS TABLE OF VARCHAR2(32767) INDEX BY BINARY_INTEGER;
+    TYPE num_array IS TABLE OF NUMBER INDEX BY BINARY_INTEGER;
+    v_stmts str_array;
+    v_ignore num_array;
+    v_codes num_array;
+    v_errors str_array;
+    v_ignored BOOLEAN;
+BEGIN
+    v_stmts := :stmts;
+    v_ignore := :ignore;
+    :failed := 0;
+    FOR i IN 1..v_stmts.COUNT LOOP
+        v_codes(i) := 0;
+        v_errors(i) := NULL;
+        BEGIN
+            EXECUTE IMMEDIATE v_stmts(i);
+        EXCEPTION WHEN OTHERS THEN
+            v_codes(i) := -SQLCODE;
+            v_errors(i) := SUBSTR(SQLERRM, 1, 512);
+            v_ignored := FALSE;
+            FOR j IN 1..v_ignore.COUNT LOOP
+                IF v_ignore(j) = v_codes(i) THEN
+                    v_ignored := TRUE;
+                END IF;
+            END LOOP;
+            IF NOT v_ignored THEN
+                :failed := i;
+                EXIT;
+            END IF;
+        END;
+    END LOOP;
+    :codes := v_codes;
+    :errors := v_errors;
+END;"""
+
+
+def broker_result(conn):
+    """Module result entry with connection broker usage of an oracleConnection.
+
+    Returns {'broker': {'socket', 'hit', 'hits', 'misses'}} when the session was
+    borrowed from the broker, {} otherwise, modules pass it to exit_json:
+    module.exit_json(changed=changed, **broker_result(oc))
+    """
+    broker = getattr(conn, 'broker', None)
+    return {'broker': broker} if broker else {}
+
+
+def bind_in_list(column, values, prefix='in'):
+    """Build a set-based ``column IN (...)`` predicate with one bind variable per value.
+
+    Oracle limits an IN list to 1000 expressions, longer lists are split into
+    several IN lists joined by OR, so the whole set is still fetched by a single
+    statement. Returns (predicate, params); an empty list yields a predicate
+    which matches nothing.
+    """
+    values = list(values)
+    if not values:
+        return '1 = 0', {}
+    params = {}
+    chunks = []
+    for start in range(0, len(values), 1000):
+        names = []
+        for i, value in enumerate(values[start:start + 1000], start):
+            name = '%s%d' % (prefix, i)
+            params[name] = value
+            names.append(':' + name)
+        chunks.append('%s in (%s)' % (column, ', '.join(names)))
+    if len(chunks) == 1:
+        return chunks[0], params
+    return '(%s)' % ' or '.join(chunks), params
+
+
 def oracle_connect(module):
     """
     Connect to the database using parameter provided by Ansible module instance.
@@ -254,7 +340,19 @@ class oracleConnection:
         # SYSDBA/SYSDG/SYSOPER/SYSASM over TCP with explicit credentials works in
         # python-oracledb thin mode (2.x+).
         requires_thick = not user and not password
-        _ensure_oracle_client(module, oracle_home=self.oracle_home, required=requires_thick)
+        session_container = module.params.get("session_container")
+
+        # Borrow a pooled session from the per-host connection broker (opt-in),
+        # the broker process pays the client initialization and logon instead of us.
+        self.broker = None
+        conn = None
+        broker_path = broker_socket_path(module.params) if oracle_broker_exists else None
+        if broker_path:
+            conn = self._connect_broker(broker_path, user, password, mode, service_name, hostname, port, dsn,
+                                        session_container, requires_thick)
+
+        if conn is None:
+            _ensure_oracle_client(module, oracle_home=self.oracle_home, required=requires_thick)
 
         auth_mode = _AUTH_MODES.get(mode)
         if mode != 'normal' and auth_mode is None:
@@ -262,7 +360,9 @@ class oracleConnection:
 
         connect = '<unresolved>'
         try:
-            if not user and not password:  # OS authentication or wallet
+            if conn is not None:
+                pass
+            elif not user and not password:  # OS authentication or wallet
                 if auth_mode and service_name:
                     # TNS via wallet: /@service_name as sysdba
                     connect = wallet_connect
@@ -292,11 +392,41 @@ class oracleConnection:
         self.conn.autocommit = True
         self.version = self.conn.version
         self.ddls = []
+        self.columns = []
+        self._select_failed = False
         self.changed = False
-        session_container = module.params.get("session_container")
-        if session_container:
+        # A brokered session was already switched into session_container by the broker
+        if session_container and self.broker is None:
             self.set_container(session_container)
 
+    def _connect_broker(self, broker_path, user, password, mode, service_name, hostname, port, dsn,
+                        session_container, requires_thick):
+        """Borrow a session from the connection broker, return None to connect directly."""
+        if not user and not password:
+            connect = {'wallet_connect': '/@%s' % service_name} if service_name or mode == 'normal' else {}
+            target = connect.get('wallet_connect', '/')
+        elif user and password:
+            if not dsn and hostname:
+                dsn = oracledb.makedsn(host=hostname, port=port, service_name=service_name)
+            connect = {'user': user, 'password': password, 'dsn': dsn}
+            target = dsn
+        else:
+            return None
+        key = pool_key(target, user, mode, session_container, password=password)
+        try:
+            conn = broker_connect(broker_path, key, connect=connect, thick=requires_thick, oracledb_module=oracledb)
+        except BrokerUnavailable as exc:
+            if getattr(self.module, '_verbosity', 0) >= 3:
+                self.module.warn('Connection broker not used: %s' % exc)
+            return None
+        except oracledb.DatabaseError as exc:
+            error, = exc.args
+            msg = 'Could not connect to database - %s, connect descriptor: %s' % (error.message, target)
+            self.module.fail_json(msg=msg, changed=False)
+            return None
+        self.broker = {'socket': broker_path, 'hit': conn.hit,
+                       'hits': conn.stats.get('hits', 0), 'misses': conn.stats.get('misses', 0)}
+        return conn
 
     def execute_select(self, sql, params=None, fetchone=False, fail_on_error=True):
         """Execute a select query and return fetched data.
@@ -324,20 +454,20 @@ class oracleConnection:
         sql -- SQL query
         params -- Dictionary of bind parameters (default {})
         """
+        if not fetchone:
+            rows = list(self.iter_select(sql, params, fail_on_error=fail_on_error))
+            return rows if rows or not self._select_failed else None
         if params is None:
             params = {}
         try:
             with self.conn.cursor() as cursor:
                 cursor.execute(sql, params)
                 column_names = [description[0].lower() for description in cursor.description]  # First element is the column name.
-                if fetchone:
-                    row = cursor.fetchone()
-                    if row:
-                        return dict(zip(column_names, row))
-                    else:
-                        return dict()
+                row = cursor.fetchone()
+                if row:
+                    return dict(zip(column_names, row))
                 else:
-                    return [dict(zip(column_names, row)) for row in cursor]
+                    return dict()
         except oracledb.DatabaseError as e:
             error = e.args[0]
             if fail_on_error:
@@ -345,6 +475,132 @@ class oracleConnection:
             else:
                 self.module.warn(error.message)
 
+    def iter_select(self, sql, params=None, arraysize=None, prefetchrows=None, as_dict=True, fail_on_error=True):
+        """Execute a select query and yield rows one by one, rows are never held in memory all at once.
+
+        sql -- SQL query
+        params -- Dictionary of bind parameters (default {})
+        arraysize -- Number of rows fetched from the database per round-trip (oracledb default 100)
+        prefetchrows -- Number of rows returned already by the execute round-trip
+        as_dict -- Yield dictionaries keyed by lower case column names, tuples otherwise
+        """
+        self._select_failed = False
+        if params is None:
+            params = {}
+        try:
+            with self.conn.cursor() as cursor:
+                if arraysize:
+                    cursor.arraysize = arraysize
+                if prefetchrows is not None:
+                    cursor.prefetchrows = prefetchrows
+                cursor.execute(sql, params)
+                self.columns = [description[0].lower() for description in cursor.description]
+                if as_dict:
+                    for row in cursor:
+                        yield dict(zip(self.columns, row))
+                else:
+                    for row in cursor:
+                        yield tuple(row)
+        except oracledb.DatabaseError as e:
+            self._select_failed = True
+            error = e.args[0]
+            if fail_on_error:
+                self.module.fail_json(msg=error.message, code=error.code, ddls=self.ddls, changed=self.changed)
+            else:
+                self.module.warn(error.message)
+
+    def select_limited(self, sql, params=None, max_rows=None, max_bytes=None, compact=False,
+                       arraysize=None, prefetchrows=None):
+        """Execute a select query and return at most max_rows rows / max_bytes of JSON encoded data.
+
+        Returns dict with keys rows, row_count and truncated. In compact format rows are lists of
+        column values and the column names are returned once under columns.
+        Fetching stops at the first row exceeding the limits, the rest of the result set is never read.
+        """
+        rows = []
+        size = 0
+        truncated = False
+        self.columns = []
+        cursor_rows = self.iter_select(sql, params, arraysize=arraysize, prefetchrows=prefetchrows, as_dict=not compact)
+        try:
+            for row in cursor_rows:
+                if max_rows is not None and len(rows) >= max_rows:
+                    truncated = True
+                    break
+                if max_bytes is not None:
+                    size += len(json.dumps(row, default=str))
+                    if size > max_bytes:
+                        truncated = True
+                        break
+                rows.append(list(row) if compact else row)
+        finally:
+            # closes the cursor when the result set was not read till the end
+            cursor_rows.close()
+        result = dict(rows=rows, row_count=len(rows), truncated=truncated)
+        if compact:
+            result['columns'] = self.columns
+        return result
+
+    def execute_select_multi(self, queries, arraysize=None):
+        """Execute several select queries in one round-trip and return their rows.
+
+        queries -- list of (name, sql, fetchone) tuples, queries must not use bind variables
+        All queries are opened as REF CURSOR out binds of a single anonymous PL/SQL block,
+        SQL text is bound as a string, so a failing query (missing view, privileges) does not
+        prevent the others from running. A failed query yields None and a warning.
+        Returns (results, timing): results maps name to a row dictionary (fetchone) or
+        a list of them, timing maps name to seconds spent in fetching and decoding,
+        timing['execute'] is the round-trip of the block itself.
+        """
+        results = {}
+        timing = {}
+        if getattr(self, 'broker', None) is not None or len(queries) < 2:
+            # Cursors can not be bound through the connection broker
+            for name, sql, fetchone in queries:
+                start = time.time()
+                results[name] = self.execute_select_to_dict(sql, fetchone=fetchone, fail_on_error=False)
+                timing[name] = round(time.time() - start, 3)
+            return results, timing
+
+        block = ['BEGIN']
+        params = {}
+        cursors = []
+        for i, (name, sql, fetchone) in enumerate(queries):
+            block.append('  BEGIN OPEN :c{0} FOR :s{0}; EXCEPTION WHEN OTHERS THEN :e{0} := SQLERRM; END;'.format(i))
+            ref_cursor = self.conn.cursor()
+            if arraysize:
+                ref_cursor.arraysize = arraysize
+                ref_cursor.prefetchrows = arraysize
+            cursors.append(ref_cursor)
+            params['c%d' % i] = ref_cursor
+            params['s%d' % i] = sql
+        block.append('END;')
+        try:
+            with self.conn.cursor() as cursor:
+                for i in range(len(queries)):
+                    params['e%d' % i] = cursor.var(oracledb.STRING, 4000)
+                start = time.time()
+                cursor.execute('\n'.join(block), params)
+                timing['execute'] = round(time.time() - start, 3)
+                for i, (name, sql, fetchone) in enumerate(queries):
+                    start = time.time()
+                    error = params['e%d' % i].getvalue()
+                    if error:
+                        self.module.warn(error)
+                        results[name] = None
+                    else:
+                        ref_cursor = cursors[i]
+                        columns = [d[0].lower() for d in ref_cursor.description]
+                        rows = [dict(zip(columns, row)) for row in ref_cursor]
+                        results[name] = (rows[0] if rows else dict()) if fetchone else rows
+                    timing[name] = round(time.time() - start, 3)
+        except oracledb.DatabaseError as e:
+            error = e.args[0]
+            self.module.fail_json(msg=error.message, code=error.code, ddls=self.ddls, changed=self.changed)
+        finally:
+            for ref_cursor in cursors:
+                ref_cursor.close()
+        return results, timing
 
     def execute_ddl(self, request, params=None, no_change=False, ignore_errors=None, ddls_entry=None):
         """Execute a DDL request and keep trace it in ddls attribute.
@@ -375,7 +631,58 @@ class oracleConnection:
             else:
                 pass
 
-            
+    def execute_ddls(self, requests, no_change=False, ignore_errors=None, ddls_entries=None):
+        """Execute a list of DDL requests in one round-trip and keep trace them in ddls attribute.
+
+        Statements are shipped as a bound string collection to a single anonymous
+        PL/SQL block which runs them by EXECUTE IMMEDIATE, in order. Error codes listed
+        in ignore_errors are skipped, the first other error stops the batch and fails
+        the module like execute_ddl() does. In check mode, nothing is executed.
+        ddls_entries -- optional list, same length as requests, recorded in ``ddls``
+            instead of the requests (see ddls_entry in execute_ddl).
+        Returns list of error codes, one per request: 0 for success, None if not executed.
+        """
+        requests = list(requests)
+        if ignore_errors is None:
+            ignore_errors = []
+        traces = list(ddls_entries) if ddls_entries is not None else requests
+        if len(requests) < 2 or self.module.check_mode:
+            for request, trace in zip(requests, traces):
+                self.execute_ddl(request, no_change=no_change, ignore_errors=ignore_errors, ddls_entry=trace)
+            return [0] * len(requests)
+
+        if self.module._verbosity >= 3:
+            for trace in traces:
+                self.module.warn("SQL: --{}".format(trace))
+        size = max(len(r.encode('utf-8')) for r in requests)
+        with self.conn.cursor() as cursor:
+            stmts = cursor.arrayvar(oracledb.STRING, requests, size)
+            # A code which is never raised keeps the collection non-empty
+            ignore = cursor.arrayvar(oracledb.NUMBER, list(ignore_errors) or [0])
+            codes = cursor.arrayvar(oracledb.NUMBER, len(requests))
+            errors = cursor.arrayvar(oracledb.STRING, len(requests), 512)
+            failed = cursor.var(oracledb.NUMBER)
+            try:
+                cursor.execute(EXECUTE_DDLS_BLOCK, {'stmts': stmts, 'ignore': ignore, 'failed': failed,
+                                                    'codes': codes, 'errors': errors})
+            except oracledb.DatabaseError as e:
+                error = e.args[0]
+                self.module.fail_json(msg=error.message, code=error.code, ddls=self.ddls, changed=self.changed)
+            failed = int(failed.getvalue() or 0)
+            codes = [int(c) if c is not None else None for c in (codes.getvalue() or [])]
+            errors = list(errors.getvalue() or [])
+
+        codes += [None] * (len(requests) - len(codes))
+        for i, trace in enumerate(traces):
+            if codes[i] is None:
+                break
+            self.ddls.append(trace)
+            if codes[i] == 0 and not no_change:
+                self.changed = True
+        if failed:
+            self.module.fail_json(msg=errors[failed - 1], code=codes[failed - 1], ddls=self.ddls, changed=self.changed)
+        return codes
+
     def execute_statement(self, statement, params=None):
         """Execute a statement, can be a query or a procedure and return lines of dbms_output.put_line().
 
@@ -500,6 +807,40 @@ class oracleConnection:
         return ''
 
 
+    def resolve_object_names(self, object_names):
+        """Resolve many unqualified object names by one query, same precedence as resolve_object_name.
+
+        Returns dictionary NAME -> 'OWNER.OBJECT_NAME' for names which could be resolved.
+        """
+        names = sorted(set(n.upper() for n in object_names))
+        if not names:
+            return {}
+        objects, params = bind_in_list('object_name', names, 'obj')
+        synonyms, _ = bind_in_list('synonym_name', names, 'obj')
+        sql = """
+        select name, owner || '.' || object_name from (
+            select name, owner, object_name, row_number() over (partition by name order by precedence) rn
+            from (
+                -- 1. Check YOUR objects first (highest priority)
+                select object_name name, user owner, object_name, 1 precedence
+                from user_objects
+                where object_type <> 'SYNONYM' and (%s)
+                union all
+                -- 2. Check YOUR private synonyms
+                select synonym_name, table_owner, table_name, 2
+                from user_synonyms
+                where %s
+                union all
+                -- 3. Check PUBLIC synonyms (final fallback)
+                select synonym_name, table_owner, table_name, 3
+                from all_synonyms
+                where owner = 'PUBLIC' and (%s)
+            )
+        ) where rn = 1""" % (objects, synonyms, synonyms)
+        rows = self.execute_select(sql, params, fail_on_error=False) or []
+        return dict((name, resolved) for (name, resolved) in rows)
+
+
 class dictcur(object):
     # need to monkeypatch the built-in execute function to always return a dict
     def __init__(self, cursor):
@@ -250,33 +250,35 @@ def main():
                             PRINCIPAL, PRINCIPAL_TYPE, GRANT_TYPE, PRIVILEGE
                      FROM DBA_HOST_ACES ORDER BY HOST, ACE_ORDER"""
             rows = conn.execute_select_to_dict(sql)
-        module.exit_json(changed=False, acl_entries=rows)
+        module.exit_json(changed=False, acl_entries=rows, **broker_result(conn))
 
     elif state == 'present':
         if ace_exists(conn, module):
-            module.exit_json(changed=False, msg='ACE already exists')
+            module.exit_json(changed=False, msg='ACE already exists', **broker_result(conn))
         if module.check_mode:
             sql, _ = _host_ace_mutate_sql_params(module, 'APPEND_HOST_ACE')
             module.exit_json(
                 changed=True,
                 ddls=['--' + sql],
                 msg='ACE would be created (check mode)',
+                **broker_result(conn),
             )
         create_ace(conn, module)
-        module.exit_json(changed=conn.changed, ddls=conn.ddls, msg='ACE created')
+        module.exit_json(changed=conn.changed, ddls=conn.ddls, msg='ACE created', **broker_result(conn))
 
     elif state == 'absent':
         if not ace_exists(conn, module):
-            module.exit_json(changed=False, msg='ACE does not exist')
+            module.exit_json(changed=False, msg='ACE does not exist', **broker_result(conn))
         if module.check_mode:
             sql, _ = _host_ace_mutate_sql_params(module, 'REMOVE_HOST_ACE')
             module.exit_json(
                 changed=True,
                 ddls=['--' + sql],
                 msg='ACE would be removed (check mode)',
+                **broker_result(conn),
             )
         remove_ace(conn, module)
-        module.exit_json(changed=conn.changed, ddls=conn.ddls, msg='ACE removed')
+        module.exit_json(changed=conn.changed, ddls=conn.ddls, msg='ACE removed', **broker_result(conn))
 
 
 from ansible.module_utils.basic import AnsibleModule
@@ -292,7 +294,7 @@ from ansible.module_utils.basic import AnsibleModule
 # In this case we do import from collections
 try:
     from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import (  # noqa: E501
-        oracleConnection, sanitize_string_params,
+        oracleConnection, broker_result, sanitize_string_params,
     )
 except ImportError:
     def sanitize_string_params(_params):
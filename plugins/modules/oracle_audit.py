@@ -375,14 +375,18 @@ def create_policy(conn, module):
     conn.execute_ddl(sql)
 
 
+def drop_policy_sql(module):
+    """Return DROP statement for a Unified Audit policy."""
+    return 'DROP AUDIT POLICY %s' % module.params["policy_name"]
+
+
 def drop_policy(conn, module):
     """Drop a Unified Audit policy."""
-    policy_name = module.params["policy_name"]
-    conn.execute_ddl('DROP AUDIT POLICY %s' % policy_name)
+    conn.execute_ddl(drop_policy_sql(module))
 
 
-def enable_policy(conn, module):
-    """Enable a Unified Audit policy."""
+def enable_policy_sql(module):
+    """Return AUDIT POLICY statement enabling a Unified Audit policy."""
     policy_name = module.params["policy_name"]
     enabled_users = module.params["enabled_users"]
     enabled_except_users = module.params["enabled_except_users"]
@@ -395,14 +399,22 @@ def enable_policy(conn, module):
     elif scope_kind == 'except':
         sql += ' EXCEPT %s' % ', '.join(sorted(scope_names))
     # scope_kind == 'all': omit BY/EXCEPT (all users)
+    return sql
 
-    conn.execute_ddl(sql)
+
+def enable_policy(conn, module):
+    """Enable a Unified Audit policy."""
+    conn.execute_ddl(enable_policy_sql(module))
+
+
+def disable_policy_sql(module):
+    """Return NOAUDIT POLICY statement disabling a Unified Audit policy."""
+    return 'NOAUDIT POLICY %s' % module.params["policy_name"]
 
 
 def disable_policy(conn, module):
     """Disable a Unified Audit policy."""
-    policy_name = module.params["policy_name"]
-    conn.execute_ddl('NOAUDIT POLICY %s' % policy_name)
+    conn.execute_ddl(disable_policy_sql(module))
 
 
 def main():
@@ -458,27 +470,32 @@ def main():
             enabled=bool(enabled_rows),
             policy=policy_rows,
             enabled_details=enabled_rows,
+            **broker_result(conn),
         )
 
     elif state == 'present':
         if policy_exists(conn, policy_name):
-            module.exit_json(changed=False, msg='Policy already exists')
+            module.exit_json(changed=False, msg='Policy already exists', **broker_result(conn))
         create_policy(conn, module)
         module.exit_json(
             changed=conn.changed, ddls=conn.ddls,
             msg='Audit policy created',
+            **broker_result(conn),
         )
 
     elif state == 'absent':
         if not policy_exists(conn, policy_name):
-            module.exit_json(changed=False, msg='Policy does not exist')
-        # Disable first if enabled
+            module.exit_json(changed=False, msg='Policy does not exist', **broker_result(conn))
+        # Disable first if enabled, both statements are sent in one round-trip
+        statements = []
         if policy_is_enabled(conn, policy_name):
-            disable_policy(conn, module)
-        drop_policy(conn, module)
+            statements.append(disable_policy_sql(module))
+        statements.append(drop_policy_sql(module))
+        conn.execute_ddls(statements)
         module.exit_json(
             changed=conn.changed, ddls=conn.ddls,
             msg='Audit policy dropped',
+            **broker_result(conn),
         )
 
     elif state == 'enabled':
@@ -493,13 +510,17 @@ def main():
             module.exit_json(
                 changed=False,
                 msg='Policy already enabled with requested scope',
+                **broker_result(conn),
             )
+        statements = []
         if enabled_rows:
-            disable_policy(conn, module)
-        enable_policy(conn, module)
+            statements.append(disable_policy_sql(module))
+        statements.append(enable_policy_sql(module))
+        conn.execute_ddls(statements)
         module.exit_json(
             changed=conn.changed, ddls=conn.ddls,
             msg='Audit policy enabled',
+            **broker_result(conn),
         )
 
     elif state == 'disabled':
@@ -509,11 +530,12 @@ def main():
                 changed=False,
             )
         if not policy_is_enabled(conn, policy_name):
-            module.exit_json(changed=False, msg='Policy already disabled')
+            module.exit_json(changed=False, msg='Policy already disabled', **broker_result(conn))
         disable_policy(conn, module)
         module.exit_json(
             changed=conn.changed, ddls=conn.ddls,
             msg='Audit policy disabled',
+            **broker_result(conn),
         )
 
 
@@ -530,7 +552,7 @@ from ansible.module_utils.basic import AnsibleModule
 # In this case we do import from collections
 try:
     from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import (  # noqa: E501
-        oracleConnection,
+        oracleConnection, broker_result,
         sanitize_string_params,
         sql_single_quoted_literal,
     )
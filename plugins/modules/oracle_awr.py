@@ -182,7 +182,7 @@ def main():
     result = query_existing(conn)
     snap_interval = int(result['snap_interval'].total_seconds() // 60)
     retention = int(result['retention'].total_seconds() // 60 // 60 // 24)
-    module.exit_json(msg=msg,  changed=conn.changed, ddls=conn.ddls, retention=retention, snap_interval=snap_interval)
+    module.exit_json(msg=msg,  changed=conn.changed, ddls=conn.ddls, retention=retention, snap_interval=snap_interval, **broker_result(conn))
 
 
 from ansible.module_utils.basic import *
@@ -197,7 +197,7 @@ from ansible.module_utils.basic import *
 
 # In thise we do import from collections
 try:
-    from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import oracleConnection, sanitize_string_params
+    from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import oracleConnection, broker_result, sanitize_string_params
 except ImportError:
     sanitize_string_params = lambda p: None
 
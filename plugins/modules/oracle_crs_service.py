@@ -192,6 +192,11 @@ try:
 except ImportError:
     pass
 
+try:
+    from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_crs import crs_resources, srvctl_running, run_change_command
+except ImportError:
+    pass
+
 
 class oracle_crs_service:
     def __init__(self, module, ohomes):
@@ -212,7 +217,7 @@ class oracle_crs_service:
         self.changed = True
         if self.module.check_mode:
             return 0, '', ''
-        (rc, stdout, stderr) = self.module.run_command(command)
+        (rc, stdout, stderr) = run_change_command(self.module, command)
         if rc or stderr:
             self.module.fail_json(msg='srvctl failed({}): {} {}'.format(rc, stdout, stderr)
                                   , commands=self.commands
@@ -227,54 +232,8 @@ class oracle_crs_service:
             return None
 
     def get_crs_config(self, resource_type):
-        if resource_type == 'asm':
-            dfilter = '(TYPE = ora.asm.type)'
-        elif resource_type == 'db':
-            dfilter = '(TYPE = ora.database.type)'
-        elif resource_type == 'listener':
-            dfilter = '(TYPE = ora.listener.type)'
-        elif resource_type == 'service':
-            dfilter = '(TYPE = ora.service.type)'
-        else:
-            self.module.fail_json(msg='Unknown resource type: {}'.format(resource_type)
-                                  , commands=self.commands
-                                  , changed=self.changed)
-
-        command = [self.ohomes.crsctl, 'stat', 'res', '-p', '-w', dfilter]
-        (rc, stdout, stderr) = self.module.run_command(command)
-
-        if rc or stderr:
-            self.module.fail_json(msg='Failed command: crsctl stat res -p, {}'.format(stderr)
-                                  , commands=self.commands
-                                  , changed=self.changed)
-
-        name = None
-        retval = dict()
-        resource = dict()
-        for line in stdout.splitlines():
-            try:
-                (key, value) = line.split('=', 1)
-                if value:
-                    resource.update({key: value})
-                if key == 'NAME':
-                    if value.endswith('.svc'):
-                        db = value[len('ora.'):].split('.')[0].lower()
-                        sc = value[len('ora.'):].split('.')[1].lower()
-                        name = '{}.{}'.format(db, sc)
-                    elif value.startswith('ora.'):
-                        name = value[len('ora.'):].split('.')[0].lower()
-                    else:
-                        name = value.split('.')[0].lower()
-            except ValueError as e:
-                retval[name] = resource
-                resource = dict()
-        if resource_type == 'service':
-            db = self.module.params['db'].lower()
-            sc = self.resource_name.lower()
-            self.curent_resource = retval.get('{}.{}'.format(db, sc), dict())
-        else:
-            self.curent_resource = retval.get(self.resource_name.lower(), dict())
-
+        self.crs = crs_resources(self.module, self.ohomes.crsctl, commands=self.commands, changed=self.changed)
+        self.curent_resource = self.crs.config(resource_type, '{}.{}'.format(self.module.params['db'], self.resource_name))
 
     def get_service_config(self, module):
         command = [self.srvctl
@@ -420,14 +379,11 @@ class oracle_crs_service:
             srvctl = [self.srvctl, 'disable', 'service', '-s', self.resource_name, '-d', database_name]
             (rc, stdout, stderr) = self.run_change_command(srvctl)
 
-        srvctl = [self.srvctl, 'status', 'service', '-s', self.resource_name, '-d', database_name]
-        (rc, stdout, stderr) = self.module.run_command(srvctl)
-        running = None
-        for line in stdout.splitlines():
-            if 'is not running' in line:
-                running = False
-            if 'is running' in line:
-                running = True
+        running = self.crs.running('service', '{}.{}'.format(database_name, self.resource_name))
+        if running is None:
+            srvctl = [self.srvctl, 'status', 'service', '-s', self.resource_name, '-d', database_name]
+            (rc, stdout, stderr) = self.module.run_command(srvctl)
+            running = srvctl_running(stdout)
 
         if running is None and not self.module.check_mode:
             self.module.fail_json("Could not check if {} is running".format(self.resource_name)
@@ -1249,10 +1249,11 @@ def _run_sql_mode(module):
             dataguard_stats=sql_get_dataguard_stats(conn),
             archive_dest_status=sql_get_archive_dest_status(conn),
             dataguard_processes=sql_get_dataguard_processes(conn),
+            **broker_result(conn),
         )
 
     if module.check_mode:
-        module.exit_json(changed=False, msg='Check mode: no SQL operations executed')
+        module.exit_json(changed=False, msg='Check mode: no SQL operations executed', **broker_result(conn))
 
     apply_state = module.params["apply_state"]
     if apply_state == 'started':
@@ -1272,6 +1273,7 @@ def _run_sql_mode(module):
         ddls=conn.ddls,
         database=sql_get_database_info(conn),
         msg='Data Guard SQL operations completed',
+        **broker_result(conn),
     )
 
 
@@ -1288,7 +1290,7 @@ from ansible.module_utils.basic import *  # noqa: F403
 # In this case we do import from collections
 try:
     from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import (  # noqa: E501
-        oracleConnection, sanitize_string_params,
+        oracleConnection, broker_result, sanitize_string_params,
     )
 except ImportError:
     oracleConnection = None
@@ -753,7 +753,7 @@ def ensure_db_state(module, ohomes, newdb):
 
         msg = 'Database %s has been put in the intended state - Archivelog: %s, Force Logging: %s, Flashback: %s, Supplemental Logging: %s, Timezone: %s' %\
                 (db_name, archivelog, force_logging, flashback, supplemental_logging, timezone)
-        module.exit_json(msg=msg, changed=True, ddls=return_ddls)
+        module.exit_json(msg=msg, changed=True, ddls=return_ddls, **broker_result(conn))
     else:
         if newdb:
             if archcomp:
@@ -763,7 +763,7 @@ def ensure_db_state(module, ohomes, newdb):
         else:
             msg = 'Database %s already exists and is in the intended state - Archivelog: %s, Force Logging: %s, Flashback: %s, Supplemental Logging: %s, Timezone: %s' %\
                     (db_name, archivelog, force_logging, flashback, supplemental_logging, timezone)
-        module.exit_json(msg=msg, changed=newdb)
+        module.exit_json(msg=msg, changed=newdb, **broker_result(conn))
 
 
 def apply_restart_changes(module, ohomes, instance_name, change_restart_sql):
@@ -1039,7 +1039,7 @@ from ansible.module_utils.basic import *
 
 # In these we do import from collections
 try:
-    from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import oracleConnection, sanitize_string_params
+    from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import oracleConnection, broker_result, sanitize_string_params
     from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_homes import OracleHomes
 except ImportError:
     sanitize_string_params = lambda p: None
@@ -212,11 +212,11 @@ def main():
 
     if state == 'status':
         rows = get_dblink(conn, link_name, link_type)
-        module.exit_json(changed=False, exists=bool(rows), dblink=rows)
+        module.exit_json(changed=False, exists=bool(rows), dblink=rows, **broker_result(conn))
 
     elif state == 'present':
         if dblink_exists(conn, link_name, link_type):
-            module.exit_json(changed=False, msg='Database link already exists')
+            module.exit_json(changed=False, msg='Database link already exists', **broker_result(conn))
         if not module.params["connect_using"]:
             module.fail_json(msg='connect_using is required for state=present', changed=False)
 
@@ -245,22 +245,24 @@ def main():
                 changed=True,
                 ddls=['--' + sql],
                 msg='Database link would be created (check mode)',
+                **broker_result(conn),
             )
         create_dblink(conn, module)
-        module.exit_json(changed=conn.changed, ddls=conn.ddls, msg='Database link created')
+        module.exit_json(changed=conn.changed, ddls=conn.ddls, msg='Database link created', **broker_result(conn))
 
     elif state == 'absent':
         if not dblink_exists(conn, link_name, link_type):
-            module.exit_json(changed=False, msg='Database link does not exist')
+            module.exit_json(changed=False, msg='Database link does not exist', **broker_result(conn))
         if module.check_mode:
             sql = build_drop_dblink_sql(module)
             module.exit_json(
                 changed=True,
                 ddls=['--' + sql],
                 msg='Database link would be dropped (check mode)',
+                **broker_result(conn),
             )
         drop_dblink(conn, module)
-        module.exit_json(changed=conn.changed, ddls=conn.ddls, msg='Database link dropped')
+        module.exit_json(changed=conn.changed, ddls=conn.ddls, msg='Database link dropped', **broker_result(conn))
 
 
 from ansible.module_utils.basic import *  # noqa: F403
@@ -276,7 +278,7 @@ from ansible.module_utils.basic import *  # noqa: F403
 # In this case we do import from collections
 try:
     from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import (  # noqa: E501
-        oracleConnection,
+        oracleConnection, broker_result,
         sanitize_string_params,
         sql_single_quoted_literal,
     )
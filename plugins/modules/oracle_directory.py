@@ -116,7 +116,7 @@ def main():
             drop_directory(oc, module)
         else:
             msg = "Directory %s doesn't exist" % directory_name
-            module.exit_json(msg=msg, changed=False)
+            module.exit_json(msg=msg, changed=False, **broker_result(oc))
 
     module.fail_json(msg='Unhandled exit', changed=False)
 
@@ -133,7 +133,7 @@ from ansible.module_utils.basic import *
 
 # In these we do import from collections
 try:
-    from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import oracleConnection, sanitize_string_params
+    from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import oracleConnection, broker_result, sanitize_string_params
 except ImportError:
     sanitize_string_params = lambda p: None
 
@@ -7,6 +7,7 @@ module: oracle_facts
 short_description: Returns some facts about Oracle DB
 description:
   - Returns some facts about Oracle DB
+  - All requested sections are queried by one round-trip to the database, seconds spent per section are returned in C(timing)
   - See connection parameters for oracle_ping
 version_added: "3.0.0"
 options:
@@ -103,6 +104,11 @@ EXAMPLES = '''
 '''
 
 import os
+import time
+
+
+# Rows fetched per round-trip for queries returning many rows (parameters, tablespaces)
+FETCH_ARRAYSIZE = 500
 
 
 def detect_paths(module, conn):
@@ -168,88 +174,73 @@ def detect_paths(module, conn):
     return {'password_file': PASSWORD, 'spfile': SPFILE, "pfile": PFILE, "crs_home": h.crs_home}
 
 
-def query_database(module, conn):
-    SQL = "select * from V$DATABASE"
-    database = conn.execute_select_to_dict(SQL, fetchone=True)
-    if 'CDB' not in database:
-        database.update({'CDB': 'NO'})
-    return database
-
-
-def query_patch_level(module, conn, instance):
-    version = instance['version']
+def patch_level_sql(version):
+    """Return query of the registry for the patch level of database version or None"""
     if version.startswith('11'):
-        SQL = """ SELECT nvl(max(ID) KEEP (DENSE_RANK LAST ORDER BY ACTION_TIME),0) as bundle
+        return """ SELECT nvl(max(ID) KEEP (DENSE_RANK LAST ORDER BY ACTION_TIME),0) as bundle
             FROM sys.registry$history where BUNDLE_SERIES='PSU' """
-        bundle = conn.execute_select_to_dict(SQL, fetchone=True)
-        if bundle and bundle['bundle']:
-            version = version.rstrip('0') + str(bundle['bundle'])
     if version.startswith('12'):
-       SQL = """ select MIN(BUNDLE_ID) KEEP (DENSE_RANK LAST ORDER BY ACTION_TIME) BUNDLE_ID
+        return """ select MIN(BUNDLE_ID) KEEP (DENSE_RANK LAST ORDER BY ACTION_TIME) BUNDLE_ID
             from dba_registry_sqlpatch where status = 'SUCCESS' """
-       bundle = conn.execute_select_to_dict(SQL, fetchone=True)
-       if bundle and bundle['bundle_id']:
-           version = version.rstrip('0') + str(bundle['bundle_id'])
-    elif int(version[0:2]) >= 18:
-        SQL = """ SELECT distinct REGEXP_SUBSTR(description, '[0-9]{2}.[0-9]{1,2}.[0-9].[0-9].[0-9]{6}') as VER
+    if int(version[0:2]) >= 18:
+        return """ SELECT distinct REGEXP_SUBSTR(description, '[0-9]{2}.[0-9]{1,2}.[0-9].[0-9].[0-9]{6}') as VER
             from dba_registry_sqlpatch
             where TARGET_VERSION in
             (SELECT max(TARGET_VERSION) KEEP (DENSE_RANK LAST ORDER BY ACTION_TIME) as VER
             FROM dba_registry_sqlpatch where status='SUCCESS' and FLAGS not like '%J%') and ACTION = 'APPLY' """
-        bundle = conn.execute_select_to_dict(SQL, fetchone=True)
-        if bundle and bundle['ver']:
-            version = str(bundle['ver'])
-
-    return version
+    return None
 
 
-def query_instance(module, conn):
-    SQL = "select * from V$INSTANCE"
-    instance = conn.execute_select_to_dict(SQL, fetchone=True)
-    return instance
+def patch_level(instance, bundle):
+    """Combine v$instance version with the row returned by patch_level_sql()"""
+    version = instance['version']
+    if not bundle:
+        return version
+    if version.startswith('11') and bundle.get('bundle'):
+        version = version.rstrip('0') + str(bundle['bundle'])
+    if version.startswith('12'):
+        if bundle.get('bundle_id'):
+            version = version.rstrip('0') + str(bundle['bundle_id'])
+    elif int(version[0:2]) >= 18 and bundle.get('ver'):
+        version = str(bundle['ver'])
+    return version
 
 
-def query_tablespaces(module, conn):
+def tablespaces_sql(conn):
     if conn.version >= '12.1':
-        SQL = """
+        return """
         select ts.con_id, ts.name, ts.bigfile, round(sum(bytes)/1024/1024) size_mb, count(*) datafiles#
         from v$tablespace ts
         join v$datafile df on df.ts#=ts.ts# and df.con_id=ts.con_id
         group by ts.name, ts.bigfile, ts.con_id 
         order by 1,2"""
     else:
-        SQL = """
+        return """
         select 0 con_id, ts.name, ts.bigfile, round(sum(bytes)/1024/1024) size_mb, count(*) datafiles#
         from v$tablespace ts 
         join v$datafile df on df.ts#=ts.ts# 
         group by ts.name, ts.bigfile 
         order by 1,2"""
 
-    tablespaces = conn.execute_select_to_dict(SQL)
-    return tablespaces
-
 
-def query_temp(module, conn):
+def temp_sql(conn):
     if conn.version >= '12.1':
-        SQL = """
+        return """
         select ts.con_id, ts.name, ts.bigfile, round(sum(bytes)/1024/1024) size_mb, count(*) tempfiles# 
         from v$tablespace ts 
         join v$tempfile df on df.ts#=ts.ts# and df.con_id=ts.con_id 
         group by ts.name, ts.bigfile, ts.con_id 
         order by 1,2"""
     else:
-        SQL = """
+        return """
         select 0 con_id, ts.name, ts.bigfile, round(sum(bytes)/1024/1024) size_mb, count(*) tempfiles# 
         from v$tablespace ts 
         join v$tempfile df on df.ts#=ts.ts# 
         group by ts.name, ts.bigfile 
         order by 1,2"""
 
-    temp = conn.execute_select_to_dict(SQL)
-    return temp
-
 
-def query_userenv(module, conn):
+def userenv_sql(conn):
     # USERENV
     sql = """
     SELECT sys_context('USERENV','CURRENT_USER') current_user
@@ -262,37 +253,32 @@ def query_userenv(module, conn):
         sql += ", to_number(sys_context('USERENV','CURRENT_EDITION_ID')) CURRENT_EDITION_ID " \
                ", sys_context('USERENV','CURRENT_EDITION_NAME') CURRENT_EDITION_NAME "
     sql += " FROM DUAL"
-    userenv = conn.execute_select_to_dict(sql, fetchone=True)
-    return userenv
+    return sql
 
 
-def query_redo(module, conn):
+def redo_sql(module):
     if module.params['redo'].lower() == 'summary':
-        SQL = """
+        return """
         select thread# THREAD, count(1) as COUNT, max(round(bytes/1024/1024)) as SIZE_MB
         , min(group#) min_seq, max(group#) max_seq
         from v$log group by THREAD#"""
     else:
-        SQL = """
+        return """
         select group# as GROUP, thread# as THREAD, sequence#, round(bytes/1024/1024) mb, blocksize, archived, status
         from v$log order by thread#,group#"""
-    redolog = conn.execute_select_to_dict(SQL)
-    return redolog
 
 
-def query_standby(module, conn):
+def standby_sql(module):
     if module.params['standby'].lower() == 'summary':
-        SQL = "select thread# THREAD, count(1) as COUNT, max(round(bytes/1024/1024)) as SIZE_MB" \
-              ", min(group#) min_seq, max(group#) max_seq " \
-              "from v$standby_log group by THREAD#"
+        return "select thread# THREAD, count(1) as COUNT, max(round(bytes/1024/1024)) as SIZE_MB" \
+               ", min(group#) min_seq, max(group#) max_seq " \
+               "from v$standby_log group by THREAD#"
     else:
-        SQL = "select group#, thread#, sequence#, round(bytes/1024/1024) mb, blocksize, archived, status " \
-              "from v$standby_log order by thread#,group#"
-    redolog = conn.execute_select_to_dict(SQL)
-    return redolog
+        return "select group#, thread#, sequence#, round(bytes/1024/1024) mb, blocksize, archived, status " \
+               "from v$standby_log order by thread#,group#"
 
 
-def query_params(module, conn):
+def params_sql(module):
     params = module.params['parameter']
     if isinstance(params, list):
         p = ','.join(["'{}'".format(p.lower()) for p in params])
@@ -305,12 +291,64 @@ def query_params(module, conn):
         filter = " WHERE NAME = '{}'".format(params.lower())
     else:
         filter = ''
-    SQL = 'select name, value, isdefault from v$parameter ' + filter
-    resultset = conn.execute_select_to_dict(SQL)
-    result = {}
-    for p in resultset:
-        result[p['name']] = {'isdefault': p['isdefault'], 'value': p['value']}
-    return result
+    return 'select name, value, isdefault from v$parameter ' + filter
+
+
+def fact_queries(module, conn):
+    """List of (section, sql, fetchone) for all requested sections, in the order they used to be queried"""
+    queries = [
+        ('instance', "select * from V$INSTANCE", True),
+        ('database', "select * from V$DATABASE", True),
+    ]
+    if module.params["patch_level"] and patch_level_sql(conn.version):
+        queries.append(('patch_level', patch_level_sql(conn.version), True))
+    if module.params["tablespaces"]:
+        queries.append(('tablespaces', tablespaces_sql(conn), False))
+    if module.params["temp"]:
+        queries.append(('temp', temp_sql(conn), False))
+    if module.params['userenv']:
+        queries.append(('userenv', userenv_sql(conn), True))
+    if module.params['redo']:
+        queries.append(('redo', redo_sql(module), False))
+    if module.params['standby']:
+        queries.append(('standby', standby_sql(module), False))
+    if module.params['parameter']:
+        queries.append(('parameter', params_sql(module), False))
+    queries.append(('rac', "SELECT inst_id, instance_name, host_name, startup_time FROM gv$instance ORDER BY inst_id", False))
+    if conn.version >= '12.1':
+        queries.append(('pdb', "SELECT con_id, rawtohex(guid) guid_hex, name, open_mode FROM v$pdbs ORDER BY name", False))
+    return queries
+
+
+def collect_facts(module, conn):
+    """Query all requested sections in one round-trip, return (facts, timing)"""
+    start = time.time()
+    sections, timing = conn.execute_select_multi(fact_queries(module, conn), arraysize=FETCH_ARRAYSIZE)
+    timing['total'] = round(time.time() - start, 3)
+
+    instance = sections['instance']
+    database = sections['database']
+    if instance is None or database is None:
+        module.fail_json(msg="Could not query v$instance/v$database", changed=False)
+    if 'CDB' not in database:
+        database.update({'CDB': 'NO'})
+
+    facts = {}
+    if module.params["instance"]:
+        facts['instance'] = instance
+    if module.params["database"]:
+        facts['database'] = database
+    if module.params["patch_level"]:
+        facts['patch_level'] = patch_level(instance, sections.get('patch_level'))
+    for section in ('tablespaces', 'temp', 'userenv', 'redo', 'standby'):
+        if section in sections:
+            facts[section] = sections[section]
+    if 'parameter' in sections:
+        facts['parameter'] = dict((p['name'], {'isdefault': p['isdefault'], 'value': p['value']})
+                                  for p in sections['parameter'] or [])
+    facts['rac'] = sections['rac'] or []
+    facts['pdb'] = (sections.get('pdb') or []) if database['CDB'] == 'YES' else []
+    return facts, timing
 
 
 def main():
@@ -388,54 +426,10 @@ def main():
         paths = detect_paths(module, conn)
         db.update(paths)
 
-    instance = query_instance(module, conn)
-    if module.params["instance"]:
-        db.update({'instance': instance})
-
-    database = query_database(module, conn)
-    if module.params["database"]:
-        db.update({'database': database})
-
-    if module.params["patch_level"]:
-        patch_level = query_patch_level(module, conn, instance)
-        db.update({'patch_level': patch_level})
-
-    if module.params["tablespaces"]:
-        tablespaces = query_tablespaces(module, conn)
-        db.update({'tablespaces': tablespaces})
-
-    if module.params["temp"]:
-        temp = query_temp(module, conn)
-        db.update({'temp': temp})
-
-    if module.params['userenv']:
-        userenv = query_userenv(module, conn)
-        db.update({'userenv': userenv})
-
-    if module.params['redo']:
-        redo = query_redo(module, conn)
-        db.update({'redo': redo})
-
-    if module.params['standby']:
-        standby = query_standby(module, conn)
-        db.update({'standby': standby})
-
-    if module.params['parameter']:
-        parameters = query_params(module, conn)
-        db.update({'parameter': parameters})
-
-    rac = conn.execute_select_to_dict("SELECT inst_id, instance_name, host_name, startup_time FROM gv$instance ORDER BY inst_id")
-
-    try:
-        if database['CDB'] == 'YES':
-            pdb = conn.execute_select_to_dict("SELECT con_id, rawtohex(guid) guid_hex, name, open_mode FROM v$pdbs ORDER BY name")
-        else:
-            pdb = []
-    except Exception:
-        pdb = []
-
-    db.update({'rac': rac, 'pdb': pdb})
-    module.exit_json(msg="Database parameters queried. Check ansible_facts['{}']".format(sid), changed=False, ansible_facts=facts)
+    collected, timing = collect_facts(module, conn)
+    db.update(collected)
+    module.exit_json(msg="Database parameters queried. Check ansible_facts['{}']".format(sid), changed=False, ansible_facts=facts,
+                     timing=timing, **broker_result(conn))
 
 
 from ansible.module_utils.basic import *
@@ -450,7 +444,7 @@ from ansible.module_utils.basic import *
 #    pass
 
 try:
-    from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import oracleConnection, sanitize_string_params
+    from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import oracleConnection, broker_result, sanitize_string_params
     from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_homes import OracleHomes
 except ImportError:
     sanitize_string_params = lambda p: None
@@ -155,24 +155,27 @@ def main():
             changed=False,
             exists=bool(rows),
             restore_point=rows,
+            **broker_result(conn),
         )
 
     elif state == 'present':
         if restore_point_exists(conn, name):
-            module.exit_json(changed=False, msg='Restore point already exists')
+            module.exit_json(changed=False, msg='Restore point already exists', **broker_result(conn))
         create_restore_point(conn, module)
         module.exit_json(
             changed=conn.changed, ddls=conn.ddls,
             msg='Restore point created',
+            **broker_result(conn),
         )
 
     elif state == 'absent':
         if not restore_point_exists(conn, name):
-            module.exit_json(changed=False, msg='Restore point does not exist')
+            module.exit_json(changed=False, msg='Restore point does not exist', **broker_result(conn))
         drop_restore_point(conn, module)
         module.exit_json(
             changed=conn.changed, ddls=conn.ddls,
             msg='Restore point dropped',
+            **broker_result(conn),
         )
 
 
@@ -189,7 +192,7 @@ from ansible.module_utils.basic import *  # noqa: F403
 # In this case we do import from collections
 try:
     from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import (  # noqa: E501
-        oracleConnection, sanitize_string_params,
+        oracleConnection, broker_result, sanitize_string_params,
     )
 except ImportError:
     def sanitize_string_params(_params):
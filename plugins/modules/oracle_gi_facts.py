@@ -35,6 +35,7 @@ EXAMPLES = '''
 import socket
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from subprocess import check_output, CalledProcessError, TimeoutExpired
 
 
@@ -53,6 +54,19 @@ def exec_program(arguments):
     return exec_program_lines(arguments)[0]
 
 
+# srvctl/crsctl/cemutlo processes started at once, each srvctl start is a JVM start
+GI_PROBE_WORKERS = 8
+
+
+def run_parallel(tasks):
+    """ run independent probes (dict name => callable) concurrently, return dict name => result """
+    if len(tasks) < 2:
+        return dict((name, func()) for name, func in tasks.items())
+    with ThreadPoolExecutor(max_workers=min(GI_PROBE_WORKERS, len(tasks))) as pool:
+        futures = dict((name, pool.submit(func)) for name, func in tasks.items())
+        return dict((name, f.result()) for name, f in futures.items())
+
+
 def hostname_to_fqdn(hostname):
     if "." not in hostname:
         return socket.getfqdn(hostname)
@@ -71,21 +85,36 @@ class OracleGiFacts:
         self.cemutlo = os.path.join(ohomes.crs_home, 'bin', 'cemutlo')
         self.shorthostname = socket.gethostname().split('.', 1)[0]
 
-    def local_listener(self):
+    def listener_names(self):
         args = [self.srvctl, 'status', 'listener']
         if self.ohomes.oracle_crs:
             args += ['-n', self.shorthostname]
         listeners_out = exec_program_lines(args)
         re_listener_name = re.compile('Listener (.+) is enabled')
         listeners = []
-        out = []
         for line in listeners_out:
             if "is enabled" in line:
                 m = re_listener_name.search(line)
                 listeners.append(m.group(1))
+        return listeners
+
+    def listener_config_tasks(self, listeners):
+        return dict((('listener', l), lambda l=l: exec_program_lines([self.srvctl, 'config', 'listener', '-l', l]))
+                    for l in listeners)
+
+    def scan_listener_config_tasks(self):
+        return dict((('scan_listener', n), lambda n=n: exec_program_lines([self.srvctl, 'config', 'scan_listener', '-k', n]))
+                    for n in self.networks.keys())
+
+    def local_listener(self, listeners=None, outputs=None):
+        if listeners is None:
+            listeners = self.listener_names()
+        tasks = self.listener_config_tasks(listeners)
+        configs = outputs if outputs is not None else run_parallel(tasks)
+        out = []
         for l in listeners:
             config = {}
-            output = exec_program_lines([self.srvctl, 'config', 'listener', '-l', l])
+            output = configs[('listener', l)]
             for line in output:
                 if line.startswith('Name:'):
                     config['name'] = line[6:]
@@ -105,10 +134,11 @@ class OracleGiFacts:
             out.append(config)
         return out
 
-    def scan_listener(self):
+    def scan_listener(self, outputs=None):
         out = dict()
+        configs = outputs if outputs is not None else run_parallel(self.scan_listener_config_tasks())
         for n in self.networks.keys():
-            output = exec_program_lines([self.srvctl, 'config', 'scan_listener', '-k', n])
+            output = configs[('scan_listener', n)]
             for line in output:
                 endpoints = None
                 # 19c
@@ -244,40 +274,61 @@ def main():
     os.environ['ORACLE_HOME'] = ohomes.crs_home
     oracle_gi_facts = OracleGiFacts(module, ohomes)
 
+    # All probes which do not depend on each other are started at once
+    tasks = {
+        'clustername': lambda: exec_program([oracle_gi_facts.cemutlo, '-n']),
+        'asm': oracle_gi_facts.get_asm,
+        'vip': oracle_gi_facts.get_vips,
+        'network': oracle_gi_facts.get_networks,
+        'scan': oracle_gi_facts.get_scans,
+        'listeners': oracle_gi_facts.listener_names,
+        'database_list': lambda: exec_program_lines([oracle_gi_facts.srvctl, 'config', 'database']),
+    }
+    # Cluster version
+    if ohomes.oracle_crs:
+        tasks['activeversion'] = lambda: exec_program([ohomes.crsctl, 'query', 'crs', 'activeversion'])
+        has_versions = []
+    else:
+        has_versions = ['releaseversion', 'releasepatch', 'softwareversion', 'softwarepatch']
+        for i in has_versions:
+            tasks[i] = lambda i=i: exec_program([ohomes.crsctl, 'query', 'has', i])
+    results = run_parallel(tasks)
+
     # Cluster name
-    facts.update({'clustername': exec_program([oracle_gi_facts.cemutlo, '-n'])})
+    facts.update({'clustername': results['clustername']})
 
     # Cluster version
     if ohomes.oracle_crs:
-        version = exec_program([ohomes.crsctl, 'query', 'crs', 'activeversion'])
-        facts.update({'activeversion': version})
-    else:
-        for i in ['releaseversion', 'releasepatch', 'softwareversion', 'softwarepatch']:
-            version = exec_program([ohomes.crsctl, 'query', 'has', i])
-            m = re.search(r'\[([0-9.]+)\]$', version)
-            if m:
-                facts.update({i: m.group(1)})
-                facts.update({"version": m.group(1)})  # for backward compatibility
-            else:
-                facts.update({i: version})
+        facts.update({'activeversion': results['activeversion']})
+    for i in has_versions:
+        version = results[i]
+        m = re.search(r'\[([0-9.]+)\]$', version)
+        if m:
+            facts.update({i: m.group(1)})
+            facts.update({"version": m.group(1)})  # for backward compatibility
+        else:
+            facts.update({i: version})
 
     # ASM
-    asm = oracle_gi_facts.get_asm()
-    facts.update({'asm': asm})
+    facts.update({'asm': results['asm']})
     # VIPS
-    oracle_gi_facts.vips = oracle_gi_facts.get_vips()
+    oracle_gi_facts.vips = results['vip']
     facts.update({'vip': list(oracle_gi_facts.vips.values())})
     # Networks
-    oracle_gi_facts.networks = oracle_gi_facts.get_networks()
+    oracle_gi_facts.networks = results['network']
     facts.update({'network': list(oracle_gi_facts.networks.values())})
     # SCANs
-    oracle_gi_facts.scans = oracle_gi_facts.get_scans()
+    oracle_gi_facts.scans = results['scan']
     facts.update({'scan': list(oracle_gi_facts.scans.values())})
-    # Listener
-    facts.update({'local_listener': oracle_gi_facts.local_listener()})
-    facts.update({'scan_listener': list(oracle_gi_facts.scan_listener().values()) if ohomes.oracle_crs else []})
+    # Listener, configs of local and scan listeners depend on the results above and are fetched at once
+    tasks = oracle_gi_facts.listener_config_tasks(results['listeners'])
+    if ohomes.oracle_crs:
+        tasks.update(oracle_gi_facts.scan_listener_config_tasks())
+    outputs = run_parallel(tasks)
+    facts.update({'local_listener': oracle_gi_facts.local_listener(results['listeners'], outputs)})
+    facts.update({'scan_listener': list(oracle_gi_facts.scan_listener(outputs).values()) if ohomes.oracle_crs else []})
     # Databases
-    facts.update({'database_list': exec_program_lines([oracle_gi_facts.srvctl, 'config', 'database'])})
+    facts.update({'database_list': results['database_list']})
     # ORACLE_CRS_HOME
     facts.update({'oracle_crs_home': os.environ['ORACLE_HOME']})
     # Output
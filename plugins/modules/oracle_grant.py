@@ -33,6 +33,9 @@ options:
       - "e.g."
       - "select,update,insert,delete:sys.dba_tablespaces"
       - "select:sys.v_$session"
+      - Object names without owner are resolved like in SQL (own objects, private and public synonyms),
+        all of them by one query
+      - Privileges of the same object are coalesced into one GRANT and one REVOKE statement
     required: false
     default: null
     type: list
@@ -140,17 +143,14 @@ EXAMPLES = '''
 '''
 
 
-def get_dir_privs(conn, schema, directory_privs, grant_mode):
-    total_sql_dir = []
-    grant_list_dir = []
-    revoke_list_dir = []
+import time
+
 
+def get_dir_privs(conn, schema, directory_privs, grant_mode):
     # Directory Privs
-    wanted_dirprivs_list = directory_privs
-    w_object_name_l = [w.split(':')[1].lower() for w in wanted_dirprivs_list]
-    w_object_priv_l = [w.split(':')[0].lower() for w in wanted_dirprivs_list]
-    w_object_priv_l = [set(w.split(',')) for w in w_object_priv_l]
-    wanted_privs_d = dict(zip(w_object_name_l, w_object_priv_l))
+    wanted_privs_d = dict()
+    for w in directory_privs:
+        wanted_privs_d.setdefault(w.split(':')[1].lower(), set()).update(w.split(':')[0].lower().split(','))
 
     currdsql_all = """
     select listagg(p.privilege, ',') within group (order by p.privilege), p.table_name
@@ -163,67 +163,63 @@ def get_dir_privs(conn, schema, directory_privs, grant_mode):
     """
     result = conn.execute_select(currdsql_all, params={'grantee': schema}, fetchone=False)
 
-    c_dir_name_l = [o[1].lower() for o in result]
-    c_dir_priv_l = [o[0].lower() for o in result]
-    c_dir_priv_l = [set(o[0].lower().split(',')) for o in result]
-    current_dir_privs_d = dict(zip(c_dir_name_l, c_dir_priv_l))
-
-    remove_completely_dir = set(c_dir_name_l).difference(w_object_name_l)
-    for remove in remove_completely_dir:
-        rdsql = 'revoke all on directory %s from %s' % (remove, schema)
-        revoke_list_dir.append(rdsql)
-
-    newstuff = set(w_object_name_l).difference(c_dir_name_l)
-    if newstuff:
-        for directory in newstuff:
-            grants = wanted_privs_d[directory]
-            nsql = "grant %s on directory %s to %s" % (','.join(grants), directory, schema)
-            grant_list_dir.append(nsql)
-
-    changedstuff = set(w_object_name_l).intersection(c_dir_name_l)
-    for directory in changedstuff:
-        wanted_grants = wanted_privs_d[directory]
-        current_grants = current_dir_privs_d[directory]
-        new_grants = wanted_grants.difference(current_grants)
-        old_grants = current_grants.difference(wanted_grants)
-        if new_grants:
-            adsql = "grant %s on directory %s to %s" % (','.join(new_grants), directory, schema)
-            grant_list_dir.append(adsql)
-        if old_grants:
-            rdsql = "revoke %s on directory %s from %s" % (','.join(old_grants), directory, schema)
-            revoke_list_dir.append(rdsql)
-
-    if grant_mode.lower() == 'exact':
-        total_sql_dir.extend(revoke_list_dir)
+    current_dir_privs_d = dict((o[1].lower(), set(o[0].lower().split(','))) for o in result)
 
-    total_sql_dir.extend(grant_list_dir)
+    return plan_obj_privs(schema, wanted_privs_d, current_dir_privs_d, grant_mode, on='directory ')
 
-    return total_sql_dir
 
+def parse_obj_privs(conn, wanted_privs_list):
+    """Return dictionary owner.object -> set of wanted privileges.
 
-def get_obj_privs(conn, schema, wanted_privs_list, grant_mode):
-    total_sql_obj = []
-    grant_list = []
-    revoke_list = []
-
-    # OBJECT PRIVS
-    w_object_name_l = [] # wanted object names in privilege list
-    w_object_priv_l = [] # wanted privileges in privilege list
+    Unqualified object names are resolved by one query for all of them, privileges
+    listed for the same object several times are merged.
+    """
+    wanted = []
     for priv in wanted_privs_list:
         object_name = priv.split(':')[1].lower().strip()
         object_priv = priv.split(':')[0].lower().strip()
-        object_priv = set(object_priv.split(','))
+        wanted.append((object_name, set(p.strip() for p in object_priv.split(','))))
+
+    resolved = conn.resolve_object_names([o for (o, _) in wanted if '.' not in o])
+
+    wanted_privs_d = dict()
+    for (object_name, object_priv) in wanted:
         if '.' not in object_name:
-            r = conn.resolve_object_name(object_name).lower()
-            object_name = r if r else object_name
-        w_object_name_l.extend([object_name])
-        w_object_priv_l.extend([object_priv])
+            object_name = resolved.get(object_name.upper(), object_name).lower()
+        wanted_privs_d.setdefault(object_name, set()).update(object_priv)
+    return wanted_privs_d
+
+
+def plan_obj_privs(schema, wanted_privs_d, current_privs_d, grant_mode, on=''):
+    """Compute grant/revoke statements turning current object privileges into wanted ones.
+
+    Every object gets at most one GRANT and one REVOKE, with all its privileges coalesced.
+    """
+    grant_list = []
+    revoke_list = []
+
+    for obj in sorted(set(current_privs_d).difference(wanted_privs_d)):
+        revoke_list.append('revoke all on %s%s from %s' % (on, obj, schema))
+
+    for obj in sorted(wanted_privs_d):
+        wanted_grants = wanted_privs_d[obj]
+        current_grants = current_privs_d.get(obj, set())
+        new_grants = wanted_grants.difference(current_grants)
+        old_grants = current_grants.difference(wanted_grants)
+        if new_grants:
+            grant_list.append("grant %s on %s%s to %s" % (','.join(sorted(new_grants)), on, obj, schema))
+        if old_grants:
+            revoke_list.append("revoke %s on %s%s from %s" % (','.join(sorted(old_grants)), on, obj, schema))
+
+    total_sql_obj = []
+    if grant_mode.lower() == 'exact':
+        total_sql_obj.extend(revoke_list)
+    total_sql_obj.extend(grant_list)
+    return total_sql_obj
 
-    #w_object_name_l = [w.split(':')[1].lower().strip() for w in wanted_privs_list]
-    #w_object_priv_l = [w.split(':')[0].lower().strip() for w in wanted_privs_list]
-    #w_object_priv_l = [set(w.split(',')) for w in w_object_priv_l]
-    wanted_privs_d = dict(zip(w_object_name_l, w_object_priv_l))
 
+def get_current_obj_privs(conn, schema):
+    """Return dictionary owner.object -> set of privileges granted to schema, fetched by one query"""
     currsql_all = """
     select listagg(distinct p.privilege,',') within group (order by p.privilege)
         --, CASE WHEN p.owner = 'SYS' THEN '' ELSE p.OWNER||'.' END || p.table_name
@@ -236,39 +232,23 @@ def get_obj_privs(conn, schema, wanted_privs_list, grant_mode):
     group by p.owner,p.table_name
     """
     result = conn.execute_select(currsql_all, {'schema': schema}, fetchone=False)
-    c_object_name_l = [o[1].lower() for o in result]
-    c_object_priv_l = [set(o[0].lower().split(',')) for o in result]
-    current_privs_d = dict(zip(c_object_name_l, c_object_priv_l))
-
-    remove_completely = set(c_object_name_l).difference(w_object_name_l)
-    for remove in remove_completely:
-        rsql = 'revoke all on %s from %s' % (remove, schema)
-        revoke_list.append(rsql)
-
-    newstuff = set(w_object_name_l).difference(c_object_name_l)
-    for obj in newstuff:
-        grants = wanted_privs_d[obj]
-        nsql = "grant %s on %s to %s" % (','.join(grants), obj, schema)
-        grant_list.append(nsql)
-
-    changedstuff = set(w_object_name_l).intersection(c_object_name_l)
-    for obj in changedstuff:
-        wanted_grants = wanted_privs_d[obj]
-        current_grants = current_privs_d[obj]
-        new_grants = wanted_grants.difference(current_grants)
-        old_grants = current_grants.difference(wanted_grants)
-        if new_grants:
-            asql = "grant %s on %s to %s" % (','.join(new_grants), obj, schema)
-            grant_list.append(asql)
-        if old_grants:
-            rsql = "revoke %s on %s from %s" % (','.join(old_grants), obj, schema)
-            revoke_list.append(rsql)
+    return dict((o[1].lower(), set(o[0].lower().split(','))) for o in result)
 
-    if grant_mode.lower() == 'exact':
-        total_sql_obj.extend(revoke_list)
 
-    total_sql_obj.extend(grant_list)
+def get_obj_privs(conn, schema, wanted_privs_list, grant_mode, timing=None):
+    timing = {} if timing is None else timing
+
+    start = time.time()
+    wanted_privs_d = parse_obj_privs(conn, wanted_privs_list)
+    timing['resolve'] = round(time.time() - start, 3)
 
+    start = time.time()
+    current_privs_d = get_current_obj_privs(conn, schema)
+    timing['current'] = round(time.time() - start, 3)
+
+    start = time.time()
+    total_sql_obj = plan_obj_privs(schema, wanted_privs_d, current_privs_d, grant_mode)
+    timing['plan'] = round(time.time() - start, 3)
     return total_sql_obj
 
 
@@ -310,10 +290,13 @@ def ensure_grant(module, conn, schema, wanted_grant_list, object_privs, director
     # This list will hold all grant the user currently has
     total_sql = []
     total_current = []
+    # Seconds spent in resolving object names, reading current grants, planning and applying changes
+    timing = dict()
 
-    obj_privs = get_obj_privs(conn, schema, object_privs, grant_mode)
+    obj_privs = get_obj_privs(conn, schema, object_privs, grant_mode, timing)
     total_sql.extend(obj_privs)
 
+    start = time.time()
     dir_privs = get_dir_privs(conn, schema, directory_privs, grant_mode)
     total_sql.extend(dir_privs)
 
@@ -326,6 +309,7 @@ def ensure_grant(module, conn, schema, wanted_grant_list, object_privs, director
     # Get the current sys privs for the schema. If any are present, add them to the total
     curr_sys_grant = get_current_sys_grant(conn, schema)
     total_current.extend(curr_sys_grant)
+    timing['current'] += round(time.time() - start, 3)
 
     # Get the difference between current grant and wanted grant
     grant_to_add = set(wanted_grant_list).difference(total_current)
@@ -342,24 +326,26 @@ def ensure_grant(module, conn, schema, wanted_grant_list, object_privs, director
         grant_to_remove = [x for x in grant_to_remove if x not in exceptions_priv]
 
     if grant_mode.lower() == 'exact' and any(grant_to_remove):
-        grant_to_remove = ','.join(grant_to_remove)
+        grant_to_remove = ','.join(sorted(grant_to_remove))
         remove_sql = 'revoke %s from %s' % (grant_to_remove, schema)
         remove_sql += container_clause
         total_sql.append(remove_sql)
 
     if any(grant_to_add):
-        grant_to_add = ','.join(grant_to_add)
+        grant_to_add = ','.join(sorted(grant_to_add))
         add_sql = 'grant %s to %s' % (grant_to_add, schema)
         add_sql += container_clause
         total_sql.append(add_sql)
 
+    start = time.time()
+    conn.execute_ddls(total_sql)
+    timing['apply'] = round(time.time() - start, 3)
+
     if total_sql:
-        for sql in total_sql:
-            conn.execute_ddl(sql)
-        module.exit_json(msg=total_sql, changed=conn.changed, ddls=conn.ddls)
+        module.exit_json(msg=total_sql, changed=conn.changed, ddls=conn.ddls, timing=timing)
     else:
         msg = 'Nothing to do'
-        module.exit_json(msg=msg, changed=conn.changed)
+        module.exit_json(msg=msg, changed=conn.changed, timing=timing)
 
 
 # Remove grant to the schema
@@ -386,12 +372,11 @@ def remove_grant(module, conn, grantee, grants, object_privs, directory_privs, c
         sql = 'revoke %s on directory %s from %s' % (privilege, directory, grantee)
         total_sql.append(sql)
 
-    for sql in total_sql:
-        # Ignore errors:
-        # 01951, 00000,  "ROLE '%s' not granted to '%s'"
-        # 01927, 00000, "cannot REVOKE privileges you did not grant"
-        # 01952, 00000,  "system privileges not granted to '%s'"
-        conn.execute_ddl(sql, ignore_errors=[1927, 1951, 1952])
+    # Ignore errors:
+    # 01951, 00000,  "ROLE '%s' not granted to '%s'"
+    # 01927, 00000, "cannot REVOKE privileges you did not grant"
+    # 01952, 00000,  "system privileges not granted to '%s'"
+    conn.execute_ddls(total_sql, ignore_errors=[1927, 1951, 1952])
 
     msg = 'The grant(s) successfully removed from the schema/role %s' % grantee
     module.exit_json(msg=msg, changed=conn.changed, ddls=conn.ddls)
@@ -182,7 +182,7 @@ def main():
                 )
             )
         )
-        module.exit_json(changed=would_change, msg='Check mode: no change executed')
+        module.exit_json(changed=would_change, msg='Check mode: no change executed', **broker_result(oc))
     #
     #c = conn.cursor()
     result_changed = False
@@ -270,13 +270,13 @@ def main():
         result_changed = True
 
     conn.commit()
-    module.exit_json(msg=", ".join(msg), changed=result_changed)
+    module.exit_json(msg=", ".join(msg), changed=result_changed, **broker_result(oc))
 
 
 from ansible.module_utils.basic import *
 try:
     from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import (  # noqa: E501
-        oracleConnection, sanitize_string_params,
+        oracleConnection, broker_result, sanitize_string_params,
     )
 except ImportError:
     def sanitize_string_params(module_params):
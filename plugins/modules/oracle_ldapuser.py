@@ -117,6 +117,41 @@ options:
             - If value does not "Oracle identifier" compatible, then this user is silently skipped
         required: false
         default: sAMAccountName
+    ldap_page_size:
+        description:
+            - Number of entries requested per page (RFC 2696 paged results)
+            - Active Directory returns at most MaxPageSize (1000) entries for unpaged search
+            - Use 0 for unpaged search
+        required: false
+        default: 1000
+        type: int
+        version_added: "3.5.0"
+    ldap_watermark_attribute:
+        description:
+            - Fetch only users changed since the last successful run
+            - The highest value of this attribute seen on users and groups from group_role_map is stored in ldap_watermark_file on the host the module runs on
+            - All user names are still listed (without other attributes) to detect deleted users
+            - Group membership changes do not change user entries, when any group from group_role_map changed all users are synchronised
+            - uSNChanged is local to a domain controller, always use the same one in ldap_connect
+        required: false
+        choices: ['uSNChanged', 'modifyTimestamp']
+        version_added: "3.5.0"
+    ldap_watermark_file:
+        description:
+            - File where ldap_watermark_attribute values are stored
+            - One file can hold watermarks of more directories, searches and databases
+        required: false
+        default: ~/.ansible/oracle_cache/ldapuser_watermark.json
+        type: path
+        version_added: "3.5.0"
+    sync_batch_size:
+        description:
+            - Number of users synchronised at once, users are created/altered and
+              grants/revokes are computed by one query per batch
+        required: false
+        default: 500
+        type: int
+        version_added: "3.5.0"
     deleted_user_mode:
         description:
             - What action to take then user is not found in LDAP search anymore
@@ -168,11 +203,17 @@ EXAMPLES = '''
         group_role_map:
           - {dn: "CN=prod_db_reader,OU=Security Groups,DC=domain,DC=int", group: "prod_db_reader"}
           - {dn: "CN=prod_db_writer,OU=Security Groups,DC=domain,DC=int", group: "prod_db_writer"}
+        # later runs fetch only users changed since the previous one
+        ldap_watermark_attribute: uSNChanged
       environment: "{{ oracle_env }}"
 '''
 
+import json
+import os
 import re
 
+from ansible.module_utils._text import to_text
+
 try:
     import oracledb
 except ImportError:
@@ -182,6 +223,7 @@ else:
 
 try:
     import ldap
+    from ldap.controls import SimplePagedResultsControl
 except ImportError:
     ldap_module_exists = False
 else:
@@ -204,32 +246,257 @@ def clean_string(s):
 
 # Module code
 
-def query_ldap_users():
+def search_pages(filterstr, attrlist):
+    """ yield LDAP result pages, RFC 2696 paged results when ldap_page_size is set
+
+    Active Directory returns at most MaxPageSize (1000) entries for an unpaged search.
+    """
+    scope = ldap.SCOPE_SUBTREE if lparam['subtree'] else ldap.SCOPE_ONELEVEL
+    page_size = module.params.get('ldap_page_size')
+    if not page_size:
+        yield lconn.search_s(lparam['basedn'], scope, filterstr, attrlist)
+        return
+    control = SimplePagedResultsControl(True, size=page_size, cookie='')
+    while True:
+        msgid = lconn.search_ext(lparam['basedn'], scope, filterstr, attrlist, serverctrls=[control])
+        (_, rdata, _, serverctrls) = lconn.result3(msgid)
+        yield rdata
+        cookies = [c.cookie for c in serverctrls if c.controlType == SimplePagedResultsControl.controlType]
+        if not cookies or not cookies[0]:
+            break
+        control.cookie = cookies[0]
+
+
+def query_ldap_users(filterstr=None, attrlist=None):
+    """ yield users found in LDAP, users whose name is not valid Oracle identifier are skipped """
     # What attributes to get from LDAP
-    resultattrlist = [lparam['username']]
-    if module.params['group_role_map'] is not None:
-        resultattrlist.append('memberOf')
-    #
-    users = []
+    if attrlist is None:
+        attrlist = [lparam['username']]
+        if module.params['group_role_map'] is not None:
+            attrlist.append('memberOf')
+        if module.params.get('ldap_watermark_attribute'):
+            attrlist.append(module.params['ldap_watermark_attribute'])
+    watermark = module.params.get('ldap_watermark_attribute')
     try:
-        result = lconn.search_s(lparam['basedn'], ldap.SCOPE_SUBTREE if lparam['subtree'] else ldap.SCOPE_ONELEVEL, lparam['filter'], resultattrlist)
-        results = [entry for dn, entry in result if isinstance(entry, dict)]
-        for user in results:
+        for page in search_pages(filterstr or lparam['filter'], attrlist):
+            for (_, user) in page:
+                if not isinstance(user, dict):
+                    continue
+                try:
+                    userinfo = { 'username': clean_string(to_text(user[lparam['username']][0])) }
+                except Exception:
+                    continue
+                if 'memberOf' in attrlist:
+                    userinfo['memberOf'] = [to_text(g) for g in user.get('memberOf', [])]
+                if watermark and user.get(watermark):
+                    userinfo['watermark'] = to_text(user[watermark][0])
+                yield userinfo
+    except ldap.LDAPError as e:
+        module.fail_json(msg="Error querying LDAP: %s" % e, changed=False)
+
+
+def user_groups(user):
+    """ Oracle roles of the user mapped from its LDAP group membership """
+    mgroups = []
+    if module.params['group_role_map'] is None:
+        return mgroups
+    for gr in module.params['group_role_map']:
+        if gr['dn'] in user.get('memberOf', []):
             try:
-                userinfo = { 'username': clean_string(user[lparam['username']][0]) }
-                if module.params['group_role_map'] is not None:
-                    userinfo['memberOf'] = user['memberOf']
-                users.append(userinfo)
+                mgroups.append(clean_string(gr['group']))
             except Exception:
                 pass
-    except ldap.LDAPError as e:
-        module.fail_json(msg="Error querying LDAP: %s" % e, changed=False)
-    return users
+    return mgroups
+
+
+def watermark_key(value):
+    # uSNChanged is a number, modifyTimestamp (generalized time) sorts as a string
+    if module.params['ldap_watermark_attribute'] == 'uSNChanged':
+        return int(value)
+    return value
+
+
+def watermark_path():
+    path = module.params.get('ldap_watermark_file')
+    if path:
+        return path
+    return os.path.join(os.path.expanduser('~'), '.ansible', 'oracle_cache', 'ldapuser_watermark.json')
+
+
+def watermark_id():
+    """ watermark is valid only for the same directory, search and target database """
+    p = module.params
+    return '|'.join(str(x) for x in (p['ldap_connect'], lparam['basedn'], lparam['filter'], p['ldap_watermark_attribute'],
+                                     p['dsn'] or '%s:%s/%s' % (p['hostname'], p['port'], p['service_name']),
+                                     p['session_container'], p['user_profile'].upper()))
+
+
+def load_watermarks():
+    try:
+        with open(watermark_path()) as f:
+            watermarks = json.load(f)
+    except (IOError, OSError, ValueError):
+        return dict()
+    return watermarks if isinstance(watermarks, dict) else dict()
+
+
+def save_watermark(value):
+    """ atomically replace the watermark file, failures are not fatal """
+    path = watermark_path()
+    watermarks = load_watermarks()
+    watermarks[watermark_id()] = value
+    tmp = '{}.{}'.format(path, os.getpid())
+    try:
+        directory = os.path.dirname(path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory, 0o700)
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(watermarks, f)
+        os.rename(tmp, path)
+    except (IOError, OSError) as e:
+        module.warn('Can not write LDAP watermark {}: {}'.format(path, e))
+
+
+def highest_watermark(watermark, value):
+    if value and (watermark is None or watermark_key(value) > watermark_key(watermark)):
+        return value
+    return watermark
+
+
+def group_watermarks():
+    """ ldap_watermark_attribute values of the mapped groups
+
+    Group membership changes do not change users' uSNChanged/modifyTimestamp, only the groups' ones.
+    """
+    attr = module.params['ldap_watermark_attribute']
+    values = []
+    for gr in module.params['group_role_map'] or []:
+        try:
+            for (_, entry) in lconn.search_s(gr['dn'], ldap.SCOPE_BASE, '(%s=*)' % attr, [attr]):
+                if isinstance(entry, dict) and entry.get(attr):
+                    values.append(to_text(entry[attr][0]))
+        except ldap.NO_SUCH_OBJECT:
+            continue
+        except ldap.LDAPError as e:
+            module.fail_json(msg="Error querying LDAP: %s" % e, changed=False)
+    return values
+
+
+def batches(iterable, size):
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def execsql(sql, stats, counter):
+    c = conn.cursor()
+    try:
+        c.execute(sql)
+    except oracledb.DatabaseError as e:
+        error, = e.args
+        module.fail_json(msg='%s: %s' % (sql, error.message), changed=stats['changes'] > 0, stats=stats)
+    stats[counter] += 1
+    stats['changes'] += 1
+
+
+def check_target(target):
+    c = conn.cursor()
+    c.execute("""
+        SELECT (SELECT count(*) FROM dba_tablespaces WHERE tablespace_name = :tbs AND contents = 'PERMANENT'),
+               (SELECT count(*) FROM dba_tablespaces WHERE tablespace_name = :tmp AND contents = 'TEMPORARY'),
+               (SELECT count(*) FROM dba_profiles WHERE profile = :profile AND rownum <= 1)
+        FROM dual""", {'tbs': target['tbs'], 'tmp': target['tmp'], 'profile': target['profile']})
+    (tbs, tmp, profile) = c.fetchone()
+    if not tbs or not tmp:
+        module.fail_json(msg='Permanent or temporary tablespace not found.', changed=False)
+    if not profile:
+        module.fail_json(msg='Profile not found.', changed=False)
+
+
+def user_clauses(target):
+    """ PROFILE/TABLESPACE and QUOTA clauses of CREATE/ALTER USER """
+    quota = 'unlimited' if target['quota'] is None else '%dM' % target['quota']
+    return (' PROFILE %s DEFAULT TABLESPACE %s TEMPORARY TABLESPACE %s' % (target['profile'], target['tbs'], target['tmp']),
+            ' QUOTA %s ON %s' % (quota, target['tbs']))
+
+
+def sync_batch(users, target, stats):
+    """ create/alter users of one batch, then grant/revoke the difference found by one MINUS query """
+    usernames = [u['username'] for u in users]
+    (in_clause, params) = bind_in_list('u.username', usernames)
+    params['tbs'] = target['tbs']
+    c = conn.cursor()
+    c.execute("""
+        SELECT u.username, u.account_status, u.authentication_type, u.default_tablespace, u.temporary_tablespace, u.profile,
+               CASE WHEN q.max_bytes > 0 THEN q.max_bytes/1024/1024 ELSE q.max_bytes END
+        FROM dba_users u LEFT OUTER JOIN dba_ts_quotas q ON q.username = u.username AND q.dropped = 'NO' AND q.tablespace_name = :tbs
+        WHERE """ + in_clause, params)
+    existing = dict((row[0], row) for row in c.fetchall())
+
+    (attributes, quota) = user_clauses(target)
+    password = target['password']
+    for username in usernames:
+        row = existing.get(username)
+        if row is None:
+            identified = 'EXTERNALLY' if password is None else 'BY "%s" PASSWORD EXPIRE' % password
+            execsql('CREATE USER %s IDENTIFIED %s%s%s' % (username, identified, attributes, quota), stats, 'created')
+            continue
+        (_, status, auth, tbs, tmp, profile, qmb) = row
+        # In any change in data is detected, correct it back
+        if tbs != target['tbs'] or tmp != target['tmp'] or profile != target['profile'] or 'LOCKED' in status \
+                or (password is None and auth == 'PASSWORD') \
+                or (-1 if target['quota'] is None else target['quota']) != (-100 if qmb is None else qmb):
+            identified = ' IDENTIFIED EXTERNALLY' if password is None else ''
+            execsql('ALTER USER %s%s%s ACCOUNT UNLOCK%s' % (username, identified, attributes, quota), stats, 'altered')
+
+    desired = ['%s/%s' % (u['username'], priv) for u in users for priv in target['grants'] + user_groups(u)]
+    list_type = conn.gettype('SYS.ODCIVARCHAR2LIST')
+    c = conn.cursor()
+    c.execute("""
+        WITH desired AS (
+            SELECT substr(column_value, 1, instr(column_value, '/') - 1) grantee,
+                   substr(column_value, instr(column_value, '/') + 1) priv
+            FROM TABLE(:desired)),
+        granted AS (
+            SELECT grantee, privilege priv FROM dba_sys_privs WHERE grantee IN (SELECT column_value FROM TABLE(:usernames))
+            UNION ALL
+            SELECT grantee, granted_role FROM dba_role_privs WHERE grantee IN (SELECT column_value FROM TABLE(:usernames)))
+        SELECT 'GRANT', grantee, priv FROM (SELECT grantee, priv FROM desired MINUS SELECT grantee, priv FROM granted)
+        UNION ALL
+        SELECT 'REVOKE', grantee, priv FROM (SELECT grantee, priv FROM granted MINUS SELECT grantee, priv FROM desired)
+        ORDER BY 2, 1, 3""", {'desired': list_type.newobject(desired), 'usernames': list_type.newobject(usernames)})
+    for (action, grantee, priv) in c.fetchall():
+        if action == 'GRANT':
+            execsql('GRANT %s TO %s' % (priv, grantee), stats, 'granted')
+        else:
+            execsql('REVOKE %s FROM %s' % (priv, grantee), stats, 'revoked')
+    conn.commit()
+
+
+def remove_users(seen, target, stats):
+    """ lock or drop users with the LDAP profile which were not found in LDAP """
+    c = conn.cursor()
+    c.execute("SELECT username FROM dba_users WHERE profile = :profile AND (account_status = 'OPEN' OR account_status NOT LIKE '%LOCKED%')",
+              {'profile': target['profile']})
+    for (username,) in c.fetchall():
+        if username in seen:
+            continue
+        if module.params['deleted_user_mode'] == 'drop':
+            execsql('DROP USER %s CASCADE' % username, stats, 'removed')
+        else:
+            execsql('ALTER USER %s ACCOUNT LOCK' % username, stats, 'removed')
+    conn.commit()
+
 
 # Ansible code
 def main():
     global lconn, conn, lparam, module
-    msg = ['']
     module = AnsibleModule(
         argument_spec = dict(
             user          = dict(required=False, aliases=['un', 'username']),
@@ -255,6 +522,10 @@ def main():
             ldap_user_subtree = dict(default=True, type='bool'),
             ldap_user_filter  = dict(default='(objectClass=user)'),
             ldap_username_attribute = dict(default='sAMAccountName'),
+            ldap_page_size = dict(default=1000, type='int'),
+            ldap_watermark_attribute = dict(default=None, choices=['uSNChanged', 'modifyTimestamp']),
+            ldap_watermark_file = dict(default=None, type='path'),
+            sync_batch_size = dict(default=500, type='int'),
             deleted_user_mode = dict(default='lock', choices=['lock','drop']),
             group_role_map    = dict(default=None, type='list')
         ),
@@ -292,228 +563,64 @@ def main():
     if module.check_mode:
         module.exit_json(
             changed=True,
-            msg='Check mode: synchronisation LDAP potentiellement mutative (estimation conservative)'
+            msg='Check mode: synchronisation LDAP potentiellement mutative (estimation conservative)',
+            **broker_result(oc)
         )
     #
-    users = query_ldap_users()
-    lconn.unbind()
-    # Prepare lists to send to Oracle
-    usernames = []
-    ldapgroups = []
+    target = {
+        'tbs': clean_string(module.params['user_default_tablespace']),
+        'tmp': clean_string(module.params['user_temp_tablespace']),
+        'profile': clean_string(module.params['user_profile']),
+        'password': module.params['user_default_password'],
+        'quota': module.params['user_quota_on_default_tbs_mb'],
+        'grants': [x.upper() for x in module.params['user_grants']],
+    }
+    check_target(target)
+    # Only users changed since the last run are fetched, unless group membership has changed.
+    # The stored watermark is the highest value of users and mapped groups, a group above it has changed.
+    watermark = None
+    groups = []
+    if module.params.get('ldap_watermark_attribute'):
+        watermark = load_watermarks().get(watermark_id())
+        groups = group_watermarks()
+    delta = watermark is not None and all(watermark_key(v) <= watermark_key(watermark) for v in groups)
+    user_filter = lparam['filter']
+    if delta:
+        user_filter = '(&%s(%s>=%s))' % (lparam['filter'], module.params['ldap_watermark_attribute'], watermark)
+
+    stats = dict(users=0, batches=0, created=0, altered=0, granted=0, revoked=0, removed=0, changes=0, delta=delta)
     msgstr = []
-    for user in users:
-        usernames.append(user['username'])
-        if module.params['group_role_map'] is not None and 'memberOf' in user:
-            # Search matching DN from the user memberOf list
-            mgroups = []
-            for gr in module.params['group_role_map']:
-                if gr['dn'] in user['memberOf']:
-                    try:
-                        mgroups.append("%s" % clean_string(gr['group']))
-                    except Exception:
-                        pass
-            g = ",".join(mgroups)
-        else:
-            g = ""
-        ldapgroups.append(g)
-        msgstr.append("%s - %s" % (user['username'], g))
-    #
-    if not len(usernames):
-        module.fail_json(msg="No users found in LDAP", changed=False)
+    seen = set()
+    for batch in batches(query_ldap_users(user_filter), max(module.params.get('sync_batch_size') or 500, 1)):
+        for user in batch:
+            seen.add(user['username'])
+            msgstr.append("%s - %s" % (user['username'], ",".join(user_groups(user))))
+            watermark = highest_watermark(watermark, user.get('watermark'))
+        sync_batch(batch, target, stats)
+        stats['users'] += len(batch)
+        stats['batches'] += 1
+    if delta:
+        # deleted users are not returned by a delta search, list all user names
+        seen = set(u['username'] for u in query_ldap_users(lparam['filter'], [lparam['username']]))
+    lconn.unbind()
     #
-    msg[0] = msgstr
-    c = conn.cursor()
-    var_usernames = c.arrayvar(oracledb.STRING, usernames)
-    var_grants = c.arrayvar(oracledb.STRING, [x.upper() for x in module.params['user_grants']])
-    var_ldapgroups = c.arrayvar(oracledb.STRING, ldapgroups)
-    var_changes = c.var(oracledb.NUMBER)
-    c.execute("""
-      DECLARE
-          TYPE str_array IS TABLE OF VARCHAR2(50) INDEX BY BINARY_INTEGER;
-          v_changes NUMBER:= 0;
-          v_profile dba_users.profile%type;
-          v_tbs dba_users.default_tablespace%type;
-          v_tmp dba_users.temporary_tablespace%type;
-          v_processed_users VARCHAR2(32267);
-          v_default_password VARCHAR2(30);
-          v_tbs_quota number;
-          v_grants str_array;
-          i NUMBER;
-
-          PROCEDURE execsql(v_sql VARCHAR2) IS
-          BEGIN
-              EXECUTE IMMEDIATE v_sql;
-              v_changes:= v_changes + 1;
-          END;
-
-          PROCEDURE check_grants(p_username dba_users.username%type, p_ldap_groups str_array) IS
-              v_all_privs VARCHAR2(4000);
-              v_needed_privs VARCHAR2(4000);
-          BEGIN
-              -- Check what needs to be added
-              SELECT ','||listagg(priv,',') WITHIN GROUP (order by priv)||',' INTO v_all_privs FROM (
-                  SELECT privilege priv FROM dba_sys_privs WHERE grantee = p_username
-                  UNION ALL
-                  SELECT granted_role FROM dba_role_privs WHERE grantee = p_username
-              );
-              IF v_grants IS NOT NULL AND v_grants.COUNT > 0 THEN
-                  FOR i IN v_grants.FIRST..v_grants.LAST LOOP
-                      v_needed_privs:= v_needed_privs||','||v_grants(i);
-                      IF v_all_privs NOT LIKE '%,'||v_grants(i)||',%' THEN
-                          execsql('GRANT '||v_grants(i)||' TO '||p_username);
-                      END IF;
-                  END LOOP;
-              END IF;
-              IF p_ldap_groups IS NOT NULL AND p_ldap_groups.COUNT > 0 THEN
-                  FOR i IN p_ldap_groups.FIRST..p_ldap_groups.LAST LOOP
-                      v_needed_privs:= v_needed_privs||','||p_ldap_groups(i);
-                      IF v_all_privs NOT LIKE '%,'||p_ldap_groups(i)||',%' THEN
-                          execsql('GRANT '||p_ldap_groups(i)||' TO '||p_username);
-                      END IF;
-                  END LOOP;
-              END IF;
-              v_needed_privs:= v_needed_privs||',';
-              -- Check what need to be revoked
-              FOR rec IN (SELECT priv FROM (
-                                SELECT privilege priv FROM dba_sys_privs WHERE grantee = p_username
-                                UNION ALL
-                                SELECT granted_role FROM dba_role_privs WHERE grantee = p_username)
-                          WHERE v_needed_privs NOT LIKE '%,'||priv||',%') LOOP
-                  execsql('REVOKE '||rec.priv||' FROM '||p_username);
-              END LOOP;
-          END;
-
-          PROCEDURE add_user(p_username dba_users.username%type) IS
-              v_sql VARCHAR2(200);
-          BEGIN
-              v_sql:= 'CREATE USER '||p_username||
-                  ' IDENTIFIED '||case when v_default_password is null then 'EXTERNALLY' ELSE 'BY "'||v_default_password||'" PASSWORD EXPIRE' end||
-                  ' PROFILE '||v_profile||' DEFAULT TABLESPACE '||v_tbs||' TEMPORARY TABLESPACE '||v_tmp||
-                  ' QUOTA '||CASE WHEN v_tbs_quota IS NULL THEN 'unlimited' ELSE v_tbs_quota||'M' END||' ON '||v_tbs;
-              execsql(v_sql);
-          END;
-
-          PROCEDURE remove_user(p_username dba_users.username%type) IS
-          BEGIN
-              IF :var_deleted_user_mode = 'drop' THEN
-                  execsql('DROP USER '||p_username||' CASCADE');
-              ELSIF :var_deleted_user_mode = 'lock' THEN
-                  execsql('ALTER USER '||p_username||' ACCOUNT LOCK');
-              END IF;
-          END;
-
-          PROCEDURE alter_user(p_username dba_users.username%type) IS
-          BEGIN
-              execsql('ALTER USER '||p_username||' '||case when v_default_password is null then 'IDENTIFIED EXTERNALLY' end||
-                  ' PROFILE '||v_profile||' DEFAULT TABLESPACE '||v_tbs||' TEMPORARY TABLESPACE '||v_tmp||' ACCOUNT UNLOCK'||
-                  ' QUOTA '||CASE WHEN v_tbs_quota IS NULL THEN 'unlimited' ELSE v_tbs_quota||'M' END||' ON '||v_tbs);
-          END;
-
-          PROCEDURE process_user(p_username dba_users.username%type, p_ldap_groups varchar2) IS
-              v_as dba_users.account_status%type;
-              v_at dba_users.authentication_type%type;
-              v_dt dba_users.default_tablespace%type;
-              v_temp dba_users.temporary_tablespace%type;
-              v_p dba_users.profile%type;
-              v_qmb dba_ts_quotas.max_bytes%type;
-              v_ldap_groups str_array;
-              l_comma_index PLS_INTEGER;
-              l_index PLS_INTEGER:= 1;
-              v_tmpstr VARCHAR2(4000);
-              v_s varchar2(50);
-          BEGIN
-              v_processed_users:= v_processed_users||','||p_username;
-              -- Process LDAP groups
-              v_tmpstr:= p_ldap_groups||',';
-              LOOP
-                  l_comma_index:= INSTR(v_tmpstr, ',', l_index);
-                  EXIT WHEN l_comma_index = 0;
-                  v_s:= SUBSTR(v_tmpstr, l_index, l_comma_index - l_index);
-                  IF v_s IS NOT NULL THEN
-                      v_ldap_groups(v_ldap_groups.COUNT+1):= v_s;
-                  END IF;
-                  l_index:= l_comma_index + 1;
-              END LOOP;
-              --
-              SELECT u.account_status, u.authentication_type, u.default_tablespace, u.temporary_tablespace, u.profile,
-                  CASE WHEN q.max_bytes > 0 THEN q.max_bytes/1024/1024 ELSE q.max_bytes END
-                  INTO v_as, v_at, v_dt, v_temp, v_p, v_qmb
-              FROM dba_users u LEFT OUTER JOIN dba_ts_quotas q ON q.username = u.username AND q.dropped = 'NO' AND q.tablespace_name = v_tbs
-              WHERE u.username = p_username;
-              -- In any change in data is detected, correct it back
-              IF v_dt != v_tbs OR v_temp != v_tmp OR v_p != v_profile OR v_as LIKE '%LOCKED%' OR (v_default_password IS NULL AND v_at = 'PASSWORD') OR
-                  (NVL(v_tbs_quota, -1) != NVL(v_qmb, -100)) THEN
-                  alter_user(p_username);
-              END IF;
-              check_grants(p_username, v_ldap_groups);
-          EXCEPTION
-              WHEN no_data_found THEN
-                  add_user(p_username);
-                  check_grants(p_username, v_ldap_groups);
-          END;
-
-          PROCEDURE process_array(p_usernames IN str_array, p_ldap_groups IN str_array) IS
-          BEGIN
-              FOR i IN p_usernames.FIRST..p_usernames.LAST LOOP
-                  process_user(p_usernames(i), p_ldap_groups(i));
-              END LOOP;
-          END;
-
-      BEGIN
-          -- Validate parameters, if any tablespace does not exist, the select will excpetion with no_data_found
-          v_tbs:= :var_tbs;
-          v_tmp:= :var_temp;
-          v_profile:= :var_profile;
-          BEGIN
-              SELECT 1 INTO i FROM dba_tablespaces WHERE tablespace_name = v_tbs and contents = 'PERMANENT';
-              SELECT 1 INTO i FROM dba_tablespaces WHERE tablespace_name = v_tmp and contents = 'TEMPORARY';
-          EXCEPTION
-              WHEN no_data_found THEN
-                  raise_application_error(-20100, 'Permanent or temporary tablespace not found.');
-          END;
-          BEGIN
-              SELECT 1 INTO i FROM dba_profiles WHERE profile = v_profile AND rownum <= 1;
-          EXCEPTION
-              WHEN no_data_found THEN
-                  raise_application_error(-20101, 'Profile not found.');
-          END;
-          v_default_password:= :var_default_password;
-          v_grants:= :var_grants;
-          v_tbs_quota:= :var_user_quota;
-          -- Process userlist
-          process_array(:var_usernames, :var_ldapgroups);
-          -- Check users who are not listed
-          v_processed_users:= v_processed_users||',';
-          FOR rec IN (SELECT username FROM dba_users WHERE profile = v_profile AND (account_status = 'OPEN' OR account_status NOT LIKE '%LOCKED%') ) LOOP
-            -- separate check in PL/SQL since v_processed_users can be over 4000 bytes long
-              IF v_processed_users NOT LIKE '%,'||rec.username||',%' THEN
-                remove_user(rec.username);
-              END IF;
-          END LOOP;
-          -- Return
-          :var_changes:= v_changes;
-      END;
-    """, {
-        'var_usernames': var_usernames, 'var_changes': var_changes,
-        'var_tbs': clean_string(module.params['user_default_tablespace']),
-        'var_temp': clean_string(module.params['user_temp_tablespace']),
-        'var_profile': clean_string(module.params['user_profile']),
-        'var_deleted_user_mode': module.params['deleted_user_mode'],
-        'var_default_password': module.params['user_default_password'],
-        'var_user_quota': module.params['user_quota_on_default_tbs_mb'],
-        'var_grants': var_grants,
-        'var_ldapgroups': var_ldapgroups
-    })
-    conn.commit()
+    if not seen:
+        module.fail_json(msg="No users found in LDAP", changed=stats['changes'] > 0)
+    remove_users(seen, target, stats)
+    for value in groups:
+        watermark = highest_watermark(watermark, value)
+    if module.params.get('ldap_watermark_attribute') and watermark is not None:
+        save_watermark(watermark)
+        stats['watermark'] = watermark
     #
-    module.exit_json(msg=msg[0], changed=var_changes.getvalue()>0)
+    module.exit_json(msg=msgstr, changed=stats['changes'] > 0, stats=stats, **broker_result(oc))
 
 
 from ansible.module_utils.basic import *
 
 try:
     from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import (  # noqa: E501
-        oracleConnection, sanitize_string_params,
+        oracleConnection, broker_result, sanitize_string_params, bind_in_list,
     )
 except ImportError:
     def sanitize_string_params(module_params):
@@ -17,6 +17,27 @@ options:
     description: The home which will be patched
     required: False (If env ORACLE_HOME is set)
     aliases: ['oh']
+  oracle_homes:
+    description:
+      - List of homes which will be patched by the same patch, mutually exclusive with I(oracle_home)
+      - Only I(state=present) and I(state=absent) are supported
+      - Patch state and prerequisites (conflict check) of all homes are checked concurrently first,
+        no home is patched when any of the checks fails
+      - Per-home status, message and timing is returned in C(homes)
+    required: False
+    type: list
+    elements: str
+    version_added: "3.5.0"
+  apply_concurrency:
+    description:
+      - Number of homes patched at the same time in I(oracle_homes) mode
+      - Every opatch session writes its log into C(cfgtoollogs/opatch) of its own ORACLE_HOME
+      - opatch locks the central inventory, homes registered in the same inventory (oraInst.loc of the home,
+        else /etc/oraInst.loc) are patched one after another regardless of this setting
+    required: False
+    default: 1
+    type: int
+    version_added: "3.5.0"
   patch_base:
     description: Path to where the patch is located e.g /nfs/patches/12.1.0.2/27468957
     required: False
@@ -75,7 +96,9 @@ options:
     choices: ['present','absent','opatchversion', 'lspatches']
 
 notes:
-   -
+   - Applied patches are read from C(inventory/ContentsXML/comps.xml) and C(inventory/oneoffs/*/etc/config/inventory.xml)
+     of the ORACLE_HOME, C(opatch lspatches) is only executed when the inventory can not be parsed
+   - C(state=lspatches) returns also C(patches), list of applied patches with their bugs and targets
 requirements: [ "os","pwd","distutils.version" ]
 author:
   - Mikael Sandström, oravirt@gmail.com, @oravirt
@@ -97,11 +120,30 @@ EXAMPLES = '''
   oracle_opatch:
     state: present
     patch_base: "/install/oracle_patches/12345"
+
+- name: Apply patch to all database homes, two homes at a time
+  oracle_opatch:
+    state: present
+    patch_base: "/install/oracle_patches/12345"
+    oracle_homes:
+      - /u01/app/oracle/product/19.0.0/db1
+      - /u01/app/oracle/product/19.0.0/db2
+      - /u01/app/oracle/product/19.0.0/db3
+    apply_concurrency: 2
 '''
 
 import os, pwd
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from distutils.version import LooseVersion
 
+# Upper bound of ORACLE_HOMEs inspected and analyzed concurrently in oracle_homes mode
+ANALYZE_WORKERS = 8
+ORA_INST_LOC = '/etc/oraInst.loc'
+# OPatch versions below this one need an OCM response file
+OPATCH_VERSION_NOOCM = '12.2.0.1.5'
+
 
 def get_version(module, oracle_home):
     '''
@@ -173,10 +215,31 @@ def get_patch_id(module, path):
     module.fail_json(msg='Could not determine patch_id from: %s' % path, changed=False)
 
 
-def check_patch_applied(module, oracle_home, patch_id, patch_version, opatchauto):
+def parse_lspatches(stdout):
     '''
-    Gets all patches already applied and compares to the
-    intended patch
+    Parses opatch lspatches output, returns (patches, last message line)
+    '''
+    patches = []
+    msg = 'lspatches'
+    for line in stdout.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith('OPatch succeeded'):
+            msg = line
+            break
+        if ';' in line:
+            (patch_id, description) = line.split(';', 1)
+            if patch_id and description:
+                patches.append(dict(patch_id=patch_id, description=description, bugs=[], targets=[]))
+        else:
+            msg = line
+    return patches, msg
+
+
+def opatch_lspatches(module, oracle_home, opatchauto=False):
+    '''
+    Returns stdout of opatch lspatches
     '''
 
     command = ''
@@ -185,54 +248,54 @@ def check_patch_applied(module, oracle_home, patch_id, patch_version, opatchauto
         command += 'sudo -u %s ' % oh_owner
     command += '%s/OPatch/opatch lspatches ' % oracle_home
     (rc, stdout, stderr) = module.run_command(command)
-    #module.exit_json(msg=stdout, changed=False)
     if rc != 0:
         msg = 'Error - STDOUT: %s, STDERR: %s, COMMAND: %s' % (stdout, stderr, command)
         module.fail_json(msg=msg, changed=False)
+    return stdout
+
+
+def check_patch_applied(module, oracle_home, patch_id, patch_version, opatchauto):
+    '''
+    Gets all patches already applied and compares to the
+    intended patch
+    The inventory XML files are read directly, opatch lspatches is only used when they are not readable
+    '''
+
+    patches = home_patches(oracle_home)
+    if patches is not None:
+        # Same lines as printed by opatch lspatches
+        stdout = '\n'.join('%s;%s' % (p['patch_id'], p['description']) for p in patches)
     else:
-        if opatchauto:
-            chk = '%s' % patch_version
-        elif not opatchauto and patch_id is not None and patch_version is not None:
-            chk = '%s (%s)' % (patch_version, patch_id)
-        else:
-            chk = '%s' % patch_id
+        stdout = opatch_lspatches(module, oracle_home, opatchauto)
 
-        if chk in stdout:
-            return True
-        else:
-            return False
+    if opatchauto:
+        chk = '%s' % patch_version
+    elif not opatchauto and patch_id is not None and patch_version is not None:
+        chk = '%s (%s)' % (patch_version, patch_id)
+    else:
+        chk = '%s' % patch_id
 
+    if chk in stdout:
+        return True
+    else:
+        return False
 
-def list_patches(module, oracle_home):
-    command = '%s/OPatch/opatch lspatches ' % oracle_home
-    (rc, stdout, stderr) = module.run_command(command)
-    #module.exit_json(msg=stdout, changed=False)
-    if rc != 0:
-        msg = 'Error - STDOUT: %s, STDERR: %s, COMMAND: %s' % (stdout, stderr, command)
-        module.fail_json(msg=msg, changed=False)
 
-    retval = dict()
-    msg = 'lspatches'
-    for line in stdout.split('\n'):
-        line = line.strip()
-        if not line:
-            continue
-        if line.startswith('OPatch succeeded'):
-            msg = line
-            break
-        if ';' in line:
-            (patch_id, description) = line.split(';')
-            if patch_id and description:
-                retval.update({patch_id: description})
-        else:
-            msg = line
-    module.exit_json(msg=msg, lspatches=retval, changed=False)
+def list_patches(module, oracle_home):
+    patches = home_patches(oracle_home)
+    if patches is not None:
+        msg = 'Patches read from %s/inventory' % oracle_home
+    else:
+        (patches, msg) = parse_lspatches(opatch_lspatches(module, oracle_home))
+    retval = dict((p['patch_id'], p['description']) for p in patches)
+    module.exit_json(msg=msg, lspatches=retval, patches=patches, changed=False)
 
 
-def analyze_patch (module, oracle_home, patch_base, opatchauto):
+def analyze_patch (module, oracle_home, patch_base, opatchauto, versions=None):
+    major = versions[0] if versions else major_version
     checks = []
     if opatchauto:
-        if major_version < '12.1':
+        if major < '12.1':
             oh_owner = get_file_owner(module, oracle_home)
             command = ''
             command += 'sudo -u %s ' % oh_owner
@@ -263,18 +326,25 @@ def analyze_patch (module, oracle_home, patch_base, opatchauto):
             module.fail_json(msg=msg, changed=False)
     return True
 
-def apply_patch (module, oracle_home, patch_base, patch_id, patch_version, opatchauto, ocm_response_file, offline, stop_processes, rolling, output):
+def apply_patch (module, oracle_home, patch_base, patch_id, patch_version, opatchauto, ocm_response_file, offline, stop_processes, rolling, output, versions=None,
+                 check_conflicts=None, noocm_version=None):
     '''
     Applies the patch
+    versions: (major_version, opatch_version) of oracle_home, module globals when not set
+    check_conflicts, noocm_version: conflict_check and opatch_version_noocm, module globals when not set
     '''
 
-    if conflict_check:
-        if not analyze_patch(module, oracle_home, patch_base, opatchauto):
+    (major, opatch) = versions if versions else (major_version, opatch_version)
+    check_conflicts = conflict_check if check_conflicts is None else check_conflicts
+    noocm_version = noocm_version or opatch_version_noocm
+
+    if check_conflicts:
+        if not analyze_patch(module, oracle_home, patch_base, opatchauto, versions):
             module.fail_json(msg='Prereq checks failed')
 
     if opatchauto:
         opoptions = ''
-        if major_version < '12.1':
+        if major < '12.1':
             opatch_cmd = 'opatch auto'
             if offline:
                 oh = ' -och'
@@ -296,7 +366,7 @@ def apply_patch (module, oracle_home, patch_base, patch_id, patch_version, opatc
         opatch_cmd = 'opatch'
         command = '%s/OPatch/%s apply %s -oh %s -silent' % (oracle_home, opatch_cmd, patch_base, oracle_home)
 
-    if ocm_response_file is not None and (LooseVersion(opatch_version) < LooseVersion(opatch_version_noocm)):
+    if ocm_response_file is not None and (LooseVersion(opatch) < LooseVersion(noocm_version)):
         command += ' -ocmrf %s' % ocm_response_file
 
     (rc, stdout, stderr) = module.run_command(command)
@@ -382,13 +452,16 @@ def stop_process(module, oracle_home):
                         module.fail_json(msg=msg, changed=False)
 
 
-def remove_patch (module, oracle_home, patch_base, patch_id, opatchauto, ocm_response_file,output):
+def remove_patch (module, oracle_home, patch_base, patch_id, opatchauto, ocm_response_file, output, versions=None, noocm_version=None):
     '''
     Removes the patch
+    noocm_version: opatch_version_noocm, module global when not set
     '''
 
+    (major, opatch) = versions if versions else (major_version, opatch_version)
+    noocm_version = noocm_version or opatch_version_noocm
     if opatchauto:
-        if major_version < '12.1':
+        if major < '12.1':
             opatch_cmd = 'opatch auto -rollback'
         else:
             opatch_cmd = 'opatchauto rollback'
@@ -399,7 +472,7 @@ def remove_patch (module, oracle_home, patch_base, patch_id, opatchauto, ocm_res
         command = '%s/OPatch/%s -id %s -silent' % (oracle_home,opatch_cmd, patch_id)
 
 
-    if ocm_response_file is not None and (LooseVersion(opatch_version) < LooseVersion(opatch_version_noocm)):
+    if ocm_response_file is not None and (LooseVersion(opatch) < LooseVersion(noocm_version)):
         command += ' -ocmrf %s' % ocm_response_file
 
     #module.exit_json(msg=command, changed=False)
@@ -422,6 +495,182 @@ def remove_patch (module, oracle_home, patch_base, patch_id, opatchauto, ocm_res
             module.exit_json(msg=msg, changed=False)
 
 
+class HomeResult(Exception):
+    '''
+    Raised by HomeModule instead of exit_json/fail_json
+    '''
+
+    def __init__(self, failed, result):
+        super(HomeResult, self).__init__(result.get('msg'))
+        self.failed = failed
+        self.result = result
+
+
+class HomeModule():
+    '''
+    Module proxy for work on one ORACLE_HOME in a worker thread
+    exit_json/fail_json raise HomeResult, so one home can not terminate the whole module
+    '''
+
+    def __init__(self, module):
+        self.module = module
+        self.params = module.params
+        self.check_mode = module.check_mode
+
+    def run_command(self, *args, **kwargs):
+        return self.module.run_command(*args, **kwargs)
+
+    def warn(self, msg):
+        self.module.warn(msg)
+
+    def exit_json(self, **kwargs):
+        raise HomeResult(False, kwargs)
+
+    def fail_json(self, **kwargs):
+        raise HomeResult(True, kwargs)
+
+
+def run_homes(module, func, oracle_homes, workers):
+    '''
+    Runs func(HomeModule, oracle_home) for every home on at most workers threads
+    Returns {oracle_home: result}, failures are reported as status failed
+    '''
+
+    def run(oracle_home):
+        start = time.time()
+        try:
+            result = func(HomeModule(module), oracle_home)
+        except HomeResult as e:
+            result = dict(status='failed' if e.failed else 'unchanged', changed=False, msg=e.result.get('msg'))
+        return result, round(time.time() - start, 3)
+
+    if workers < 2 or len(oracle_homes) < 2:
+        outputs = [run(oracle_home) for oracle_home in oracle_homes]
+    else:
+        with ThreadPoolExecutor(max_workers=min(workers, len(oracle_homes))) as executor:
+            outputs = list(executor.map(run, oracle_homes))
+    return dict(zip(oracle_homes, outputs))
+
+
+def inspect_home(module, oracle_home, patch_id):
+    '''
+    Versions, patch state and prerequisite checks of one ORACLE_HOME
+    '''
+
+    p = module.params
+    if not os.path.exists('%s/OPatch/opatch' % oracle_home):
+        module.fail_json(msg='OPatch doesn\'t seem to exist in %s/OPatch/' % oracle_home, changed=False)
+    versions = (get_version(module, oracle_home), get_opatch_version(module, oracle_home))
+    opatch = versions[1]
+    if p['opatch_minversion'] is not None and LooseVersion(opatch) < LooseVersion(p['opatch_minversion']):
+        module.fail_json(msg='Current OPatch version: %s, minimum version needed is: %s' % (opatch, p['opatch_minversion']))
+    if p['state'] == 'present' and p['ocm_response_file'] is None and LooseVersion(opatch) < LooseVersion(OPATCH_VERSION_NOOCM):
+        module.fail_json(msg='An OCM response file is needed when the opatch version is < %s. Current opatch version: %s'
+                         % (OPATCH_VERSION_NOOCM, opatch))
+
+    applied = check_patch_applied(module, oracle_home, patch_id, p['patch_version'], p['opatchauto'])
+    pending = applied != (p['state'] == 'present')
+    if pending and p['state'] == 'present' and p['conflict_check']:
+        analyze_patch(module, oracle_home, p['patch_base'], p['opatchauto'], versions)
+    if not pending:
+        status = 'already applied' if applied else 'not applied'
+    else:
+        status = 'pending'
+    return dict(status=status, changed=False, pending=pending, versions=versions)
+
+
+def inventory_location(oracle_home):
+    '''
+    Central inventory of an ORACLE_HOME, its own oraInst.loc takes precedence over /etc/oraInst.loc
+    Returns None when no inventory pointer can be read
+    '''
+
+    for loc in (os.path.join(oracle_home, 'oraInst.loc'), ORA_INST_LOC):
+        try:
+            with open(loc) as f:
+                for line in f:
+                    if line.startswith('inventory_loc='):
+                        return os.path.normpath(line.strip().split('=', 1)[1])
+        except (IOError, OSError):
+            continue
+    return None
+
+
+def change_home(module, oracle_home, patch_id, versions):
+    '''
+    Applies or removes the patch in one ORACLE_HOME, the prerequisites were already analyzed
+    so the conflict check is not repeated
+    '''
+
+    p = module.params
+    if p['state'] == 'present':
+        apply_patch(module, oracle_home, p['patch_base'], patch_id, p['patch_version'], p['opatchauto'],
+                    p['ocm_response_file'], p['offline'], p['stop_processes'], p['rolling'], 'short', versions,
+                    check_conflicts=False, noocm_version=OPATCH_VERSION_NOOCM)
+        return dict(status='applied', changed=True, msg='Patch %s successfully applied to %s' % (patch_id, oracle_home))
+    remove_patch(module, oracle_home, p['patch_base'], patch_id, p['opatchauto'], p['ocm_response_file'], 'short', versions,
+                 noocm_version=OPATCH_VERSION_NOOCM)
+    return dict(status='removed', changed=True, msg='Patch %s successfully removed from %s' % (patch_id, oracle_home))
+
+
+def patch_homes(module, patch_id):
+    '''
+    oracle_homes mode: prerequisites of all homes are checked concurrently, nothing is changed when any of them fails,
+    then the patch is applied/removed with apply_concurrency homes at a time
+    '''
+
+    oracle_homes = module.params['oracle_homes']
+    state = module.params['state']
+    if state not in ('present', 'absent'):
+        module.fail_json(msg='oracle_homes can only be used with state present or absent', changed=False)
+    if (module.params['patch_base'] or patch_id) is None:
+        module.fail_json(msg='patch_base & patch_id needs to be set', changed=False)
+    if module.params['opatchauto'] and module.params['patch_version'] is None:
+        module.fail_json(msg='patch_version (e.g 12.1.0.2.1801417) needs to be set if opatchauto is True', changed=False)
+
+    homes = dict()
+    inspected = run_homes(module, lambda m, oh: inspect_home(m, oh, patch_id), oracle_homes, ANALYZE_WORKERS)
+    for (oracle_home, (result, elapsed)) in inspected.items():
+        homes[oracle_home] = dict(status=result['status'], changed=False, msg=result.get('msg'),
+                                  timing=dict(analyze=elapsed))
+    failed = [oh for oh in oracle_homes if homes[oh]['status'] == 'failed']
+    if failed:
+        module.fail_json(msg='Prerequisites failed in: %s' % ', '.join(failed), homes=homes, changed=False)
+
+    pending = [oh for oh in oracle_homes if inspected[oh][0]['pending']]
+    if module.check_mode:
+        for oracle_home in pending:
+            homes[oracle_home]['status'] = 'would apply' if state == 'present' else 'would remove'
+            homes[oracle_home]['changed'] = True
+        module.exit_json(msg='Check mode: %d of %d homes would be changed' % (len(pending), len(oracle_homes)),
+                         homes=homes, changed=bool(pending))
+
+    # opatch locks the central inventory, homes sharing one are serialized,
+    # pending homes are interleaved by inventory so that waiting homes do not occupy all workers
+    inventories = dict((oh, inventory_location(oh)) for oh in pending)
+    locks = dict((inventory, threading.Lock()) for inventory in inventories.values())
+    rank = dict()
+    for oracle_home in pending:
+        rank[oracle_home] = len([oh for oh in pending[:pending.index(oracle_home)] if inventories[oh] == inventories[oracle_home]])
+    pending.sort(key=lambda oh: rank[oh])
+
+    def change(m, oracle_home):
+        with locks[inventories[oracle_home]]:
+            return change_home(m, oracle_home, patch_id, inspected[oracle_home][0]['versions'])
+
+    changed = run_homes(module, change, pending, module.params['apply_concurrency'])
+    for (oracle_home, (result, elapsed)) in changed.items():
+        homes[oracle_home].update(status=result['status'], changed=result['changed'], msg=result.get('msg'))
+        homes[oracle_home]['timing']['apply'] = elapsed
+
+    changed_homes = [oh for oh in oracle_homes if homes[oh]['changed']]
+    failed = [oh for oh in pending if homes[oh]['status'] == 'failed']
+    msg = '%d of %d homes changed' % (len(changed_homes), len(oracle_homes))
+    if failed:
+        module.fail_json(msg='%s, failed: %s' % (msg, ', '.join(failed)), homes=homes, changed=bool(changed_homes))
+    module.exit_json(msg=msg, homes=homes, changed=bool(changed_homes))
+
+
 def main():
 
     msg = ['']
@@ -434,6 +683,8 @@ def main():
     module = AnsibleModule(
         argument_spec = dict(
             oracle_home         = dict(required=False, aliases=['oh']),
+            oracle_homes        = dict(required=False, type='list', elements='str'),
+            apply_concurrency   = dict(default=1, type='int'),
             patch_base          = dict(default=None, aliases=['path', 'source', 'patch_source', 'phBaseDir']),
             patch_id            = dict(default=None, aliases=['id']),
             patch_version       = dict(required=None, aliases=['version']),
@@ -448,6 +699,7 @@ def main():
             output              = dict(default="short", choices=["short", "verbose"]),
             state               = dict(default="present", choices=["present", "absent", "opatchversion", "lspatches"]),
         ),
+        mutually_exclusive=[['oracle_home', 'oracle_homes']],
         supports_check_mode=True,
     )
 
@@ -468,6 +720,9 @@ def main():
     if patch_base and not patch_id:
         patch_id = get_patch_id(module, patch_base)
 
+    if module.params.get('oracle_homes'):
+        patch_homes(module, patch_id)
+
     if oracle_home:
         os.environ['ORACLE_HOME'] = oracle_home
     elif 'ORACLE_HOME' in os.environ:
@@ -566,5 +821,11 @@ def main():
 
 from ansible.module_utils.basic import *
 
+# In these we do import from collections
+try:
+    from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.describe_patchset import home_patches
+except ImportError:
+    home_patches = lambda oracle_home: None
+
 if __name__ == '__main__':
     main()
@@ -28,6 +28,35 @@ options:
     description: Return only databases which are OPEN
     required: false
     default: false
+  fact_cache:
+    description:
+      - Path of a cache file for static discovery results (ORACLE_HOMEs, CRS/HAS setup, oratab entries), or C(yes) for
+        C(~/.ansible/oracle_cache/oracle_homes.json)
+      - Cache entries are validated by mtime, inode and size of oraInst.loc, inventory.xml, oratab, ocr.loc, olr.loc
+        and comps.xml of each ORACLE_HOME
+      - Running instances and their status are always probed live
+      - When not set, environment variable C(ANSIBLE_ORACLE_FACT_CACHE) is used, the cache is disabled by default
+    required: false
+    type: str
+    version_added: "3.5.0"
+  refresh:
+    description: Ignore content of the I(fact_cache) and rediscover everything, the cache file is rewritten
+    required: false
+    default: false
+    type: bool
+    version_added: "3.5.0"
+  status_engine:
+    description:
+      - How the status of running instances is queried
+      - C(oracledb) uses python-oracledb bequeath connections, one helper process per ORACLE_HOME and owner, sqlplus is
+        used when oracledb can not be used for an instance
+      - C(sqlplus) executes sqlplus for every instance
+      - C(auto) uses C(oracledb) when python-oracledb is installed
+      - When not set, environment variable C(ANSIBLE_ORACLE_STATUS_ENGINE) is used, default is C(auto)
+    required: false
+    type: str
+    choices: ['auto', 'oracledb', 'sqlplus']
+    version_added: "3.5.0"
 notes:
   - Has to run either as root or oracle db owner
 requirements:
@@ -69,6 +98,11 @@ tasks:
 - debug:
     var: sid_list
 
+- name: Reuse static discovery results from previous runs
+  oracle_oratab:
+    fact_cache: "yes"
+  register: sid_list
+
 # More detailed example is here: 
 # https://github.com/ibre5041/ansible_oracle_modules_example/blob/main/oracle_oratab.yml
 # 
@@ -101,6 +135,20 @@ try:
 except ImportError:
     pass
 
+def probe_db_status(h, sid):
+    try:
+        return h.query_db_status(oracle_owner = h.facts_item[sid]['owner']
+                                 , oracle_home = h.facts_item[sid]['ORACLE_HOME']
+                                 , oracle_sid = h.facts_item[sid]['ORACLE_SID'])
+    except Exception:
+        return ['DOWN']
+
+
+def probe_db_statuses(h, sids):
+    """ query status of all SIDs in parallel, wall-clock is bounded by the slowest probe """
+    return dict(zip(sids, h.parallel_map(lambda sid: probe_db_status(h, sid), sids, as_owner=True)))
+
+
 # Ansible code
 def main():
     oracle_list = []
@@ -111,6 +159,9 @@ def main():
             open_only = dict(default=False, type="bool"),
             writable_only = dict(default=False, type="bool"),
             homes = dict(default=None, choices=[None, 'all', 'client', 'server', 'crs', 'gateway']),
+            fact_cache = dict(default=None, type='str'),
+            refresh = dict(default=False, type='bool'),
+            status_engine = dict(default=None, choices=['auto', 'oracledb', 'sqlplus']),
             facts_item = dict()
          ),
         supports_check_mode=True
@@ -126,6 +177,7 @@ def main():
     h.list_processes()
     h.parse_oratab()
 
+    probes = []
     for sid in list(h.facts_item):
         try:
             sqlplus_path = os.path.join(h.facts_item[sid]['ORACLE_HOME'], 'bin', 'oracle')
@@ -134,22 +186,19 @@ def main():
         except Exception:
             pass
 
-        status = ['DOWN']
+        h.facts_item[sid]['status'] = ['DOWN']
         should_probe = bool(h.facts_item[sid]["running"])
         if not should_probe and sid.startswith('+ASM') and h.facts_item[sid].get('owner'):
             # Best-effort ASM probing when process discovery is restricted.
             should_probe = True
         if should_probe:
-            try:
-                status = h.query_db_status(oracle_owner = h.facts_item[sid]['owner']
-                                           , oracle_home = h.facts_item[sid]['ORACLE_HOME']
-                                           , oracle_sid = h.facts_item[sid]['ORACLE_SID'])
-                if 'ASM' in status:
-                    h.facts_item[sid]['running'] = True
-            except Exception:
-                status = ['DOWN']
+            probes.append(sid)
+
+    for sid, status in probe_db_statuses(h, probes).items():
+        if 'ASM' in status:
+            h.facts_item[sid]['running'] = True
         h.facts_item[sid]['status'] = status
-        
+
     if running_only:
         for sid in list(h.facts_item):
             if not h.facts_item[sid]["running"]:
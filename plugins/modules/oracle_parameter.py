@@ -217,14 +217,14 @@ def main():
         elif parameter.default_value != parameter.current_value and scope in ['memory', 'both']:
             reset_parameter(conn, module, parameter)
         else:
-            module.exit_json(msg="Nothing to do for: {}".format(str(parameter)), changed=False)
+            module.exit_json(msg="Nothing to do for: {}".format(str(parameter)), changed=False, **broker_result(conn))
     elif state == 'present':
         if scope in ['spfile', 'both'] and parameter.spfile_value != value:
             modify_parameter(conn, module, parameter)
         elif scope in ['memory', 'both'] and parameter.display_value != value:
             modify_parameter(conn, module, parameter)
         else:
-            module.exit_json(msg="Nothing to do for: {}".format(str(parameter)), changed=False)
+            module.exit_json(msg="Nothing to do for: {}".format(str(parameter)), changed=False, **broker_result(conn))
 
     module.fail_json(msg='Unhandled exit', changed=False)
 
@@ -241,7 +241,7 @@ from ansible.module_utils.basic import *
 
 # In this case we do import from collections
 try:
-    from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import oracleConnection, sanitize_string_params
+    from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import oracleConnection, broker_result, sanitize_string_params
 except ImportError:
     sanitize_string_params = lambda p: None
 
@@ -566,14 +566,14 @@ def main():
             remove_pdb(oc, module, pdb)
         else:
             msg = "Pluggable database %s doesn't exist" % pdb_name
-            module.exit_json(msg=msg, changed=False)
+            module.exit_json(msg=msg, changed=False, **broker_result(oc))
 
     elif state == 'unplugged':
         if pdb:
             unplug_pdb(oc, module)
         else:
             msg = "Pluggable database %s doesn't exist" % pdb_name
-            module.exit_json(msg=msg, changed=False)
+            module.exit_json(msg=msg, changed=False, **broker_result(oc))
 
     elif state == 'status':
         if pdb:
@@ -585,12 +585,12 @@ def main():
             else:
                 module.fail_json(msg='Unsupported PDB state %s' % pdb['open_mode'])
             module.exit_json(msg='PDB %s exists' % pdb_name, state=state
-                             , read_only=bool(pdb['open_mode'] == 'READ ONLY'), changed=False)
+                             , read_only=bool(pdb['open_mode'] == 'READ ONLY'), changed=False, **broker_result(oc))
         else:
             msg = "Pluggable database %s doesn't exist" % pdb_name
             module.fail_json(msg=msg, changed=False)
 
-    module.exit_json(msg="Unhandled exit", changed=False)
+    module.exit_json(msg="Unhandled exit", changed=False, **broker_result(oc))
 
 
 # In these we do import from local project sub-directory <project-dir>/module_utils
@@ -603,7 +603,7 @@ def main():
 
 # In these we do import from collections
 try:
-    from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import oracleConnection, sanitize_string_params
+    from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import oracleConnection, broker_result, sanitize_string_params
 except ImportError:
     sanitize_string_params = lambda p: None
 
@@ -106,7 +106,7 @@ def main():
 
     oc = oracleConnection(module)
     r = check_connection(oc)
-    module.exit_json(msg="Connection successful: " + str(r), changed=oc.changed)
+    module.exit_json(msg="Connection successful: " + str(r), changed=oc.changed, **broker_result(oc))
 
 
 from ansible.module_utils.basic import *
@@ -121,7 +121,7 @@ from ansible.module_utils.basic import *
 
 # In these we do import from collections
 try:
-    from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import oracleConnection, sanitize_string_params
+    from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import oracleConnection, broker_result, sanitize_string_params
 except ImportError:
     sanitize_string_params = lambda p: None
 
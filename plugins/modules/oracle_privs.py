@@ -52,6 +52,14 @@ options:
     required: False
     default: True
     type: bool  
+  chunk_size:
+    description:
+      - Number of objects read from DBA_OBJECTS and granted/revoked per database round trip.
+      - Every chunk is committed, interrupted run continues with objects not processed yet.
+    required: False
+    default: 1000
+    type: int
+    version_added: "3.5.0"
   hostname:
     description: The Oracle database host
     required: false
@@ -181,6 +189,7 @@ EXAMPLES = '''
 '''
 
 import re
+import time
 
 try:
     import oracledb
@@ -189,6 +198,164 @@ except ImportError:
 else:
     oracledb_exists = True
 
+# Objects fetched and granted/revoked per round trip
+CHUNK_SIZE = 1000
+
+# Executes one chunk of GRANT/REVOKE statements, stops at the first error
+EXEC_CHUNK = """
+DECLARE
+    TYPE str_array IS TABLE OF VARCHAR2(4000) INDEX BY BINARY_INTEGER;
+    v_stmts str_array;
+    v_done NUMBER:= 0;
+BEGIN
+    v_stmts:= :stmts;
+    FOR i IN 1..v_stmts.COUNT LOOP
+        EXECUTE IMMEDIATE v_stmts(i);
+        v_done:= i;
+    END LOOP;
+    :done:= v_done;
+EXCEPTION
+    WHEN others THEN
+        :done:= v_done;
+        :errstr:= sqlerrm;
+END;"""
+
+
+class PrivsEngine:
+    """ Computes missing (present) or superfluous (absent) privileges and executes them chunk by chunk
+
+    dba_sys_privs/dba_role_privs/dba_tab_privs are read only for the requested grantees, privileges and owner,
+    objects are read per owner in chunks of chunk_size. Every chunk is committed, an interrupted run
+    continues where it stopped, because already granted/revoked privileges are not found again.
+    """
+
+    def __init__(self, module, conn, state, privs, chunk_size):
+        self.module = module
+        self.conn = conn
+        self.state = state
+        self.privs = privs
+        self.chunk_size = max(chunk_size, 1)
+        self.executed = []
+        self.changes = 0
+        self.objects = 0
+        self.chunks = 0
+        self.started = time.time()
+
+    def grantees(self, roles):
+        """ requested users and roles which exist and are not Oracle maintained """
+        maintained = " AND oracle_maintained = 'N'" if int(str(self.conn.version).split('.')[0]) >= 12 else ""
+        (in_users, params) = bind_in_list('username', roles, 'r')
+        (in_roles, _) = bind_in_list('role', roles, 'r')
+        c = self.conn.cursor()
+        c.execute("SELECT username FROM dba_users WHERE %s%s UNION SELECT role FROM dba_roles WHERE %s%s"
+                  % (in_users, maintained, in_roles, maintained), params)
+        found = set(row[0] for row in c.fetchall())
+        return [r for r in roles if r in found]
+
+    def diff(self, grantee, granted):
+        """ privileges of grantee to be granted (present) or revoked (absent) """
+        if self.state == 'present':
+            return [p for p in self.privs if (grantee, p) not in granted]
+        return [p for p in self.privs if (grantee, p) in granted]
+
+    def statement(self, grantee, privs, on=''):
+        if self.state == 'present':
+            return 'GRANT %s%s TO "%s"' % (','.join(privs), on, grantee)
+        return 'REVOKE %s%s FROM "%s"' % (','.join(privs), on, grantee)
+
+    def system_privs(self, grantees):
+        if not grantees:
+            return
+        (in_grantee, params) = bind_in_list('grantee', grantees, 'g')
+        c = self.conn.cursor()
+        c.execute("SELECT grantee, privilege FROM dba_sys_privs WHERE %s UNION ALL "
+                  "SELECT grantee, granted_role FROM dba_role_privs WHERE %s" % (in_grantee, in_grantee), params)
+        granted = set((grantee, priv) for (grantee, priv) in c.fetchall())
+        stmts = []
+        for grantee in grantees:
+            privs = self.diff(grantee, granted)
+            if privs:
+                stmts.append(self.statement(grantee, privs))
+        self.execute(stmts)
+
+    def object_privs(self, objs, objtypes, grantees):
+        if not grantees:
+            return
+        # owner partitions, owner part of SCHEMA.OBJECT can not contain wildcard
+        owners = dict()
+        for obj in objs:
+            (owner, name) = obj.split('.', 1)
+            owners.setdefault(owner, []).append(name)
+        for owner in sorted(owners):
+            self.owner_privs(owner, owners[owner], objtypes, grantees)
+
+    def owner_privs(self, owner, patterns, objtypes, grantees):
+        (in_grantee, params) = bind_in_list('grantee', grantees, 'g')
+        (in_priv, priv_params) = bind_in_list('privilege', self.privs, 'p')
+        params.update(priv_params)
+        params['owner'] = owner
+        c = self.conn.cursor()
+        c.execute("SELECT table_name, grantee, privilege FROM dba_tab_privs WHERE owner = :owner AND %s AND %s"
+                  % (in_grantee, in_priv), params)
+        granted = dict()
+        for (name, grantee, priv) in c.fetchall():
+            granted.setdefault(name, set()).add((grantee, priv))
+
+        (in_type, params) = bind_in_list('object_type', objtypes, 't')
+        likes = []
+        for (i, pattern) in enumerate(patterns):
+            params['o%d' % i] = pattern.replace('_', '\\_')
+            likes.append("object_name LIKE :o%d ESCAPE '\\'" % i)
+        params['owner'] = owner
+        c = self.conn.cursor()
+        c.arraysize = self.chunk_size
+        c.execute("SELECT DISTINCT object_name FROM dba_objects WHERE owner = :owner AND %s AND (%s) ORDER BY object_name"
+                  % (in_type, ' OR '.join(likes)), params)
+        while True:
+            rows = c.fetchmany(self.chunk_size)
+            if not rows:
+                break
+            stmts = []
+            for (name,) in rows:
+                have = granted.get(name, set())
+                for grantee in grantees:
+                    privs = self.diff(grantee, have)
+                    if privs:
+                        stmts.append(self.statement(grantee, privs, ' ON "%s"."%s"' % (owner, name)))
+            self.objects += len(rows)
+            self.execute(stmts)
+
+    def execute(self, stmts):
+        """ execute one chunk of statements in one round trip and commit it """
+        self.chunks += 1
+        if not stmts:
+            return
+        c = self.conn.cursor()
+        var_done = c.var(oracledb.NUMBER)
+        var_errstr = c.var(oracledb.STRING)
+        size = max(len(s.encode('utf-8')) for s in stmts)
+        c.execute(EXEC_CHUNK, {'stmts': c.arrayvar(oracledb.STRING, stmts, size),
+                               'done': var_done, 'errstr': var_errstr})
+        done = int(var_done.getvalue() or 0)
+        self.changes += done
+        self.executed.extend(stmts[:done])
+        if done < len(stmts):
+            self.conn.rollback()
+            self.module.fail_json(msg='%s-"%s"-%s' % (self.msg(), stmts[done], var_errstr.getvalue()),
+                                  changed=self.changes > 0, stats=self.stats())
+        self.conn.commit()
+
+    def msg(self):
+        if self.module.params['quiet']:
+            return ''
+        return ''.join('-' + s for s in self.executed)
+
+    def stats(self):
+        seconds = max(time.time() - self.started, 0.001)
+        return dict(objects=self.objects, chunks=self.chunks, statements=self.changes, seconds=round(seconds, 3),
+                    objects_per_second=round(self.objects / seconds, 1))
+
+
 # Ansible code
 def main():
     global lconn, conn, lparam, module
@@ -210,7 +377,8 @@ def main():
             objtypes      = dict(required=False, default=['TABLE','VIEW'], type='list'),
             roles         = dict(required=True, type='list', aliases=['role']),
             convert_to_upper = dict(default=True, type='bool'),
-            quiet         = dict(required=False, default=True, type='bool')
+            quiet         = dict(required=False, default=True, type='bool'),
+            chunk_size    = dict(required=False, default=CHUNK_SIZE, type='int')
         ),
         supports_check_mode=True
     )
@@ -235,7 +403,6 @@ def main():
     for p in module.params['objtypes']:
         if not re_priv.match(p):
             module.fail_json(msg="Invalid object type '%s'" % p)
-    objtypes = ",%s," % ",".join(module.params['objtypes'])
     # Connect to database
     oc = oracleConnection(module)
     conn = oc.conn
@@ -246,175 +413,29 @@ def main():
     if module.check_mode:
         module.exit_json(
             changed=True,
-            msg='Check mode: changement possible (estimation conservative pour un calcul de privilèges complexe)'
+            msg='Check mode: changement possible (estimation conservative pour un calcul de privilèges complexe)',
+            **broker_result(oc)
         )
     #
-    c = conn.cursor()
-    var_changes = c.var(oracledb.NUMBER)
-    var_error = c.var(oracledb.NUMBER)
-    var_errstr = c.var(oracledb.STRING)
-    var_privs = c.arrayvar(oracledb.STRING, [p.upper() for p in module.params['privs']])
-    objectslist = [p.replace("_", "\_") for p in module.params['objs']] if module.params['objs'] is not None else []
-    var_objs = c.arrayvar(oracledb.STRING, objectslist if not module.params['convert_to_upper'] else [p.upper() for p in objectslist], 100)
-    var_roles = c.arrayvar(oracledb.STRING, module.params['roles'] if not module.params['convert_to_upper'] else [p.upper() for p in module.params['roles']], 50)
-    #
-    rs_subquery = "SELECT username role FROM dba_users $IF DBMS_DB_VERSION.VERSION >= 12 $THEN WHERE oracle_maintained='N' $END UNION ALL SELECT role FROM dba_roles $IF DBMS_DB_VERSION.VERSION >= 12 $THEN WHERE oracle_maintained='N' $END INTERSECT SELECT column_value name FROM table(v_roles_sql)"
-    objs_subquery = "SELECT DISTINCT o.owner, o.object_name FROM dba_objects o JOIN table(v_objs_sql) s ON o.owner||'.'||o.object_name LIKE s.column_value ESCAPE '\\' AND v_objtype LIKE '%,'||o.object_type||',%'"
-    rp_subquery = "SELECT rs.role, p.column_value priv FROM rs CROSS JOIN table(v_privs_sql) p"
-    #
-    plsql_block = """
-    DECLARE
-        TYPE str_array IS TABLE OF VARCHAR2(50) INDEX BY BINARY_INTEGER;
-        -- output
-        v_changes NUMBER:= 0;
-        v_error NUMBER:= 0;
-        v_errstr VARCHAR2(32267);
-        -- input
-        v_state VARCHAR2(10);
-        v_objects str_array;
-        v_objtype VARCHAR2(4000);
-        v_privs str_array;
-        v_roles str_array;
-        v_report_error NUMBER:= 1;
-        v_quiet NUMBER;
-        v_privs_sql sys.DBMS_DEBUG_VC2COLL:= sys.DBMS_DEBUG_VC2COLL();
-        v_roles_sql sys.DBMS_DEBUG_VC2COLL:= sys.DBMS_DEBUG_VC2COLL();
-        v_objs_sql sys.DBMS_DEBUG_VC2COLL:= sys.DBMS_DEBUG_VC2COLL();
-
-        PROCEDURE execsql(p_sql VARCHAR2) IS
-        BEGIN
-            EXECUTE IMMEDIATE p_sql;
-            v_changes:= v_changes+1;
-            IF v_quiet = 0 THEN
-                v_errstr:= v_errstr||'-'||p_sql;
-            END IF;
-        EXCEPTION
-            WHEN others THEN
-                v_error:= v_report_error;
-                v_errstr:= v_errstr||'-"'||p_sql||'"-'||sqlerrm;
-                raise;
-        END;
-
-    BEGIN
-        -- assign input
-        v_state:= :var_state;
-        v_objects:= :var_objs;
-        v_objtype:= :var_objtype;
-        v_privs:= :var_privs;
-        v_roles:= :var_roles;
-        v_quiet:= :var_quiet;
-        -- Copy to a new array that can be used in SQL
-        FOR i IN v_privs.FIRST..v_privs.LAST LOOP
-            v_privs_sql.extend();
-            v_privs_sql(v_privs_sql.count):= v_privs(i);
-        END LOOP;
-        v_privs.delete;
-        FOR i IN v_roles.FIRST..v_roles.LAST LOOP
-            v_roles_sql.extend();
-            v_roles_sql(v_roles_sql.count):= v_roles(i);
-        END LOOP;
-        v_roles.delete;
-        IF v_objects.COUNT > 0 THEN
-            FOR i IN v_objects.FIRST..v_objects.LAST LOOP
-                v_objs_sql.extend();
-                v_objs_sql(v_objs_sql.count):= v_objects(i);
-            END LOOP;
-            v_objects.delete;
-        END IF;
-        --
-        BEGIN
-            IF v_objs_sql.COUNT > 0 THEN
-                -- Object privileges
-                IF v_state = 'present' THEN
-                    FOR rec IN (
-                        WITH objs AS (%s),
-                             rs AS (%s),
-                             rp AS (%s),
-                             objpr AS (SELECT o.owner, o.object_name, rp.priv, rp.role FROM objs o CROSS JOIN rp)
-                        SELECT owner, object_name, role, LISTAGG(priv,',') WITHIN GROUP (ORDER BY priv) privs FROM (
-                            SELECT owner, object_name, priv, role FROM objpr
-                            MINUS
-                            SELECT owner, table_name, privilege, grantee FROM dba_tab_privs)
-                        GROUP BY owner, object_name, role
-                    ) LOOP
-                        execsql('GRANT '||rec.privs||' ON "'||rec.owner||'"."'||rec.object_name||'" TO "'||rec.role||'"');
-                    END LOOP;
-                ELSIF v_state = 'absent' THEN
-                    FOR rec IN (
-                        WITH objs AS (%s),
-                             rs AS (%s),
-                             rp AS (%s),
-                             objpr AS (SELECT o.owner, o.object_name, rp.priv, rp.role FROM objs o CROSS JOIN rp)
-                        SELECT t.owner, t.table_name, t.grantee, LISTAGG(t.privilege,',') WITHIN GROUP (ORDER BY t.privilege) privs
-                        FROM dba_tab_privs t JOIN objpr o ON t.owner=o.owner AND t.table_name=o.object_name AND t.privilege=o.priv AND t.grantee=o.role
-                        GROUP BY t.owner, t.table_name, t.grantee
-                    ) LOOP
-                        execsql('REVOKE '||rec.privs||' ON "'||rec.owner||'"."'||rec.table_name||'" FROM "'||rec.grantee||'"');
-                    END LOOP;
-                END IF;
-            ELSE
-                -- System/role grants
-                IF v_state = 'present' THEN
-                    FOR rec IN (
-                        WITH rs AS (%s),
-                             rp AS (%s)
-                        SELECT role, LISTAGG(priv, ',') WITHIN GROUP (ORDER BY priv) privs FROM (
-                            SELECT rp.role, rp.priv FROM rp
-                            MINUS
-                            SELECT grantee, privilege FROM dba_sys_privs
-                            MINUS
-                            SELECT grantee, granted_role FROM dba_role_privs)
-                        GROUP BY role
-                    ) LOOP
-                        execsql('GRANT '||rec.privs||' TO "'||rec.role||'"');
-                    END LOOP;
-                ELSIF v_state = 'absent' THEN
-                    FOR rec IN (
-                        WITH rs AS (%s),
-                             rp AS (%s)
-                        SELECT s.role, LISTAGG(s.priv, ',') WITHIN GROUP (ORDER BY s.priv) privs FROM
-                            (SELECT grantee role, privilege priv FROM dba_sys_privs
-                             UNION ALL
-                             SELECT grantee, granted_role FROM dba_role_privs) s JOIN rp ON rp.role = s.role AND rp.priv = s.priv
-                        GROUP BY s.role
-                    ) LOOP
-                        execsql('REVOKE '||rec.privs||' FROM "'||rec.role||'"');
-                    END LOOP;
-                END IF;
-            END IF;
-        EXCEPTION
-            WHEN others THEN
-                NULL;
-        END;
-        -- assign output
-        :var_error:= v_error;
-        :var_errstr:= v_errstr;
-        :var_changes:= v_changes;
-    END;
-    """ % (objs_subquery, rs_subquery, rp_subquery, objs_subquery, rs_subquery, rp_subquery, rs_subquery, rp_subquery, rs_subquery, rp_subquery)
-    c.execute(plsql_block, {
-        'var_changes': var_changes,
-        'var_error': var_error,
-        'var_errstr': var_errstr,
-        'var_privs': var_privs,
-        'var_objs': var_objs,
-        'var_objtype': objtypes.upper(),
-        'var_roles': var_roles,
-        'var_state': module.params['state'],
-        'var_quiet': 1 if module.params['quiet'] else 0
-    })
-    if var_error.getvalue() > 0:
-        conn.rollback()
-        module.fail_json(msg=var_errstr.getvalue(), changed=var_changes.getvalue()>0)
+    privs = [p.upper() for p in module.params['privs']]
+    roles = module.params['roles'] if not module.params['convert_to_upper'] else [p.upper() for p in module.params['roles']]
+    objs = module.params['objs'] or []
+    if module.params['convert_to_upper']:
+        objs = [p.upper() for p in objs]
+    engine = PrivsEngine(module, conn, module.params['state'], privs, module.params.get('chunk_size') or CHUNK_SIZE)
+    grantees = engine.grantees(roles)
+    if objs:
+        engine.object_privs(objs, [t.upper() for t in module.params['objtypes']], grantees)
     else:
-        conn.commit()
-    module.exit_json(msg=var_errstr.getvalue(), changed=var_changes.getvalue()>0)
+        engine.system_privs(grantees)
+    conn.commit()
+    module.exit_json(msg=engine.msg(), changed=engine.changes > 0, stats=engine.stats(), **broker_result(oc))
 
 
 from ansible.module_utils.basic import *
 try:
     from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import (  # noqa: E501
-        oracleConnection, sanitize_string_params,
+        oracleConnection, broker_result, sanitize_string_params, bind_in_list,
     )
 except ImportError:
     def sanitize_string_params(module_params):
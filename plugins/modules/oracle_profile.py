@@ -11,11 +11,23 @@ description:
 version_added: "3.0.0"
 options:
   name:
-    description:  The name of the profile (should be in uppercase)
-    required: true
+    description:
+      - The name of the profile (should be in uppercase)
+      - Either I(name) or I(profiles) is required
+    required: false
     type: str 
     default: None
     aliases: ['profile']
+  profiles:
+    description:
+      - List of profiles to manage in one module invocation
+      - Each item accepts I(profile), I(state), I(attribute_name), I(attribute_value) and I(attributes),
+        options not set in an item are taken from the module level options
+      - Current limits of all profiles are read by one query, per-profile results are returned in C(profiles)
+    required: false
+    type: list
+    elements: dict
+    version_added: "3.5.0"
   state:
     description: The intended state of the profile.
     default: present
@@ -55,6 +67,20 @@ EXAMPLES = '''
 - debug:
     msg: "{{ _test_profile.profile }}"
 
+- name: Manage several profiles in one task
+  oracle_profile:
+    mode: sysdba
+    profiles:
+      - profile: APP_PROFILE
+        attributes:
+          PASSWORD_LIFE_TIME: "UNLIMITED"
+          SESSIONS_PER_USER: "20"
+      - profile: BATCH_PROFILE
+        attributes:
+          IDLE_TIME: "60"
+      - profile: OLD_PROFILE
+        state: absent
+
 # Create a profile
 - hosts: dbserver
   vars:
@@ -105,11 +131,22 @@ def check_profile_exists(conn, profile_name):
     return set(result)
 
 
-def create_profile(conn, module):
-    profile_name = module.params['profile'].upper()
-    attribute_name = module.params['attribute_name']
-    attribute_value = module.params['attribute_value']
-    attributes = module.params['attributes']
+# Check if the profiles exist, one query for all of them
+def check_profiles_exist(conn, profile_names):
+    predicate, params = bind_in_list('upper(profile)', [p.upper() for p in profile_names], 'profile')
+    sql = "select upper(profile), resource_name, limit from dba_profiles where %s" % predicate
+    profiles = dict()
+    for (profile, resource_name, limit) in conn.execute_select(sql, params, fetchone=False):
+        profiles.setdefault(profile, set()).add((resource_name, limit))
+    return profiles
+
+
+def create_profile(conn, module, params=None):
+    p = module.params if params is None else params
+    profile_name = p['profile'].upper()
+    attribute_name = p['attribute_name']
+    attribute_value = p['attribute_value']
+    attributes = p['attributes']
 
     if attributes:
         keys = [x.upper() for x in attributes.keys()]
@@ -123,25 +160,23 @@ def create_profile(conn, module):
         sql += ' %s %s' % (limit[0], limit[1])
 
     conn.execute_ddl(sql)
+    return 'Successfully created profile %s ' % profile_name
 
-    profile = check_profile_exists(conn, profile_name)
-    msg = 'Successfully created profile %s ' % profile_name
-    module.exit_json(msg=msg, changed=conn.changed, ddls=conn.ddls, profile=dict(profile))
 
-
-def remove_profile(conn, module):
-    profile_name = module.params['profile'].upper()
+def remove_profile(conn, module, params=None):
+    p = module.params if params is None else params
+    profile_name = p['profile'].upper()
     dropsql = 'drop profile "%s"' % profile_name
     conn.execute_ddl(dropsql)
-    msg = 'Profile %s successfully removed' % profile_name
-    module.exit_json(msg=msg, changed=conn.changed, ddls=conn.ddls, profile=dict())
+    return 'Profile %s successfully removed' % profile_name
 
 
-def ensure_profile_state(conn, module, current_set):
-    profile_name = module.params['profile'].upper()
-    attribute_name = module.params['attribute_name']
-    attribute_value = module.params['attribute_value']
-    attributes = module.params['attributes']
+def ensure_profile_state(conn, module, current_set, params=None):
+    p = module.params if params is None else params
+    profile_name = p['profile'].upper()
+    attribute_name = p['attribute_name']
+    attribute_value = p['attribute_value']
+    attributes = p['attributes']
 
     if attributes:
         keys = [x.upper() for x in attributes.keys()]
@@ -158,17 +193,55 @@ def ensure_profile_state(conn, module, current_set):
     changes = wanted_set.difference(current_set)
 
     if not changes:
-        profile = check_profile_exists(conn, profile_name)
-        module.exit_json(msg='Nothing to do', changed=conn.changed, ddls=conn.ddls, profile=dict(profile))
+        return 'Nothing to do'
 
     # Process changed attributes
     for change in changes:
         sql += ' %s %s' % (change[0], change[1])
 
     conn.execute_ddl(sql)
-    msg = 'Successfully altered the profile (%s) / %s' % (profile_name, str(changes))
-    profile = check_profile_exists(conn, profile_name)
-    module.exit_json(msg=msg, changed=conn.changed, ddls=conn.ddls, profile=dict(profile))
+    return 'Successfully altered the profile (%s) / %s' % (profile_name, str(changes))
+
+
+# Create/alter/drop all profiles from the profiles list
+def ensure_profiles(conn, module):
+    """Read current limits of all listed profiles by one query and converge them in this session"""
+    items = []
+    for entry in module.params['profiles']:
+        params = dict(module.params)
+        params.update(dict((k, v) for (k, v) in entry.items() if v is not None))
+        if len(params['attribute_name']) != len(params['attribute_value']):
+            module.fail_json(msg="attribute_name and attribute_value must have same lengths (profile %s)" % params['profile'], changed=False)
+        items.append(params)
+
+    names = [p['profile'].upper() for p in items]
+    current = check_profiles_exist(conn, names)
+
+    results = dict()
+    for p in items:
+        name = p['profile'].upper()
+        profile = current.get(name)
+        before = len(conn.ddls)
+        if p['state'] == 'absent':
+            if profile:
+                msg = remove_profile(conn, module, p)
+            else:
+                msg = "Profile %s doesn't exist" % name
+        elif profile:
+            msg = ensure_profile_state(conn, module, profile, p)
+        else:
+            msg = create_profile(conn, module, p)
+        results[name] = dict(changed=len(conn.ddls) > before, msg=msg, ddls=conn.ddls[before:])
+
+    # Read back the resulting limits, one query again
+    if any(r['changed'] for r in results.values()):
+        current = check_profiles_exist(conn, names)
+    for name in results:
+        results[name]['profile'] = dict(current.get(name, set()))
+
+    changed_profiles = [n for n in results if results[n]['changed']]
+    msg = '%d of %d profiles changed' % (len(changed_profiles), len(results))
+    module.exit_json(msg=msg, changed=conn.changed, ddls=conn.ddls, profiles=results)
 
 
 def main():
@@ -184,14 +257,22 @@ def main():
             oracle_home   = dict(required=False, aliases=['oh']),
             session_container = dict(required=False),
             
-            profile             = dict(required=True, aliases=['name']),
+            profile             = dict(required=False, aliases=['name']),
+            profiles            = dict(required=False, type='list', elements='dict', options=dict(
+                profile             = dict(required=True, aliases=['name']),
+                attribute_name      = dict(required=False, default=None, type='list', aliases=['an']),
+                attribute_value     = dict(required=False, default=None, type='list', aliases=['av']),
+                attributes          = dict(required=False, default=None, type='dict'),
+                state               = dict(default=None, choices=["present", "absent"]),
+            )),
             attribute_name      = dict(required=False, default=[], type='list', aliases=['an']),
             attribute_value     = dict(required=False, default=[], type='list', aliases=['av']),
             attributes          = dict(required=False, default={}, type='dict'),
             state               = dict(default="present", choices=["present", "absent"]),
         ),
-        mutually_exclusive=['attribute_name', 'attributes'],
+        mutually_exclusive=['attribute_name', 'attributes', ['profile', 'profiles']],
         required_together=[['user', 'password'], ['attribute_name', 'attribute_value']],
+        required_one_of=[['profile', 'profiles']],
         supports_check_mode=True
     )
     sanitize_string_params(module.params)
@@ -208,18 +289,24 @@ def main():
 
     oc = oracleConnection(module)
 
+    if module.params.get("profiles"):
+        ensure_profiles(oc, module)
+
     profile = check_profile_exists(oc, name)
     if state == 'present':
         if profile:
-            ensure_profile_state(oc, module, profile)
+            msg = ensure_profile_state(oc, module, profile)
         else:
-            create_profile(oc, module)
+            msg = create_profile(oc, module)
+        profile = check_profile_exists(oc, name)
+        module.exit_json(msg=msg, changed=oc.changed, ddls=oc.ddls, profile=dict(profile), **broker_result(oc))
     elif state == 'absent':
         if profile:
-            remove_profile(oc, module)
+            msg = remove_profile(oc, module)
+            module.exit_json(msg=msg, changed=oc.changed, ddls=oc.ddls, profile=dict(), **broker_result(oc))
         else:
-            module.exit_json(msg="Profile %s doesn't exist" % name, changed=False, profile=dict())
-    module.exit_json(msg="Unhandled exit", changed=False)
+            module.exit_json(msg="Profile %s doesn't exist" % name, changed=False, profile=dict(), **broker_result(oc))
+    module.exit_json(msg="Unhandled exit", changed=False, **broker_result(oc))
 
 
 from ansible.module_utils.basic import *
@@ -234,7 +321,7 @@ from ansible.module_utils.basic import *
 
 # In these we do import from collections
 try:
-    from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import oracleConnection, sanitize_string_params
+    from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import oracleConnection, broker_result, sanitize_string_params, bind_in_list
 except ImportError:
     sanitize_string_params = lambda p: None
 
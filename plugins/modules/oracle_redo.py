@@ -26,6 +26,23 @@ options:
     description: Redolog type, redo or standby
     default: "redo"
     choices: ['redo','standby']
+  poll_interval:
+    description:
+      - Seconds between two reads of v$log (v$standby_log) while old groups are waiting to become droppable
+      - New groups of all threads are added first, old groups are dropped as soon as they are INACTIVE and archived,
+        CURRENT groups are switched, ACTIVE groups checkpointed
+    required: False
+    default: 2
+    type: int
+    version_added: "3.5.0"
+  resize_timeout:
+    description:
+      - Seconds to wait for all old groups to be dropped, the module fails with per thread state when exceeded
+      - Per thread added/dropped groups, log switches and elapsed seconds are returned in C(threads)
+    required: False
+    default: 3600
+    type: int
+    version_added: "3.5.0"
 notes:
     - oracledb needs to be installed
 requirements: [ "oracledb" ]
@@ -49,6 +66,18 @@ EXAMPLES = '''
     size: 200M
     groups: 5
 
+- name: Resize online redologs of busy RAC database, report elapsed time per thread
+  oracle_redo:
+    mode: sysdba
+    size: 4G
+    groups: 6
+    poll_interval: 5
+    resize_timeout: 7200
+  register: redo
+
+- debug:
+    msg: "{{ redo.threads }}"
+
 - hosts: all
   gather_facts: true
   vars:
@@ -76,8 +105,183 @@ EXAMPLES = '''
 '''
 
 
+import time
+
 import oracledb
 
+SIZE_UNITS = {'M': 1024 ** 2, 'G': 1024 ** 3, 'T': 1024 ** 4}
+# Seconds between two reads of v$log/v$standby_log while old groups are drained
+POLL_INTERVAL = 2
+# Seconds to wait for old groups to become droppable
+RESIZE_TIMEOUT = 3600
+# Group is still needed for crash recovery / is the current log
+ORA_LOG_NEEDED = (1623, 1624)
+
+
+class RedoThread():
+    """ resize state of one redo thread: add -> drain -> done """
+
+    def __init__(self, thread, add, drop):
+        self.thread = thread
+        self.add = add              # group numbers to be added
+        self.pending = set(drop)    # group numbers to be dropped
+        self.state = 'add'
+        self.added = []
+        self.dropped = []
+        self.switches = 0
+        self.checkpointed = False
+        self.started = time.time()
+        self.elapsed = 0.0
+
+    def result(self):
+        return dict(state=self.state, added=self.added, dropped=self.dropped, switches=self.switches,
+                    pending=sorted(self.pending), elapsed=round(self.elapsed, 3))
+
+
+class RedoResizer():
+    """ Converges redo (or standby redo) logs of all enabled threads to wanted size and number of groups
+
+    All new groups are added first, then v$log (v$standby_log) is polled and every old group is dropped
+    as soon as it is INACTIVE/UNUSED and archived. A thread whose old group is CURRENT gets a log switch,
+    ACTIVE groups get a checkpoint. Threads are processed side by side, every poll advances all of them.
+    """
+
+    def __init__(self, module, conn, log_type, size, groups, poll_interval=POLL_INTERVAL, timeout=RESIZE_TIMEOUT):
+        self.module = module
+        self.conn = conn
+        self.standby = log_type == 'standby'
+        self.size = size
+        self.bytes = int(float(size[:-1]) * SIZE_UNITS[size[-1].upper()])
+        self.groups = int(groups)
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.ddls = []
+        self.threads = dict()
+        self.size_changes = 0
+        self.group_changes = 0
+        # set by plan()
+        self.rac = False
+        self.noarchivelog = False
+
+    def query(self, sql):
+        cur = self.conn.cursor()
+        try:
+            cur.execute(sql)
+            return cur.fetchall()
+        except oracledb.DatabaseError as exc:
+            error, = exc.args
+            self.module.fail_json(msg=error.message, changed=bool(self.ddls), ddls=self.ddls)
+        finally:
+            cur.close()
+
+    def execute(self, sql, ignore=()):
+        """ execute DDL, returns False when it failed with one of ignore error codes """
+        cur = self.conn.cursor()
+        try:
+            cur.execute(sql)
+        except oracledb.DatabaseError as exc:
+            error, = exc.args
+            if getattr(error, 'code', None) in ignore:
+                return False
+            self.module.fail_json(msg='%s: %s' % (sql, error.message), changed=bool(self.ddls), ddls=self.ddls,
+                                  threads=self.result())
+        finally:
+            cur.close()
+        self.ddls.append(sql)
+        return True
+
+    def read_logs(self):
+        """ {thread#: {group#: (bytes, status, droppable)}} """
+        if self.standby:
+            rows = [(t, g, b, s, s != 'ACTIVE') for (t, g, b, s) in
+                    self.query('select thread#, group#, bytes, status from v$standby_log')]
+        else:
+            rows = [(t, g, b, s, s in ('INACTIVE', 'UNUSED') and (a == 'YES' or self.noarchivelog)) for (t, g, b, s, a) in
+                    self.query('select thread#, group#, bytes, status, archived from v$log')]
+        logs = dict()
+        for (thread, group, size, status, droppable) in rows:
+            logs.setdefault(thread, dict())[group] = (size, status, droppable)
+        return logs
+
+    def plan(self):
+        self.rac = self.query('select parallel from v$instance')[0][0] == 'YES'
+        self.noarchivelog = self.query('select log_mode from v$database')[0][0] == 'NOARCHIVELOG'
+        threads = [t for (t,) in self.query("select thread# from v$thread where enabled != 'DISABLED' order by thread#")]
+        logs = self.read_logs()
+        # group numbers are unique across v$log and v$standby_log
+        used = [g for (g,) in self.query('select group# from v$log union all select group# from v$standby_log')]
+        next_group = max(used or [0]) + 1
+        for thread in threads:
+            current = logs.get(thread, dict())
+            old = [g for g in sorted(current) if current[g][0] != self.bytes]
+            good = [g for g in sorted(current) if current[g][0] == self.bytes]
+            # surplus groups of right size, highest group numbers go first
+            surplus = good[self.groups:]
+            add = list(range(next_group, next_group + max(self.groups - len(good), 0)))
+            next_group += len(add)
+            self.size_changes += len(old)
+            if len(current) != self.groups:
+                self.group_changes += 1
+            self.threads[thread] = RedoThread(thread, add, old + surplus)
+
+    def add_groups(self, t):
+        for group in t.add:
+            self.execute('alter database add %slogfile thread %d group %d size %s'
+                         % ('standby ' if self.standby else '', t.thread, group, self.size))
+            t.added.append(group)
+        t.state = 'drain'
+
+    def drain(self, t, logs):
+        for group in sorted(t.pending):
+            if group not in logs:
+                t.pending.discard(group)
+                continue
+            (_, _, droppable) = logs[group]
+            if droppable:
+                if self.execute('alter database drop %slogfile group %d' % ('standby ' if self.standby else '', group),
+                                ignore=ORA_LOG_NEEDED):
+                    t.pending.discard(group)
+                    t.dropped.append(group)
+                else:
+                    t.checkpointed = False
+        if not t.pending:
+            t.state = 'done'
+            t.elapsed = time.time() - t.started
+            return
+        if self.standby:
+            return
+        statuses = set(logs[g][1] for g in t.pending)
+        if 'CURRENT' in statuses:
+            if self.noarchivelog:
+                self.execute('alter system switch all logfile' if self.rac else 'alter system switch logfile')
+            else:
+                self.execute('alter system archive log thread %d current' % t.thread)
+            t.switches += 1
+            t.checkpointed = False
+        elif not t.checkpointed:
+            self.execute('alter system checkpoint global' if self.rac else 'alter system checkpoint')
+            t.checkpointed = True
+
+    def run(self):
+        self.plan()
+        for t in self.threads.values():
+            self.add_groups(t)
+        started = time.time()
+        while True:
+            logs = self.read_logs()
+            for t in self.threads.values():
+                if t.state == 'drain':
+                    self.drain(t, logs.get(t.thread, dict()))
+            if all(t.state == 'done' for t in self.threads.values()):
+                return
+            if time.time() - started > self.timeout:
+                self.module.fail_json(msg='Redo log groups not droppable in %d seconds' % self.timeout,
+                                      changed=bool(self.ddls), ddls=self.ddls, threads=self.result())
+            time.sleep(self.poll_interval)
+
+    def result(self):
+        return dict((t.thread, t.result()) for t in self.threads.values())
+
 
 # Ansible code
 def main():
@@ -94,7 +298,9 @@ def main():
             
             size          = dict(required=True),
             groups        = dict(required=True),
-            log_type      = dict(default='redo', choices=["redo", "standby"])
+            log_type      = dict(default='redo', choices=["redo", "standby"]),
+            poll_interval = dict(default=POLL_INTERVAL, type='int'),
+            resize_timeout = dict(default=RESIZE_TIMEOUT, type='int'),
             # threads       = dict(default=1)
         ),
     )
@@ -121,322 +327,20 @@ def main():
         msg = 'You need to suffix the size with (M,G or T), i.e: %sM/%sG/%sT' % (size,size,size)
         module.fail_json(msg=msg, changed=False)
 
-    redosql = """
-DECLARE
-    -- output
-    v_redo_size_changes   number := 0;
-    v_redo_group_changes   number := 0;
-    v_msg       varchar2(100);
-    -- input
-    v_maxbytes  varchar2(20) ;
-    v_groups number ;
-    -- runtime
-    v_maxbytes_actual  number(10,1);
-    v_maxbytes_suffix varchar2(1);
-    v_divisor number(20);
-    v_sleep     number := 5;
-    v_israc     VARCHAR2(3);
-    v_existing_redogroups number ;
-    v_max_groupnum  number;
-    v_group_diff number;
-    v_sql_sw_lf varchar2 (50);
-    v_sql_cp    varchar2 (50);
-    
-    -- exceptions
-    missing_suffix exception;
-    
-BEGIN
-    v_maxbytes:= :redosize;
-    v_groups:= :redogroups;
-    
-    -- Check if it is a RAC database or not (parallel = True -> RAC)
-    select parallel into v_israc from v$instance;
-    IF v_israc = 'YES' THEN
-        v_sql_sw_lf := 'alter system switch all logfile';
-        v_sql_cp := 'alter system checkpoint global';
-    ELSE
-        v_sql_sw_lf := 'alter system switch logfile';
-        v_sql_cp := 'alter system checkpoint';
-    END IF;
-
-    -- Get the suffix to decide the divisor
-    select substr(v_maxbytes,-1) into v_maxbytes_suffix from dual;
-    IF upper(v_maxbytes_suffix) = 'M' THEN
-        v_divisor := 1024*1024;
-    ELSIF upper(v_maxbytes_suffix) = 'G' THEN
-        v_divisor := 1024*1024*1024;
-    ELSIF upper(v_maxbytes_suffix) = 'T' THEN
-        v_divisor := 1024*1024*1024*1024;
-    ELSE
-        raise missing_suffix;
-    END IF;
-
-    -- Strip the suffix (M/G/T) from the input string
-    IF upper(v_maxbytes_suffix) in ('M','G','T') THEN
-        select substr (v_maxbytes, 0, (length (v_maxbytes)-1)) into v_maxbytes_actual from dual;
-    END IF;
-
-    FOR rec in (select thread#, group#, status, bytes from v$log order by thread#)
-    LOOP
-        IF rec.bytes/v_divisor != v_maxbytes_actual    THEN
-            v_redo_size_changes := v_redo_size_changes+1;
-            FOR chloop in (select thread#, group#, status from v$log where thread# = rec.thread# and group# = rec.group#)
-            LOOP
-                IF chloop.status in ('CURRENT','ACTIVE') THEN
-                    --dbms_output.put_line('Current');
-                    execute immediate v_sql_sw_lf;
-                    execute immediate v_sql_cp;
-                    dbms_lock.sleep(v_sleep);
-                    execute immediate 'alter database add logfile thread '||chloop.thread# ||' size '||v_maxbytes ;
-                    execute immediate 'alter database drop logfile group '||chloop.group# ;
-                ELSE
-                    execute immediate 'alter database add logfile thread '||chloop.thread# ||' size '||v_maxbytes ;
-                    execute immediate 'alter database drop logfile group '||chloop.group# ;
-                END IF;
-            END LOOP;
-        END IF;
-    END LOOP;
-    dbms_output.put_line(v_redo_size_changes);
-
-    -- Get number of groups
-    FOR t in (select * from v$thread where enabled != 'DISABLED')
-    LOOP
-        dbms_output.put_line('Thread: '||t.thread#);
-        select count(*) into v_existing_redogroups from v$log where thread# = t.thread#;
-        dbms_output.put_line('Thread: '||t.thread# ||' numgroups: '||v_existing_redogroups);
-        IF v_existing_redogroups < v_groups THEN
-            select v_groups-v_existing_redogroups into v_group_diff from dual;
-            dbms_output.put_line('Adding '||v_group_diff ||' groups to thread: '||t.thread#);
-            FOR grloop in 1..v_group_diff
-            LOOP
-                v_redo_group_changes := v_redo_group_changes+1;
-                --v_max_groupnum := 0;
-                select max(group#) into v_max_groupnum from v$log;
-                v_max_groupnum := v_max_groupnum + 1;
-                execute immediate 'alter database add logfile thread '|| t.thread# ||' group '||v_max_groupnum ||' size '||v_maxbytes;
-                dbms_output.put_line('adding group '||v_max_groupnum ||' to thread '||t.thread#);
-            END LOOP;
-        ELSIF v_existing_redogroups > v_groups THEN
-            --select count(*) into v_existing_redogroups from v$log where thread# = t.thread#;
-            select v_existing_redogroups-v_groups into v_group_diff from dual;
-            dbms_output.put_line('Removing ' ||v_group_diff ||' groups from thread: '||t.thread#);
-
-            FOR grloop in 1..v_group_diff
-            LOOP
-                v_redo_group_changes := v_redo_group_changes+1;
-                select max(group#) into v_max_groupnum from v$log where upper(status) not in ('ACTIVE','CURRENT') and thread# = t.thread#;
-                execute immediate 'alter database drop logfile group '||v_max_groupnum ;
-                dbms_output.put_line('dropping group '||v_max_groupnum ||' thread#: '||t.thread#);
-            end loop;
-        ELSE
-            dbms_output.put_line('Nothing to do');
-        END IF;
-    END LOOP;
-
-    :o_size_changed := v_redo_size_changes;
-    :o_group_changed := v_redo_group_changes;
-    IF v_redo_size_changes > 0 THEN
-        :o_size_msg := 'All redologs have been changed to '||v_maxbytes;
-    ELSE
-        :o_size_msg := 'No size changes';
-    END IF;
-
-    IF v_redo_group_changes > 0 THEN
-        :o_group_msg := 'Groups have been adjusted to '||v_groups ||' groups';
-    ELSE
-        :o_group_msg := 'No group changes';
-    END IF;
-
-EXCEPTION
-WHEN missing_suffix THEN
-    dbms_output.put_line('--------');
-    dbms_output.put_line('You need to suffix the size with (M,G or T), i.e: '||v_maxbytes ||'M/'||v_maxbytes ||'G/' ||v_maxbytes ||'T');
-    dbms_output.put_line('--------');
-END;
-"""
-
-    standbysql = """
-DECLARE
-    -- output
-    v_redo_size_changes   number := 0;
-    v_redo_group_changes   number := 0;
-    v_msg varchar2(100);
-    -- input
-    v_maxbytes varchar2(20) ;
-    v_groups number ;
-    -- runtime
-    v_maxbytes_actual number(10,1);
-    v_maxbytes_suffix varchar2(1);
-    v_divisor number(20);
-    v_sleep number := 5;
-    v_israc VARCHAR2(3);
-    v_existing_redogroups number ;
-    v_max_groupnum  number;
-    v_max_redo_groupnum number;
-    v_log  number;
-    v_group_diff number;
-    v_sql_sw_lf varchar2 (50);
-    v_sql_cp    varchar2 (50);
-    
-    -- exceptions
-    missing_suffix exception;
-    
-    BEGIN
-        v_maxbytes:= :redosize;
-        v_groups:= :redogroups;
-        
-        -- Check if it is a RAC database or not (parallel = True -> RAC)
-        select parallel into v_israc from v$instance;
-        IF v_israc = 'YES' THEN
-            v_sql_sw_lf := 'alter system switch all logfile';
-            v_sql_cp := 'alter system checkpoint global';
-        ELSE
-            v_sql_sw_lf := 'alter system switch logfile';
-            v_sql_cp := 'alter system checkpoint';
-        END IF;
-
-        -- Get the suffix to decide the divisor
-        select substr(v_maxbytes,-1) into v_maxbytes_suffix from dual;
-        IF upper(v_maxbytes_suffix) = 'M' THEN
-            v_divisor := 1024*1024;
-        ELSIF upper(v_maxbytes_suffix) = 'G' THEN
-            v_divisor := 1024*1024*1024;
-        ELSIF upper(v_maxbytes_suffix) = 'T' THEN
-            v_divisor := 1024*1024*1024*1024;
-        ELSE
-           raise missing_suffix;
-        END IF;
-
-        -- Strip the suffix (M/G/T) from the input string
-        IF upper(v_maxbytes_suffix) in ('M','G','T') THEN
-            select substr (v_maxbytes, 0, (length (v_maxbytes)-1)) into v_maxbytes_actual from dual;
-        END IF;
-
-        FOR rec in (select thread#, group#, status, bytes from v$standby_log order by thread#)
-        LOOP
-            IF rec.bytes/v_divisor != v_maxbytes_actual THEN
-            v_redo_size_changes := v_redo_size_changes+1;
-         FOR chloop in (select thread#, group#, status from v$standby_log where thread# = rec.thread# and group# = rec.group#)
-         LOOP
-             IF chloop.status in ('CURRENT','ACTIVE') THEN
-                 dbms_output.put_line('Current group: '||chloop.group#);
-             execute immediate v_sql_sw_lf;
-             execute immediate v_sql_cp;
-             dbms_lock.sleep(v_sleep);
-             execute immediate 'alter database add standby logfile thread '||chloop.thread# ||' size '||v_maxbytes ;
-             execute immediate 'alter database drop standby logfile group '||chloop.group# ;
-            ELSE
-            execute immediate 'alter database add standby logfile thread '||chloop.thread# ||' size '||v_maxbytes ;
-             execute immediate 'alter database drop standby logfile group '||chloop.group# ;
-             END IF;
-         END LOOP;
-         END IF;
-     END LOOP;
-        dbms_output.put_line('standby redo size changes: '||v_redo_size_changes);
-
-     -- Get number of groups
-     FOR t in (select * from v$thread where enabled != 'DISABLED')
-     LOOP
-         dbms_output.put_line('Thread: '||t.thread#);
-         select count(*) into v_existing_redogroups from v$standby_log where thread# = t.thread#;
-         dbms_output.put_line('Thread: '||t.thread# ||' numgroups: '||v_existing_redogroups);
-         IF v_existing_redogroups < v_groups THEN
-             v_group_diff := v_groups - v_existing_redogroups;
-         dbms_output.put_line('Adding '||v_group_diff ||' groups to thread: '||t.thread#);
-         FOR grloop in 1..v_group_diff
-         LOOP
-             v_redo_group_changes := v_redo_group_changes+1;
-             select max(group#) into v_max_redo_groupnum from v$log;
-             v_max_redo_groupnum := ceil(log(10, v_max_redo_groupnum));
-             v_max_redo_groupnum := power(10, v_max_redo_groupnum) + 1;
-             --
-             select nvl(max(GROUP#) + 1, 0) into v_max_groupnum from v$standby_log;
-             v_max_groupnum := greatest(v_max_groupnum, v_max_redo_groupnum);
-             execute immediate 'alter database add standby logfile thread '|| t.thread# ||' group '||v_max_groupnum ||' size '||v_maxbytes;
-             dbms_output.put_line('adding group '||v_max_groupnum ||' to thread '||t.thread#);
-         END LOOP;
-         ELSIF v_existing_redogroups > v_groups THEN
-             --select count(*) into v_existing_redogroups from v$standby_log where thread# = t.thread#;
-         select v_existing_redogroups-v_groups into v_group_diff from dual;
-         dbms_output.put_line('Removing ' ||v_group_diff ||' groups from thread: '||t.thread#);
-
-         FOR grloop in 1..v_group_diff
-         LOOP
-             v_redo_group_changes := v_redo_group_changes+1;
-            select max(group#) into v_max_groupnum from v$standby_log
-            where upper(status) not in ('ACTIVE','CURRENT') and thread# = t.thread#;
-            execute immediate 'alter database drop standby logfile group '||v_max_groupnum ;
-            dbms_output.put_line('dropping group '||v_max_groupnum ||' thread#: '||t.thread#);
-            END LOOP;
-              ELSE
-            dbms_output.put_line('Nothing to do');
-        END IF;
-       END LOOP;
-
-       :o_size_changed := v_redo_size_changes;
-       :o_group_changed := v_redo_group_changes;
-       IF v_redo_size_changes > 0 THEN
-           :o_size_msg := 'All redologs have been changed to '||v_maxbytes;
-       ELSE
-           :o_size_msg := 'No size changes';
-       END IF;
-
-       IF v_redo_group_changes > 0 THEN
-           :o_group_msg := 'Groups have been adjusted to '||v_groups ||' groups';
-       ELSE
-           :o_group_msg := 'No group changes';
-       END IF;
-
-    EXCEPTION
-    WHEN missing_suffix THEN
-        dbms_output.put_line('--------');
-        dbms_output.put_line('You need to suffix the size with (M,G or T), i.e: '||v_maxbytes ||'M/'||v_maxbytes ||'G/' ||v_maxbytes ||'T');
-        dbms_output.put_line('--------');
-END;
-"""
-
-    cur = conn.cursor()
-
-    try:
-        v_size_changed = cur.var(oracledb.NUMBER)
-        v_group_changed = cur.var(oracledb.NUMBER)
-        v_size_msg = cur.var(oracledb.STRING)
-        v_group_msg = cur.var(oracledb.STRING)
-        if log_type == 'redo':
-            cur.execute(redosql, {
-                'redosize': size,
-                'redogroups': groups ,
-                'o_size_changed': v_size_changed,
-                'o_group_changed': v_group_changed,
-                'o_size_msg': v_size_msg,
-                'o_group_msg': v_group_msg}
-            )
-        else:
-            cur.execute(standbysql, {
-                'redosize': size,
-                'redogroups': groups ,
-                'o_size_changed': v_size_changed,
-                'o_group_changed': v_group_changed,
-                'o_size_msg': v_size_msg,
-                'o_group_msg': v_group_msg}
-            )            
-    except oracledb.DatabaseError as exc:
-        error, = exc.args
-        msg = '%s' % (error.message)
-        module.fail_json(msg=msg, changed=False)
+    resizer = RedoResizer(module, conn, log_type, size, groups, module.params.get('poll_interval', POLL_INTERVAL),
+                          module.params.get('resize_timeout', RESIZE_TIMEOUT))
+    resizer.run()
 
-    size_result_changed = v_size_changed.getvalue()
-    group_result_changed = v_group_changed.getvalue()
-    #module.exit_json(msg=result_changed, changed=False)
-    size_msg = v_size_msg.getvalue()
-    group_msg = v_group_msg.getvalue()
-    msg = "%s. %s." % (size_msg, group_msg)
-    if (size_result_changed > 0 or group_result_changed > 0):
-        changed = True
+    if resizer.size_changes > 0:
+        size_msg = 'All redologs have been changed to %s' % size
+    else:
+        size_msg = 'No size changes'
+    if resizer.group_changes > 0:
+        group_msg = 'Groups have been adjusted to %s groups' % groups
     else:
-        changed = False
-    #module.exit_json(msg=result_changed, changed=False)
-    module.exit_json(msg=msg, changed=changed)
+        group_msg = 'No group changes'
+    msg = "%s. %s." % (size_msg, group_msg)
+    module.exit_json(msg=msg, changed=bool(resizer.ddls), ddls=resizer.ddls, threads=resizer.result())
 
 
 from ansible.module_utils.basic import *
@@ -12,8 +12,20 @@ description:
 version_added: "3.0.1"
 options:
   role:
-    description: The role that should be added/removed
-    required: True
+    description:
+      - The role that should be added/removed
+      - Either I(role) or I(roles) is required
+    required: false
+  roles:
+    description:
+      - List of roles to manage in one module invocation
+      - Each item accepts I(role), I(state), I(auth) and I(auth_conf), options not set
+        in an item are taken from the module level options
+      - Current state of all roles is read by one query, per-role results are returned in C(roles)
+    required: false
+    type: list
+    elements: dict
+    version_added: "3.5.0"
   state:
     description: The intended state of the role
     default: present
@@ -39,6 +51,18 @@ EXAMPLES = '''
     role: "foo"
     identified_method: "password"
     identified_value: "bar"
+
+- name: Manage several roles in one task
+  oracle_role:
+    mode: sysdba
+    roles:
+      - role: app_read
+      - role: app_write
+      - role: app_admin
+        auth: password
+        auth_conf: "{{ app_admin_role_password }}"
+      - role: app_legacy
+        state: absent
 '''
 
 
@@ -49,11 +73,19 @@ def check_role_exists(conn, role):
     return set(r.items())
 
 
+# Check if the roles exist, one query for all of them
+def check_roles_exist(conn, roles):
+    predicate, params = bind_in_list('upper(role)', [r.upper() for r in roles], 'role')
+    sql = "select role, authentication_type from dba_roles where %s" % predicate
+    return dict((r['role'].upper(), set(r.items())) for r in conn.execute_select_to_dict(sql, params))
+
+
 # Create the role
-def create_role(conn, module):
-    role = module.params["role"]
-    auth = module.params["auth"]
-    auth_conf = module.params["auth_conf"]
+def create_role(conn, module, params=None):
+    p = module.params if params is None else params
+    role = p["role"]
+    auth = p["auth"]
+    auth_conf = p["auth_conf"]
 
     # This is the default role creation
     sql = 'create role %s' % role
@@ -75,20 +107,20 @@ def create_role(conn, module):
         sql += ' identified globally'
 
     conn.execute_ddl(sql)
-    msg = 'The role (%s) has been created successfully, authentication: "%s"' % (role, auth)
-    module.exit_json(msg=msg , changed=conn.changed, ddls=conn.ddls)
+    return 'The role (%s) has been created successfully, authentication: "%s"' % (role, auth)
 
 
-def modify_role(conn, module, current_set):
-    role = module.params["role"]
-    auth = module.params["auth"]
-    auth_conf = module.params["auth_conf"]
+def modify_role(conn, module, current_set, params=None):
+    p = module.params if params is None else params
+    role = p["role"]
+    auth = p["auth"]
+    auth_conf = p["auth_conf"]
 
     sql = 'alter role %s' % role
 
     current_auth = next(v for (a, v) in current_set if a == 'authentication_type')
     if current_auth.upper() == auth.upper():
-        module.exit_json(msg='The role (%s) already exists' % role, changed=conn.changed, ddls=conn.ddls)
+        return 'The role (%s) already exists' % role
 
     if auth == 'none':
         sql += ' not identified'
@@ -108,18 +140,49 @@ def modify_role(conn, module, current_set):
         sql += ' identified globally'
 
     conn.execute_ddl(sql)
-    msg = 'The role (%s) has been changed successfully, authentication: %s, previous: %s' % (role, auth, current_auth)
-    module.exit_json(msg=msg, changed=conn.changed, ddls=conn.ddls)
+    return 'The role (%s) has been changed successfully, authentication: %s, previous: %s' % (role, auth, current_auth)
 
 
 # Drop the role
-def drop_role(conn, module):
-    role = module.params["role"]
+def drop_role(conn, module, params=None):
+    p = module.params if params is None else params
+    role = p["role"]
     sql = 'drop role %s' % role
 
     conn.execute_ddl(sql)
-    msg = 'The role (%s) has been successfully dropped' % role
-    module.exit_json(msg=msg, changed=conn.changed, ddls=conn.ddls)
+    return 'The role (%s) has been successfully dropped' % role
+
+
+# Create/modify/drop all roles from the roles list
+def ensure_roles(conn, module):
+    """Read current state of all listed roles by one query and converge them in this session"""
+    items = []
+    for entry in module.params['roles']:
+        params = dict(module.params)
+        params.update(dict((k, v) for (k, v) in entry.items() if v is not None))
+        items.append(params)
+
+    current = check_roles_exist(conn, [p['role'] for p in items])
+
+    results = dict()
+    for p in items:
+        role = p['role']
+        current_role = current.get(role.upper())
+        before = len(conn.ddls)
+        if p['state'] == 'absent':
+            if current_role:
+                msg = drop_role(conn, module, p)
+            else:
+                msg = "The role (%s) doesn't exist" % role
+        elif current_role:
+            msg = modify_role(conn, module, current_role, p)
+        else:
+            msg = create_role(conn, module, p)
+        results[role] = dict(changed=len(conn.ddls) > before, msg=msg, ddls=conn.ddls[before:])
+
+    changed_roles = [r for r in results if results[r]['changed']]
+    msg = '%d of %d roles changed' % (len(changed_roles), len(results))
+    module.exit_json(msg=msg, changed=conn.changed, ddls=conn.ddls, roles=results)
 
 
 def main():
@@ -135,12 +198,20 @@ def main():
             oracle_home   = dict(required=False, aliases=['oh']),
             session_container = dict(required=False),
 
-            role          = dict(required=True, type='str'),
+            role          = dict(required=False, type='str'),
+            roles         = dict(required=False, type='list', elements='dict', options=dict(
+                role          = dict(required=True, type='str'),
+                state         = dict(default=None, choices=["present", "absent"]),
+                auth          = dict(default=None, choices=["none", "password", "external", "global", "application"], aliases=['identified_method']),
+                auth_conf     = dict(default=None, no_log=True, aliases=['identified_value'])
+            )),
             state         = dict(default="present", choices=["present", "absent"]),
             auth          = dict(default='none', choices=["none", "password", "external", "global", "application"], aliases=['identified_method']),
             auth_conf     = dict(default=None, no_log=True, aliases=['identified_value'])
         ),
         required_together=[['user', 'password']],
+        required_one_of=[['role', 'roles']],
+        mutually_exclusive=[['role', 'roles']],
         supports_check_mode=True
     )
     sanitize_string_params(module.params)
@@ -151,18 +222,23 @@ def main():
 
     oc = oracleConnection(module)
 
+    if module.params.get("roles"):
+        ensure_roles(oc, module)
+
     current_role = check_role_exists(oc, role)
     if state == 'present':
         if not current_role:
-            create_role(oc, module)
+            msg = create_role(oc, module)
         else:
-            modify_role(oc, module, current_role)
+            msg = modify_role(oc, module, current_role)
+        module.exit_json(msg=msg, changed=oc.changed, ddls=oc.ddls, **broker_result(oc))
 
     elif state == 'absent':
         if current_role:
-            drop_role(oc, module)
+            msg = drop_role(oc, module)
+            module.exit_json(msg=msg, changed=oc.changed, ddls=oc.ddls, **broker_result(oc))
         else:
-            module.exit_json(msg="The role (%s) doesn't exist" % role, changed=False)
+            module.exit_json(msg="The role (%s) doesn't exist" % role, changed=False, **broker_result(oc))
 
     module.fail_json(msg='Unhandled exit', changed=oc.changed, ddls=oc.ddls)
 
@@ -179,7 +255,7 @@ from ansible.module_utils.basic import *
 
 # In these we do import from collections
 try:
-    from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import oracleConnection, sanitize_string_params
+    from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import oracleConnection, broker_result, sanitize_string_params, bind_in_list
 except ImportError:
     sanitize_string_params = lambda p: None
 
@@ -339,7 +339,7 @@ def main():
             )
         elif module.params['state'] == 'absent':
             would_change = result['exists']
-        module.exit_json(changed=would_change, msg='Check mode: no change executed')
+        module.exit_json(changed=would_change, msg='Check mode: no change executed', **broker_result(oc))
     #
     result_changed = False
     if module.params['state'] == 'present':
@@ -475,13 +475,13 @@ def main():
         result_changed = True
 
     conn.commit()
-    module.exit_json(msg=", ".join(msg), changed=result_changed)
+    module.exit_json(msg=", ".join(msg), changed=result_changed, **broker_result(oc))
 
 
 from ansible.module_utils.basic import *
 try:
     from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import (  # noqa: E501
-        oracleConnection, sanitize_string_params,
+        oracleConnection, broker_result, sanitize_string_params,
     )
 except ImportError:
     def sanitize_string_params(module_params):
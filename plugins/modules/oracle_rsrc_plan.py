@@ -425,6 +425,7 @@ def main():
             directives=directive_rows,
             active_plan=active,
             is_active=(active.upper() == plan_name.upper() if active else False),
+            **broker_result(conn),
         )
 
     elif state == 'present':
@@ -434,11 +435,13 @@ def main():
                 module.exit_json(
                     changed=True,
                     msg='Resource plan would be created (check mode)',
+                    **broker_result(conn),
                 )
             create_plan(conn, module)
             module.exit_json(
                 changed=conn.changed, ddls=conn.ddls,
                 msg='Resource plan created',
+                **broker_result(conn),
             )
         drift, drift_detail = resource_plan_has_drift(
             module, plan_rows[0], get_plan_directives(conn, plan_name),
@@ -447,26 +450,30 @@ def main():
             module.exit_json(
                 changed=False,
                 msg='Resource plan already matches desired state',
+                **broker_result(conn),
             )
         if module.check_mode:
             module.exit_json(
                 changed=True,
                 msg='Resource plan would be updated (check mode): %s' % drift_detail,
+                **broker_result(conn),
             )
         update_resource_plan(conn, module)
         module.exit_json(
             changed=conn.changed, ddls=conn.ddls,
             msg='Resource plan updated: %s' % drift_detail,
+            **broker_result(conn),
         )
 
     elif state == 'absent':
         if not plan_exists(conn, plan_name):
-            module.exit_json(changed=False, msg='Resource plan does not exist')
+            module.exit_json(changed=False, msg='Resource plan does not exist', **broker_result(conn))
         active = get_active_plan(conn)
         if module.check_mode:
             module.exit_json(
                 changed=True,
                 msg='Resource plan would be dropped (check mode)',
+                **broker_result(conn),
             )
         if active and active.upper() == plan_name.upper():
             conn.execute_ddl("ALTER SYSTEM SET RESOURCE_MANAGER_PLAN = ''")
@@ -474,6 +481,7 @@ def main():
         module.exit_json(
             changed=conn.changed, ddls=conn.ddls,
             msg='Resource plan dropped',
+            **broker_result(conn),
         )
 
     elif state == 'active':
@@ -481,16 +489,18 @@ def main():
             module.fail_json(msg='Plan %s does not exist' % plan_name, changed=False)
         active = get_active_plan(conn)
         if active and active.upper() == plan_name.upper():
-            module.exit_json(changed=False, msg='Plan already active')
+            module.exit_json(changed=False, msg='Plan already active', **broker_result(conn))
         if module.check_mode:
             module.exit_json(
                 changed=True,
                 msg='Resource plan would be activated (check mode)',
+                **broker_result(conn),
             )
         activate_plan(conn, module)
         module.exit_json(
             changed=conn.changed, ddls=conn.ddls,
             msg='Resource plan activated',
+            **broker_result(conn),
         )
 
 
@@ -507,7 +517,7 @@ from ansible.module_utils.basic import *  # noqa: F403
 # In this case we do import from collections
 try:
     from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import (  # noqa: E501
-        oracleConnection, sanitize_string_params,
+        oracleConnection, broker_result, sanitize_string_params,
     )
 except ImportError:
     def sanitize_string_params(_params):
@@ -175,7 +175,7 @@ def create_service(oc, module, msg):
             command += ' -rlbgoal %s' % rlbgoal
 
         # module.fail_json(msg=command)
-        (rc, stdout, stderr) = module.run_command(command)
+        (rc, stdout, stderr) = run_change_command(module, command)
         if rc != 0:
             if 'PRKO-3117' in stdout: #<-- service already exist
                 msg = 'Service %s already exists in database %s' % (name, database_name)
@@ -261,7 +261,7 @@ def ensure_service_state(oc, module, msg):
 
             if len(total_mod) > 0:
                 for cmd in total_mod:
-                    (rc, stdout, stderr) = module.run_command(cmd)
+                    (rc, stdout, stderr) = run_change_command(module, cmd)
                     if rc != 0:
                         msg = "Error modifying service. Command: %s, stdout: %s, stderr: %s" % (cmd,stdout,stderr)
                         module.fail_json(msg=msg, changed=False)
@@ -320,7 +320,7 @@ def remove_service(oc, module, msg, name, database_name, force):
         if force:
             command += ' -f'
 
-        (rc, stdout, stderr) = module.run_command(command)
+        (rc, stdout, stderr) = run_change_command(module, command)
         if rc != 0:
             if 'PRCR-1001' in stdout: #<-- service doesn' exist
                 return False
@@ -400,7 +400,7 @@ def start_service(oc, module, msg, name, database_name, configchange):
     oracle_home = module.params["oracle_home"]
     if gimanaged:
         command = "%s/bin/srvctl start service -d %s -s %s" % (oracle_home, database_name, name)
-        (rc, stdout, stderr) = module.run_command(command)
+        (rc, stdout, stderr) = run_change_command(module, command)
         if rc != 0:
             if 'PRCR-1001' in stdout:
                 msg = 'Service %s doesn\'t exist in database %s' % (name, database_name)
@@ -441,7 +441,7 @@ def stop_service(oc, module, msg, name, database_name):
     oracle_home = module.params["oracle_home"]
     if gimanaged:
         command = "%s/bin/srvctl stop service -d %s -s %s" % (oracle_home, database_name, name)
-        (rc, stdout, stderr) = module.run_command(command)
+        (rc, stdout, stderr) = run_change_command(module, command)
 
         if rc != 0:
             if ('PRCR-1005' in stdout) or ('CRS-2500' in stdout) or ('PRCD-1316' in stdout): # Already stopped
@@ -616,7 +616,7 @@ def main():
             changed = not exists
             msg = ('Service %s (%s) would be created' % (name, database_name)) if not exists \
                 else ('Service %s (%s) already exists' % (name, database_name))
-        module.exit_json(msg=msg, changed=changed)
+        module.exit_json(msg=msg, changed=changed, **broker_result(oc))
 
     if state in ('present', 'started', 'stopped'):
         if not check_service_exists(oc, module, msg, name, database_name):
@@ -634,18 +634,18 @@ def main():
         if check_service_exists(oc, module, msg, name, database_name):
             if remove_service(oc, module, msg, name, database_name, force):
                 msg = 'Service %s (%s) successfully removed' % (name, database_name)
-                module.exit_json(msg=msg, changed=True)
+                module.exit_json(msg=msg, changed=True, **broker_result(oc))
             else:
-                module.exit_json(msg=msg, changed=False)
+                module.exit_json(msg=msg, changed=False, **broker_result(oc))
         else:
             msg = 'Service %s (%s) doesn\'t exist' % (name, database_name)
-            module.exit_json(msg=msg, changed=False)
+            module.exit_json(msg=msg, changed=False, **broker_result(oc))
 
     elif state == 'restarted':
         if stop_service(oc, module, msg, name, database_name):
             if start_service(oc, module, msg, name, database_name, configchange):
                 msg = "Service %s restarted in database %s" % (name, database_name)
-                module.exit_json(msg=msg, changed=True)
+                module.exit_json(msg=msg, changed=True, **broker_result(oc))
             else:
                 module.fail_json(msg=msg, changed=True)
         else:
@@ -655,14 +655,14 @@ def main():
         if check_service_exists(oc, module, msg, name, database_name):
             if check_service_status(cursor, module, msg, name, database_name, state):
                 msg = 'Service %s is running in database %s' % (name, database_name)
-                module.exit_json(msg=msg, changed=False)
+                module.exit_json(msg=msg, changed=False, **broker_result(oc))
             else:
                 msg = 'Service %s is not running in database %s' % (name, database_name)
-                module.exit_json(msg=msg, changed=False)
+                module.exit_json(msg=msg, changed=False, **broker_result(oc))
         else:
             msg = "Service %s doesn\'t exist in database %s" % (name, database_name)
-            module.exit_json(msg=msg, changed=False)
-    module.exit_json(msg="Unhandled exit", changed=False)
+            module.exit_json(msg=msg, changed=False, **broker_result(oc))
+    module.exit_json(msg="Unhandled exit", changed=False, **broker_result(oc))
 
 
 from ansible.module_utils.basic import *
@@ -678,11 +678,16 @@ from ansible.module_utils.basic import *
 
 # In these we do import from collections
 try:
-    from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import oracleConnection, sanitize_string_params
+    from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import oracleConnection, broker_result, sanitize_string_params
     from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_homes import OracleHomes
 except ImportError:
     sanitize_string_params = lambda p: None
 
+try:
+    from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_crs import run_change_command
+except ImportError:
+    run_change_command = lambda module, command: module.run_command(command)
+
 
 if __name__ == '__main__':
     main()
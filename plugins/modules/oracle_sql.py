@@ -20,6 +20,33 @@ options:
   script:
     description: The script you want to execute. Doesn't handle selects
     required: False
+  result_format:
+    description:
+      - Format of rows returned by a select in C(data)
+      - C(dict) returns a list of dictionaries, one per row
+      - C(compact) returns column names once in C(data.columns) and rows as lists of values in C(data.rows)
+    required: False
+    default: dict
+    choices: ['dict', 'compact']
+    version_added: "3.5.0"
+  max_rows:
+    description:
+      - Return at most this number of rows, C(truncated) is set when the result set had more rows
+    required: False
+    type: int
+    version_added: "3.5.0"
+  max_bytes:
+    description:
+      - Return at most this amount of (JSON encoded) row data, C(truncated) is set when the result set was larger
+    required: False
+    type: int
+    version_added: "3.5.0"
+  arraysize:
+    description:
+      - Number of rows fetched from the database in one round-trip
+    required: False
+    type: int
+    version_added: "3.5.0"
 notes:
   - oracledb needs to be installed
   - Oracle client libraries need to be installed along with ORACLE_HOME settings.
@@ -47,6 +74,15 @@ EXAMPLES = '''
   become_user: "{{ oracle_owner }}"
   become_method: sudo
 
+# Return first 1000 rows of a large report, column names are returned only once
+- oracle_sql:
+    mode: sysdba
+    sql: "select owner, segment_name, bytes from dba_segments order by bytes desc"
+    result_format: compact
+    max_rows: 1000
+    arraysize: 1000
+  register: _segments
+
 # Execute several arbitrary SQL statements (each statement must end with a semicolon at end of line)
 - oracle_sql:
     hostname: "foo.server.net"
@@ -97,7 +133,7 @@ from ansible.module_utils.basic import AnsibleModule
 
 # In thise we do import from collections
 try:
-    from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import oracleConnection, sanitize_string_params
+    from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import oracleConnection, broker_result, sanitize_string_params
 except ImportError:
     sanitize_string_params = lambda p: None
 
@@ -140,7 +176,11 @@ def main():
             session_container = dict(required=False),
 
             sql=dict(required=False),
-            script=dict(required=False),            
+            script=dict(required=False),
+            result_format=dict(default='dict', choices=['dict', 'compact']),
+            max_rows=dict(required=False, type='int'),
+            max_bytes=dict(required=False, type='int'),
+            arraysize=dict(required=False, type='int'),
         ),
         required_if=[('mode', 'normal', ('username', 'password', 'service_name'))],
         required_one_of=[('sql', 'script')],
@@ -163,30 +203,39 @@ def main():
     # Single SELECT, PL/SQL block, DML, ALTER, DROP, ... statement
     if sql:
         if re.match(r'^\s*(select|with)\s+', sql, re.IGNORECASE):
-            result = conn.execute_select_to_dict(sql.rstrip().rstrip(';'))
-            module.exit_json(msg='Select statement executed.', changed=False, data=result)
+            compact = module.params.get("result_format") == 'compact'
+            result = conn.select_limited(sql.rstrip().rstrip(';'),
+                                         max_rows=module.params.get("max_rows"),
+                                         max_bytes=module.params.get("max_bytes"),
+                                         compact=compact,
+                                         arraysize=module.params.get("arraysize"))
+            if result['truncated']:
+                module.warn('Result set truncated after %d rows' % result['row_count'])
+            data = dict(columns=result['columns'], rows=result['rows']) if compact else result['rows']
+            module.exit_json(msg='Select statement executed.', changed=False, data=data,
+                             row_count=result['row_count'], truncated=result['truncated'], **broker_result(conn))
         elif re.match(r'^\s*(begin|declare)\b', sql, re.IGNORECASE):
             # PL/SQL anonymous block: END; requires its semicolon — do not strip it.
             lines = conn.execute_statement(sql.strip())
-            module.exit_json(msg='PL/SQL block executed.', changed=conn.changed, ddls=conn.ddls, output_lines=lines)
+            module.exit_json(msg='PL/SQL block executed.', changed=conn.changed, ddls=conn.ddls, output_lines=lines, **broker_result(conn))
         else:
             conn.execute_ddl(sql.rstrip().rstrip(';'))
-            module.exit_json(msg='SQL statement processed.', changed=conn.changed, ddls=conn.ddls)
+            module.exit_json(msg='SQL statement processed.', changed=conn.changed, ddls=conn.ddls, **broker_result(conn))
     # SQL script embeded in .yaml playbook
     elif script and not script.startswith('@'):
         execute_statements(conn, script)
-        module.exit_json(msg='DML or DDL statements executed.', changed=conn.changed, ddls=conn.ddls, output_lines=output_lines)
+        module.exit_json(msg='DML or DDL statements executed.', changed=conn.changed, ddls=conn.ddls, output_lines=output_lines, **broker_result(conn))
     # SQL file
     else:
         try:
             file_name = script.lstrip('@')
             with open(file_name, 'r') as f:
                 execute_statements(conn, f.read())
-            module.exit_json(msg='DML or DDL statements executed.', changed=conn.changed, ddls=conn.ddls, output_lines=output_lines)
+            module.exit_json(msg='DML or DDL statements executed.', changed=conn.changed, ddls=conn.ddls, output_lines=output_lines, **broker_result(conn))
         except IOError as e:
             module.fail_json(msg=str(e), changed=False)
 
-    module.exit_json(msg="Unhandled exit", changed=False)
+    module.exit_json(msg="Unhandled exit", changed=False, **broker_result(conn))
 
 
 if __name__ == '__main__':
@@ -87,7 +87,58 @@ options:
     chdir:
         description:
             - Working directory for SQL/script execution
+    parallel_degree:
+        description:
+            - Maximum number of sqlplus sessions running at once when sql/sqlscript/sqlselect or creates_sql
+              is executed in more PDBs
+            - Output is still returned in pdb_list order, per PDB output is returned in .pdbs
+            - Does not apply to catcon_pl, see catcon_processes
+            - Not used by engine oracledb, which runs everything in one session
+        required: false
+        default: 1
+        type: int
+        version_added: "3.5.0"
+    catcon_processes:
+        description:
+            - Number of parallel catcon.pl processes (catcon.pl -n)
+            - catcon.pl chooses the number by CPU count when omitted
+        required: false
+        type: int
+        version_added: "3.5.0"
+    catcon_log_dir:
+        description:
+            - Directory for catcon.pl spool files, they are kept after the run and can be followed while catcon.pl runs
+            - When omitted a temporary directory is used, it is removed only when catcon.pl succeeded
+            - Per container progress of catcon.pl is logged to syslog and returned in .containers
+            - Spool files present in the directory before the run are ignored
+        required: false
+        type: path
+        version_added: "3.5.0"
+    catcon_fail_on_errors:
+        description:
+            - Fail when the catcon.pl spool files contain ORA-, SP2- or PLS- errors
+            - By default only the return code of catcon.pl counts, the errors are just reported in .containers,
+              scripts like catctx.sql raise expected errors (e.g. ORA-00942, ORA-01918) on every run
+        required: false
+        default: false
+        type: bool
+        version_added: "3.5.0"
+    engine:
+        description:
+            - How sql, sqlselect, creates_sql and the PDB discovery queries are executed
+            - sqlplus starts new sqlplus /nolog for every statement and PDB and scrapes its output for errors
+            - oracledb executes them in one oracledb thick mode session (BEQ connect, / as sysdba unless username is given),
+              switching PDBs by alter session set container. Rows and error codes are returned in .results,
+              timeout limits each database call (call_timeout)
+            - SQL containing SQL*Plus commands (@, SET, SPOOL, ...) or more statements, sqlscript and catcon_pl
+              are always executed by sqlplus (catcon.pl)
+        required: false
+        default: sqlplus
+        choices: ['sqlplus', 'oracledb']
+        type: str
+        version_added: "3.5.0"
 
+requirements: [ "oracledb (engine oracledb only)" ]
 author: 
    - Dietmar Uhlig, Robotron (www.robotron.de)
    - Ivan Brezina
@@ -133,6 +184,7 @@ db_postinstall:
   12.2.0.1-EMS:
     - catcon_pl: "$ORACLE_HOME/ctx/admin/catctx.sql context SYSAUX TEMP NOLOCK"
       creates_sql: "select 1 from dba_registry where comp_id = 'CONTEXT'"
+      catcon_processes: 4
     - sqlscript: "?/rdbms/admin/initsqlj.sql"
       scope: pdbs
       creates_sql: "select count(*) from dba_tab_privs where table_name = 'SQLJUTL' and grantee = 'PUBLIC'"
@@ -140,6 +192,25 @@ db_postinstall:
     - sql: "alter pluggable database {{ pdb.pdb_name | default(omit) }} save state"
       scope: pdbs
 
+# Recompile invalid objects in all PDBs, up to 8 PDBs at once
+- name: Run utlrp in all PDBs
+  oracle_sqldba:
+    sqlscript: "?/rdbms/admin/utlrp.sql"
+    scope: all_pdbs
+    parallel_degree: 8
+    oracle_home: "{{ oracle_db_home }}"
+    oracle_db_name: "{{ oracle_db_name }}"
+
+# Check a registry component in every PDB through one database session
+- name: Read status of Oracle Text
+  oracle_sqldba:
+    sqlselect: "select comp_id, status from dba_registry where comp_id = 'CONTEXT'"
+    scope: all_pdbs
+    engine: oracledb
+    oracle_home: "{{ oracle_db_home }}"
+    oracle_db_name: "{{ oracle_db_name }}"
+  register: ctxstatus
+
 # see role oradb-postinstall, loops over {{ oracle_databases }} = loop_var oradb
 
 - name: Conditionally execute post installation tasks
@@ -147,6 +218,7 @@ db_postinstall:
     sql: "{{ pitask.sql | default(omit) }}"
     sqlscript: "{{ pitask.sqlscript | default(omit) }}"
     catcon_pl: "{{ pitask.catcon_pl | default(omit) }}"
+    catcon_processes: "{{ pitask.catcon_processes | default(omit) }}"
     creates_sql: "{{ pitask.creates_sql | default(omit) }}"
     username: "{{ pitask.username | default(omit) }}"
     password: "{%if pitask.username is defined%}{{ dbpasswords[oradb.oracle_db_name][pitask.username] }}{%endif%}"
@@ -166,16 +238,49 @@ import re
 import shlex
 import shutil
 import tempfile
-from subprocess import Popen, PIPE
-from threading import Timer
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from subprocess import Popen, PIPE, STDOUT
+from threading import Thread, Timer
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native, to_text
 import xml.etree.ElementTree as ET
 from copy import copy
 
+try:
+    import oracledb
+except ImportError:
+    oracledb_exists = False
+else:
+    oracledb_exists = True
+
+try:
+    from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import _ensure_oracle_client
+except ImportError:
+    _ensure_oracle_client = lambda module, oracle_home=None, required=False: False
+
 changed = False
 err_msg = ""
 result = ""
+pdb_results = dict()
+sql_results = []
+db_sessions = dict()
+catcon_results = dict()
+
+# catcon.pl output kept in memory, older lines are dropped
+CATCON_OUTPUT_LINES = 1000
+# seconds between scans of catcon.pl spool files
+CATCON_SCAN_INTERVAL = 10
+# errors reported per container
+CATCON_ERRORS = 20
+CATCON_CONTAINER = re.compile(r"==== Current Container = (\S+) Id = \d+")
+CATCON_ERROR = re.compile(r"^(ORA|SP2|PLS)-[0-9]+")
+
+# SQL*Plus commands, oracledb can not execute these
+SQLPLUS_COMMAND = re.compile(r"^\s*(@|(set|spool|start|prompt|define|undefine|column|whenever|exec|execute|host|conn|connect|var|variable|print|show)(\s|;|$))",
+                             re.IGNORECASE)
+PLSQL_BLOCK = re.compile(r"^\s*(begin|declare|create\s+(or\s+replace\s+)?(editionable\s+|noneditionable\s+)?(procedure|function|package|trigger|type)\b)",
+                         re.IGNORECASE)
 
 
 def dictify(r, root=True):
@@ -230,15 +335,43 @@ def kill_process(timeout, sql_process):
 
 
 def run_sql_p(module, sql, username, password, scope, pdb_list):
+    global pdb_results
     result = ""
     if scope == 'pdbs':
-        for pdb in pdb_list:
-            result += run_sql(module, sql, username, password, pdb)
+        outputs = run_sql_pdbs(module, sql, username, password, pdb_list)
+        pdb_results = dict(zip(pdb_list, outputs))
+        result = "".join(outputs)
     else:
         result = run_sql(module, sql, username, password, None)
     return result
 
 
+def parallel_degree(module):
+    params = getattr(module, 'params', None) or dict()
+    return max(params.get('parallel_degree') or 1, 1)
+
+
+def run_sql_pdbs(module, sql, username, password, pdb_list):
+    """ run sql in every PDB, returns list of outputs in pdb_list order
+
+    With parallel_degree > 1 up to parallel_degree sqlplus sessions run at once, errors and
+    changed flag are applied in pdb_list order, so the result does not depend on timing.
+    """
+    global changed, err_msg
+    degree = min(parallel_degree(module), len(pdb_list))
+    if degree < 2 or uses_oracledb(module, sql):
+        return [run_sql(module, sql, username, password, pdb) for pdb in pdb_list]
+
+    with ThreadPoolExecutor(max_workers=degree) as executor:
+        outcomes = list(executor.map(lambda pdb: sqlplus_exec(module, sql, username, password, pdb), pdb_list))
+    outputs = []
+    for (sout, error, mutated) in outcomes:
+        err_msg += error
+        changed = changed or mutated
+        outputs.append(sout)
+    return outputs
+
+
 def normalize_pdb_list(pdb_list):
     if pdb_list is None:
         return []
@@ -251,37 +384,153 @@ def normalize_pdb_list(pdb_list):
 
 def run_sql(module, sql, username=None, password=None, pdb=None):
     global changed, err_msg
+    execute = oracledb_exec if uses_oracledb(module, sql) else sqlplus_exec
+    (sout, error, mutated) = execute(module, sql, username, password, pdb)
+    err_msg += error
+    changed = changed or mutated
+    return sout
+
+
+def sqlplus_exec(module, sql, username=None, password=None, pdb=None):
+    """ run sql in a new sqlplus session, returns (output, error message, changed)
+
+    Does not touch module globals, so it can be called from more threads at once.
+    """
     oracle_home = module.params["oracle_home"]
     timeout = module.params['timeout']
 
     t = None
+    timed_out = []
+    error = ""
     try:
         sql_cmd = sql_input(sql, username, password, pdb)
         safe_sql_cmd = sql_input(sql, username, '********' if password else None, pdb)
         sql_process = Popen(sqlplus(oracle_home), stdin=PIPE, stdout=PIPE, stderr=PIPE, universal_newlines=True)
         if timeout > 0:
-            t = Timer(timeout, function=kill_process, args=[timeout, sql_process])
+            t = Timer(timeout, function=lambda: timed_out.append(timeout) or sql_process.kill())
             t.start()
         [sout, serr] = sql_process.communicate(input=sql_cmd)
     except Exception as e:
-        err_msg += 'Could not call sqlplus. %s. called: %s.' % (to_native(e), " ".join(sqlplus()))
-        return "[ERR]"
+        return ("[ERR]", 'Could not call sqlplus. %s. called: %s.' % (to_native(e), " ".join(sqlplus(oracle_home))), False)
     finally:
         if timeout > 0 and t is not None:
             t.cancel()
+    if timed_out:
+        error = "Timeout occured after %d seconds. " % timeout
     if sql_process.returncode != 0:
-        err_msg += "called: %s\nreturncode: %d\nresult: %s. stderr = %s." % (safe_sql_cmd, sql_process.returncode, sout, serr)
-        return "[ERR]"
+        error += "called: %s\nreturncode: %d\nresult: %s. stderr = %s." % (safe_sql_cmd, sql_process.returncode, sout, serr)
+        return ("[ERR]", error, False)
     sqlerr_pat = re.compile("^(ORA|TNS|SP2)-[0-9]+", re.MULTILINE)
     sqlplus_err = sqlerr_pat.search(sout)
     if sqlplus_err:
-        err_msg += "[ERR] sqlplus: %s\nERR Code: %s.\n" % (safe_sql_cmd, sqlplus_err.group())
-        return "[ERR]\n%s\n" % sout.strip()
+        error += "[ERR] sqlplus: %s\nERR Code: %s.\n" % (safe_sql_cmd, sqlplus_err.group())
+        return ("[ERR]\n%s\n" % sout.strip(), error, False)
+
+    return (sout.strip(), error, not is_readonly(sql))
 
+
+def is_readonly(sql):
     # Read-only statements (SELECT, CTE, subquery) do not mutate state.
-    if not sql.lstrip().lower().startswith(('select', 'with', '(')):
-        changed = True
-    return sout.strip()
+    return sql.lstrip().lower().startswith(('select', 'with', '('))
+
+
+def needs_sqlplus(sql):
+    """ True when sql has to be executed by sqlplus: SQL*Plus commands or more statements """
+    lines = [line for line in sql.splitlines() if line.strip()]
+    if not lines:
+        return False
+    if PLSQL_BLOCK.match(lines[0]):
+        # single PL/SQL block, optionally terminated by a line with "/"
+        ends = [i for (i, line) in enumerate(lines) if line.strip() == '/']
+        return bool(ends) and ends[0] != len(lines) - 1
+    starts = [lines[0]] + [line for (prev, line) in zip(lines, lines[1:]) if prev.rstrip().endswith((';', '/'))]
+    return len(starts) > 1 or any(SQLPLUS_COMMAND.match(line) for line in starts)
+
+
+def uses_oracledb(module, sql):
+    params = getattr(module, 'params', None) or dict()
+    return params.get('engine') == 'oracledb' and not needs_sqlplus(sql)
+
+
+def oracledb_statement(sql):
+    """ strip sqlplus terminators, PL/SQL blocks keep their final "end;" """
+    sql = sql.strip()
+    if sql.endswith('/'):
+        sql = sql[:-1].rstrip()
+    if not PLSQL_BLOCK.match(sql):
+        sql = sql.rstrip(';').rstrip()
+    return sql
+
+
+def fetch_value(value):
+    if hasattr(value, 'read'):
+        return value.read()
+    return value
+
+
+class OracledbSession:
+    """ one thick mode BEQ session used for all statements, PDB is switched by alter session """
+
+    def __init__(self, module, username=None, password=None):
+        if not oracledb_exists:
+            module.fail_json(msg="The oracledb module is required for engine oracledb. Install it with 'pip install oracledb'.",
+                             changed=False)
+        _ensure_oracle_client(module, oracle_home=module.params["oracle_home"], required=True)
+        if username is None:
+            self.conn = oracledb.connect(mode=oracledb.SYSDBA)
+        else:
+            self.conn = oracledb.connect(user=username, password=password)
+        self.conn.autocommit = True
+        if module.params['timeout'] > 0:
+            # per round trip, in milliseconds
+            self.conn.call_timeout = module.params['timeout'] * 1000
+        self.container = None
+
+    def set_container(self, pdb):
+        if pdb is None:
+            if self.container is None:
+                return
+            pdb = 'CDB$ROOT'
+        if pdb == self.container:
+            return
+        with self.conn.cursor() as cursor:
+            cursor.execute("alter session set container = " + pdb)
+        self.container = pdb
+
+    def execute(self, sql, pdb=None):
+        self.set_container(pdb)
+        with self.conn.cursor() as cursor:
+            cursor.execute(oracledb_statement(sql))
+            columns = [d[0] for d in cursor.description or []]
+            rows = [[fetch_value(v) for v in row] for row in cursor.fetchall()] if columns else []
+            return dict(pdb=pdb, columns=columns, rows=rows, rowcount=cursor.rowcount, code=0)
+
+
+def oracledb_exec(module, sql, username=None, password=None, pdb=None):
+    """ run sql in the shared oracledb session, returns (output, error message, changed) like sqlplus_exec
+
+    Rows and error codes are recorded in sql_results.
+    """
+    try:
+        if username not in db_sessions:
+            db_sessions[username] = OracledbSession(module, username, password)
+        res = db_sessions[username].execute(sql, pdb)
+    except oracledb.DatabaseError as e:
+        error = e.args[0]
+        sql_results.append(dict(pdb=pdb, columns=[], rows=[], rowcount=0, code=error.code, error=error.message))
+        return ("[ERR]\n%s\n" % error.message, "[ERR] oracledb: %s\nERR Code: %s.\n" % (sql, error.message), False)
+    sql_results.append(res)
+    sout = "\n".join(" ".join("" if v is None else to_text(v) for v in row) for row in res['rows'])
+    return (sout.strip(), "", not is_readonly(sql))
+
+
+def rows_state(results):
+    """ sqlselect result in the same shape as returned from dbms_xmlgen.getxml """
+    rows = []
+    for res in results:
+        for row in res['rows']:
+            rows.append(dict((c, to_text(v)) for (c, v) in zip(res['columns'], row) if v is not None))
+    return {"ROW": rows}
 
 
 def check_creates_sql(module, sql, scope, pdb_list):
@@ -292,13 +541,9 @@ def check_creates_sql(module, sql, scope, pdb_list):
         # error handling see call of check_creates_sql
         return [res] if not res or res == "0" else []
     else:
-        checked_pdb_list = []
-        for pdb in pdb_list:
-            res = run_sql(module, sql, None, None, pdb)
-            # error handling see call of check_creates_sql
-            if not res or res == "0":
-                checked_pdb_list.append(pdb)
-        return checked_pdb_list
+        results = run_sql_pdbs(module, sql, None, None, pdb_list)
+        # error handling see call of check_creates_sql
+        return [pdb for (pdb, res) in zip(pdb_list, results) if not res or res == "0"]
 
 
 def is_container(module):
@@ -314,17 +559,124 @@ def get_all_pdbs(module):
     return pdb_list
 
 
+class CatconLogs:
+    """ incremental reader of catcon.pl spool files (<base>0.log, <base>1.log, ... one per catcon process)
+
+    Every catcon process reports the container it switched to, the container is completed
+    when its process switches to an other one or exits.
+    Spool files of earlier runs in the same directory are skipped up to their size at construction,
+    they are read from the start again only when catcon.pl recreates or truncates them.
+    """
+
+    def __init__(self, logdir, base="catcon"):
+        self.logdir = logdir
+        self.base = base
+        self.offsets = dict()     # log file -> bytes already read
+        self.inodes = dict()      # log file -> inode the offset belongs to
+        self.partial = dict()     # log file -> last incomplete line
+        self.current = dict()     # log file -> container processed by its catcon process
+        self.containers = dict()  # container -> dict(status, errors)
+        for name in self.names():
+            try:
+                st = os.stat(os.path.join(self.logdir, name))
+            except OSError:
+                continue
+            self.offsets[name] = st.st_size
+            self.inodes[name] = st.st_ino
+
+    def names(self):
+        try:
+            names = sorted(os.listdir(self.logdir))
+        except OSError:
+            return []
+        return [n for n in names if n.startswith(self.base) and n.endswith(".log")]
+
+    def scan(self):
+        """ parse what was appended to the logs since the last scan, returns containers completed meanwhile """
+        completed = []
+        for name in self.names():
+            offset = self.offsets.get(name, 0)
+            try:
+                with open(os.path.join(self.logdir, name), "rb") as f:
+                    st = os.fstat(f.fileno())
+                    if st.st_ino != self.inodes.setdefault(name, st.st_ino) or st.st_size < offset:
+                        # recreated or truncated by catcon.pl, the old content is gone
+                        self.inodes[name] = st.st_ino
+                        self.partial.pop(name, None)
+                        offset = 0
+                    f.seek(offset)
+                    data = f.read()
+            except (IOError, OSError):
+                continue
+            self.offsets[name] = offset + len(data)
+            lines = (self.partial.pop(name, "") + data.decode("utf-8", "replace")).split("\n")
+            self.partial[name] = lines.pop()
+            for line in lines:
+                self.parse(name, line, completed)
+        return completed
+
+    def parse(self, name, line, completed):
+        line = line.strip()
+        m = CATCON_CONTAINER.search(line)
+        if m:
+            previous = self.current.get(name)
+            if previous is not None and previous != m.group(1):
+                self.finish(previous, completed)
+            self.current[name] = m.group(1)
+            self.containers.setdefault(m.group(1), dict(status="running", errors=[]))["status"] = "running"
+            return
+        container = self.current.get(name)
+        if container is not None and CATCON_ERROR.match(line):
+            errors = self.containers[container]["errors"]
+            if len(errors) < CATCON_ERRORS:
+                errors.append(line)
+
+    def finish(self, container, completed):
+        state = self.containers[container]
+        if state["status"] == "running":
+            state["status"] = "failed" if state["errors"] else "completed"
+            completed.append(container)
+
+    def close(self):
+        """ final scan after catcon.pl exited, containers still running are finished """
+        completed = self.scan()
+        for (name, line) in list(self.partial.items()):
+            self.parse(name, line, completed)
+        self.partial = dict()
+        for container in sorted(set(self.current.values())):
+            self.finish(container, completed)
+        return completed
+
+    def failed(self):
+        return [c for (c, state) in self.containers.items() if state["errors"]]
+
+
 def run_catcon_pl(module, pdb_list, catcon_pl):
+    """ run catcon.pl, its output is streamed into a ring buffer of last CATCON_OUTPUT_LINES lines
+
+    While catcon.pl runs, its spool files are parsed for per-container progress and errors.
+    Temporary log directory is removed only when catcon.pl succeeded.
+    """
     # after pre-processing in main() the parameter scope is not necessary any more
-    global changed, err_msg
+    global changed, err_msg, result, catcon_results
     oracle_home = module.params["oracle_home"]
     timeout = module.params["timeout"]
+    processes = module.params.get("catcon_processes")
+    keep_logs = module.params.get("catcon_log_dir")
+    fail_on_errors = module.params.get("catcon_fail_on_errors")
 
     catcon_pl = re.sub(r"^(\$ORACLE_HOME|\?)", oracle_home, catcon_pl)
-    logdir = tempfile.mkdtemp()
+    if keep_logs:
+        logdir = keep_logs
+        if not os.path.isdir(logdir):
+            os.makedirs(logdir)
+    else:
+        logdir = tempfile.mkdtemp()
     catcon_cmd = [ os.path.join(oracle_home, "perl", "bin", "perl"),
                    os.path.join(oracle_home, "rdbms", "admin", "catcon.pl"),
                    "-l", logdir, "-b", "catcon" ]
+    if processes:
+        catcon_cmd.extend(["-n", str(processes)])
     if pdb_list:
         catcon_cmd.extend(["-c", " ".join(pdb_list)])
     cc_script = shlex.split(catcon_pl)
@@ -333,27 +685,49 @@ def run_catcon_pl(module, pdb_list, catcon_pl):
             cc_script[i] = "1" + cc_script[i]
         catcon_cmd += [ "-a", "1" ]
     catcon_cmd += [ "--" ] + cc_script
+
+    output = deque(maxlen=CATCON_OUTPUT_LINES)
+    logs = CatconLogs(logdir)
     t = None
     try:
-        sql_process = Popen(catcon_cmd, stdout = PIPE, stderr = PIPE, universal_newlines=True)
+        sql_process = Popen(catcon_cmd, stdout=PIPE, stderr=STDOUT, universal_newlines=True)
         if timeout > 0:
             t = Timer(timeout, function=kill_process, args=[timeout, sql_process])
             t.start()
-        [sout, serr] = sql_process.communicate()
+        reader = Thread(target=lambda: output.extend(iter(sql_process.stdout.readline, "")))
+        reader.daemon = True
+        reader.start()
+        while reader.is_alive():
+            reader.join(CATCON_SCAN_INTERVAL)
+            for container in logs.scan():
+                module.log("catcon.pl %s: %s %s" % (cc_script[0], container, logs.containers[container]["status"]))
+        sql_process.wait()
     except Exception as e:
         err_msg += 'Could not call perl. %s. called: %s.' % (to_native(e), " ".join(catcon_cmd))
         return
     finally:
         if timeout > 0 and t is not None:
             t.cancel()
+    logs.close()
+    catcon_results = logs.containers
+    sout = "".join(output)
+    failed = sql_process.returncode != 0 or logs.failed()
+    if failed or keep_logs:
+        result += "catcon.pl logs: %s\n" % logdir
+    else:
         try:
             shutil.rmtree(logdir)
         except OSError as exc:
             if exc.errno != errno.ENOENT:
                 raise
     if sql_process.returncode != 0:
-        err_msg += "called: %s\nreturncode: %d\nresult: %s\nstderr = %s." % (" ".join(catcon_cmd), sql_process.returncode, sout, serr)
+        err_msg += "called: %s\nreturncode: %d\nresult: %s" % (" ".join(catcon_cmd), sql_process.returncode, sout)
         return
+    if logs.failed():
+        if fail_on_errors:
+            err_msg += "catcon.pl reported errors in: %s" % " ".join(logs.failed())
+        else:
+            module.warn("catcon.pl reported errors in: %s, see .containers" % " ".join(logs.failed()))
     result += sout
     changed = True
 
@@ -377,7 +751,12 @@ def main():
             nls_lang       = dict(required = False),
             chdir          = dict(required = False),
             # Maximum runtime for sqlplus and catcon.pl in seconds. 0 means no timeout.
-            timeout        = dict(required = False, default=0, type='int')
+            timeout        = dict(required = False, default=0, type='int'),
+            parallel_degree = dict(required = False, default=1, type='int'),
+            engine         = dict(required = False, default='sqlplus', choices=['sqlplus', 'oracledb']),
+            catcon_processes = dict(required = False, type='int'),
+            catcon_log_dir = dict(required = False, type='path'),
+            catcon_fail_on_errors = dict(required = False, default=False, type='bool')
         ),
         required_one_of=[('sql', 'sqlscript', 'catcon_pl', 'sqlselect')],
         mutually_exclusive=[['sql', 'sqlscript', 'catcon_pl', 'sqlselect'], ['sqlselect', 'creates_sql']],
@@ -458,7 +837,12 @@ def main():
     if pdb_list:
         result = "Run on these PDBs: %s\n" % " ".join(pdb_list)
         
-    if sqlselect is not None:
+    state = None
+    if sqlselect is not None and uses_oracledb(module, sqlselect):
+        first = len(sql_results)
+        result = run_sql_p(module, sqlselect, username, password, scope, pdb_list)
+        state = rows_state(sql_results[first:])
+    elif sqlselect is not None:
         if sqlselect.endswith(";"):
             sqlselect = sqlselect.rstrip(";")
         sqlselect = "select dbms_xmlgen.getxml('" + sqlselect.replace("'", "''") + "') from dual;"
@@ -476,13 +860,16 @@ def main():
         run_catcon_pl(module, pdb_list, catcon_pl)
 
     if err_msg:
-        module.fail_json(msg="%s: %s" % (result, err_msg), changed=changed)
+        module.fail_json(msg="%s: %s" % (result, err_msg), changed=changed, results=sql_results,
+                         containers=catcon_results)
 
     if sqlselect:
-        res_dict = dictify(ET.fromstring(result)) if result else {"ROW": []}
-        module.exit_json(msg=result, changed=False, state=res_dict)
+        if state is None:
+            state = dictify(ET.fromstring(result)) if result else {"ROW": []}
+        module.exit_json(msg=result, changed=False, state=state, results=sql_results)
     else:
-        module.exit_json(msg=result.splitlines(), changed=changed)
+        module.exit_json(msg=result.splitlines(), changed=changed, pdbs=pdb_results, results=sql_results,
+                         containers=catcon_results)
 
 
 if __name__ == '__main__':
@@ -12,8 +12,21 @@ description:
 version_added: "1.9.1"
 options:
   tablespace:
-    description: The tablespace that should be managed
-    required: True
+    description:
+      - The tablespace that should be managed
+      - Either I(tablespace) or I(tablespaces) is required
+    required: False
+  tablespaces:
+    description:
+      - List of tablespaces to manage in one module invocation
+      - Each item accepts I(tablespace), I(state), I(bigfile), I(datafile), I(numfiles), I(size), I(content),
+        I(autoextend), I(nextsize) and I(maxsize), options not set in an item are taken from the module level options
+      - Status and files of all tablespaces and db_create_file_dest are read by one query,
+        per-tablespace results are returned in C(tablespaces)
+    required: False
+    type: list
+    elements: dict
+    version_added: "3.5.0"
   state:
     description: The intended state of the tablespace
     default: present
@@ -51,6 +64,17 @@ options:
   maxsize:
     description: "If autoextend, the maximum size of the datafile (1M, 50M, 1G etc). If empty, defaults to database limits"
     aliases: ['max']
+  parallel_degree:
+    description:
+      - Number of database sessions adding data files (or resizing them) at once.
+      - With the default 1 all missing files are added by one ALTER TABLESPACE statement.
+      - Existing files are read once, files smaller than size are resized, autoextend/next/maxsize
+        changes are applied in one round trip.
+      - Progress (bytes allocated, elapsed seconds) is returned in progress.
+    required: False
+    default: 1
+    type: int
+    version_added: "3.5.0"
 notes:
   - oracledb needs to be installed
 requirements: [ "oracledb" ]
@@ -135,9 +159,54 @@ EXAMPLES = '''
     autoextend: yes
     nextsize: "1M"
     maxsize: "10M"
+
+- name: build large tablespace, 8 sessions add (OMF) datafiles at once
+  oracle_tablespace:
+    mode: sysdba
+    tablespace: "dwh"
+    size: "32G"
+    numfiles: 128
+    bigfile: no
+    autoextend: yes
+    nextsize: "1G"
+    maxsize: "unlimited"
+    parallel_degree: 8
+  register: dwh
+
+- name: Manage application tablespaces in one task
+  oracle_tablespace:
+    mode: sysdba
+    size: 1G
+    bigfile: yes
+    autoextend: yes
+    nextsize: 100M
+    maxsize: 32G
+    tablespaces:
+      - tablespace: app_data
+      - tablespace: app_index
+        size: 512M
+      - tablespace: app_temp
+        content: temp
+      - tablespace: app_old
+        state: absent
 '''
 
 
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import oracledb
+except ImportError:
+    oracledb_exists = False
+else:
+    oracledb_exists = True
+
+SIZE_UNITS = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3, 'T': 1024 ** 4}
+# maxsize unlimited of a smallfile data file, in blocks
+SMALLFILE_MAX_BLOCKS = 4194302
+
+
 # Check if the tablespace exists
 def check_tablespace_exists(conn, tablespace):
     sql = 'select tablespace_name, status from dba_tablespaces where tablespace_name = upper(:tablespace)'
@@ -145,23 +214,56 @@ def check_tablespace_exists(conn, tablespace):
     return set(r.items())
 
 
+# Read state of all listed tablespaces (status and files) and db_create_file_dest by one query
+def read_tablespaces(conn, tablespaces):
+    predicate, params = bind_in_list('t.tablespace_name', [t.upper() for t in tablespaces], 'ts')
+    sql = f"""select p.value as db_create_file_dest, t.tablespace_name, t.status, t.contents, t.block_size,
+    d.file_name, d.bytes, d.autoextensible, d.increment_by * t.block_size as next_bytes, d.maxbytes
+    from (select value from v$parameter where name = 'db_create_file_dest') p
+    left join dba_tablespaces t on {predicate}
+    left join (select tablespace_name, file_name, bytes, autoextensible, increment_by, maxbytes from dba_data_files
+               union all
+               select tablespace_name, file_name, bytes, autoextensible, increment_by, maxbytes from dba_temp_files) d
+           on d.tablespace_name = t.tablespace_name
+    order by t.tablespace_name, d.file_name"""
+    rows = conn.execute_select_to_dict(sql, params)
+    snapshot = dict(db_create_file_dest=rows[0]['db_create_file_dest'] if rows else None, tablespaces=dict())
+    for r in rows:
+        if not r['tablespace_name']:
+            continue
+        current = snapshot['tablespaces'].setdefault(r['tablespace_name'].upper(),
+                                                     dict(status=r['status'], contents=r['contents'], files=[]))
+        if r['file_name']:
+            current['files'].append(dict((k, r[k]) for k in ('file_name', 'bytes', 'autoextensible', 'next_bytes',
+                                                             'maxbytes', 'block_size')))
+    return snapshot
+
+
+def db_create_file_dest(conn, snapshot=None):
+    """ OMF destination, taken from the snapshot when tablespaces were read by read_tablespaces() """
+    if snapshot is not None:
+        return snapshot['db_create_file_dest']
+    checksql = 'select value from v$parameter where lower(name) = lower(:param)'
+    r = conn.execute_select_to_dict(checksql, {"param": 'db_create_file_dest'}, fetchone=True)
+    return r['value']
+
+
 # Create the tablespace
-def create_tablespace(conn, module):
-    tablespace = module.params["tablespace"]
-    state = module.params["state"]
-    bigfile = module.params["bigfile"]
-    datafile = module.params["datafile"]
-    numfiles = module.params["numfiles"]
-    size = module.params["size"]
-    content = module.params["content"]
-    autoextend = module.params["autoextend"]
-    nextsize = module.params["nextsize"]
-    maxsize = module.params["maxsize"]
+def create_tablespace(conn, module, params=None, snapshot=None):
+    p = module.params if params is None else params
+    tablespace = p["tablespace"]
+    state = p["state"]
+    bigfile = p["bigfile"]
+    datafile = p["datafile"]
+    numfiles = p["numfiles"]
+    size = p["size"]
+    content = p["content"]
+    autoextend = p["autoextend"]
+    nextsize = p["nextsize"]
+    maxsize = p["maxsize"]
 
     # Check if OMF is enabled
-    checksql = 'select value from v$parameter where lower(name) = lower(:param)'
-    r = conn.execute_select_to_dict(checksql, {"param": 'db_create_file_dest'}, fetchone=True)
-    if r['value']:
+    if db_create_file_dest(conn, snapshot):
         skip_datafile = True
     else:
         skip_datafile = False
@@ -284,29 +386,31 @@ def map_status(state, current_status):
 
     return wanted_status, enforcesql
 
-def ensure_tablespace_state (conn, module, tbs_just_created=False):
+def ensure_tablespace_state (conn, module, tbs_just_created=False, params=None, snapshot=None):
+    progress = dict(statements=0, bytes_planned=0, bytes_allocated=0, seconds=0)
     if module.check_mode and tbs_just_created:
         # Nothing to do here, do not fail i check mode
-        return
+        return progress
 
-    tablespace = module.params["tablespace"]
-    state = module.params["state"]
-    bigfile = module.params["bigfile"]
-    datafile = module.params["datafile"]
-    numfiles = module.params["numfiles"]
-    size = module.params["size"]
-    content = module.params["content"]
-    autoextend = module.params["autoextend"]
-    nextsize = module.params["nextsize"]
-    maxsize = module.params["maxsize"]
+    p = module.params if params is None else params
+
+    tablespace = p["tablespace"]
+    state = p["state"]
+    bigfile = p["bigfile"]
+    datafile = p["datafile"]
+    numfiles = p["numfiles"]
+    size = p["size"]
+    content = p["content"]
+    autoextend = p["autoextend"]
+    nextsize = p["nextsize"]
+    maxsize = p["maxsize"]
 
     alter_tbs_list = []
     wanted_list_dbf = []
+    file_clauses = []
 
     #module.exit_json(msg=alter_tbs_list, changed=False)
-    checksql = 'select value from v$parameter where lower(name) = lower(:param)'
-    r = conn.execute_select_to_dict(checksql, {"param": 'db_create_file_dest'}, fetchone=True)
-    if r['value']:
+    if db_create_file_dest(conn, snapshot):
         skip_datafile = True
     else:
         skip_datafile = False
@@ -318,18 +422,26 @@ def ensure_tablespace_state (conn, module, tbs_just_created=False):
     elif content == 'permanent':
         (dftype, dfsource, tbstype) = ('datafile', 'dba_data_files', 'Tablespace')
 
-    statussql = 'select status from dba_tablespaces where tablespace_name = upper(:tablespace)'
-    r = conn.execute_select_to_dict(statussql, {"tablespace": tablespace}, fetchone=True)
-    current_status = r['status']
+    # State read by read_tablespaces(), None when not read yet (single tablespace, just created tablespace)
+    current = snapshot['tablespaces'].get(tablespace.upper()) if snapshot else None
+    if current is None:
+        statussql = 'select status from dba_tablespaces where tablespace_name = upper(:tablespace)'
+        r = conn.execute_select_to_dict(statussql, {"tablespace": tablespace}, fetchone=True)
+        current_status = r['status']
+    else:
+        current_status = current['status']
     wanted_status, enforcesql = map_status(state,current_status)
     if wanted_status != current_status:
         sql = 'alter tablespace %s %s' % (tablespace, enforcesql)
         alter_tbs_list.append(sql)
 
     alter_tbs_sql = f'alter tablespace {tablespace} '
-    numfiles_curr_sql = f"select count(*) as count from {dfsource} where tablespace_name = upper(:tablespace)"
-    r = conn.execute_select_to_dict(numfiles_curr_sql, {"tablespace": tablespace}, fetchone=True)
-    crfiles = r['count']
+    if current is None:
+        numfiles_curr_sql = f"select count(*) as count from {dfsource} where tablespace_name = upper(:tablespace)"
+        r = conn.execute_select_to_dict(numfiles_curr_sql, {"tablespace": tablespace}, fetchone=True)
+        crfiles = r['count']
+    else:
+        crfiles = len(current['files'])
 
     # The following if/elif deals with adding data/temp-files
     if not skip_datafile and datafile is None:
@@ -348,14 +460,11 @@ def ensure_tablespace_state (conn, module, tbs_just_created=False):
         if autoextend and not nextsize:
             module.fail_json(msg='Error: Missing NEXT size for autoextend',changed=False)
         elif autoextend and nextsize and not maxsize:
-            wanted_list_dbf = ','.join(' size %s autoextend on next %s' % (size,nextsize) for d in range(int(newfiles)) )
+            file_clauses = [' size %s autoextend on next %s' % (size,nextsize) for d in range(int(newfiles))]
         elif autoextend and nextsize and maxsize:
-            wanted_list_dbf = ','.join(' size %s autoextend on next %s maxsize %s' % (size,nextsize,maxsize) for d in range(int(newfiles) ))
+            file_clauses = [' size %s autoextend on next %s maxsize %s' % (size,nextsize,maxsize) for d in range(int(newfiles))]
         else:
-            wanted_list_dbf = ','.join(' size %s ' % (size) for d in range(int(newfiles) ))
-
-        alter_tbs_sql += f' add {dftype} {wanted_list_dbf}'
-        alter_tbs_list.append(alter_tbs_sql)
+            file_clauses = [' size %s ' % (size) for d in range(int(newfiles))]
         #crfiles = numfiles
 
     elif numfiles is None and not bigfile and datafile is not None and int(crfiles) < int(len(datafile)):
@@ -367,195 +476,161 @@ def ensure_tablespace_state (conn, module, tbs_just_created=False):
         '''
 
         # Get the current list of datafiles
-        currfiles_perm = get_tablespace_files(conn ,tablespace)
+        if current is None:
+            currfiles_perm = get_tablespace_files(conn ,tablespace)
+        else:
+            currfiles_perm = [f['file_name'] for f in current['files']]
         # Compare the current list with the 'wanted_list_dbf'
         wanted_list_dbf = list(set(datafile) - set(currfiles_perm))
         if wanted_list_dbf:
             if autoextend and not nextsize:
                 module.fail_json(msg='Error: Missing NEXT size for autoextend',changed=False)
             elif autoextend and nextsize and not maxsize:
-                datafile_list = ','.join('\''+ d + '\' size %s autoextend on next %s' % (size,nextsize) for d in wanted_list_dbf )
+                file_clauses = ['\''+ d + '\' size %s autoextend on next %s' % (size,nextsize) for d in sorted(wanted_list_dbf)]
             elif autoextend and nextsize and maxsize:
-                datafile_list = ','.join('\''+ d + '\' size %s autoextend on next %s maxsize %s' % (size,nextsize,maxsize) for d in wanted_list_dbf )
+                file_clauses = ['\''+ d + '\' size %s autoextend on next %s maxsize %s' % (size,nextsize,maxsize) for d in sorted(wanted_list_dbf)]
             else:
-                datafile_list = ','.join('\''+ d + '\' size %s ' % (size) for d in wanted_list_dbf )
-
-            alter_tbs_sql += ' add %s %s ' % (dftype,datafile_list)
-            alter_tbs_list.append(alter_tbs_sql)
+                file_clauses = ['\''+ d + '\' size %s ' % (size) for d in sorted(wanted_list_dbf)]
             crfiles = len(datafile)
 
-    ensure_tablespace_attributes(conn,tablespace, autoextend, nextsize, maxsize)
-    # Enforce actual changes (if there are any)
-    for sql in alter_tbs_list:
-        conn.execute_ddl(sql)
+    # Files are read once, all autoextend/next/maxsize/resize changes are computed in one pass
+    files = read_tablespace_files(conn, tablespace, dfsource) if current is None else current['files']
+    changes = plan_file_changes(files, dftype, size, autoextend, nextsize, maxsize)
+    status_ddls = [(sql, 0) for sql in alter_tbs_list]
+    added = size_bytes(size) or 0
+    degree = parallel_degree(module)
+    if degree < 2:
+        # one round trip, one statement adding all missing files
+        if file_clauses:
+            status_ddls.append((alter_tbs_sql + ' add %s %s ' % (dftype, ','.join(file_clauses)), added * len(file_clauses)))
+        run_file_ddls(conn, module, changes + status_ddls, progress)
+    else:
+        # every resize and every new file gets its own session
+        run_file_ddls(conn, module, [(sql, b) for (sql, b) in changes if not b], progress)
+        run_file_ddls(conn, module, [(sql, b) for (sql, b) in changes if b], progress, degree)
+        run_file_ddls(conn, module, status_ddls, progress)
+        run_file_ddls(conn, module, [(alter_tbs_sql + f' add {dftype} {c}', added) for c in file_clauses], progress, degree)
+    return progress
+
 
+def size_bytes(size):
+    """ '100M', '2G', '512K', '1T' or plain number of bytes -> bytes, None for 'unlimited' or empty size """
+    if size is None or str(size).strip().lower() in ('', 'unlimited'):
+        return None
+    size = str(size).strip().upper()
+    if size[-1] in SIZE_UNITS:
+        return int(float(size[:-1]) * SIZE_UNITS[size[-1]])
+    return int(size)
 
-def ensure_tablespace_attributes (conn, tablespace, autoextend, nextsize, maxsize):
-
-    ensure_sql = """
-    DECLARE
-       -- output
-       v_autoextend_change number := 0;
-       v_nextsize_change number := 0;
-       v_maxsize_change number := 0;
-       -- input
-       v_tablespace varchar2(30); --:= 'blergh';
-       v_autoextend  varchar2(5); --:= 'True';
-       v_nextsize varchar2(20); --:= '10M' ;
-       v_maxsize varchar2(20); --:= '500M' ;
-       -- runtime
-       v_nextsize_suffix varchar2(1);
-       v_maxsize_suffix varchar2(1);
-       v_divisor_nextsize number(20);
-       v_divisor_maxsize number(20);
-       v_next_change number;
-       v_max_change number;
-       v_autoextend_ varchar2(3);
-       v_autoextend_sql varchar2(30);
-       v_nextsize_current varchar2(20) ;
-       v_maxsize_current varchar2(20) ;
-       v_nextsize_wanted varchar2(20) ;
-       v_maxsize_wanted varchar2(20) ;
-       v_content varchar2(30) ;
-       v_tbs_source varchar2(30);
-       v_df_source varchar2(50);
-       v_df_file varchar2(50);
-       -- exceptions
-       missing_suffix exception;
-
-       BEGIN
-           v_tablespace:= :tablespace;
-           v_autoextend:= :autoextend;
-           v_nextsize:= :nextsize;
-           v_maxsize:= :maxsize;
-           -- Check what type of tablespace it is
-           select contents into v_tbs_source from dba_tablespaces where tablespace_name = upper(''||v_tablespace||'');
-           IF upper(v_tbs_source) = 'TEMPORARY' THEN
-               v_content := 'temp';
-           ELSE
-               v_content := 'permanent';
-           END IF;
-
-           IF upper(v_autoextend) = 'TRUE' THEN
-                v_autoextend_ := 'YES';
-                v_autoextend_sql := 'on';
-           ELSE
-                v_autoextend_ := 'NO';
-                v_autoextend_sql := 'off';
-           END IF;
-           -- Get the suffix to decide the divisor
-           select substr(v_nextsize,-1),substr(v_maxsize,-1) into v_nextsize_suffix,v_maxsize_suffix from dual;
-           IF upper(v_nextsize_suffix) = 'M' THEN
-               v_divisor_nextsize := 1024*1024;
-           ELSIF upper(v_nextsize_suffix) = 'G' THEN
-               v_divisor_nextsize := 1024*1024*1024;
-           ELSIF upper(v_nextsize_suffix) = 'T' THEN
-               v_divisor_nextsize := 1024*1024*1024*1024;
-           ELSE
-               NULL;
-           END IF;
-
-           IF upper(v_maxsize_suffix) = 'M' THEN
-               v_divisor_maxsize := 1024*1024;
-           ELSIF upper(v_maxsize_suffix) = 'G' THEN
-               v_divisor_maxsize := 1024*1024*1024;
-           ELSIF upper(v_maxsize_suffix) = 'T' THEN
-               v_divisor_maxsize := 1024*1024*1024*1024;
-           ELSE
-               NULL;
-           END IF;
-
-           -- Strip the suffix (M/G/T) from the input string
-          IF upper(v_nextsize_suffix) in ('K','M','G','T') THEN
-              select substr (v_nextsize, 0, (length (v_nextsize)-1)) into v_nextsize_wanted from dual;
-          END IF;
-          IF upper(v_maxsize_suffix) in ('K','M','G','T') THEN
-              select substr (v_maxsize, 0, (length (v_maxsize)-1)) into v_maxsize_wanted from dual;
-          END IF;
-
-               -- Loop over files in the tablespace and makes changes if needed
-               IF upper(v_content) = 'TEMP' THEN
-                    v_df_file := 'tempfile';
-                    FOR rec in (select df.file_name, df.autoextensible, dt.block_size, df.increment_by, df.maxbytes
-                                from dba_tablespaces dt, dba_temp_files df
-                                where dt.tablespace_name = df.tablespace_name
-                                and dt.tablespace_name = upper(''||v_tablespace||''))
-
-                    LOOP
-                        v_nextsize_current := ((rec.block_size*rec.increment_by)/v_divisor_nextsize);
-                        v_maxsize_current := ((rec.maxbytes)/v_divisor_maxsize);
-
-                        IF (rec.autoextensible != v_autoextend_) THEN
-                            v_autoextend_change := v_autoextend_change+1;
-                            --dbms_output.put_line ('alter database '||v_df_file ||' '''||rec.file_name ||''' autoextend '||v_autoextend_sql );
-                            execute immediate 'alter database '||v_df_file ||' '''||rec.file_name ||''' autoextend '||v_autoextend_sql;
-                        END IF;
-                        IF upper(v_autoextend) = 'TRUE' THEN
-                            IF (v_nextsize_current != v_nextsize_wanted) THEN
-                                v_nextsize_change := v_nextsize_change+1;
-                                --dbms_output.put_line ('alter database tempfile '''||rec.file_name ||''' autoextend on next '||v_nextsize );
-                                execute immediate 'alter database '||v_df_file ||' '''||rec.file_name ||''' autoextend on next '||v_nextsize;
-                            END IF;
-                            IF (v_maxsize_current != v_maxsize_wanted) THEN
-                                v_maxsize_change := v_maxsize_change+1;
-                                --dbms_output.put_line ('alter database tempfile '''||rec.file_name ||''' autoextend on maxsize '||v_maxsize );
-                                execute immediate 'alter database '||v_df_file ||' '''||rec.file_name ||''' autoextend on maxsize '||v_maxsize;
-                            END IF;
-                        END IF;
-                    END LOOP;
-
-                    ELSE
-                        v_df_file := 'datafile';
-                        FOR rec in (select df.file_name, df.autoextensible, dt.block_size, df.increment_by, df.maxbytes
-                                    from dba_tablespaces dt, dba_data_files df
-                                    where dt.tablespace_name = df.tablespace_name
-                                    and dt.tablespace_name = upper(''||v_tablespace||''))
-
-                        LOOP
-                            v_nextsize_current := ((rec.block_size*rec.increment_by)/v_divisor_nextsize);
-                            v_maxsize_current := ((rec.maxbytes)/v_divisor_maxsize);
-
-                            IF (rec.autoextensible != v_autoextend_) THEN
-                                v_autoextend_change := v_autoextend_change+1;
-                                --dbms_output.put_line ('alter database '||v_df_file ||' '''||rec.file_name ||''' autoextend '||v_autoextend_sql );
-                                execute immediate 'alter database '||v_df_file ||' '''||rec.file_name ||''' autoextend '||v_autoextend_sql;
-                            END IF;
-                            IF upper(v_autoextend) = 'TRUE' THEN
-                                IF (v_nextsize_current != v_nextsize_wanted) THEN
-                                    v_nextsize_change := v_nextsize_change+1;
-                                    --dbms_output.put_line ('alter database '||v_df_file ||' '''||rec.file_name ||''' autoextend on next '||v_nextsize );
-                                    execute immediate 'alter database '||v_df_file ||' '''||rec.file_name ||''' autoextend on next '||v_nextsize;
-                                END IF;
-                                IF (v_maxsize_current != v_maxsize_wanted) THEN
-                                    v_maxsize_change := v_maxsize_change+1;
-                                    --dbms_output.put_line ('alter database '||v_df_file ||' '''||rec.file_name ||''' autoextend on maxsize '||v_maxsize );
-                                    execute immediate 'alter database '||v_df_file ||' '''||rec.file_name ||''' autoextend on maxsize '||v_maxsize;
-                                END IF;
-                            END IF;
-                        END LOOP;
-               END IF;
-               --:o_autoextend_changed := v_autoextend_change;
-               --:o_nextsize_changed := v_nextsize_change;
-               --:o_maxsize_changed := v_maxsize_change;
-               IF v_autoextend_change > 0 or v_nextsize_change > 0 or v_maxsize_change > 0 THEN
-                  dbms_output.put_line ('auto: '||v_autoextend_change);
-                  dbms_output.put_line ('next: '||v_nextsize_change);
-                  dbms_output.put_line ('max: '||v_maxsize_change);
-                  dbms_output.put_line ('Changes applied');
-               END IF;
-       END;
+
+def blocks_bytes(value, block_size):
+    """ bytes rounded up to whole blocks, as Oracle stores file sizes """
+    return -(-value // block_size) * block_size
+
+
+def read_tablespace_files(conn, tablespace, dfsource):
+    """ all data/temp files of the tablespace with their current sizes and autoextend settings, one query """
+    sql = f"""select d.file_name, d.bytes, d.autoextensible, d.increment_by * t.block_size as next_bytes,
+    d.maxbytes, t.block_size
+    from dba_tablespaces t, {dfsource} d
+    where t.tablespace_name = d.tablespace_name
+    and t.tablespace_name = upper(:tablespace)
+    order by d.file_name"""
+    return conn.execute_select_to_dict(sql, {'tablespace': tablespace})
+
+
+def plan_file_changes(files, dftype, size, autoextend, nextsize, maxsize):
+    """ compare files read by read_tablespace_files with wanted settings
+
+    Returns list of (sql, bytes) to be executed, bytes is the space allocated by a statement (resize),
+    0 for autoextend/next/maxsize changes. Files are only grown, never shrunk.
     """
+    wanted_size = size_bytes(size)
+    wanted_next = size_bytes(nextsize)
+    wanted_max = size_bytes(maxsize)
+    changes = []
+    for f in files:
+        block_size = int(f['block_size'])
+        alter = "alter database %s '%s'" % (dftype, f['file_name'])
+        if not autoextend:
+            if f['autoextensible'] == 'YES':
+                changes.append(('%s autoextend off' % alter, 0))
+        else:
+            next_changed = wanted_next is not None and int(f['next_bytes'] or 0) != blocks_bytes(wanted_next, block_size)
+            if wanted_max is not None:
+                max_changed = int(f['maxbytes'] or 0) != blocks_bytes(wanted_max, block_size)
+            else:
+                # maxsize unlimited is reported as the largest possible smallfile size (or more for bigfile)
+                max_changed = maxsize is not None and int(f['maxbytes'] or 0) < SMALLFILE_MAX_BLOCKS * block_size
+            if f['autoextensible'] != 'YES' or next_changed or max_changed:
+                sql = '%s autoextend on' % alter
+                if nextsize:
+                    sql += ' next %s' % nextsize
+                if maxsize:
+                    sql += ' maxsize %s' % maxsize
+                changes.append((sql, 0))
+        if wanted_size is not None and f['bytes'] is not None and int(f['bytes']) < wanted_size:
+            changes.append(("%s resize %s" % (alter, size), wanted_size - int(f['bytes'])))
+    return changes
+
+
+def file_session_ddl(module, sql):
+    """ execute one statement in its own database session, returns (error, seconds) """
+    start = time.time()
+    session = oracleConnection(module)
+    try:
+        with session.conn.cursor() as cursor:
+            cursor.execute(sql)
+        return (None, time.time() - start)
+    except oracledb.DatabaseError as e:
+        error = e.args[0]
+        return (getattr(error, 'message', str(error)), time.time() - start)
+    finally:
+        session.conn.close()
+
 
-    r = conn.execute_statement(ensure_sql,
-                           {'tablespace': tablespace,
-                            'autoextend': str(autoextend),
-                            'nextsize': nextsize,
-                            'maxsize': maxsize})
-    if conn.module._verbosity >= 3:
-        conn.module.warn(str(r))
+def parallel_degree(module):
+    return max(module.params.get('parallel_degree') or 1, 1)
 
-    if r:
-        conn.changed = True
+
+def run_file_ddls(conn, module, ddls, progress, degree=1):
+    """ execute list of (sql, bytes) and account allocated bytes in progress
+
+    degree 1 executes all statements in one round trip. With higher degree every statement
+    (ALTER TABLESPACE ADD DATAFILE, ALTER DATABASE DATAFILE RESIZE) gets its own session, up to degree
+    sessions run at once, so files are formatted concurrently. Allocated bytes are logged as statements complete.
+    """
+    if not ddls:
+        return
+    start = time.time()
+    planned = sum(b for (_, b) in ddls)
+    progress['bytes_planned'] += planned
+    degree = min(degree, len(ddls))
+    if degree < 2 or module.check_mode:
+        conn.execute_ddls([sql for (sql, _) in ddls])
+        progress['statements'] += len(ddls)
+        progress['bytes_allocated'] += planned
+        progress['seconds'] = round(progress['seconds'] + time.time() - start, 3)
+        return
+
+    errors = []
+    with ThreadPoolExecutor(max_workers=degree) as executor:
+        futures = dict((executor.submit(file_session_ddl, module, sql), (sql, b)) for (sql, b) in ddls)
+        for future in as_completed(futures):
+            (sql, b) = futures[future]
+            (error, seconds) = future.result()
+            if error:
+                errors.append('%s: %s' % (sql, error))
+                continue
+            conn.ddls.append(sql)
+            conn.changed = True
+            progress['statements'] += 1
+            progress['bytes_allocated'] += b
+            module.log('%s (%.1fs), %d of %d bytes allocated'
+                       % (sql, seconds, progress['bytes_allocated'], progress['bytes_planned']))
+    progress['seconds'] = round(progress['seconds'] + time.time() - start, 3)
+    if errors:
+        module.fail_json(msg='; '.join(errors), changed=conn.changed, ddls=conn.ddls, progress=progress)
 
 
 # Get the existing datafiles for the tablespace
@@ -602,6 +677,43 @@ def drop_tablespace(conn, module, tablespace):
     conn.execute_ddl(drop_sql)
 
 
+# Create/alter/drop all tablespaces from the tablespaces list
+def ensure_tablespaces(conn, module):
+    """Read current state of all listed tablespaces by one query and converge them in this session"""
+    items = []
+    for entry in module.params['tablespaces']:
+        params = dict(module.params)
+        params.update(dict((k, v) for (k, v) in entry.items() if v is not None))
+        items.append(params)
+
+    snapshot = read_tablespaces(conn, [p['tablespace'] for p in items])
+
+    results = dict()
+    for p in items:
+        tablespace = p['tablespace']
+        exists = tablespace.upper() in snapshot['tablespaces']
+        before = len(conn.ddls)
+        progress = None
+        if p['state'] == 'absent':
+            if exists:
+                drop_tablespace(conn, module, tablespace)
+                msg = f'The tablespace {tablespace} has been dropped successfully'
+            else:
+                msg = f'Nothing to do for {tablespace}'
+        elif not exists:
+            create_tablespace(conn, module, p, snapshot)
+            progress = ensure_tablespace_state(conn, module, True, p, snapshot)
+            msg = f'The tablespace {tablespace} has been created successfully'
+        else:
+            progress = ensure_tablespace_state(conn, module, False, p, snapshot)
+            msg = f'The tablespace {tablespace} has been altered successfully'
+        results[tablespace] = dict(changed=len(conn.ddls) > before, msg=msg, ddls=conn.ddls[before:], progress=progress)
+
+    changed_tablespaces = [t for t in results if results[t]['changed']]
+    msg = '%d of %d tablespaces changed' % (len(changed_tablespaces), len(results))
+    module.exit_json(msg=msg, changed=conn.changed, ddls=conn.ddls, tablespaces=results)
+
+
 def main():
     module = AnsibleModule(
         argument_spec = dict(
@@ -615,7 +727,19 @@ def main():
             oracle_home   = dict(required=False, aliases=['oh']),
             session_container = dict(required=False),
 
-            tablespace    = dict(required=True, aliases=['name','ts']),
+            tablespace    = dict(required=False, aliases=['name','ts']),
+            tablespaces   = dict(required=False, type='list', elements='dict', options=dict(
+                tablespace    = dict(required=True, aliases=['name']),
+                state         = dict(default=None, choices=["present", "absent", "read_only", "read_write", "offline", "online"]),
+                bigfile       = dict(default=None, type='bool'),
+                datafile      = dict(required=False, type='list', aliases=['datafiles']),
+                numfiles      = dict(required=False),
+                size          = dict(required=False),
+                content       = dict(default=None, choices=['permanent', 'temp', 'undo']),
+                autoextend    = dict(default=None, type='bool'),
+                nextsize      = dict(required=False, aliases=['next']),
+                maxsize       = dict(required=False, aliases=['max']),
+            )),
             state         = dict(default="present", choices=["present", "absent", "read_only", "read_write", "offline", "online" ]),
             bigfile       = dict(default=True, type='bool'),
             datafile      = dict(required=False, type='list', aliases=['datafiles','df']),
@@ -625,8 +749,10 @@ def main():
             autoextend    = dict(default=False, type='bool'),
             nextsize      = dict(required=False, aliases=['next']),
             maxsize       = dict(required=False, aliases=['max']),
+            parallel_degree = dict(required=False, default=1, type='int'),
         ),
-        mutually_exclusive = [('datafile', 'numfiles')],
+        mutually_exclusive = [('datafile', 'numfiles'), ('tablespace', 'tablespaces')],
+        required_one_of=[('tablespace', 'tablespaces')],
         required_if=[('autoextend', True, ('nextsize',))],
         supports_check_mode=True
     )
@@ -638,24 +764,27 @@ def main():
 
     conn = oracleConnection(module)
 
+    if module.params.get("tablespaces"):
+        ensure_tablespaces(conn, module)
+
     if state in ('present', 'read_only', 'read_write', 'offline', 'online'):
         if not check_tablespace_exists(conn, tablespace):
             create_tablespace(conn, module)
-            ensure_tablespace_state(conn, module, tbs_just_created=True)
+            progress = ensure_tablespace_state(conn, module, tbs_just_created=True)
             msg = f'The tablespace {tablespace} has been created successfully'
-            module.exit_json(msg=msg, changed=conn.changed, ddls=conn.ddls)
+            module.exit_json(msg=msg, changed=conn.changed, ddls=conn.ddls, progress=progress, **broker_result(conn))
         else:
-            ensure_tablespace_state(conn, module, tbs_just_created=False)
+            progress = ensure_tablespace_state(conn, module, tbs_just_created=False)
             msg = f'The tablespace {tablespace} has been altered successfully'
-            module.exit_json(msg=msg, changed=conn.changed, ddls=conn.ddls)
+            module.exit_json(msg=msg, changed=conn.changed, ddls=conn.ddls, progress=progress, **broker_result(conn))
 
     elif state == 'absent':
         if check_tablespace_exists(conn, tablespace):
             drop_tablespace(conn, module, tablespace)
             msg = f'The tablespace {tablespace} has been dropped successfully'
-            module.exit_json(msg=msg, changed=conn.changed, ddls=conn.ddls)
+            module.exit_json(msg=msg, changed=conn.changed, ddls=conn.ddls, **broker_result(conn))
         msg = f'Nothing to do for {tablespace}'
-        module.exit_json(msg=msg, changed=conn.changed, ddls=conn.ddls)
+        module.exit_json(msg=msg, changed=conn.changed, ddls=conn.ddls, **broker_result(conn))
 
 
 from ansible.module_utils.basic import *
@@ -670,7 +799,7 @@ from ansible.module_utils.basic import *
 
 # In these we do import from collections
 try:
-    from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import oracleConnection, sanitize_string_params
+    from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import oracleConnection, broker_result, sanitize_string_params, bind_in_list
 except ImportError:
     sanitize_string_params = lambda p: None
 
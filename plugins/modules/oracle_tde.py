@@ -518,6 +518,7 @@ def main():
             wallet_status=wallet.get('status', '') if wallet else '',
             master_key=master_key,
             encrypted_tablespaces=encrypted_ts,
+            **broker_result(conn),
         )
 
     if state == 'present':
@@ -552,6 +553,7 @@ def main():
             msg='TDE operations completed successfully',
             master_key=master_key,
             encrypted_tablespaces=encrypted_ts,
+            **broker_result(conn),
         )
 
     elif state == 'absent':
@@ -568,6 +570,7 @@ def main():
             ddls=_redact_ddls(conn.ddls),
             msg='Tablespace decryption completed',
             encrypted_tablespaces=encrypted_ts,
+            **broker_result(conn),
         )
 
 
@@ -584,7 +587,7 @@ from ansible.module_utils.basic import *  # noqa: F403
 # In these we do import from collections
 try:
     from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import (  # noqa: E501
-        oracleConnection, sanitize_string_params,
+        oracleConnection, broker_result, sanitize_string_params,
         build_backup_clause, build_container_clause, build_force_clause,
     )
 except ImportError as e:
@@ -26,8 +26,20 @@ options:
     default: true
     required: false
   alias:
-    description: name of stanza alias in .ora file.
-    required: true    
+    description:
+      - name of stanza alias in .ora file.
+      - Either I(alias) or I(entries) is required
+    required: false
+  entries:
+    description:
+      - List of edits applied to the .ora file in one module invocation
+      - Each item accepts I(alias), I(state), I(whole_value), I(attribute_path), I(attribute_name)
+        and I(attribute_value), options not set in an item are taken from the module level options
+      - The file is parsed once, written once (with one backup) and per-alias results are returned in C(aliases)
+    required: false
+    type: list
+    elements: dict
+    version_added: "3.5.0"
   attribute_path:
     description:
       - xpath like expression in .ora stanza
@@ -45,8 +57,8 @@ options:
     description: The whole string value for a specified alias
     required: false    
 notes:
-  - Each stanza is written on single line
-  - Comments are not supported (yet)
+  - Each modified stanza is written on single line, the rest of the file (including comments) is kept as it is
+  - Comments inside of a modified stanza are not preserved
 author:
   - Ivan Brezina
 '''
@@ -103,6 +115,21 @@ EXAMPLES = '''
     alias: "DYNAMIC_REGISTRATION_LISTENER"
     state: absent
 
+- name: Maintain several service aliases in one task
+  oracle_tnsnames:
+    path: "{{ tnsnames_file }}"
+    entries:
+      - alias: "APP1"
+        whole_value: "(DESCRIPTION=(ADDRESS=(PROTOCOL=TCP)(HOST=db1)(PORT=1521))(CONNECT_DATA=(SERVICE_NAME=app1)))"
+      - alias: "APP2"
+        attribute_path: "DESCRIPTION/CONNECT_DATA/SERVICE_NAME"
+        attribute_value: "app2"
+      - alias: "OLD_APP"
+        state: absent
+  register: _tns
+
+- debug: var=_tns.aliases
+
 '''
 
 # In this case we do import from local project project sub-directory <project-dir>/module_utils
@@ -138,6 +165,55 @@ def write_changes(module, content, dest):
                        unsafe_writes=True) #
 
 
+def apply_entry(module, orafile, p):
+    """Apply one alias edit (module params or an item of entries) to the parsed file"""
+    alias = p['alias']
+    state = p['state']
+    whole_value = p['whole_value']
+    attribute_path = p['attribute_path']
+    attribute_name = p['attribute_name']
+    attribute_value = p['attribute_value']
+
+    if len([o for o in (whole_value, attribute_path, attribute_name) if o]) > 1:
+        module.fail_json(msg="Alias {}: parameters are mutually exclusive: whole_value|attribute_path|attribute_name".format(alias))
+
+    if state == 'present':
+        if whole_value:
+            orafile.upsertalias(alias, whole_value)
+        elif attribute_name:
+            orafile.setparamvalue(alias, attribute_name, attribute_value)
+        elif attribute_path:
+            orafile.upsertaliasatribute(alias, attribute_path, attribute_value)
+    elif state == 'absent':
+        if whole_value:
+            module.fail_json(msg="Combination state: present and whole_value is not allowed")
+        elif attribute_path:
+            orafile.deleteparampath(alias, attribute_path)
+        elif attribute_name:
+            orafile.deleteparam(alias, attribute_name)
+        elif not attribute_name and not attribute_path and not whole_value:
+            orafile.removealias(alias)
+        else:
+            module.fail_json(msg="Combination of parameter not allowed")
+
+    param = orafile.findalias(alias)
+    return param.valuesstr() if param else ''
+
+
+def apply_entries(module, orafile):
+    """Apply all items of entries to one in-memory file, return per-alias results"""
+    results = dict()
+    for entry in module.params['entries']:
+        p = dict(module.params)
+        p.update(dict((k, v) for (k, v) in entry.items() if v is not None))
+        orafile.changed, changed = False, orafile.changed
+        value = apply_entry(module, orafile, p)
+        previous = results.get(p['alias'], {}).get('changed', False)
+        results[p['alias']] = dict(changed=previous or orafile.changed, msg="{}={}".format(p['alias'], value))
+        orafile.changed = changed or orafile.changed
+    return results
+
+
 # Ansible code
 def main():
     module = AnsibleModule(
@@ -146,7 +222,15 @@ def main():
             follow      = dict(default=True, required=False),
             backup      = dict(type='bool', default=True), # inherited from add_file_common_args
             state       = dict(default="present", choices=["present", "absent"]),
-            alias       = dict(required=True),
+            alias       = dict(required=False),
+            entries     = dict(required=False, type='list', elements='dict', options=dict(
+                alias           = dict(required=True),
+                state           = dict(default=None, choices=["present", "absent"]),
+                whole_value     = dict(required=False),
+                attribute_path  = dict(required=False),
+                attribute_name  = dict(required=False),
+                attribute_value = dict(required=False),
+            )),
             whole_value = dict(required=False),
             attribute_path  = dict(required=False),
             attribute_name  = dict(required=False),
@@ -154,23 +238,19 @@ def main():
         ),
         #add_file_common_args=True,
         supports_check_mode=True,
-        mutually_exclusive=[['whole_value', 'attribute_path', 'attribute_name']]
+        required_one_of=[['alias', 'entries']],
+        mutually_exclusive=[['whole_value', 'attribute_path', 'attribute_name'], ['alias', 'entries']]
     )
     
     #if module._verbosity >= 3:
     #    module.exit_json(changed=True, debug=module.params)
 
-    whole_value     = module.params['whole_value']
-    attribute_value = module.params['attribute_value']
-    attribute_path  = module.params['attribute_path']
-    attribute_name  = module.params['attribute_name']
-
     # Preparation
     facts = {}
 
     filename = module.params["path"]
     alias = module.params['alias']
-    state = module.params['state']
+    entries = module.params.get('entries')
 
     try:
         if module.params["follow"]:
@@ -186,31 +266,12 @@ def main():
 
     orafile = DotOraFile(filename)
 
-    if state == 'present':
-        if whole_value:
-            orafile.upsertalias(alias, whole_value)
-        elif attribute_name:
-            orafile.setparamvalue(alias, attribute_name, attribute_value)
-        elif attribute_path:
-            orafile.upsertaliasatribute(alias, attribute_path, attribute_value)
-    elif state == 'absent':
-        if whole_value:
-            module.fail_json(msg="Combination state: present and whole_value is not allowed")
-        elif attribute_path:
-            orafile.deleteparampath(alias, attribute_path)
-        elif attribute_name:
-            orafile.deleteparam(alias, attribute_name)
-        elif not attribute_name and not attribute_path and not whole_value:
-            orafile.removealias(alias)
-        else:
-            module.fail_json(msg="Combination of parameter not allowed")
-
-
-    try:
-        param = next(p for p in orafile.params if p.name and p.name.casefold() == alias.casefold())
-        alias_value = param.valuesstr()
-    except StopIteration:
-        alias_value = ''
+    results = dict()
+    alias_value = None
+    if entries:
+        results = apply_entries(module, orafile)
+    else:
+        alias_value = apply_entry(module, orafile, module.params)
 
     new_content = str(orafile)
     changed = bool(old_content != new_content and orafile.changed)
@@ -223,6 +284,10 @@ def main():
     # Output
     for line in orafile.warn:
         module.warn(line)
+    if entries:
+        changed_aliases = [a for a in results if results[a]['changed']]
+        msg = '{} of {} aliases changed'.format(len(changed_aliases), len(results))
+        module.exit_json(msg=msg, changed=changed, aliases=results, ansible_facts=facts)
     module.exit_json(msg="{}={}".format(alias, alias_value), changed=changed, ansible_facts=facts)
 
 
@@ -12,9 +12,24 @@ description:
 version_added: "3.0.0"
 options:
   schema:
-    description: The schema that you want to manage
+    description:
+      - The schema that you want to manage
+      - Either I(schema) or I(users) is required
     required: false
     default: None
+  users:
+    description:
+      - List of schemas to manage in one module invocation
+      - Each item accepts the per-schema options of this module (schema, schema_password,
+        schema_password_hash, state, expired, locked, default_tablespace, default_temp_tablespace,
+        profile, authentication_type, external_name, container, container_data).
+        Options not set in an item are taken from the module level options.
+      - Current state of all schemas is read by one query, changes are applied in one session.
+        Per-schema results are returned in C(users).
+    required: false
+    type: list
+    elements: dict
+    version_added: "3.5.0"
   schema_password:
     description: The password for the new schema. i.e '..identified by password'
     required: false
@@ -136,6 +151,20 @@ EXAMPLES = '''
     mode: sysdba
     schema: myschema
     state: absent
+
+- name: Provision many schemas in one task
+  oracle_user:
+    mode: sysdba
+    default_tablespace: users
+    profile: app_profile
+    users:
+      - schema: app_user1
+        schema_password: Xiejfkljfssgdhd123
+      - schema: app_user2
+        schema_password_hash: "{{ 'secret' | ibre5041.ansible_oracle_modules.pwhash12c }}"
+        locked: true
+      - schema: old_app_user
+        state: absent
 '''
 
 
@@ -144,10 +173,7 @@ import string
 from binascii import unhexlify
 
 
-# Check if the user/schema exists
-def check_user_exists(conn, schema):
-    """Check user exists, return user's attributes"""
-    sql = """
+USER_COLUMNS = """
     select username
         , account_status
         , default_tablespace
@@ -155,11 +181,22 @@ def check_user_exists(conn, schema):
         , profile
         , authentication_type
         , external_name
-        , oracle_maintained
+        , oracle_maintained"""
+
+
+# Check if the user/schema exists
+def check_user_exists(conn, schema):
+    """Check user exists, return user's attributes"""
+    sql = USER_COLUMNS + """
     from dba_users
     where username = upper(:schema_name)"""
 
     r = conn.execute_select_to_dict(sql, {"schema_name": schema}, fetchone=True)
+    return set(split_account_status(conn, r).items())
+
+
+def split_account_status(conn, r):
+    """Split dba_users.account_status into account_status and password_status"""
     if r:
         acs = r['account_status']
         if acs == 'EXPIRED & LOCKED':
@@ -177,21 +214,57 @@ def check_user_exists(conn, schema):
         else:
             conn.fail_json(msg="Unsupported account state %s" % acs, ddls=conn.ddls, changed=conn.changed)
 
-    return set(r.items())
+    return r
+
+
+# Check if the users/schemas exist, one query for all of them
+def check_users_exist(conn, schemas, password_hash=False, container_data=False):
+    """Return dict username -> current state for all existing schemas.
+
+    Each value holds the attribute set (as returned by check_user_exists) under
+    'attributes' and optionally the password hash ('spare4') and the default
+    CONTAINER_DATA attribute ('all_containers'). The optional columns come from
+    sys.user$ and cdb_container_data; when those are not readable, the query
+    is repeated without them.
+    """
+    predicate, params = bind_in_list('u.username', [s.upper() for s in schemas], 'schema')
+    extra = ''
+    if password_hash:
+        extra += """
+        , (select s.spare4 from sys.user$ s where s.name = u.username) spare4"""
+    if container_data:
+        extra += """
+        , (select max(c.all_containers) from cdb_container_data c
+           where c.username = u.username and c.default_attr = 'Y' and c.object_name is null) all_containers"""
+    sql = USER_COLUMNS + "%s\n    from dba_users u\n    where " + predicate
+
+    rows = None
+    if extra:
+        rows = conn.execute_select_to_dict(sql % extra, params, fail_on_error=False)
+    if rows is None:
+        rows = conn.execute_select_to_dict(sql % '', params)
+
+    users = dict()
+    for r in rows:
+        current = {'spare4': r.pop('spare4', None) or '', 'all_containers': r.pop('all_containers', None)}
+        current['attributes'] = set(split_account_status(conn, r).items())
+        users[r['username']] = current
+    return users
 
 
 # Create the user/schema
-def create_user(conn, module):
-    schema = module.params["schema"]
-    schema_password = module.params["schema_password"]
-    schema_password_hash = module.params["schema_password_hash"]
-    default_tablespace = module.params["default_tablespace"]
-    default_temp_tablespace = module.params["default_temp_tablespace"]
-    profile = module.params["profile"]
-    authentication_type = module.params["authentication_type"]
-    external_name = module.params["external_name"]
-    container = module.params["container"]
-    container_data = module.params["container_data"]
+def create_user(conn, module, params=None):
+    p = module.params if params is None else params
+    schema = p["schema"]
+    schema_password = p["schema_password"]
+    schema_password_hash = p["schema_password_hash"]
+    default_tablespace = p["default_tablespace"]
+    default_temp_tablespace = p["default_temp_tablespace"]
+    profile = p["profile"]
+    authentication_type = p["authentication_type"]
+    external_name = p["external_name"]
+    container = p["container"]
+    container_data = p["container_data"]
 
     if authentication_type is None and (schema_password_hash or schema_password):
         # Override authentication_type when password provided
@@ -230,10 +303,10 @@ def create_user(conn, module):
     if container:
         sql += ' container=%s' % container
 
-    if module.params['locked']:
+    if p['locked']:
         sql += ' account lock'
 
-    if module.params['expired']:
+    if p['expired']:
         sql += ' password expire'
 
     conn.execute_ddl(sql)
@@ -242,8 +315,7 @@ def create_user(conn, module):
         alter_sql = 'alter user %s set container_data=%s container=current' % (schema, container)
         conn.execute_ddl(alter_sql)
 
-    msg = 'The schema %s has been created successfully' % schema
-    module.exit_json(msg=msg, changed=conn.changed, ddls=conn.ddls)
+    return 'The schema %s has been created successfully' % schema
 
 
 # Get the current default CONTAINER_DATA attribute for the user
@@ -318,14 +390,19 @@ def get_change(change_set, change):
 
 
 # Modify the user/schema
-def modify_user(conn, module, user):
-    schema = module.params["schema"]
-    schema_password = module.params["schema_password"]
-    schema_password_hash = module.params["schema_password_hash"]
-    authentication_type = module.params["authentication_type"]
-    external_name = module.params["external_name"]
-    container = module.params["container"]
-    container_data = module.params["container_data"]
+def modify_user(conn, module, user, params=None, prefetched=None):
+    """Alter the user to match wanted state, return (changed, msg).
+
+    prefetched -- current state from check_users_exist, saves per user queries
+    """
+    p = module.params if params is None else params
+    schema = p["schema"]
+    schema_password = p["schema_password"]
+    schema_password_hash = p["schema_password_hash"]
+    authentication_type = p["authentication_type"]
+    external_name = p["external_name"]
+    container = p["container"]
+    container_data = p["container_data"]
 
     sql = 'alter user %s ' % schema
 
@@ -334,10 +411,15 @@ def modify_user(conn, module, user):
         authentication_type = 'PASSWORD'
 
     current_set = user
-    try:
-        old_pw_hash = get_user_password_hash(conn, schema)
-    except Exception:
-        module.warn("Failed to get password hash for schema %s" % schema)
+    if prefetched is not None:
+        old_pw_hash = prefetched.get('spare4') or ''
+    elif schema_password_hash or schema_password:
+        try:
+            old_pw_hash = get_user_password_hash(conn, schema)
+        except Exception:
+            module.warn("Failed to get password hash for schema %s" % schema)
+            old_pw_hash = ''
+    else:
         old_pw_hash = ''
     wanted_set = set()
 
@@ -356,26 +438,26 @@ def modify_user(conn, module, user):
     elif authentication_type == 'none':
         wanted_set.add(('authentication_type', 'NONE'))
 
-    if module.params['locked'] is not None:
-        if module.params['locked']:
+    if p['locked'] is not None:
+        if p['locked']:
             wanted_set.add(('account_status', 'LOCKED'))
         else:
             wanted_set.add(('account_status', 'OPEN'))
 
-    if module.params['expired'] is not None:
-        if module.params['expired']:
+    if p['expired'] is not None:
+        if p['expired']:
             wanted_set.add(('password_status', 'EXPIRED'))
         else:
             wanted_set.add(('password_status', 'UNEXPIRED'))
 
-    if module.params['default_tablespace']:
-        wanted_set.add(('default_tablespace', module.params['default_tablespace'].upper()))
+    if p['default_tablespace']:
+        wanted_set.add(('default_tablespace', p['default_tablespace'].upper()))
 
-    if module.params["default_temp_tablespace"]:
-        wanted_set.add(('temporary_tablespace', module.params["default_temp_tablespace"].upper()))
+    if p["default_temp_tablespace"]:
+        wanted_set.add(('temporary_tablespace', p["default_temp_tablespace"].upper()))
 
-    if module.params['profile']:
-        wanted_set.add(('profile', module.params['profile'].upper()))
+    if p['profile']:
+        wanted_set.add(('profile', p['profile'].upper()))
 
     changes = wanted_set.difference(current_set)
 
@@ -395,8 +477,8 @@ def modify_user(conn, module, user):
         else:
             # In this case we have to try to re-set the same password as we do already have
             # Either by entering the same password or by resupplying own computed hash(TODO)
-            schema_password = module.params['schema_password']
-            schema_password_hash = module.params['schema_password_hash']
+            schema_password = p['schema_password']
+            schema_password_hash = p['schema_password_hash']
             if schema_password_hash:
                 sql += ''' identified by "%s" ''' % schema_password_hash
             elif schema_password:
@@ -405,8 +487,8 @@ def modify_user(conn, module, user):
                 module.fail_json(msg="Can on un-expire password, without providing password(or hash)", changed=conn.changed, ddls=conn.ddls)
     elif authentication_type == 'EXTERNAL' or external_name_changed:
         sql += ' identified externally'
-        if module.params['external_name']:
-            sql += " as '%s'" % module.params['external_name']
+        if p['external_name']:
+            sql += " as '%s'" % p['external_name']
     elif authentication_type == 'GLOBAL':
         sql += ''' identified globally '''
     elif authentication_type == 'NONE':
@@ -440,21 +522,26 @@ def modify_user(conn, module, user):
     container_data_changed = False
     if container_data:
         wanted_all = 'Y' if container == 'all' else 'N'
-        if get_container_data_all(conn, schema) != wanted_all:
+        if prefetched is not None:
+            current_all = prefetched.get('all_containers')
+        else:
+            current_all = get_container_data_all(conn, schema)
+        if current_all != wanted_all:
             alter_sql = 'alter user %s set container_data=%s container=current' % (schema, container)
             conn.execute_ddl(alter_sql)
             container_data_changed = True
 
     # wanted list is subset of current settings, do not do anything
     if not changes and not container_data_changed:
-        module.exit_json(msg='The schema (%s) is in the intended state' % schema, changed=conn.changed, ddls=conn.ddls)
+        return False, 'The schema (%s) is in the intended state' % schema
 
-    module.exit_json(msg='Successfully altered the user (%s) / %s' % (schema, str(changes)), changed=conn.changed, ddls=conn.ddls)
+    return True, 'Successfully altered the user (%s) / %s' % (schema, str(changes))
 
 
 # Drop the user
-def drop_user(conn, module, user):
-    schema = module.params["schema"]
+def drop_user(conn, module, user, params=None):
+    p = module.params if params is None else params
+    schema = p["schema"]
     oracle_maintained = next(v for (a, v) in user if a == 'oracle_maintained')
     if oracle_maintained == 'Y':
         msg = 'Trying to drop an internal user: %s. Not allowed' % schema
@@ -462,7 +549,45 @@ def drop_user(conn, module, user):
 
     sql = 'drop user %s cascade' % schema
     conn.execute_ddl(sql)
-    module.exit_json(msg='Successfully dropped the user (%s)' % schema, changed=conn.changed, ddls=conn.ddls)
+    return 'Successfully dropped the user (%s)' % schema
+
+
+# Create/modify/drop all users from the users list
+def ensure_users(conn, module):
+    """Read current state of all listed users by one query and converge them in this session"""
+    items = []
+    for entry in module.params['users']:
+        params = dict(module.params)
+        params.update(dict((k, v) for (k, v) in entry.items() if v is not None))
+        if params['external_name'] and params['authentication_type'] != 'external':
+            module.fail_json(msg="external_name is only valid with authentication_type=external (schema %s)" % params['schema'], changed=False)
+        if params['schema_password'] and params['schema_password_hash']:
+            module.fail_json(msg="schema_password and schema_password_hash are mutually exclusive (schema %s)" % params['schema'], changed=False)
+        items.append(params)
+
+    password_hash = any(p['schema_password'] or p['schema_password_hash'] for p in items)
+    container_data = any(p['container_data'] for p in items)
+    current = check_users_exist(conn, [p['schema'] for p in items], password_hash=password_hash, container_data=container_data)
+
+    results = dict()
+    for p in items:
+        schema = p['schema']
+        user = current.get(schema.upper())
+        before = len(conn.ddls)
+        if p['state'] == 'absent':
+            if user:
+                msg = drop_user(conn, module, user['attributes'], p)
+            else:
+                msg = "The schema (%s) doesn't exist" % schema
+        elif user:
+            (_, msg) = modify_user(conn, module, user['attributes'], p, prefetched=user)
+        else:
+            msg = create_user(conn, module, p)
+        results[schema] = dict(changed=len(conn.ddls) > before, msg=msg, ddls=conn.ddls[before:])
+
+    changed_users = [u for u in results if results[u]['changed']]
+    msg = '%d of %d schemas changed' % (len(changed_users), len(results))
+    module.exit_json(msg=msg, changed=conn.changed, ddls=conn.ddls, users=results)
 
 
 def main():
@@ -478,7 +603,22 @@ def main():
             oracle_home   = dict(required=False, aliases=['oh']),
             session_container = dict(required=False),
 
-            schema        = dict(required=True, type='str', aliases=['name', 'schema_name']),
+            schema        = dict(required=False, type='str', aliases=['name', 'schema_name']),
+            users         = dict(required=False, type='list', elements='dict', options=dict(
+                schema        = dict(required=True, type='str', aliases=['name', 'schema_name']),
+                schema_password = dict(default=None, no_log=True),
+                schema_password_hash = dict(default=None, no_log=True),
+                state         = dict(default=None, choices=["present", "absent"]),
+                expired       = dict(type='bool', default=None),
+                locked        = dict(type='bool', default=None),
+                default_tablespace = dict(default=None),
+                default_temp_tablespace = dict(default=None, aliases=['temporary_tablespace']),
+                profile       = dict(default=None),
+                authentication_type = dict(default=None, choices=['password', 'external', 'global', 'none']),
+                external_name = dict(default=None),
+                container     = dict(default=None, choices=["all", "current"]),
+                container_data = dict(default=None)
+            )),
             schema_password = dict(default=None, no_log=True),
             schema_password_hash = dict(default=None, no_log=True),
             state         = dict(default="present", choices=["present", "absent"]),
@@ -493,7 +633,8 @@ def main():
             container_data = dict(default=None)
         ),
         required_together=[['user', 'password']],
-        mutually_exclusive=[['schema_password', 'schema_password_hash']],
+        required_one_of=[['schema', 'users']],
+        mutually_exclusive=[['schema_password', 'schema_password_hash'], ['schema', 'users']],
         supports_check_mode=True,
     )
     sanitize_string_params(module.params)
@@ -507,20 +648,25 @@ def main():
 
     oc = oracleConnection(module)
 
+    if module.params.get("users"):
+        ensure_users(oc, module)
+
     user = check_user_exists(oc, schema)
     if state not in ['absent']:
         if user:
-            modify_user(oc, module, user)
+            (_, msg) = modify_user(oc, module, user)
         else:
-            create_user(oc, module)
+            msg = create_user(oc, module)
+        module.exit_json(msg=msg, changed=oc.changed, ddls=oc.ddls, **broker_result(oc))
 
     elif state == 'absent':
         if user:
-            drop_user(oc, module, user)
+            msg = drop_user(oc, module, user)
+            module.exit_json(msg=msg, changed=oc.changed, ddls=oc.ddls, **broker_result(oc))
         else:
-            module.exit_json(msg="The schema (%s) doesn't exist" % schema, changed=False)
+            module.exit_json(msg="The schema (%s) doesn't exist" % schema, changed=False, **broker_result(oc))
 
-    module.exit_json(msg='Unhandled exit', changed=False)
+    module.exit_json(msg='Unhandled exit', changed=False, **broker_result(oc))
 
 
 from ansible.module_utils.basic import *
@@ -535,7 +681,7 @@ from ansible.module_utils.basic import *
 
 # In these we do import from collections
 try:
-    from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import oracleConnection, sanitize_string_params
+    from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import oracleConnection, broker_result, sanitize_string_params, bind_in_list
 except ImportError:
     sanitize_string_params = lambda p: None
 
@@ -795,6 +795,7 @@ def main():
             wallet_type=status.get('wallet_type', '') if status else '',
             keystore_mode=status.get('keystore_mode', '') if status else '',
             tde_key_present=tde_key_exists(conn),
+            **broker_result(conn),
         )
 
     if state == 'status':
@@ -839,6 +840,7 @@ def main():
             wallet_type=status.get('wallet_type', '') if status else '',
             keystore_mode=status.get('keystore_mode', '') if status else '',
             tde_key_present=tde_key_exists(conn),
+            **broker_result(conn),
         )
 
 
@@ -858,7 +860,7 @@ from ansible.module_utils.basic import *  # noqa: F403
 # In these we do import from collections
 try:
     from ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils.oracle_utils import (  # noqa: E501
-        oracleConnection, sanitize_string_params,
+        oracleConnection, broker_result, sanitize_string_params,
         build_backup_clause, build_container_clause, build_force_clause,
     )
 except ImportError as e:
@@ -39,6 +39,31 @@ def _sql_single_quoted_literal_stub(value):
     return str(value).replace("'", "''")
 
 
+def _bind_in_list_stub(column, values, prefix='in'):
+    """Mirror production oracle_utils.bind_in_list (IN lists of at most 1000 binds)."""
+    values = list(values)
+    if not values:
+        return '1 = 0', {}
+    params = {}
+    chunks = []
+    for start in range(0, len(values), 1000):
+        names = []
+        for i, value in enumerate(values[start:start + 1000], start):
+            name = '%s%d' % (prefix, i)
+            params[name] = value
+            names.append(':' + name)
+        chunks.append('%s in (%s)' % (column, ', '.join(names)))
+    if len(chunks) == 1:
+        return chunks[0], params
+    return '(%s)' % ' or '.join(chunks), params
+
+
+def _broker_result_stub(conn):
+    """Mirror production oracle_utils.broker_result."""
+    broker = getattr(conn, 'broker', None)
+    return {'broker': broker} if broker else {}
+
+
 def _ensure_fake_oracle_utils():
     """Register (or patch) the collection shim so dynamic module loads always see required symbols."""
     if _OU_PATH not in sys.modules:
@@ -75,6 +100,8 @@ def _ensure_fake_oracle_utils():
             return clause
 
         _ou_mod.build_backup_clause = _build_backup
+        _ou_mod.bind_in_list = _bind_in_list_stub
+        _ou_mod.broker_result = _broker_result_stub
         sys.modules[_OU_PATH] = _ou_mod
         return
 
@@ -86,6 +113,11 @@ def _ensure_fake_oracle_utils():
     if not hasattr(ou, 'build_container_clause'):
         ou.build_container_clause = lambda c: ' CONTAINER = ALL' if c == 'all' else ''
 
+    if not hasattr(ou, 'bind_in_list'):
+        ou.bind_in_list = _bind_in_list_stub
+    if not hasattr(ou, 'broker_result'):
+        ou.broker_result = _broker_result_stub
+
     if not hasattr(ou, 'build_backup_clause'):
         def _build_backup(backup=True, backup_tag=None):
             if not backup:
@@ -97,8 +129,27 @@ def _ensure_fake_oracle_utils():
         ou.build_backup_clause = _build_backup
 
 
+_MU_PACKAGE = "ansible_collections.ibre5041.ansible_oracle_modules.plugins.module_utils"
+
+# module_utils without external dependencies, modules import the real ones
+_REAL_MODULE_UTILS = ("oracle_crs", "describe_patchset")
+
+
+def _ensure_real_module_utils():
+    for name in _REAL_MODULE_UTILS:
+        full_name = "{}.{}".format(_MU_PACKAGE, name)
+        if full_name in sys.modules:
+            continue
+        path = REPO_ROOT / "plugins" / "module_utils" / "{}.py".format(name)
+        spec = importlib.util.spec_from_file_location(full_name, str(path))
+        mu_mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mu_mod)  # type: ignore[union-attr]
+        sys.modules[full_name] = mu_mod
+
+
 def _ensure_fake_ansible_basic():
     _ensure_fake_oracle_utils()
+    _ensure_real_module_utils()
 
     if "ansible.module_utils.basic" in sys.modules:
         return
@@ -166,6 +217,8 @@ def _ensure_fake_ansible_basic():
             return clause
 
         _ou_mod.build_backup_clause = _build_backup
+        _ou_mod.bind_in_list = _bind_in_list_stub
+        _ou_mod.broker_result = _broker_result_stub
         sys.modules[_ou_path] = _ou_mod
 
     ansible_mod = types.ModuleType("ansible")
@@ -187,7 +240,7 @@ def _ensure_fake_ansible_basic():
     basic_mod.os = __import__("os")
     basic_mod.re = __import__("re")
     text_mod.to_native = lambda v, **_kwargs: str(v)
-    text_mod.to_text = lambda v, **_kwargs: str(v)
+    text_mod.to_text = lambda v, **_kwargs: v.decode('utf-8') if isinstance(v, bytes) else str(v)
 
     sys.modules["ansible"] = ansible_mod
     sys.modules["ansible.module_utils"] = module_utils_mod
@@ -19,6 +19,7 @@ class BaseFakeModule:
     def __init__(self, **_kwargs):
         self.params = dict(self.__class__.params)
         self._warnings = []
+        self._logs = []
         self._verbosity = 0
 
     def exit_json(self, **kwargs):
@@ -32,6 +33,9 @@ class BaseFakeModule:
     def warn(self, msg):
         self._warnings.append(msg)
 
+    def log(self, msg):
+        self._logs.append(msg)
+
     def run_command(self, command, **_kwargs):
         """Default stub – override per test."""
         return (0, "", "")
@@ -69,6 +73,20 @@ class BaseFakeConn:
             return self.rows[0] if self.rows else ()
         return self.rows
 
+    def iter_select(self, sql, params=None, arraysize=None, prefetchrows=None, as_dict=True, fail_on_error=True):
+        for row in self.execute_select_to_dict(sql, params) or []:
+            yield row if as_dict else tuple(row.values())
+
+    def execute_select_multi(self, queries, arraysize=None):
+        # Like oracleConnection, a failing query yields None and does not stop the others
+        results = {}
+        for name, sql, fetchone in queries:
+            try:
+                results[name] = self.execute_select_to_dict(sql, fetchone=fetchone)
+            except Exception:
+                results[name] = None
+        return results, dict((name, 0.0) for name, _sql, _fetchone in queries)
+
     def execute_ddl(self, request, params=None, no_change=False, ignore_errors=None, ddls_entry=None):
         self._last_executed_ddl = request
         trace = ddls_entry if ddls_entry is not None else request
@@ -76,6 +94,13 @@ class BaseFakeConn:
         if not no_change:
             self.changed = True
 
+    def execute_ddls(self, requests, no_change=False, ignore_errors=None, ddls_entries=None):
+        requests = list(requests)
+        traces = list(ddls_entries) if ddls_entries is not None else requests
+        for request, trace in zip(requests, traces):
+            self.execute_ddl(request, no_change=no_change, ignore_errors=ignore_errors, ddls_entry=trace)
+        return [0] * len(requests)
+
     def execute_statement(self, sql, params=None):
         self.ddls.append(sql)
         self.changed = True
@@ -94,6 +119,11 @@ class BaseFakeConn:
         """Default: return the name unchanged (no synonym resolution)."""
         return object_name
 
+    def resolve_object_names(self, object_names):
+        """Bulk variant of resolve_object_name: NAME -> resolved name."""
+        resolved = dict((n.upper(), self.resolve_object_name(n)) for n in object_names)
+        return dict((n, r) for (n, r) in resolved.items() if r)
+
 
 # ---------------------------------------------------------------------------
 # Standard connection params dict – merge with module-specific params
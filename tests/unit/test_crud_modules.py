@@ -1139,6 +1139,52 @@ def test_tablespace_offline_state(monkeypatch):
     assert any("offline" in d.lower() for d in payload["ddls"])
 
 
+def _ts_row(name, status="ONLINE", file_name=None, bytes=100 * 1024 ** 2, autoextensible="NO"):
+    return {"db_create_file_dest": "+DATA", "tablespace_name": name, "status": status, "contents": "PERMANENT",
+            "block_size": 8192, "file_name": file_name or "+DATA/%s.dbf" % name.lower(), "bytes": bytes,
+            "autoextensible": autoextensible, "next_bytes": 0, "maxbytes": 0}
+
+
+def test_tablespace_list_reads_state_once_and_reports_per_tablespace(monkeypatch):
+    mod = _load("oracle_tablespace")
+    queries = []
+
+    class Mod(BaseFakeModule):
+        params = _ts_params(tablespace=None, tablespaces=[
+            {"tablespace": "APP_DATA"},
+            {"tablespace": "APP_RO", "state": "read_only"},
+            {"tablespace": "NEWTS"},
+            {"tablespace": "OLD", "state": "absent"},
+            {"tablespace": "GONE", "state": "absent"},
+        ])
+
+    class _Conn(BaseFakeConn):
+        def execute_select_to_dict(self, sql, params=None, fetchone=False, fail_on_error=True):
+            queries.append((sql, params))
+            if "left join dba_tablespaces" in sql:
+                return [_ts_row("APP_DATA"), _ts_row("APP_RO"), _ts_row("OLD")]
+            # only the tablespace created by this task is read again
+            assert params == {"tablespace": "NEWTS"}
+            return {"status": "ONLINE", "count": 1} if fetchone else []
+
+    monkeypatch.setattr(mod, "AnsibleModule", Mod)
+    monkeypatch.setattr(mod, "oracleConnection", _Conn, raising=False)
+
+    with pytest.raises(ExitJson) as exc:
+        mod.main()
+    payload = exc.value.args[0]
+    assert sorted(queries[0][1].values()) == ["APP_DATA", "APP_RO", "GONE", "NEWTS", "OLD"]
+    assert len(queries) == 4
+    results = payload["tablespaces"]
+    assert results["APP_DATA"]["changed"] is False
+    assert results["APP_RO"]["ddls"] == ["alter tablespace APP_RO read only"]
+    assert results["NEWTS"]["ddls"] == ["create bigfile tablespace NEWTS datafile size 100M"]
+    assert results["OLD"]["ddls"] == ["drop tablespace OLD including contents and datafiles"]
+    assert results["GONE"] == {"changed": False, "msg": "Nothing to do for GONE", "ddls": [], "progress": None}
+    assert payload["msg"] == "3 of 5 tablespaces changed"
+    assert payload["changed"] is True
+
+
 # ===========================================================================
 # oracle_user - additional tests for better coverage
 # ===========================================================================
@@ -2343,3 +2389,140 @@ def test_pdb_unplug_executes_ddls(monkeypatch):
     assert len(result["ddls"]) == 3
     assert any("unplug" in d.lower() for d in result["ddls"])
     assert any("drop" in d.lower() for d in result["ddls"])
+
+
+# ===========================================================================
+# oracle_user - users list (batch mode)
+# ===========================================================================
+
+class _UserBatchConn(BaseFakeConn):
+    """Answers the set-based dba_users query with rows for the existing users."""
+
+    def __init__(self, module, existing):
+        super().__init__(module)
+        self._existing = existing
+        self.queries = []
+
+    def execute_select_to_dict(self, sql, params=None, fetchone=False, fail_on_error=True):
+        self.queries.append(sql)
+        wanted = set((params or {}).values())
+        rows = []
+        for name, row in self._existing.items():
+            if name in wanted:
+                row = dict(row, username=name)
+                if "spare4" in sql:
+                    row["spare4"] = "S:FAKEHASH1234ABCDEF"
+                rows.append(row)
+        return rows
+
+
+def _user_item(schema, **overrides):
+    item = dict.fromkeys(("schema_password", "schema_password_hash", "state", "expired", "locked",
+                          "default_tablespace", "default_temp_tablespace", "profile",
+                          "authentication_type", "external_name", "container", "container_data"))
+    item["schema"] = schema
+    item.update(overrides)
+    return item
+
+
+def test_user_batch_reads_once_and_converges_all(monkeypatch):
+    mod = _load("oracle_user")
+
+    class Mod(BaseFakeModule):
+        params = _user_params(schema=None, schema_password=None, authentication_type=None, users=[
+            _user_item("new_user", schema_password="Secret1"),
+            _user_item("locked_user", locked=True),
+            _user_item("same_user"),
+            _user_item("old_user", state="absent"),
+            _user_item("missing_user", state="absent"),
+        ])
+
+    existing = {"LOCKED_USER": _default_user_row(), "SAME_USER": _default_user_row(),
+                "OLD_USER": _default_user_row()}
+    conn = _UserBatchConn(None, existing)
+    monkeypatch.setattr(mod, "AnsibleModule", Mod)
+    monkeypatch.setattr(mod, "oracleConnection", lambda m: conn, raising=False)
+
+    with pytest.raises(ExitJson) as exc:
+        mod.main()
+    payload = exc.value.args[0]
+    users = payload["users"]
+    assert len(conn.queries) == 1
+    assert "create user new_user" in users["new_user"]["ddls"][0]
+    assert "account lock" in users["locked_user"]["ddls"][0]
+    assert users["same_user"]["changed"] is False
+    assert users["old_user"]["ddls"] == ["drop user old_user cascade"]
+    assert users["missing_user"]["changed"] is False
+    assert payload["msg"] == "3 of 5 schemas changed"
+
+
+def test_user_batch_falls_back_when_user_dollar_not_readable(monkeypatch):
+    mod = _load("oracle_user")
+
+    class Mod(BaseFakeModule):
+        params = _user_params(schema=None, authentication_type=None,
+                              users=[_user_item("same_user", schema_password="Secret1")])
+
+    class _NoUserDollarConn(_UserBatchConn):
+        def execute_select_to_dict(self, sql, params=None, fetchone=False, fail_on_error=True):
+            if "sys.user$" in sql:
+                self.queries.append(sql)
+                return None
+            return super().execute_select_to_dict(sql, params, fetchone, fail_on_error)
+
+    conn = _NoUserDollarConn(None, {"SAME_USER": _default_user_row()})
+    monkeypatch.setattr(mod, "AnsibleModule", Mod)
+    monkeypatch.setattr(mod, "oracleConnection", lambda m: conn, raising=False)
+
+    with pytest.raises(ExitJson) as exc:
+        mod.main()
+    users = exc.value.args[0]["users"]
+    assert len(conn.queries) == 2
+    # the current hash is unknown, so the password is set again
+    assert "identified by" in users["same_user"]["ddls"][0]
+
+
+# ===========================================================================
+# oracle_grant - bulk object name resolution
+# ===========================================================================
+
+def test_grant_resolves_object_names_in_bulk_and_coalesces_privs(monkeypatch):
+    mod = _load("oracle_grant")
+
+    class Mod(BaseFakeModule):
+        params = _grant_params(
+            grants=[],
+            object_privs=["select:emp", "insert:emp", "select:dept", "select,update:hr.jobs", "select:missing"],
+            grant_mode="exact",
+        )
+
+    class _Conn(_GrantConn):
+        resolve_calls = []
+
+        def resolve_object_names(self, object_names):
+            self.resolve_calls.append(sorted(object_names))
+            return {"EMP": "HR.EMP", "DEPT": "HR.DEPARTMENTS"}
+
+        def resolve_object_name(self, object_name):
+            raise AssertionError("names must be resolved in bulk")
+
+        def execute_select(self, sql, params=None, fetchone=False):
+            if "dba_tab_privs" in sql.lower() and "object_type = 'DIRECTORY'" not in sql:
+                return [("select", "hr.emp"), ("delete", "hr.jobs")]
+            return []
+
+    monkeypatch.setattr(mod, "AnsibleModule", Mod)
+    monkeypatch.setattr(mod, "oracleConnection", _Conn, raising=False)
+
+    with pytest.raises(ExitJson) as exc:
+        mod.main()
+    payload = exc.value.args[0]
+    assert _Conn.resolve_calls == [["dept", "emp", "emp", "missing"]]
+    assert payload["ddls"] == [
+        "revoke delete on hr.jobs from APPUSER",
+        "grant select on hr.departments to APPUSER",
+        "grant insert on hr.emp to APPUSER",
+        "grant select,update on hr.jobs to APPUSER",
+        "grant select on missing to APPUSER",
+    ]
+    assert set(payload["timing"]) == {"resolve", "current", "plan", "apply"}
@@ -0,0 +1,83 @@
+"""Unit tests for module_utils/describe_patchset.py patch repository catalog."""
+import json
+import os
+import zipfile
+
+from conftest import load_module_from_path, module_path
+
+
+def _dp():
+    return load_module_from_path(module_path("plugins", "module_utils", "describe_patchset.py"), "describe_patchset_test")
+
+
+PATCH_SEARCH = """<results><patch><bug><number>35648110</number>
+<abstract>OJVM RELEASE UPDATE 19.21.0.0.0</abstract></bug></patch></results>"""
+
+BUNDLE = """<system_patch_bundle_xml patch_id="35642822"><subpatches>
+<subpatch location="35643107"><target_types><target_type type="oracle_database"/><target_type type="has"/></target_types></subpatch>
+<subpatch location="35652062"><target_types><target_type type="has"/></target_types></subpatch>
+</subpatches></system_patch_bundle_xml>"""
+
+
+def _oneoff(patch_id, description, targets):
+    return ('<oneoff_inventory><patch_id number="%s"/><patch_description>%s</patch_description><targets>%s</targets>'
+            '</oneoff_inventory>' % (patch_id, description, "".join('<target type="%s"/>' % t for t in targets)))
+
+
+def _repository(tmp_path):
+    # unzipped patch
+    (tmp_path / "35648110" / "etc" / "config").mkdir(parents=True)
+    (tmp_path / "PatchSearch.xml").write_text(PATCH_SEARCH)
+    (tmp_path / "35648110" / "etc" / "config" / "inventory.xml").write_text(
+        _oneoff("35648110", "OJVM RELEASE UPDATE: 19.21.0.0.231017 (35648110)", []))
+    # RU zip, 35652062 is listed in bundle.xml but not shipped in the zip
+    with zipfile.ZipFile(str(tmp_path / "p35642822_190000_Linux-x86-64.zip"), "w") as z:
+        z.writestr("35642822/bundle.xml", BUNDLE)
+        z.writestr("35642822/35643107/etc/config/inventory.xml",
+                   _oneoff("35643107", "Database Release Update : 19.21.0.0.231017 (35643107)", ["oracle_database", "has"]))
+        z.writestr("35642822/35643107/files/lib/libserver19.a/kcb.o", "x")
+    return str(tmp_path)
+
+
+def test_describe_patchset_prints_directory_and_zip_entries(tmp_path, capsys):
+    dp = _dp()
+    path = _repository(tmp_path)
+    dp.main(path)
+    zip_path = os.path.join(path, "p35642822_190000_Linux-x86-64.zip")
+    assert capsys.readouterr().out.splitlines() == [
+        "PATCHSET:%s/35648110:OJVM RELEASE UPDATE 19.21.0.0.0" % path,
+        "ONE-OFF:%s/35648110:OJVM RELEASE UPDATE: 19.21.0.0.231017 (35648110):()" % path,
+        "BUNDLEPART:%s/35642822/35643107:(oracle_database,has)" % zip_path,
+        "ONE-OFF:%s:Database Release Update : 19.21.0.0.231017 (35643107):(oracle_database,has)" % zip_path,
+    ]
+
+
+def test_describe_patchset_catalog_reparses_only_changed_files(tmp_path, monkeypatch):
+    dp = _dp()
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    path = _repository(repo)
+    catalog_file = str(tmp_path / "catalog.json")
+
+    parsed = []
+    describe_file = dp.describe_file
+    monkeypatch.setattr(dp, "describe_file", lambda p: parsed.append(p) or describe_file(p))
+
+    catalog = dp.update_catalog(path, catalog_file)
+    assert len(parsed) == 3
+    assert json.load(open(catalog_file))["files"].keys() == catalog["files"].keys()
+
+    del parsed[:]
+    dp.update_catalog(path, catalog_file)
+    assert parsed == []
+
+    (repo / "PatchSearch.xml").write_text(PATCH_SEARCH.replace("19.21", "19.22"))
+    os.utime(str(repo / "PatchSearch.xml"), ns=(0, 10 ** 18))
+    catalog = dp.update_catalog(path, catalog_file)
+    assert parsed == [os.path.join(path, "PatchSearch.xml")]
+
+    found = dp.find_patch(catalog, "35643107", "oracle_database")
+    assert [r["kind"] for r in found] == ["BUNDLEPART", "ONE-OFF"]
+    assert found[1]["location"].endswith(".zip")
+    assert dp.find_patch(catalog, "35643107", "cluster") == []
+    assert dp.find_patch(catalog, "35652062") == []
@@ -0,0 +1,128 @@
+import importlib
+import importlib.util
+import sys
+
+import pytest
+
+from conftest import module_path
+
+
+def _load_dotora():
+    # dotora imports the ANTLR runtime relatively, load module_utils as a package
+    name = "dotora_module_utils"
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            name, str(module_path("plugins", "module_utils", "__init__.py")),
+            submodule_search_locations=[str(module_path("plugins", "module_utils"))])
+        package = importlib.util.module_from_spec(spec)
+        sys.modules[name] = package
+        spec.loader.exec_module(package)
+    return importlib.import_module(name + ".dotora")
+
+
+TNSNAMES = """# tnsnames.ora, maintained by ansible
+ORCL =
+  (DESCRIPTION =
+    (ADDRESS = (PROTOCOL = TCP)(HOST = db1.example.com)(PORT = 1521))
+    (CONNECT_DATA =
+      (SERVER = DEDICATED)   # inline comment
+      (SERVICE_NAME = orcl)
+    )
+  )
+
+PDB1=(DESCRIPTION=(ADDRESS_LIST=(ADDRESS=(PROTOCOL=TCP)(HOST=h1)(PORT=1521))(ADDRESS=(PROTOCOL=TCP)(HOST=h2)(PORT=1521)))(CONNECT_DATA=(SERVICE_NAME=pdb1)))
+NAMES.DIRECTORY_PATH= (TNSNAMES, EZCONNECT)
+SQLNET.X = "quoted value"
+SID_LIST_LISTENER =
+  (SID_LIST =
+    (SID_DESC =
+      (ORACLE_HOME = /u01/app/oracle/product/19.3.0/dbhome_1)
+      (SID_NAME = orcl)
+      (ENVS = 'LD_LIBRARY_PATH=/u01/lib')
+    )
+  )
+"""
+
+
+def _dump(dotora, p):
+    values = [_dump(dotora, v) if isinstance(v, dotora.OraParameter) else str(v) for v in p.values]
+    return (p.name, p.lineFrom, p.lineTo, p.start, p.stop, values)
+
+
+@pytest.fixture
+def tnsnames(tmp_path):
+    path = tmp_path / "tnsnames.ora"
+    path.write_text(TNSNAMES)
+    return str(path)
+
+
+def test_native_parser_matches_antlr_reference(tnsnames):
+    dotora = _load_dotora()
+    native = dotora.DotOraFile(tnsnames)
+    antlr = dotora.DotOraFile(tnsnames, engine='antlr')
+
+    assert [_dump(dotora, p) for p in native.params] == [_dump(dotora, p) for p in antlr.params]
+    for orafile in (native, antlr):
+        orafile.upsertaliasatribute("PDB1", "DESCRIPTION/CONNECT_DATA/SERVICE_NAME", "pdb2")
+        orafile.removealias("SQLNET.X")
+    assert str(native) == str(antlr)
+
+
+def test_only_modified_alias_is_parsed_and_serialised(tnsnames):
+    dotora = _load_dotora()
+    orafile = dotora.DotOraFile(tnsnames)
+
+    orafile.setparamvalue("PDB1", "HOST", "h3", oldvalue="h2")
+
+    assert orafile.changed is True
+    assert [p is not None for p in orafile._params] == [False, True, False, False, False]
+    expected = TNSNAMES.replace("(HOST=h2)", "(HOST=h3)")
+    assert str(orafile) == expected
+    assert str(orafile.findalias("pdb1")) in expected
+
+
+def test_untouched_file_is_written_back_verbatim(tnsnames):
+    dotora = _load_dotora()
+    orafile = dotora.DotOraFile(tnsnames)
+
+    orafile.setparamvalue("PDB1", "HOST", "h2", oldvalue="h9")
+    orafile.deleteparam("MISSING", "HOST")
+
+    assert orafile.changed is False
+    assert str(orafile) == TNSNAMES
+
+
+def test_remove_and_add_aliases(tnsnames):
+    dotora = _load_dotora()
+    orafile = dotora.DotOraFile(tnsnames)
+
+    orafile.removealias("names.directory_path")
+    orafile.upsertalias("NEW", "(DESCRIPTION=(ADDRESS=(HOST=h)))")
+    orafile.upsertalias("SQLNET.X", '"quoted value"')
+
+    text = str(orafile)
+    assert "NAMES.DIRECTORY_PATH" not in text
+    assert 'SQLNET.X = "quoted value"\nSID_LIST_LISTENER' in text
+    assert text.endswith("  )\nNEW=(DESCRIPTION=(ADDRESS=(HOST=h)))\n")
+    assert orafile.findalias("names.directory_path") is None
+
+
+def test_all_aliases_are_changed(tnsnames):
+    dotora = _load_dotora()
+    orafile = dotora.DotOraFile(tnsnames)
+
+    orafile.setparamvalue("@all", "PORT", "1522")
+
+    assert str(orafile).count("1522") == 3
+    assert orafile.getaliasatribute("SID_LIST_LISTENER", "SID_LIST/SID_DESC/SID_NAME").name == "SID_DESC"
+
+
+def test_syntax_errors_are_reported(tmp_path):
+    dotora = _load_dotora()
+    for text in ("A = (B = 1", "A = B)\n", "A = {B}\n"):
+        path = tmp_path / "bad.ora"
+        path.write_text(text)
+        with pytest.raises(ValueError):
+            dotora.DotOraFile(str(path)).params
+    with pytest.raises(ValueError):
+        dotora.parse_slice(dotora.tokenize("IFILE = /etc/other.ora"))
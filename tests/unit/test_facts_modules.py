@@ -572,6 +572,32 @@ def test_facts_exception_in_pdb_block(monkeypatch):
     assert facts["pdb"] == []
 
 
+def test_facts_sections_are_collected_in_one_call(monkeypatch):
+    """All requested sections are passed to one execute_select_multi call, timing is returned."""
+    mod = _load()
+    os.environ["ORACLE_SID"] = "ORCL"
+    calls = []
+
+    class _MultiConn(_FactsConn):
+        def execute_select_multi(self, queries, arraysize=None):
+            calls.append([name for name, _sql, _fetchone in queries])
+            return super().execute_select_multi(queries, arraysize)
+
+    class Mod(BaseFakeModule):
+        params = _facts_params(instance=True, userenv=True, redo="summary", parameter="@all@")
+
+    monkeypatch.setattr(mod, "AnsibleModule", Mod)
+    monkeypatch.setattr(mod, "oracleConnection", _MultiConn, raising=False)
+
+    with pytest.raises(ExitJson) as exc:
+        mod.main()
+    assert calls == [["instance", "database", "userenv", "redo", "parameter", "rac", "pdb"]]
+    payload = exc.value.args[0]
+    assert payload["timing"]["instance"] == 0.0
+    assert "total" in payload["timing"]
+    assert payload["ansible_facts"]["ORCL"]["instance"]["instance_name"] == "ORCL1"
+
+
 # ===========================================================================
 # gather_subset tests
 # ===========================================================================
@@ -1413,6 +1439,50 @@ def test_gi_facts_listener_parsing(monkeypatch):
     assert facts["local_listener"][0]["name"] == "LISTENER"
 
 
+def test_gi_facts_probes_run_concurrently(monkeypatch):
+    """Independent srvctl calls and per-network scan_listener configs are started at once."""
+    import threading
+    mod = _load_gi()
+    first = threading.Barrier(3, timeout=5)
+    second = threading.Barrier(2, timeout=5)
+    network = ["Network 1 exists", "Subnet IPv4: 10.0.0.0/255.255.255.0/eth0, static",
+               "Network 2 exists", "Subnet IPv4: 10.0.1.0/255.255.255.0/eth1, static"]
+    scan = ["SCAN name: scan1, Network: 1", "SCAN name: scan2, Network: 2"]
+
+    def _fake_exec_lines(args):
+        if args[1:3] in (["config", "asm"], ["config", "vip"], ["config", "network"]):
+            first.wait()
+        if args[1:3] == ["config", "scan_listener"]:
+            second.wait()
+            return ["Endpoints: TCP:1521"]
+        if args[1:3] == ["config", "network"]:
+            return network
+        if args[1:3] == ["config", "scan"]:
+            return scan
+        return [""]
+
+    monkeypatch.setattr(mod, "exec_program_lines", _fake_exec_lines, raising=False)
+    monkeypatch.setattr(mod, "exec_program", lambda args: "", raising=False)
+    monkeypatch.setattr(mod, "hostname_to_fqdn", lambda name: name + ".example.com", raising=False)
+
+    class Mod(BaseFakeModule):
+        params = _gi_params()
+
+    class _Homes(FakeOracleHomes):
+        def __init__(self):
+            super().__init__()
+            self.oracle_crs = True
+
+    monkeypatch.setattr(mod, "AnsibleModule", Mod)
+    monkeypatch.setattr(mod, "OracleHomes", _Homes, raising=False)
+
+    with pytest.raises(ExitJson) as exc:
+        mod.main()
+    facts = exc.value.args[0]["ansible_facts"]["oracle_gi_facts"]
+    assert sorted(l["network"] for l in facts["scan_listener"]) == ["1", "2"]
+    assert facts["scan_listener"][0]["scan_address"].endswith(".example.com")
+
+
 def test_gi_facts_crs_active_version(monkeypatch):
     """CRS environment with oracle_crs=True (correctly set) → activeversion populated."""
     mod = _load_gi()
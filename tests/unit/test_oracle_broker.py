@@ -0,0 +1,352 @@
+import datetime
+import decimal
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+import pytest
+
+from conftest import ExitJson, FailJson, load_module_from_path, module_path
+
+
+class _Error:
+    def __init__(self, code, message):
+        self.code = code
+        self.message = message
+
+
+class _FakeDBError(Exception):
+    pass
+
+
+class _FakeVar:
+    def __init__(self, typ, value=None):
+        self.typ = typ
+        self.value = value
+
+    def getvalue(self, pos=0):
+        return self.value
+
+    def setvalue(self, pos, value):
+        self.value = value
+
+
+class _FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.description = None
+        self.rowcount = 0
+        self._rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def var(self, typ):
+        return _FakeVar(typ)
+
+    def arrayvar(self, typ, value, size=None):
+        return _FakeVar(typ, value)
+
+    def execute(self, sql, params=None):
+        self.conn.executed.append(sql)
+        if "fail" in sql:
+            raise _FakeDBError(_Error(942, "ORA-00942: table or view does not exist"))
+        if sql.lower().startswith("select"):
+            self.description = [("NAME", str), ("CREATED", None), ("SIZE", None)]
+            self._rows = [("A", datetime.datetime(2024, 1, 2, 3, 4, 5), decimal.Decimal("1.5"))]
+            self.rowcount = 1
+        if params and "out" in params:
+            params["out"].setvalue(0, "resolved")
+
+    def callproc(self, name, args):
+        for arg in args:
+            if isinstance(arg, _FakeVar):
+                arg.setvalue(0, 7)
+
+    def fetchall(self):
+        return list(self._rows)
+
+
+class _FakeConnection:
+    version = "19.0.0"
+
+    def __init__(self):
+        self.executed = []
+        self.autocommit = False
+        self.closed = False
+
+    def cursor(self):
+        return _FakeCursor(self)
+
+    def ping(self):
+        if self.closed:
+            raise _FakeDBError(_Error(3113, "ORA-03113"))
+
+    def rollback(self):
+        pass
+
+    def commit(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class FakeOracleDb:
+    DatabaseError = _FakeDBError
+    ProgrammingError = type("ProgrammingError", (Exception,), {})
+    NUMBER = float
+    STRING = str
+    SYSDBA = 2
+
+    def __init__(self):
+        self.connections = []
+
+    def connect(self, *args, **kwargs):
+        if kwargs.get("password") == "wrong":
+            raise _FakeDBError(_Error(1017, "ORA-01017: invalid username/password"))
+        conn = _FakeConnection()
+        self.connections.append(conn)
+        return conn
+
+    def init_oracle_client(self, **kwargs):
+        pass
+
+    @staticmethod
+    def makedsn(**kwargs):
+        return "fake_dsn"
+
+
+@pytest.fixture
+def broker_env():
+    mod = load_module_from_path(module_path("plugins", "module_utils", "oracle_broker.py"), "oracle_broker_test")
+    # Unix socket paths are limited to ~100 characters, keep it short
+    directory = tempfile.mkdtemp(prefix="ob")
+    db = FakeOracleDb()
+    server = mod.BrokerServer(os.path.join(directory, "b.sock"), idle_timeout=60, oracledb_module=db)
+    server.bind()
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield mod, server, db
+    server.shutdown()
+    thread.join(5)
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+def _key(mod, password="p", container=None):
+    return mod.pool_key("fake_dsn", "scott", "normal", container, password=password, environ={})
+
+
+def _connect(mod, server, key, password="p"):
+    return mod.BrokerConnection(server.socket_path, key, connect={"user": "scott", "password": password, "dsn": "fake_dsn"},
+                                oracledb_module=FakeOracleDb)
+
+
+def _wait_idle(server):
+    for _ in range(100):
+        if server.snapshot()["active"] == 0:
+            return
+        time.sleep(0.01)
+
+
+def test_broker_reuses_pooled_session(broker_env):
+    mod, server, db = broker_env
+    key = _key(mod)
+
+    first = _connect(mod, server, key)
+    assert first.hit is False
+    first.close()
+    _wait_idle(server)
+
+    second = _connect(mod, server, key)
+    assert second.hit is True
+    second.close()
+    _wait_idle(server)
+
+    stats = mod.broker_stats(server.socket_path)
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert len(db.connections) == 1
+
+
+def test_broker_different_password_does_not_share_session(broker_env):
+    mod, server, db = broker_env
+    _connect(mod, server, _key(mod)).close()
+    _wait_idle(server)
+
+    other = _connect(mod, server, _key(mod, password="other"), password="other")
+    assert other.hit is False
+    other.close()
+    assert len(db.connections) == 2
+
+
+def test_broker_cursor_returns_rows_and_types(broker_env):
+    mod, server, _db = broker_env
+    conn = _connect(mod, server, _key(mod))
+    with conn.cursor() as cursor:
+        cursor.execute("select name, created, size from dual")
+        assert [d[0] for d in cursor.description] == ["NAME", "CREATED", "SIZE"]
+        rows = cursor.fetchall()
+    assert rows == [("A", datetime.datetime(2024, 1, 2, 3, 4, 5), decimal.Decimal("1.5"))]
+    conn.close()
+
+
+def test_broker_out_binds_are_returned(broker_env):
+    mod, server, _db = broker_env
+    conn = _connect(mod, server, _key(mod))
+    cursor = conn.cursor()
+    out = cursor.var(str)
+    cursor.execute("begin :out := 'x'; end;", {"out": out})
+    assert out.getvalue() == "resolved"
+    num = cursor.var(int)
+    cursor.callproc("dbms_output.get_lines", [num])
+    assert num.getvalue() == 7
+    conn.close()
+
+
+def test_broker_propagates_database_errors(broker_env):
+    mod, server, _db = broker_env
+    conn = _connect(mod, server, _key(mod))
+    with pytest.raises(_FakeDBError) as exc:
+        conn.cursor().execute("select * from fail")
+    assert exc.value.args[0].code == 942
+    conn.close()
+
+
+def test_broker_login_error_is_database_error(broker_env):
+    mod, server, _db = broker_env
+    with pytest.raises(_FakeDBError) as exc:
+        _connect(mod, server, _key(mod, password="wrong"), password="wrong")
+    assert "ORA-01017" in exc.value.args[0].message
+
+
+def test_broker_discards_session_after_alter_session(broker_env):
+    mod, server, db = broker_env
+    key = _key(mod)
+    conn = _connect(mod, server, key)
+    conn.cursor().execute("ALTER SESSION SET CONTAINER = PDB1")
+    conn.close()
+    _wait_idle(server)
+
+    again = _connect(mod, server, key)
+    assert again.hit is False
+    again.close()
+    assert db.connections[0].closed is True
+
+
+@pytest.mark.parametrize("sql", [
+    "BEGIN dbms_session.set_role('DBA'); END;",
+    "  /* execute_ddls */\nDECLARE\n  v NUMBER;\nBEGIN\n  EXECUTE IMMEDIATE :stmt;\nEND;",
+    "-- role\nset role dba",
+])
+def test_broker_discards_session_after_plsql(broker_env, sql):
+    mod, server, db = broker_env
+    key = _key(mod)
+    conn = _connect(mod, server, key)
+    conn.cursor().execute(sql)
+    conn.close()
+    _wait_idle(server)
+
+    again = _connect(mod, server, key)
+    assert again.hit is False
+    again.close()
+    assert db.connections[0].closed is True
+
+
+def test_broker_keeps_session_after_plain_queries(broker_env):
+    mod, server, db = broker_env
+    key = _key(mod)
+    conn = _connect(mod, server, key)
+    conn.cursor().execute("select 1 from dual")
+    conn.close()
+    _wait_idle(server)
+
+    again = _connect(mod, server, key)
+    assert again.hit is True
+    again.close()
+
+
+def test_broker_session_container_is_set_on_connect(broker_env):
+    mod, server, db = broker_env
+    conn = _connect(mod, server, _key(mod, container="pdb1"))
+    conn.close()
+    assert db.connections[0].executed == ["ALTER SESSION SET CONTAINER = PDB1"]
+
+
+def test_broker_reap_closes_idle_sessions(broker_env):
+    mod, server, db = broker_env
+    _connect(mod, server, _key(mod)).close()
+    _wait_idle(server)
+
+    assert server.reap(now=time.time() + 3600) == 1
+    assert db.connections[0].closed is True
+    assert server.snapshot()["idle"] == 0
+
+
+def test_broker_socket_path_is_opt_in():
+    mod = load_module_from_path(module_path("plugins", "module_utils", "oracle_broker.py"), "oracle_broker_path_test")
+    assert mod.broker_socket_path({}, environ={}) is None
+    assert mod.broker_socket_path({}, environ={"ANSIBLE_ORACLE_BROKER": "no"}) is None
+    assert mod.broker_socket_path({}, environ={"ANSIBLE_ORACLE_BROKER": "yes"}).endswith("broker.sock")
+    assert mod.broker_socket_path({"broker": "/tmp/x.sock"}, environ={}) == "/tmp/x.sock"
+
+
+class _Module:
+    check_mode = False
+    _verbosity = 0
+
+    def __init__(self, params):
+        self.params = params
+        self.warnings = []
+
+    def exit_json(self, **kwargs):
+        raise ExitJson(kwargs)
+
+    def fail_json(self, **kwargs):
+        raise FailJson(kwargs)
+
+    def warn(self, msg):
+        self.warnings.append(msg)
+
+
+def _load_utils_with_broker(mod, name):
+    utils = load_module_from_path(module_path("plugins", "module_utils", "oracle_utils.py"), name)
+    utils.oracledb = FakeOracleDb
+    utils.oracledb_exists = True
+    utils.oracle_broker_exists = True
+    for attr in ("BrokerUnavailable", "broker_connect", "broker_socket_path", "pool_key"):
+        setattr(utils, attr, getattr(mod, attr))
+    return utils
+
+
+def test_oracle_connection_borrows_session_from_broker(broker_env, monkeypatch):
+    mod, server, db = broker_env
+    utils = _load_utils_with_broker(mod, "oracle_utils_broker_test")
+    params = dict(hostname="localhost", port=1521, service_name="svc", user="scott", password="p",
+                  mode="normal", oracle_home=None, dsn="fake_dsn", session_container=None,
+                  broker=server.socket_path)
+
+    oc = utils.oracleConnection(_Module(params))
+    rows = oc.execute_select_to_dict("select name, created, size from dual")
+    oc.conn.close()
+    _wait_idle(server)
+
+    assert rows[0]["name"] == "A"
+    assert oc.broker["hit"] is False
+
+    module = _Module(params)
+    oc = utils.oracleConnection(module)
+    assert oc.broker["hit"] is True
+    assert oc.broker["hits"] == 1
+    oc.conn.close()
+    assert len(db.connections) == 1
+    assert utils.broker_result(oc) == {"broker": oc.broker}
+    assert utils.broker_result(oc)["broker"]["socket"] == server.socket_path
+    assert module.exit_json.__func__ is _Module.exit_json
+    assert utils.broker_result(object()) == {}
@@ -857,46 +857,93 @@ def test_stats_prefs_old_db_fails(monkeypatch):
 # oracle_redo
 # ===========================================================================
 
-class _RedoCursor(_FakeCursor):
-    """Cursor that sets output vars on execute() for redo PL/SQL block."""
+M = 1024 ** 2
+
+
+class _RedoDb:
+    """Simulated v$log/v$standby_log: switches, checkpoints and archiving change group status."""
+
+    def __init__(self, logs, standby=(), threads=(1,), rac="NO", log_mode="ARCHIVELOG", active_checkpoints=1):
+        # logs: [thread, group, bytes, status, archived]
+        self.logs = [list(row) for row in logs]
+        self.standby = [list(row) for row in standby]
+        self.threads = list(threads)
+        self.rac = rac
+        self.log_mode = log_mode
+        self.active_checkpoints = active_checkpoints
+        self.statements = []
+
+    def query(self, sql):
+        if "v$instance" in sql:
+            return [(self.rac,)]
+        if "v$database" in sql:
+            return [(self.log_mode,)]
+        if "v$thread" in sql:
+            return [(t,) for t in self.threads]
+        if "union all" in sql:
+            return [(row[1],) for row in self.logs + self.standby]
+        if "v$standby_log" in sql:
+            return [tuple(row[:4]) for row in self.standby]
+        return [tuple(row) for row in self.logs]
+
+    def execute(self, sql):
+        self.statements.append(sql)
+        words = sql.split()
+        if sql.startswith("alter database add standby logfile"):
+            self.standby.append([int(words[6]), int(words[8]), 200 * M, "UNASSIGNED", "YES"])
+        elif sql.startswith("alter database add logfile"):
+            self.logs.append([int(words[5]), int(words[7]), 200 * M, "UNUSED", "YES"])
+        elif sql.startswith("alter database drop"):
+            group = int(words[-1])
+            rows = self.standby if "standby" in sql else self.logs
+            row = next(r for r in rows if r[1] == group)
+            if row[3] in ("CURRENT", "ACTIVE"):
+                raise _RedoError(1624, "ORA-01624: log %d needed for crash recovery" % group)
+            rows.remove(row)
+        elif "archive log thread" in sql or "switch" in sql:
+            thread = int(words[5]) if "thread" in sql else 1
+            rows = [r for r in self.logs if r[0] == thread]
+            current = next(r for r in rows if r[3] == "CURRENT")
+            nxt = rows[(rows.index(current) + 1) % len(rows)]
+            current[3], current[4] = "ACTIVE", "YES"
+            nxt[3], nxt[4] = "CURRENT", "NO"
+        elif "checkpoint" in sql:
+            self.active_checkpoints -= 1
+            if self.active_checkpoints <= 0:
+                for r in self.logs:
+                    if r[3] == "ACTIVE":
+                        r[3] = "INACTIVE"
+
+
+class _RedoError(Exception):
+    def __init__(self, code, message):
+        super().__init__(type("Error", (), {"code": code, "message": message})())
+
+
+class _RedoDbCursor:
+    def __init__(self, db):
+        self._db = db
+        self._rows = []
 
-    def __init__(self, conn, size_changed=0, group_changed=0,
-                 size_msg="No size change", group_msg="No group change"):
-        super().__init__(conn)
-        self._size_changed = size_changed
-        self._group_changed = group_changed
-        self._size_msg = size_msg
-        self._group_msg = group_msg
-        self._created_vars = []
+    def execute(self, sql, params=None):
+        if sql.startswith("select"):
+            self._rows = self._db.query(sql)
+        else:
+            self._db.execute(sql)
 
-    def var(self, typ):
-        v = _FakeVar()
-        self._created_vars.append(v)
-        return v
+    def fetchall(self):
+        return self._rows
 
-    def execute(self, sql, params=None):
-        super().execute(sql, params)
-        # Vars order: size_changed, group_changed, size_msg, group_msg
-        values = [self._size_changed, self._group_changed,
-                  self._size_msg, self._group_msg]
-        for i, val in enumerate(values):
-            if i < len(self._created_vars):
-                self._created_vars[i]._value = val
+    def close(self):
+        pass
 
 
-class _RedoFakeConn(FakeOracleConn):
-    def __init__(self, size_changed=0, group_changed=0,
-                 size_msg="", group_msg=""):
-        super().__init__()
-        self.version = "19.0.0"
-        self._size_changed = size_changed
-        self._group_changed = group_changed
-        self._size_msg = size_msg
-        self._group_msg = group_msg
+class _RedoDbConn:
+    def __init__(self, db):
+        self._db = db
 
     def cursor(self):
-        return _RedoCursor(self, self._size_changed, self._group_changed,
-                           self._size_msg, self._group_msg)
+        return _RedoDbCursor(self._db)
 
 
 def _redo_params(**overrides):
@@ -910,92 +957,103 @@ def _redo_params(**overrides):
         "size": "200M",
         "groups": 3,
         "log_type": "redo",
+        "poll_interval": 0,
+        "resize_timeout": 60,
     }
     base.update(overrides)
     return base
 
 
-def test_redo_no_change(monkeypatch):
-    """No size or group changes needed → changed=False."""
+def _run_redo(monkeypatch, db, **params):
     mod = _load("oracle_redo")
-    conn = _RedoFakeConn(size_changed=0, group_changed=0)
 
     class Mod(BaseFakeModule):
-        params = _redo_params()
+        pass
 
+    Mod.params = _redo_params(**params)
     monkeypatch.setattr(mod, "AnsibleModule", Mod)
-    monkeypatch.setattr(mod, "oracle_connect", lambda m: conn, raising=False)
-    monkeypatch.setattr(mod, "oracledb", FakeOracleDb, raising=False)
+    monkeypatch.setattr(mod, "oracle_connect", lambda m: _RedoDbConn(db), raising=False)
+    monkeypatch.setattr(mod.oracledb, "DatabaseError", Exception, raising=False)
+    return mod
+
+
+def test_redo_no_change(monkeypatch):
+    """All groups of wanted size and count → nothing executed."""
+    db = _RedoDb([[1, 1, 200 * M, "CURRENT", "NO"], [1, 2, 200 * M, "INACTIVE", "YES"],
+                  [1, 3, 200 * M, "INACTIVE", "YES"]])
+    mod = _run_redo(monkeypatch, db)
 
     with pytest.raises(ExitJson) as exc:
         mod.main()
     assert exc.value.args[0]["changed"] is False
+    assert exc.value.args[0]["msg"] == "No size changes. No group changes."
+    assert db.statements == []
 
 
-def test_redo_size_change(monkeypatch):
-    """Size change needed → changed=True."""
-    mod = _load("oracle_redo")
-    conn = _RedoFakeConn(size_changed=1, group_changed=0,
-                         size_msg="Redo log resized")
-
-    class Mod(BaseFakeModule):
-        params = _redo_params()
-
-    monkeypatch.setattr(mod, "AnsibleModule", Mod)
-    monkeypatch.setattr(mod, "oracle_connect", lambda m: conn, raising=False)
-    monkeypatch.setattr(mod, "oracledb", FakeOracleDb, raising=False)
+def test_redo_resize_adds_first_and_drops_old_groups_when_droppable(monkeypatch):
+    """New groups are added up front, CURRENT is switched, ACTIVE checkpointed, old groups dropped."""
+    db = _RedoDb([[1, 1, 50 * M, "CURRENT", "NO"], [1, 2, 50 * M, "INACTIVE", "YES"],
+                  [1, 3, 50 * M, "INACTIVE", "NO"]])
+    mod = _run_redo(monkeypatch, db)
 
     with pytest.raises(ExitJson) as exc:
         mod.main()
-    assert exc.value.args[0]["changed"] is True
-
-
-def test_redo_group_change(monkeypatch):
-    """Group count change needed → changed=True."""
-    mod = _load("oracle_redo")
-    conn = _RedoFakeConn(size_changed=0, group_changed=1,
-                         group_msg="Groups added")
-
-    class Mod(BaseFakeModule):
-        params = _redo_params()
-
-    monkeypatch.setattr(mod, "AnsibleModule", Mod)
-    monkeypatch.setattr(mod, "oracle_connect", lambda m: conn, raising=False)
-    monkeypatch.setattr(mod, "oracledb", FakeOracleDb, raising=False)
+    result = exc.value.args[0]
+    assert result["changed"] is True
+    assert result["msg"] == "All redologs have been changed to 200M. No group changes."
+    assert db.statements[:4] == [
+        "alter database add logfile thread 1 group 4 size 200M",
+        "alter database add logfile thread 1 group 5 size 200M",
+        "alter database add logfile thread 1 group 6 size 200M",
+        # group 3 is not archived yet, group 1 is CURRENT
+        "alter database drop logfile group 2",
+    ]
+    assert "alter system archive log thread 1 current" in db.statements
+    assert "alter system checkpoint" in db.statements
+    assert sorted(r[1] for r in db.logs) == [4, 5, 6]
+    thread = result["threads"][1]
+    assert thread["state"] == "done" and thread["added"] == [4, 5, 6]
+    assert sorted(thread["dropped"]) == [1, 2, 3]
+    assert thread["elapsed"] >= 0
+
+
+def test_redo_threads_are_drained_side_by_side(monkeypatch):
+    """RAC: both threads get their groups, surplus group of right size is dropped."""
+    db = _RedoDb([[1, 1, 200 * M, "CURRENT", "NO"], [1, 2, 200 * M, "INACTIVE", "YES"],
+                  [1, 3, 200 * M, "INACTIVE", "YES"], [1, 4, 200 * M, "INACTIVE", "YES"],
+                  [2, 5, 200 * M, "CURRENT", "NO"], [2, 6, 200 * M, "INACTIVE", "YES"]],
+                 threads=(1, 2), rac="YES")
+    mod = _run_redo(monkeypatch, db)
 
     with pytest.raises(ExitJson) as exc:
         mod.main()
-    assert exc.value.args[0]["changed"] is True
+    result = exc.value.args[0]
+    assert result["msg"] == "No size changes. Groups have been adjusted to 3 groups."
+    assert db.statements == ["alter database add logfile thread 2 group 7 size 200M",
+                             "alter database drop logfile group 4"]
+    assert result["threads"][2]["added"] == [7]
+    assert result["threads"][1]["dropped"] == [4]
 
 
 def test_redo_invalid_size_fails(monkeypatch):
     """size without M/G/T suffix → fail_json."""
-    mod = _load("oracle_redo")
-    conn = _RedoFakeConn()
-
-    class Mod(BaseFakeModule):
-        params = _redo_params(size="200")  # no M/G/T suffix
-
-    monkeypatch.setattr(mod, "AnsibleModule", Mod)
-    monkeypatch.setattr(mod, "oracle_connect", lambda m: conn, raising=False)
-    monkeypatch.setattr(mod, "oracledb", FakeOracleDb, raising=False)
+    mod = _run_redo(monkeypatch, _RedoDb([]), size="200")
 
     with pytest.raises(FailJson):
         mod.main()
 
 
-def test_redo_standby_type(monkeypatch):
-    """log_type=standby → executes standby SQL block."""
-    mod = _load("oracle_redo")
-    conn = _RedoFakeConn(size_changed=0, group_changed=0)
+def test_redo_standby_waits_for_active_log(monkeypatch):
+    """log_type=standby → standby groups added, ACTIVE standby log is not dropped, timeout reports state."""
+    db = _RedoDb([[1, 1, 200 * M, "CURRENT", "NO"], [1, 2, 200 * M, "INACTIVE", "YES"]],
+                 standby=[[1, 3, 50 * M, "ACTIVE"], [1, 4, 50 * M, "UNASSIGNED"]])
+    mod = _run_redo(monkeypatch, db, log_type="standby", groups=2, resize_timeout=0)
 
-    class Mod(BaseFakeModule):
-        params = _redo_params(log_type="standby")
-
-    monkeypatch.setattr(mod, "AnsibleModule", Mod)
-    monkeypatch.setattr(mod, "oracle_connect", lambda m: conn, raising=False)
-    monkeypatch.setattr(mod, "oracledb", FakeOracleDb, raising=False)
-
-    with pytest.raises(ExitJson) as exc:
+    with pytest.raises(FailJson) as exc:
         mod.main()
-    assert exc.value.args[0]["changed"] is False
+    result = exc.value.args[0]
+    assert db.statements == ["alter database add standby logfile thread 1 group 5 size 200M",
+                             "alter database add standby logfile thread 1 group 6 size 200M",
+                             "alter database drop standby logfile group 4"]
+    assert result["threads"][1]["pending"] == [3]
+    assert result["threads"][1]["state"] == "drain"
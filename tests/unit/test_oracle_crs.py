@@ -0,0 +1,221 @@
+"""Unit tests for the shared CRS resource model (module_utils/oracle_crs.py)."""
+import pytest
+
+from conftest import ExitJson, FailJson, load_module_from_path, module_path
+from helpers import BaseFakeModule, FakeOracleHomes
+
+
+def _crs():
+    return load_module_from_path(module_path("plugins", "module_utils", "oracle_crs.py"), "oracle_crs_test")
+
+
+# crsctl stat res -f: static attributes first, then one section per instance
+CRSCTL_FULL = """NAME=ora.orcl.db
+TYPE=ora.database.type
+ORACLE_HOME=/u01/app/oracle/19.0.0
+SPFILE=+DATA/ORCL/spfileorcl.ora
+USR_ORA_INST_NAME@SERVERNAME(rac1)=orcl1
+USR_ORA_INST_NAME@SERVERNAME(rac2)=orcl2
+CARDINALITY_ID=1
+LAST_SERVER=rac1
+STATE=ONLINE
+TARGET=ONLINE
+CARDINALITY_ID=2
+LAST_SERVER=rac2
+STATE=OFFLINE
+TARGET=ONLINE
+
+NAME=ora.orcl.app.svc
+TYPE=ora.service.type
+CLB_GOAL=LONG
+CARDINALITY_ID=1
+LAST_SERVER=rac1
+STATE=OFFLINE
+TARGET=OFFLINE
+
+NAME=ora.LISTENER.lsnr
+TYPE=ora.listener.type
+ENDPOINTS=TCP:1521
+STATE=ONLINE on rac1, ONLINE on rac2
+TARGET=ONLINE, ONLINE
+
+NAME=ora.asm
+TYPE=ora.asm.type
+ASM_DISKSTRING=/dev/oracleasm/*
+"""
+
+
+def test_crs_model_indexes_by_type_name_and_server():
+    crs = _crs().CrsResources.from_output(CRSCTL_FULL)
+
+    db = crs.get("db", "ORCL")
+    assert db.name == "ora.orcl.db"
+    assert db.attributes["SPFILE"] == "+DATA/ORCL/spfileorcl.ora"
+    assert "STATE" not in db.attributes
+    assert [i["STATE"] for i in db.instances] == ["ONLINE", "OFFLINE"]
+    assert db.running_on() == ["rac1"]
+
+    assert crs.config("service", "orcl.app") == {"NAME": "ora.orcl.app.svc", "TYPE": "ora.service.type",
+                                                 "CLB_GOAL": "LONG"}
+    assert crs.get("ora.listener.type", "listener").servers() == ["rac1", "rac2"]
+    assert [r.name for r in crs.of_type("asm")] == ["ora.asm"]
+    assert sorted(r.name for r in crs.on_server("rac2")) == ["ora.LISTENER.lsnr", "ora.orcl.db"]
+
+
+def test_crs_model_runtime_state():
+    crs = _crs().CrsResources.from_output(CRSCTL_FULL)
+    assert crs.running("db", "orcl") is True
+    assert crs.running("service", "orcl.app") is False
+    assert crs.running("listener", "listener") is True
+    # -p style output without runtime attributes: state unknown
+    assert crs.running("asm", "asm") is None
+    assert crs.running("db", "missing") is None
+    assert crs.config("db", "missing") == {}
+
+
+def test_crs_model_merges_per_instance_blocks():
+    """crsctl stat res -v repeats the resource block for every instance."""
+    out = ("NAME=ora.orcl.db\nTYPE=ora.database.type\nLAST_SERVER=rac1\nSTATE=ONLINE on rac1\nTARGET=ONLINE\n\n"
+           "NAME=ora.orcl.db\nTYPE=ora.database.type\nLAST_SERVER=rac2\nSTATE=INTERMEDIATE on rac2\nTARGET=ONLINE\n")
+    db = _crs().CrsResources.from_output(out).get("db", "orcl")
+    assert len(db.instances) == 2
+    assert db.running_on() == ["rac1", "rac2"]
+
+
+def test_crs_resources_runs_crsctl_once_and_fails_on_error():
+    crs = _crs()
+    calls = []
+
+    class Mod(BaseFakeModule):
+        params = {}
+
+        def run_command(self, cmd, **_kw):
+            calls.append(cmd)
+            return self.response
+
+    m = Mod()
+    m.response = (0, CRSCTL_FULL, "")
+    table = crs.crs_resources(m, "/grid/bin/crsctl")
+    assert calls == [["/grid/bin/crsctl", "stat", "res", "-f"]]
+    assert len(table.resources) == 4
+
+    m.response = (1, "", "CRS-4535")
+    with pytest.raises(FailJson) as exc:
+        crs.crs_resources(m, "/grid/bin/crsctl", changed=False)
+    assert "CRS-4535" in exc.value.args[0]["msg"]
+
+
+def test_crs_db_state_is_answered_from_crsctl(monkeypatch):
+    """State reported by crsctl stat res -f, no srvctl status call is needed."""
+    mod = load_module_from_path("plugins/modules/oracle_crs_db.py", "oracle_crs_db_model")
+    calls = []
+    out = ("NAME=ora.mydb.db\nTYPE=ora.database.type\nORACLE_HOME=/u01/oracle\n"
+           "CARDINALITY_ID=1\nLAST_SERVER=myhost\nSTATE=OFFLINE\nTARGET=OFFLINE\n\n")
+
+    class Mod(BaseFakeModule):
+        params = {"name": "mydb", "state": "started", "enabled": True, "oraclehome": "/u01/oracle",
+                  "domain": None, "spfile": None, "pwfile": None, "role": None, "startoption": None,
+                  "stopoption": None, "dbname": None, "instance": None, "policy": None,
+                  "diskgroup": None, "force": False}
+
+        def run_command(self, cmd, **_kw):
+            calls.append(cmd)
+            return (0, out, "") if "crsctl" in cmd[0] else (0, "", "")
+
+    monkeypatch.setattr(mod, "AnsibleModule", Mod)
+    monkeypatch.setattr(mod, "OracleHomes", FakeOracleHomes, raising=False)
+
+    with pytest.raises(ExitJson) as exc:
+        mod.main()
+    assert exc.value.args[0]["changed"] is True
+    assert [c[1:3] for c in calls] == [["stat", "res"], ["start", "database"]]
+
+
+def test_crs_snapshot_is_reused_until_expired(tmp_path, monkeypatch):
+    crs = _crs()
+    path = str(tmp_path / "crs.json")
+    monkeypatch.setenv("ANSIBLE_ORACLE_CRS_SNAPSHOT", path)
+    calls = []
+
+    class Mod(BaseFakeModule):
+        params = {}
+
+        def run_command(self, cmd, **_kw):
+            calls.append(cmd)
+            return (0, CRSCTL_FULL, "")
+
+    first = crs.crs_resources(Mod(), "/grid/bin/crsctl")
+    second = crs.crs_resources(Mod(), "/grid/bin/crsctl")
+    assert len(calls) == 1
+    assert second.running("db", "orcl") is True
+    assert second.get("db", "orcl").running_on() == first.get("db", "orcl").running_on()
+    assert [r.name for r in second.on_server("rac2")] == [r.name for r in first.on_server("rac2")]
+
+    # other clusterware home or expired snapshot is not used
+    assert crs.load_snapshot(path, "/other/bin/crsctl", 15) is None
+    assert crs.load_snapshot(path, "/grid/bin/crsctl", 15, now=crs.time.time() + 60) is None
+
+    crs.invalidate_snapshot()
+    crs.crs_resources(Mod(), "/grid/bin/crsctl")
+    assert len(calls) == 2
+
+
+def test_crs_change_command_invalidates_snapshot(tmp_path, monkeypatch):
+    snapshot = tmp_path / "crs.json"
+    monkeypatch.setenv("ANSIBLE_ORACLE_CRS_SNAPSHOT", str(snapshot))
+    mod = load_module_from_path("plugins/modules/oracle_crs_asm.py", "oracle_crs_asm_snapshot")
+    out = ("NAME=ora.asm\nTYPE=ora.asm.type\nENABLED=1\n"
+           "CARDINALITY_ID=1\nLAST_SERVER=myhost\nSTATE=OFFLINE\nTARGET=OFFLINE\n\n")
+    calls = []
+
+    class Mod(BaseFakeModule):
+        params = {"name": "asm", "state": "started", "enabled": True, "listener": None, "spfile": None,
+                  "pwfile": None, "diskstring": None, "force": False}
+
+        def run_command(self, cmd, **_kw):
+            calls.append(cmd)
+            if "crsctl" in cmd[0]:
+                return (0, out, "")
+            assert not snapshot.exists()
+            # an other task takes a snapshot while srvctl is still running
+            snapshot.write_text("{}")
+            return (0, "", "")
+
+    monkeypatch.setattr(mod, "AnsibleModule", Mod)
+    monkeypatch.setattr(mod, "OracleHomes", FakeOracleHomes, raising=False)
+
+    with pytest.raises(ExitJson):
+        mod.main()
+    assert [c[1] for c in calls] == ["stat", "start"]
+    assert not snapshot.exists()
+
+
+def test_run_change_command_drops_snapshot_before_and_after(tmp_path, monkeypatch):
+    snapshot = tmp_path / "crs.json"
+    monkeypatch.setenv("ANSIBLE_ORACLE_CRS_SNAPSHOT", str(snapshot))
+    crs = _crs()
+
+    class Mod(BaseFakeModule):
+        params = {"oracle_home": "/u01/db"}
+
+        def run_command(self, cmd, **_kw):
+            assert not snapshot.exists()
+            snapshot.write_text("{}")
+            return (0, "", "")
+
+    snapshot.write_text("{}")
+    assert crs.run_change_command(Mod(), "/u01/db/bin/srvctl start service -d DB1 -s SVC1") == (0, "", "")
+    assert not snapshot.exists()
+
+
+def test_services_srvctl_changes_go_through_run_change_command(monkeypatch):
+    mod = load_module_from_path("plugins/modules/oracle_services.py", "oracle_services_snapshot")
+    calls = []
+    monkeypatch.setattr(mod, "run_change_command", lambda module, command: calls.append(command) or (0, "", ""))
+    mod.gimanaged = True
+
+    class Mod(BaseFakeModule):
+        params = {"oracle_home": "/u01/db"}
+
+    assert mod.start_service(None, Mod(), "", "SVC1", "DB1", False)
+    assert calls == ["/u01/db/bin/srvctl start service -d DB1 -s SVC1"]
@@ -30,3 +30,298 @@ def test_oracle_homes_warns_for_invalid_oracle_home(monkeypatch):
 
     homes.add_home("/invalid/home")
     assert any("does not have valid directory" in w for w in homes.module.warnings)
+
+
+def test_oracle_homes_add_homes_describes_in_parallel_keeps_order(monkeypatch):
+    import threading
+
+    mod = load_module_from_path(module_path("plugins", "module_utils", "oracle_homes.py"), "oracle_homes_test_par")
+    monkeypatch.setattr(mod.os.path, "isdir", lambda v: v != "/invalid")
+    homes = mod.OracleHomes(DummyModule())
+    homes.homes = {}
+    # every probe waits for the others, serial execution would break the barrier
+    barrier = threading.Barrier(3, timeout=5)
+
+    def describe(home):
+        barrier.wait()
+        return {"ORACLE_HOME": home, "ORACLE_BASE": "/u01/base", "home_type": "server", "owner": "oracle"}
+
+    monkeypatch.setattr(homes, "describe_home", describe)
+    homes.add_homes(["/u01/h3", "/u01/h1", "/invalid", "/u01/h2", "/u01/h1"])
+
+    assert list(homes.homes) == ["/u01/h3", "/u01/h1", "/u01/h2"]
+    assert any("/invalid" in w for w in homes.module.warnings)
+
+
+def test_oracle_homes_parse_oratab_registers_sids(monkeypatch, tmp_path):
+    mod = load_module_from_path(module_path("plugins", "module_utils", "oracle_homes.py"), "oracle_homes_test_tab")
+    monkeypatch.setattr(mod.os.path, "isdir", lambda _v: True)
+    homes = mod.OracleHomes(DummyModule())
+    homes.homes = {}
+    homes.facts_item = {}
+    described = []
+
+    def describe(home):
+        described.append(home)
+        return {"ORACLE_HOME": home, "ORACLE_BASE": "/u01/base", "home_type": "server", "owner": "oracle"}
+
+    monkeypatch.setattr(homes, "describe_home", describe)
+    oratab = "# comment\nDB1:/u01/h1:N\nDB2:/u01/h2:Y\nDB3:/u01/h1:N\n"
+    real_open = open
+    monkeypatch.setattr("builtins.open",
+                        lambda f, *a, **kw: __import__("io").StringIO(oratab) if f == "/etc/oratab" else real_open(f, *a, **kw))
+    homes.parse_oratab()
+
+    assert sorted(described) == ["/u01/h1", "/u01/h2"]
+    assert homes.facts_item["DB3"]["ORACLE_HOME"] == "/u01/h1"
+    assert homes.facts_item["DB2"]["ORACLE_BASE"] == "/u01/base"
+
+
+def _cached_host(monkeypatch, tmp_path, name):
+    mod = load_module_from_path(module_path("plugins", "module_utils", "oracle_homes.py"), name)
+    home = tmp_path / "dbhome_1"
+    (home / "inventory" / "ContentsXML").mkdir(parents=True)
+    (home / "inventory" / "ContentsXML" / "comps.xml").write_text(
+        '<PRD_LIST><TL_LIST><COMP NAME="oracle.server"/></TL_LIST></PRD_LIST>')
+    inventory = tmp_path / "oraInventory"
+    (inventory / "ContentsXML").mkdir(parents=True)
+    (inventory / "ContentsXML" / "inventory.xml").write_text(
+        '<INVENTORY><HOME_LIST><HOME NAME="h1" LOC="{}"/></HOME_LIST></INVENTORY>'.format(home))
+    (tmp_path / "oraInst.loc").write_text("inventory_loc={}\n".format(inventory))
+    (tmp_path / "oratab").write_text("DB1:{}:N\n".format(home))
+    monkeypatch.setattr(mod, "ORA_INST_LOC", str(tmp_path / "oraInst.loc"))
+    monkeypatch.setattr(mod, "ORATAB", str(tmp_path / "oratab"))
+    monkeypatch.setattr(mod, "OCR_LOC", str(tmp_path / "ocr.loc"))
+    monkeypatch.setattr(mod, "OLR_LOC", str(tmp_path / "olr.loc"))
+    monkeypatch.setattr(mod.OracleHomes, "base_from_home", lambda self, h: "/u01/app/oracle")
+
+    described = []
+    real_describe = mod.OracleHomes.describe_home
+
+    def describe(self, h):
+        described.append(h)
+        return real_describe(self, h)
+
+    monkeypatch.setattr(mod.OracleHomes, "describe_home", describe)
+    return mod, str(home), described
+
+
+class ParamsModule(DummyModule):
+    def __init__(self, **params):
+        super().__init__()
+        self.params = params
+
+
+def test_oracle_homes_fact_cache_reuses_static_discovery(monkeypatch, tmp_path):
+    mod, home, described = _cached_host(monkeypatch, tmp_path, "oracle_homes_test_cache")
+    cache = str(tmp_path / "cache" / "homes.json")
+
+    first = mod.OracleHomes(ParamsModule(fact_cache=cache))
+    first.parse_oratab()
+    assert first.cache_hit is False
+    assert described == [home]
+    assert first.homes[home]["home_type"] == "server"
+
+    second = mod.OracleHomes(ParamsModule(fact_cache=cache))
+    second.parse_oratab()
+    assert second.cache_hit is True
+    assert described == [home]
+    assert second.homes == first.homes
+    assert second.facts_item["DB1"]["ORACLE_BASE"] == "/u01/app/oracle"
+
+    # refresh ignores the cache content
+    mod.OracleHomes(ParamsModule(fact_cache=cache, refresh=True))
+    assert described == [home, home]
+
+
+def test_oracle_homes_fact_cache_invalidated_by_comps_xml_change(monkeypatch, tmp_path):
+    import os
+
+    mod, home, described = _cached_host(monkeypatch, tmp_path, "oracle_homes_test_cache_inv")
+    cache = str(tmp_path / "homes.json")
+    mod.OracleHomes(ParamsModule(fact_cache=cache))
+
+    comps = os.path.join(home, "inventory", "ContentsXML", "comps.xml")
+    with open(comps, "w") as f:
+        f.write('<PRD_LIST><TL_LIST><COMP NAME="oracle.client"/></TL_LIST></PRD_LIST>')
+    os.utime(comps, ns=(1, 1))
+
+    homes = mod.OracleHomes(ParamsModule(fact_cache=cache))
+    assert homes.cache_hit is True
+    assert described == [home, home]
+    assert homes.homes[home]["home_type"] == "client"
+
+
+def test_oracle_homes_fact_cache_is_opt_in():
+    mod = load_module_from_path(module_path("plugins", "module_utils", "oracle_homes.py"), "oracle_homes_test_cache_path")
+    assert mod.fact_cache_path({}, environ={}) is None
+    assert mod.fact_cache_path({}, environ={"ANSIBLE_ORACLE_FACT_CACHE": "no"}) is None
+    assert mod.fact_cache_path({}, environ={"ANSIBLE_ORACLE_FACT_CACHE": "yes"}).endswith("oracle_homes.json")
+    assert mod.fact_cache_path({"fact_cache": "/tmp/x.json"}, environ={}) == "/tmp/x.json"
+
+
+FAKE_ORACLEDB = '''
+import os
+
+SYSDBA = 2
+
+
+class DatabaseError(Exception):
+    pass
+
+
+class ProgrammingError(Exception):
+    pass
+
+
+def init_oracle_client(**kwargs):
+    pass
+
+
+STATES = {"ORCL": ("OPEN", "READ WRITE", "PRIMARY", 0), "STBY": ("MOUNTED", "MOUNTED", "PHYSICAL STANDBY", 1)}
+
+
+class Cursor:
+    description = None
+
+    def execute(self, sql):
+        sid = os.environ["ORACLE_SID"]
+        if sid == "NOMNT":
+            if "v$database" in sql:
+                raise DatabaseError("ORA-01507: database not mounted")
+            self.description, self.row = [("STATUS",)], ("STARTED",)
+            return
+        status, open_mode, role, dg = STATES[sid]
+        self.description = [("STATUS",), ("OPEN_MODE",), ("DATABASE_ROLE",), ("ORA_DG_ON",)]
+        self.row = (status, open_mode, role, dg)
+
+    def fetchone(self):
+        return self.row
+
+
+class Connection:
+    def cursor(self):
+        return Cursor()
+
+    def close(self):
+        pass
+
+
+def connect(mode=None):
+    if os.environ["ORACLE_SID"] == "FAIL":
+        raise DatabaseError("ORA-01031: insufficient privileges")
+    return Connection()
+'''
+
+
+def test_oracle_homes_oracledb_status_probe_reuses_helper(monkeypatch, tmp_path):
+    import os
+    import pwd
+
+    mod = load_module_from_path(module_path("plugins", "module_utils", "oracle_homes.py"), "oracle_homes_test_probe")
+    (tmp_path / "oracledb.py").write_text(FAKE_ORACLEDB)
+    monkeypatch.setenv("PYTHONPATH", str(tmp_path))
+    owner = pwd.getpwuid(os.getuid()).pw_name
+
+    homes = mod.OracleHomes(ParamsModule(status_engine="oracledb"))
+    sqlplus = []
+    monkeypatch.setattr(homes, "query_db_status_sqlplus", lambda o, h, sid: sqlplus.append(sid) or ["SQLPLUS"])
+    try:
+        assert homes.query_db_status(owner, str(tmp_path), "ORCL") == ["OPEN", "READ WRITE"]
+        assert homes.query_db_status(owner, str(tmp_path), "STBY") == ["MOUNTED", "STANDBY"]
+        assert homes.query_db_status(owner, str(tmp_path), "NOMNT") == ["STARTED"]
+        # connection errors fall back to sqlplus
+        assert homes.query_db_status(owner, str(tmp_path), "FAIL") == ["SQLPLUS"]
+        assert sqlplus == ["FAIL"]
+        assert len(homes._status_helpers) == 1
+    finally:
+        homes.close_status_helpers()
+
+
+def test_oracle_homes_status_engine_falls_back_without_oracledb(monkeypatch, tmp_path):
+    import os
+    import pwd
+
+    mod = load_module_from_path(module_path("plugins", "module_utils", "oracle_homes.py"), "oracle_homes_test_probe_fb")
+    # a broken oracledb module shadows any installed one
+    (tmp_path / "oracledb.py").write_text("raise ImportError('no oracledb here')\n")
+    monkeypatch.setenv("PYTHONPATH", str(tmp_path))
+    owner = pwd.getpwuid(os.getuid()).pw_name
+
+    homes = mod.OracleHomes(ParamsModule(status_engine="oracledb"))
+    monkeypatch.setattr(homes, "query_db_status_sqlplus", lambda o, h, sid: ["SQLPLUS"])
+    assert homes.query_db_status(owner, str(tmp_path), "ORCL") == ["SQLPLUS"]
+    assert homes.query_db_status(owner, str(tmp_path), "ORCL2") == ["SQLPLUS"]
+    assert sum("oracledb status probe not available" in w for w in homes.module.warnings) == 1
+    assert mod.status_engine({}, environ={"ANSIBLE_ORACLE_STATUS_ENGINE": "sqlplus"}) == "sqlplus"
+
+
+def test_oracle_homes_sqlplus_probe_switches_owner_without_preexec_fn(monkeypatch):
+    import threading
+
+    mod = load_module_from_path(module_path("plugins", "module_utils", "oracle_homes.py"), "oracle_homes_test_owner")
+    calls = []
+
+    class _PW:
+        pw_name = "oracle"
+        pw_dir = "/home/oracle"
+        pw_uid = 1000
+        pw_gid = 1001
+
+    class _Proc:
+        returncode = 0
+
+        def communicate(self, **_kwargs):
+            return (b"STATUS\n-------\nOPEN\n", b"")
+
+    monkeypatch.setattr(mod.pwd, "getpwnam", lambda _u: _PW())
+    monkeypatch.setattr(mod.os, "getuid", lambda: 0)
+    monkeypatch.setattr(mod.os, "getgrouplist", lambda _u, _g: [1001, 1002])
+    monkeypatch.setattr(mod.subprocess, "Popen", lambda *args, **kwargs: calls.append(kwargs) or _Proc())
+    monkeypatch.setattr(mod.sys, "version_info", (3, 9, 0))
+
+    homes = mod.OracleHomes(DummyModule())
+    assert homes.query_db_status_sqlplus("oracle", "/u01/db", "ORCL") == ["OPEN", "UNKNOWN"]
+    assert "preexec_fn" not in calls[0]
+    assert (calls[0]["user"], calls[0]["group"], calls[0]["extra_groups"]) == (1000, 1001, [1001, 1002])
+
+    # older interpreters need preexec_fn, probes spawning as owner are not run in threads then
+    monkeypatch.setattr(mod.sys, "version_info", (3, 8, 10))
+    assert callable(homes.owner_popen_kwargs(1000, 1001, [1001])["preexec_fn"])
+    workers = set()
+    homes.max_workers = 4
+    homes.parallel_map(lambda i: workers.add(threading.get_ident()), range(8), as_owner=True)
+    assert len(workers) == 1
+
+
+def test_oracle_homes_status_helpers_start_outside_global_lock(monkeypatch):
+    import threading
+
+    mod = load_module_from_path(module_path("plugins", "module_utils", "oracle_homes.py"), "oracle_homes_test_reserve")
+    homes = mod.OracleHomes(DummyModule())
+    monkeypatch.setattr(homes, "close_status_helpers", lambda: None)
+    # both homes must be starting at the same time, a global lock held while spawning would break the barrier
+    barrier = threading.Barrier(2, timeout=5)
+    starts = []
+
+    def start(helper, oracle_owner, oracle_home):
+        starts.append(oracle_home)
+        barrier.wait()
+        return oracle_home != "/u01/broken"
+
+    monkeypatch.setattr(homes, "start_status_helper", start)
+    calls = ["/u01/db1", "/u01/broken", "/u01/db1", "/u01/broken"]
+    results = {}
+
+    def probe(i):
+        results[i] = homes.status_helper("oracle", calls[i])
+
+    threads = [threading.Thread(target=probe, args=(i,)) for i in range(len(calls))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(10)
+    assert sorted(starts) == ["/u01/broken", "/u01/db1"]
+    assert results[0] is results[2] and results[0] is not None
+    assert results[1] is None and results[3] is None
+    assert homes._status_helpers[("/u01/broken", "oracle")] is None
@@ -205,7 +205,7 @@ def test_query_ldap_users_returns_users(monkeypatch):
     monkeypatch.setattr(mod, "module", FakeMod(), raising=False)
     _setup_ldap_globals(monkeypatch, mod, FakeLdap, fake_users)
 
-    users = mod.query_ldap_users()
+    users = list(mod.query_ldap_users())
     assert len(users) == 2
     assert users[0]["username"] == "USER1"
     assert users[1]["username"] == "USER2"
@@ -240,7 +240,7 @@ def test_query_ldap_users_filters_invalid(monkeypatch):
     }, raising=False)
     monkeypatch.setattr(mod, "module", FakeMod(), raising=False)
 
-    users = mod.query_ldap_users()
+    users = list(mod.query_ldap_users())
     assert len(users) == 1
     assert users[0]["username"] == "VALID1"
 
@@ -283,9 +283,14 @@ class _FakeVar:
         return self._value
 
 
+# USER1 already exists with the requested attributes and grants
+_USER1 = ("USER1", "OPEN", "EXTERNAL", "USERS", "TEMP", "LDAP_USER", -1)
+
+
 class _FakeCursor:
     def __init__(self):
         self.ddls = []
+        self.rows = []
 
     def var(self, typ):
         return _FakeVar(0)
@@ -295,12 +300,34 @@ class _FakeCursor:
 
     def execute(self, sql, params=None):
         self.ddls.append(sql)
+        if "FROM dba_users u" in sql:
+            self.rows = [_USER1]
+        elif "FROM dba_users WHERE profile" in sql:
+            self.rows = [("USER1",)]
+        elif "FROM dual" in sql:
+            self.rows = [(1, 1, 1)]
+        else:
+            self.rows = []
+
+    def fetchone(self):
+        return self.rows[0]
+
+    def fetchall(self):
+        return self.rows
+
+
+class _FakeListType:
+    def newobject(self, values):
+        return list(values)
 
 
 class _FakeOradbConn:
     def cursor(self):
         return _FakeCursor()
 
+    def gettype(self, name):
+        return _FakeListType()
+
     def commit(self):
         pass
 
@@ -456,3 +483,172 @@ def test_main_group_role_map(monkeypatch):
     with pytest.raises(ExitJson) as exc:
         mod.main()
     assert exc.value.args[0]["changed"] is False
+
+
+# ---------------------------------------------------------------------------
+# paged search, batches and watermark
+# ---------------------------------------------------------------------------
+
+class _PagedControl:
+    controlType = "1.2.840.113556.1.4.319"
+
+    def __init__(self, criticality, size, cookie):
+        self.size = size
+        self.cookie = cookie
+
+
+class _PagedLdap(_FakeLdapModule):
+    SCOPE_BASE = 0
+    NO_SUCH_OBJECT = KeyError
+
+    class _FakeLconn(_FakeLdapModule._FakeLconn):
+        """Directory of users (name, uSNChanged) served in pages of ldap_page_size."""
+        users = []
+        groups = {}
+        searches = []
+
+        def search_ext(self, basedn, scope, filter_str, attrs, serverctrls=None):
+            control = serverctrls[0]
+            self.searches.append((filter_str, list(attrs), control.cookie))
+            users = [u for u in self.users if ">=" not in filter_str or u[1] >= int(filter_str.split(">=")[1][:-2])]
+            start = int(control.cookie or 0)
+            self.page = ([("cn=%s" % name, {"sAMAccountName": [name.encode()], "uSNChanged": [str(usn).encode()],
+                                            "memberOf": [b"CN=readers,DC=int"]})
+                          for (name, usn) in users[start:start + control.size]],
+                         str(start + control.size) if start + control.size < len(users) else "")
+            return 1
+
+        def result3(self, msgid):
+            (rdata, cookie) = self.page
+            return (101, rdata, msgid, [_PagedControl(True, 0, cookie)])
+
+        def search_s(self, basedn, scope, filter_str, attrs):
+            if basedn not in self.groups:
+                raise _PagedLdap.NO_SUCH_OBJECT(basedn)
+            return [(basedn, {"uSNChanged": [str(self.groups[basedn]).encode()]})]
+
+
+class _RecordingConn(_FakeOradbConn):
+    """Database with USER1 locked and granted an extra role, MINUS query answered from the bound lists."""
+
+    def __init__(self):
+        self.executed = []
+        self.binds = []
+
+    def cursor(self):
+        conn = self
+
+        class _Cursor(_FakeCursor):
+            def execute(self, sql, params=None):
+                conn.executed.append(sql)
+                self.rows = []
+                if "FROM dual" in sql:
+                    self.rows = [(1, 1, 1)]
+                elif "FROM dba_users u" in sql:
+                    names = [v for (k, v) in sorted(params.items()) if k != "tbs"]
+                    self.rows = [("USER1", "LOCKED", "EXTERNAL", "USERS", "TEMP", "LDAP_USER", -1)] if "USER1" in names else []
+                elif "MINUS" in sql:
+                    conn.binds.append((params["usernames"], params["desired"]))
+                    self.rows = [("GRANT", d.split("/")[0], d.split("/")[1]) for d in params["desired"]
+                                 if not d.startswith("USER1/")]
+                    if "USER1" in params["usernames"]:
+                        self.rows.append(("REVOKE", "USER1", "DBA"))
+                elif "FROM dba_users WHERE profile" in sql:
+                    self.rows = [("USER1",), ("GONE",)]
+        return _Cursor()
+
+
+def _run_sync(monkeypatch, mod, conn, **params):
+    monkeypatch.setattr(mod, "oracledb_exists", True, raising=False)
+    monkeypatch.setattr(mod, "ldap_module_exists", True, raising=False)
+    monkeypatch.setattr(mod, "ldap", _PagedLdap, raising=False)
+    monkeypatch.setattr(mod, "SimplePagedResultsControl", _PagedControl, raising=False)
+    monkeypatch.setattr(mod, "oracledb", _FakeOradb, raising=False)
+
+    class _OC:
+        def __init__(self, module):
+            self.conn = conn
+
+    monkeypatch.setattr(mod, "oracleConnection", _OC, raising=False)
+    monkeypatch.setattr(mod, "AnsibleModule", _make_ldap_mod(_ldap_params(**params)))
+    with pytest.raises(ExitJson) as exc:
+        mod.main()
+    return exc.value.args[0]
+
+
+def test_sync_pages_ldap_and_diffs_grants_per_batch(monkeypatch):
+    """All pages are read, users are processed in batches, grants come from one MINUS query per batch."""
+    mod = _load()
+    _PagedLdap._FakeLconn.users = [("user%d" % i, 100 + i) for i in range(1, 6)]
+    _PagedLdap._FakeLconn.searches = []
+    conn = _RecordingConn()
+    group_map = [{"dn": "CN=readers,DC=int", "group": "reader_role"}]
+    result = _run_sync(monkeypatch, mod, conn, ldap_page_size=2, sync_batch_size=3, group_role_map=group_map)
+
+    assert [s[2] for s in _PagedLdap._FakeLconn.searches] == ["", "2", "4"]
+    assert [b[0] for b in conn.binds] == [["USER1", "USER2", "USER3"], ["USER4", "USER5"]]
+    assert conn.binds[1][1] == ["USER4/CREATE SESSION", "USER4/READER_ROLE", "USER5/CREATE SESSION", "USER5/READER_ROLE"]
+    ddls = [s for s in conn.executed if s.startswith(("CREATE", "ALTER", "GRANT", "REVOKE"))]
+    assert ddls[0] == "ALTER USER USER1 IDENTIFIED EXTERNALLY PROFILE LDAP_USER DEFAULT TABLESPACE USERS " \
+                      "TEMPORARY TABLESPACE TEMP ACCOUNT UNLOCK QUOTA unlimited ON USERS"
+    assert ddls[1].startswith("CREATE USER USER2 IDENTIFIED EXTERNALLY PROFILE LDAP_USER")
+    assert "REVOKE DBA FROM USER1" in ddls
+    assert ddls[-1] == "ALTER USER GONE ACCOUNT LOCK"
+    assert result["changed"] is True
+    assert result["stats"] == dict(users=5, batches=2, created=4, altered=1, granted=8, revoked=1, removed=1,
+                                   changes=15, delta=False)
+
+
+def test_sync_watermark_fetches_only_changed_users(monkeypatch, tmp_path):
+    """Second run searches users changed since the stored uSNChanged, a changed mapped group forces full sync."""
+    mod = _load()
+    _PagedLdap._FakeLconn.users = [("user1", 101), ("user2", 105)]
+    _PagedLdap._FakeLconn.groups = {"CN=readers,DC=int": 50}
+    group_map = [{"dn": "CN=readers,DC=int", "group": "reader_role"}]
+    params = dict(ldap_page_size=100, ldap_watermark_attribute="uSNChanged", group_role_map=group_map,
+                  ldap_watermark_file=str(tmp_path / "wm.json"))
+
+    _PagedLdap._FakeLconn.searches = []
+    result = _run_sync(monkeypatch, mod, _RecordingConn(), **params)
+    assert result["stats"]["watermark"] == "105"
+    assert result["stats"]["delta"] is False
+
+    _PagedLdap._FakeLconn.users.append(("user3", 110))
+    _PagedLdap._FakeLconn.searches = []
+    conn = _RecordingConn()
+    result = _run_sync(monkeypatch, mod, conn, **params)
+    assert result["stats"]["delta"] is True
+    assert result["stats"]["watermark"] == "110"
+    assert [s[0] for s in _PagedLdap._FakeLconn.searches] == ["(&(objectClass=user)(uSNChanged>=105))",
+                                                             "(objectClass=user)"]
+    # user names only for detection of deleted users
+    assert _PagedLdap._FakeLconn.searches[1][1] == ["sAMAccountName"]
+    assert [b[0] for b in conn.binds] == [["USER2", "USER3"]]
+
+    _PagedLdap._FakeLconn.groups = {"CN=readers,DC=int": 120}
+    _PagedLdap._FakeLconn.searches = []
+    result = _run_sync(monkeypatch, mod, _RecordingConn(), **params)
+    assert result["stats"]["delta"] is False
+    assert [s[0] for s in _PagedLdap._FakeLconn.searches] == ["(objectClass=user)"]
+
+
+def test_sync_watermark_includes_mapped_groups(monkeypatch, tmp_path):
+    """A group changed after every user is part of the stored watermark, the next run is a delta search again."""
+    mod = _load()
+    _PagedLdap._FakeLconn.users = [("user1", 101), ("user2", 105)]
+    _PagedLdap._FakeLconn.groups = {"CN=readers,DC=int": 200}
+    group_map = [{"dn": "CN=readers,DC=int", "group": "reader_role"},
+                 {"dn": "CN=deleted,DC=int", "group": "deleted_role"}]
+    params = dict(ldap_page_size=100, ldap_watermark_attribute="uSNChanged", group_role_map=group_map,
+                  ldap_watermark_file=str(tmp_path / "wm.json"))
+
+    _PagedLdap._FakeLconn.searches = []
+    result = _run_sync(monkeypatch, mod, _RecordingConn(), **params)
+    assert result["stats"]["delta"] is False
+    assert result["stats"]["watermark"] == "200"
+
+    _PagedLdap._FakeLconn.searches = []
+    result = _run_sync(monkeypatch, mod, _RecordingConn(), **params)
+    assert result["stats"]["delta"] is True
+    assert result["stats"]["watermark"] == "200"
+    assert _PagedLdap._FakeLconn.searches[0][0] == "(&(objectClass=user)(uSNChanged>=200))"
@@ -20,7 +20,12 @@ class FakeAnsibleModule:
         raise RuntimeError(kwargs)
 
 
-class FakeOracleHomes:
+class FakeHomesBase:
+    def parallel_map(self, func, items, as_owner=False):
+        return [func(item) for item in items]
+
+
+class FakeOracleHomes(FakeHomesBase):
     def __init__(self, _module):
         self.facts_item = {
             "+ASM": {"ORACLE_HOME": "/nonexistent", "ORACLE_SID": "+ASM", "running": False},
@@ -123,7 +128,7 @@ def test_oratab_owner_assigned_when_stat_succeeds(monkeypatch):
     """When oracle binary stat works, owner is populated (line 133)."""
     mod = _load()
 
-    class Homes:
+    class Homes(FakeHomesBase):
         def __init__(self, _m):
             self.facts_item = {
                 "ORCL": {
@@ -159,7 +164,7 @@ def test_oratab_asm_probe_when_not_running_sets_running_true(monkeypatch):
     """When +ASM has running=False but has owner, probe is attempted (lines 141-148)."""
     mod = _load()
 
-    class Homes:
+    class Homes(FakeHomesBase):
         def __init__(self, _m):
             self.facts_item = {
                 "+ASM": {
@@ -199,7 +204,7 @@ def test_oratab_asm_probe_exception_yields_down_status(monkeypatch):
     """When query_db_status raises, status falls back to ['DOWN'] (line 150)."""
     mod = _load()
 
-    class Homes:
+    class Homes(FakeHomesBase):
         def __init__(self, _m):
             self.facts_item = {
                 "+ASM": {
@@ -237,7 +242,7 @@ def test_oratab_running_only_warns_for_normal_down_sid(monkeypatch):
     """running_only=True with a down non-ASM SID emits a warning (line 158)."""
     mod = _load()
 
-    class Homes:
+    class Homes(FakeHomesBase):
         def __init__(self, _m):
             self.facts_item = {
                 "ORCL": {
@@ -274,7 +279,7 @@ def test_oratab_asm_only_removes_non_asm_and_warns(monkeypatch):
     """asm_only=True drops non-ASM SIDs and warns (lines 161-164)."""
     mod = _load()
 
-    class Homes:
+    class Homes(FakeHomesBase):
         def __init__(self, _m):
             self.facts_item = {
                 "ORCL": {
@@ -317,7 +322,7 @@ def test_oratab_asm_only_keeps_asm_instance(monkeypatch):
     """asm_only=True keeps a SID whose status contains 'ASM' (lines 161-163)."""
     mod = _load()
 
-    class Homes:
+    class Homes(FakeHomesBase):
         def __init__(self, _m):
             self.facts_item = {
                 "+ASM": {
@@ -355,7 +360,7 @@ def test_oratab_open_only_removes_closed_db_and_warns(monkeypatch):
     """open_only=True drops databases that are not OPEN (lines 167-172)."""
     mod = _load()
 
-    class Homes:
+    class Homes(FakeHomesBase):
         def __init__(self, _m):
             self.facts_item = {
                 "ORCL": {
@@ -399,7 +404,7 @@ def test_oratab_open_only_keeps_asm_regardless(monkeypatch):
     """open_only=True skips ASM instances (they are not checked for OPEN) (line 168-169)."""
     mod = _load()
 
-    class Homes:
+    class Homes(FakeHomesBase):
         def __init__(self, _m):
             self.facts_item = {
                 "+ASM": {
@@ -437,7 +442,7 @@ def test_oratab_writable_only_removes_read_only_db(monkeypatch):
     """writable_only=True drops non-READ WRITE databases (lines 175-180)."""
     mod = _load()
 
-    class Homes:
+    class Homes(FakeHomesBase):
         def __init__(self, _m):
             self.facts_item = {
                 "ORCL": {
@@ -481,7 +486,7 @@ def test_oratab_writable_only_keeps_asm_regardless(monkeypatch):
     """writable_only=True skips ASM instances (line 176-177)."""
     mod = _load()
 
-    class Homes:
+    class Homes(FakeHomesBase):
         def __init__(self, _m):
             self.facts_item = {
                 "+ASM": {
@@ -519,7 +524,7 @@ def _homes_base_params(homes_val):
     return _base_params(homes=homes_val)
 
 
-class _HomesWithTypes:
+class _HomesWithTypes(FakeHomesBase):
     """OracleHomes stub with multiple home types for filter tests."""
 
     def __init__(self, _m):
@@ -625,3 +630,41 @@ def test_oratab_homes_none_keeps_all(monkeypatch):
         assert result["changed"] is False
     else:
         raise AssertionError("should exit_json")
+
+
+def test_oratab_status_probes_run_in_parallel(monkeypatch):
+    import threading
+
+    mod = _load()
+    homes_mod = load_module_from_path(module_path("plugins", "module_utils", "oracle_homes.py"), "oracle_homes_oratab")
+    # every probe waits for the others, serial execution would break the barrier
+    barrier = threading.Barrier(3, timeout=5)
+
+    class Homes(FakeHomesBase):
+        max_workers = 3
+        parallel_map = homes_mod.OracleHomes.parallel_map
+
+        def __init__(self, _m):
+            self.facts_item = dict(
+                (sid, {"ORACLE_HOME": "/fake/home", "ORACLE_SID": sid, "running": True, "owner": "oracle"})
+                for sid in ("DB1", "DB2", "DB3"))
+            self.homes = {}
+
+        def list_crs_instances(self): return None
+        def list_processes(self): return None
+        def parse_oratab(self): return None
+
+        def query_db_status(self, oracle_owner, oracle_home, oracle_sid):
+            barrier.wait()
+            return ["OPEN", "READ WRITE"] if oracle_sid != "DB2" else ["MOUNTED"]
+
+    _make_stat_raises(mod, monkeypatch)
+    _patch(monkeypatch, mod, _base_params(), Homes)
+    try:
+        mod.main()
+    except ExitJson as exc:
+        payload = exc.args[0]
+    else:
+        raise AssertionError("module should exit_json")
+    assert payload["oracle_list"]["DB1"]["status"] == ["OPEN", "READ WRITE"]
+    assert payload["oracle_list"]["DB2"]["status"] == ["MOUNTED"]
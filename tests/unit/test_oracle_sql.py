@@ -33,6 +33,16 @@ class FakeConn:
     def execute_select_to_dict(self, _sql):
         return self.data
 
+    def select_limited(self, sql, params=None, max_rows=None, max_bytes=None, compact=False,
+                       arraysize=None, prefetchrows=None):
+        self.select_args = dict(max_rows=max_rows, max_bytes=max_bytes, compact=compact, arraysize=arraysize)
+        rows = self.data[:max_rows] if max_rows is not None else self.data
+        result = dict(rows=rows, row_count=len(rows), truncated=len(rows) < len(self.data))
+        if compact:
+            result["columns"] = list(self.data[0]) if self.data else []
+            result["rows"] = [list(r.values()) for r in rows]
+        return result
+
     def execute_ddl(self, statement):
         self.ddls.append(statement)
         self.changed = statement.startswith("insert")
@@ -236,3 +246,50 @@ def test_script_file_ioerror(monkeypatch):
         assert payload["changed"] is False
     else:
         raise AssertionError("module should fail_json")
+
+
+def test_select_compact_format_with_row_limit(monkeypatch):
+    mod = _load()
+    FakeAnsibleModule.params = {
+        "user": "u",
+        "password": "p",
+        "mode": "normal",
+        "hostname": "db.example",
+        "port": 1521,
+        "service_name": "svc",
+        "dsn": None,
+        "oracle_home": None,
+        "pdb_name": None,
+        "sql": "select name, value from t",
+        "script": None,
+        "result_format": "compact",
+        "max_rows": 1,
+        "max_bytes": None,
+        "arraysize": 1000,
+    }
+
+    class _Module(FakeAnsibleModule):
+        warnings = []
+
+        def warn(self, msg):
+            self.warnings.append(msg)
+
+    class _Conn(FakeConn):
+        def __init__(self, module):
+            super().__init__(module)
+            self.data = [{"name": "a", "value": 1}, {"name": "b", "value": 2}]
+
+    monkeypatch.setattr(mod, "AnsibleModule", _Module)
+    monkeypatch.setattr(mod, "oracleConnection", _Conn, raising=False)
+
+    try:
+        mod.main()
+    except ExitJson as exc:
+        payload = exc.args[0]
+    else:
+        raise AssertionError("module should exit_json")
+    assert payload["data"] == {"columns": ["name", "value"], "rows": [["a", 1]]}
+    assert payload["truncated"] is True
+    assert payload["row_count"] == 1
+    assert FakeConn.last.select_args["arraysize"] == 1000
+    assert _Module.warnings == ["Result set truncated after 1 rows"]
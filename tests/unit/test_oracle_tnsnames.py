@@ -59,6 +59,9 @@ class FakeDotOraFile:
     def removealias(self, _alias):
         return None
 
+    def findalias(self, alias):
+        return next((p for p in self.params if p.name and p.name.casefold() == alias.casefold()), None)
+
     def __str__(self):
         return "NEW_CONTENT"
 
@@ -203,3 +206,57 @@ def test_absent_state_follow_symlink_and_missing_alias(monkeypatch, tmp_path):
         assert payload["msg"] == "TEST_ALIAS="
     else:
         raise AssertionError("module should exit_json")
+
+
+def test_entries_are_applied_to_one_file_with_one_write(monkeypatch, tmp_path):
+    from test_dotora import TNSNAMES, _load_dotora
+
+    mod = load_module_from_path(module_path("plugins", "modules", "oracle_tnsnames.py"), "oracle_tns_test_entries")
+    target = tmp_path / "tnsnames.ora"
+    target.write_text(TNSNAMES)
+    calls = {"write": [], "backup": 0}
+
+    class _Module(FakeAnsibleModule):
+        def backup_local(self, filename):
+            calls["backup"] += 1
+            return filename + ".bak"
+
+    _Module.params = {
+        "path": str(target),
+        "follow": True,
+        "backup": True,
+        "state": "present",
+        "alias": None,
+        "whole_value": None,
+        "attribute_path": None,
+        "attribute_name": None,
+        "attribute_value": None,
+        "check_mode": False,
+        "entries": [
+            {"alias": "NEW1", "whole_value": "(DESCRIPTION=(ADDRESS=(HOST=n1)))"},
+            {"alias": "PDB1", "attribute_path": "DESCRIPTION/CONNECT_DATA/SERVICE_NAME", "attribute_value": "pdb9"},
+            {"alias": "ORCL", "attribute_name": "SERVER", "attribute_value": "DEDICATED"},
+            {"alias": "SQLNET.X", "state": "absent"},
+        ],
+    }
+
+    monkeypatch.setattr(mod, "AnsibleModule", _Module)
+    monkeypatch.setattr(mod, "DotOraFile", _load_dotora().DotOraFile, raising=False)
+    monkeypatch.setattr(mod, "write_changes", lambda _m, content, dest: calls["write"].append(content))
+
+    try:
+        mod.main()
+    except ExitJson as exc:
+        payload = exc.args[0]
+    else:
+        raise AssertionError("module should exit_json")
+
+    assert payload["changed"] is True
+    assert payload["msg"] == "3 of 4 aliases changed"
+    assert {a: r["changed"] for a, r in payload["aliases"].items()} == {
+        "NEW1": True, "PDB1": True, "ORCL": False, "SQLNET.X": True}
+    assert payload["aliases"]["SQLNET.X"]["msg"] == "SQLNET.X="
+    assert calls["backup"] == 1
+    assert len(calls["write"]) == 1
+    content = calls["write"][0]
+    assert "SERVICE_NAME=pdb9" in content and "NEW1=" in content and "SQLNET.X" not in content
@@ -242,3 +242,272 @@ def test_ensure_oracle_client_required_dpi1047_fails():
         assert "DPI-1047" in payload["msg"]
     else:
         raise AssertionError("required thick mode should fail on DPI-1047")
+
+
+class _RowsCursor:
+    def __init__(self, rows):
+        self.description = [("NAME",), ("VALUE",)]
+        self.rows = rows
+        self.fetched = 0
+        self.closed = False
+        self.arraysize = 100
+
+    def execute(self, _sql, _params=None):
+        pass
+
+    def __iter__(self):
+        for row in self.rows:
+            self.fetched += 1
+            yield row
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.closed = True
+
+
+class _RowsConn:
+    def __init__(self, rows):
+        self.last = _RowsCursor(rows)
+
+    def cursor(self):
+        return self.last
+
+
+def test_iter_select_streams_rows_and_sets_arraysize():
+    utils = load_module_from_path(module_path("plugins", "module_utils", "oracle_utils.py"), "oracle_utils_test_iter")
+    conn = _new_conn_instance(utils)
+    conn.conn = _RowsConn([("a", 1), ("b", 2)])
+
+    rows = conn.iter_select("select name, value from t", arraysize=500)
+    assert next(rows) == {"name": "a", "value": 1}
+    assert conn.conn.last.fetched == 1
+    assert conn.conn.last.arraysize == 500
+    assert list(rows) == [{"name": "b", "value": 2}]
+    assert conn.conn.last.closed is True
+
+
+def test_select_limited_truncates_and_closes_cursor():
+    utils = load_module_from_path(module_path("plugins", "module_utils", "oracle_utils.py"), "oracle_utils_test_limit")
+    conn = _new_conn_instance(utils)
+    conn.conn = _RowsConn([("p%d" % i, i) for i in range(1000)])
+
+    result = conn.select_limited("select name, value from t", max_rows=10, compact=True)
+
+    assert result["truncated"] is True
+    assert result["row_count"] == 10
+    assert result["columns"] == ["name", "value"]
+    assert result["rows"][0] == ["p0", 0]
+    assert conn.conn.last.fetched == 11
+    assert conn.conn.last.closed is True
+
+    conn.conn = _RowsConn([("p%d" % i, i) for i in range(1000)])
+    result = conn.select_limited("select name, value from t", max_bytes=100)
+    assert result["truncated"] is True
+    assert 0 < result["row_count"] < 10
+    assert result["rows"][0] == {"name": "p0", "value": 0}
+
+    conn.conn = _RowsConn([("a", 1)])
+    assert conn.select_limited("select name, value from t", max_rows=1)["truncated"] is False
+
+
+def test_execute_select_to_dict_returns_none_on_ignored_error():
+    utils = load_module_from_path(module_path("plugins", "module_utils", "oracle_utils.py"), "oracle_utils_test_err")
+
+    class _Error:
+        code = 942
+        message = "ORA-00942: table or view does not exist"
+
+    class _DatabaseError(Exception):
+        pass
+
+    class _FailingCursor(_RowsCursor):
+        def execute(self, _sql, _params=None):
+            raise _DatabaseError(_Error())
+
+    class _FailingConn:
+        def cursor(self):
+            return _FailingCursor([])
+
+    utils.oracledb = type("oracledb", (), {"DatabaseError": _DatabaseError})
+    conn = _new_conn_instance(utils)
+    conn.conn = _FailingConn()
+
+    assert conn.execute_select_to_dict("select * from missing", fail_on_error=False) is None
+    assert conn.module.warnings == ["ORA-00942: table or view does not exist"]
+    conn.conn = _RowsConn([])
+    assert conn.execute_select_to_dict("select * from t") == []
+
+
+def test_resolve_object_names_uses_one_query():
+    utils = load_module_from_path(module_path("plugins", "module_utils", "oracle_utils.py"), "oracle_utils_test_resolve")
+    conn = _new_conn_instance(utils)
+    queries = []
+
+    def execute_select(sql, params=None, fetchone=False, fail_on_error=True):
+        queries.append((sql, params))
+        return [("EMP", "HR.EMP")]
+
+    conn.execute_select = execute_select
+
+    assert conn.resolve_object_names(["emp", "Dept", "EMP"]) == {"EMP": "HR.EMP"}
+    assert len(queries) == 1
+    sql, params = queries[0]
+    assert sorted(params.values()) == ["DEPT", "EMP"]
+    assert "user_synonyms" in sql and "all_synonyms" in sql
+    assert conn.resolve_object_names([]) == {}
+
+
+class _ArrayVar:
+    def __init__(self, value=None):
+        self.value = value
+
+    def getvalue(self):
+        return self.value
+
+
+class _BlockCursor:
+    """Emulates EXECUTE_DDLS_BLOCK: statements containing 'bad' raise ORA-01927 or ORA-00942"""
+
+    def __init__(self, calls):
+        self.calls = calls
+
+    def arrayvar(self, _typ, value, _size=None):
+        return _ArrayVar(value if isinstance(value, list) else None)
+
+    def var(self, _typ):
+        return _ArrayVar()
+
+    def execute(self, sql, params):
+        self.calls.append(sql)
+        codes, errors = [], []
+        params['failed'].value = 0
+        for i, stmt in enumerate(params['stmts'].value, 1):
+            code = 1927 if 'bad' in stmt else 942 if 'missing' in stmt else 0
+            codes.append(code)
+            errors.append('ORA-%05d' % code if code else None)
+            if code and code not in params['ignore'].value:
+                params['failed'].value = i
+                break
+        params['codes'].value = codes
+        params['errors'].value = errors
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+def _ddls_conn(utils, check_mode=False):
+    calls = []
+    utils.oracledb = type("oracledb", (), {"STRING": str, "NUMBER": int, "DatabaseError": Exception})
+    conn = _new_conn_instance(utils, check_mode=check_mode)
+    conn.conn = type("_Conn", (), {"cursor": lambda self: _BlockCursor(calls)})()
+    return conn, calls
+
+
+def test_execute_ddls_runs_batch_in_one_round_trip():
+    utils = load_module_from_path(module_path("plugins", "module_utils", "oracle_utils.py"), "oracle_utils_test_ddls")
+    conn, calls = _ddls_conn(utils)
+
+    codes = conn.execute_ddls(["grant a to x", "revoke bad from x", "grant b to x"], ignore_errors=[1927],
+                              ddls_entries=["grant a", "revoke bad", "grant b"])
+
+    assert len(calls) == 1 and "EXECUTE IMMEDIATE" in calls[0]
+    assert codes == [0, 1927, 0]
+    assert conn.ddls == ["grant a", "revoke bad", "grant b"]
+    assert conn.changed is True
+
+
+def test_execute_ddls_fails_on_first_error_not_ignored():
+    utils = load_module_from_path(module_path("plugins", "module_utils", "oracle_utils.py"), "oracle_utils_test_ddls_fail")
+    conn, _calls = _ddls_conn(utils)
+
+    try:
+        conn.execute_ddls(["grant a to x", "select * from missing", "grant b to x"])
+    except FailJson:
+        pass
+    assert conn.module.failed["code"] == 942
+    assert conn.module.failed["msg"] == "ORA-00942"
+    assert conn.ddls == ["grant a to x", "select * from missing"]
+
+
+def test_execute_ddls_check_mode_does_not_execute():
+    utils = load_module_from_path(module_path("plugins", "module_utils", "oracle_utils.py"), "oracle_utils_test_ddls_check")
+    conn, calls = _ddls_conn(utils, check_mode=True)
+
+    assert conn.execute_ddls(["grant a to x", "grant b to x"]) == [0, 0]
+    assert calls == []
+    assert conn.ddls == ["--grant a to x", "--grant b to x"]
+    assert conn.changed is True
+
+
+class _RefCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.description = None
+        self.rows = []
+        self.closed = False
+
+    def var(self, _typ, _size=None):
+        return _ArrayVar()
+
+    def execute(self, sql, params):
+        self.conn.executed.append(sql)
+        for name, value in params.items():
+            if name.startswith('s'):
+                i = name[1:]
+                if 'missing' in value:
+                    params['e' + i].value = 'ORA-00942: table or view does not exist'
+                else:
+                    ref = params['c' + i]
+                    ref.description = [('NAME',), ('VALUE',)]
+                    ref.rows = [('a', 1), ('b', 2)]
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+class _RefConn:
+    def __init__(self):
+        self.executed = []
+        self.cursors = []
+
+    def cursor(self):
+        cursor = _RefCursor(self)
+        self.cursors.append(cursor)
+        return cursor
+
+
+def test_execute_select_multi_uses_one_round_trip():
+    utils = load_module_from_path(module_path("plugins", "module_utils", "oracle_utils.py"), "oracle_utils_test_multi")
+    utils.oracledb = type("oracledb", (), {"STRING": str, "DatabaseError": Exception})
+    conn = _new_conn_instance(utils)
+    conn.conn = _RefConn()
+
+    results, timing = conn.execute_select_multi([
+        ("one", "select name, value from t", True),
+        ("all", "select name, value from t", False),
+        ("bad", "select * from missing", False),
+    ], arraysize=50)
+
+    assert len(conn.conn.executed) == 1
+    assert conn.conn.executed[0].count("OPEN :c") == 3
+    assert results["one"] == {"name": "a", "value": 1}
+    assert results["all"] == [{"name": "a", "value": 1}, {"name": "b", "value": 2}]
+    assert results["bad"] is None
+    assert conn.module.warnings == ["ORA-00942: table or view does not exist"]
+    assert set(timing) == {"execute", "one", "all", "bad"}
+    assert all(c.closed for c in conn.conn.cursors[:3])
+    assert conn.conn.cursors[0].arraysize == 50
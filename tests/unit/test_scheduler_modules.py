@@ -1600,6 +1600,8 @@ class _PrivsZeroCursor:
         return _PrivsZeroConn._ZeroVar()
 
     def arrayvar(self, typ, values, size=None):
+        # size is the maximum length of one element
+        assert size is None or all(len(v) <= size for v in values)
         return values
 
     def execute(self, sql, params=None):
@@ -1876,53 +1878,182 @@ def test_privs_low_version_fails(monkeypatch):
     assert "11g" in exc.value.args[0]["msg"].lower()
 
 
-def test_privs_var_error_triggers_rollback_and_fail(monkeypatch):
-    """var_error.getvalue() > 0 -> rollback + fail_json."""
+def test_privs_chunk_error_triggers_rollback_and_fail(monkeypatch):
+    """statement failing inside a chunk -> rollback + fail_json with the failed statement."""
     mod = _load("oracle_privs")
+    conn = _PrivsEngineConn(grantees=[("TESTROLE",)], done=0, errstr="ORA-01031: insufficient privileges")
 
-    rolled_back = []
+    class Mod(BaseFakeModule):
+        params = _privs_params(privs=["create session"])
 
-    class _IndexedVar:
-        def __init__(self, index):
-            self._index = index
+    monkeypatch.setattr(mod, "AnsibleModule", Mod)
+    monkeypatch.setattr(mod, "oracleConnection", _privs_engine_oc(conn))
 
-        def getvalue(self):
-            if self._index == 1:
-                return 1
-            if self._index == 2:
-                return "PL/SQL error detail"
-            return 0
+    with pytest.raises(FailJson) as exc:
+        mod.main()
+    assert conn.rolled_back, "rollback() should have been called"
+    assert '"GRANT CREATE SESSION TO "TESTROLE""-ORA-01031' in exc.value.args[0]["msg"]
+
+
+class _PrivsEngineVar:
+    def __init__(self, value=None):
+        self.value = value
+
+    def getvalue(self):
+        return self.value
+
+
+class _PrivsEngineConn(FakeOracleConn):
+    """Answers the grantee, dba_tab_privs, dba_objects and privilege queries of PrivsEngine."""
+
+    def __init__(self, grantees=(), granted=(), objects=(), done=None, errstr=None):
+        super().__init__()
+        self.grantees = list(grantees)
+        self.granted = list(granted)
+        self.objects = list(objects)
+        self.done = done
+        self.errstr = errstr
+        self.queries = []
+        self.chunks = []
+        self.commits = 0
+        self.rolled_back = False
+
+    def cursor(self):
+        return _PrivsEngineCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rolled_back = True
 
-    class _ErrConn(_PrivsZeroConn):
-        def rollback(self):
-            rolled_back.append(True)
 
-        def cursor(self):
-            return _ErrCursor(self)
+class _PrivsEngineCursor:
+    def __init__(self, conn):
+        self._conn = conn
+        self._rows = []
+        self.arraysize = 100
+
+    def var(self, typ):
+        return _PrivsEngineVar()
 
-    class _ErrCursor(_PrivsZeroCursor):
-        def __init__(self, conn):
-            super().__init__(conn)
-            self._var_idx = 0
+    def arrayvar(self, typ, values, size=None):
+        # size is the maximum length of one element, as in oracledb
+        assert size is not None and all(len(v.encode("utf-8")) <= size for v in values), (size, values)
+        return list(values)
+
+    def execute(self, sql, params=None):
+        conn = self._conn
+        if "EXECUTE IMMEDIATE" in sql:
+            conn.chunks.append(params["stmts"])
+            params["done"].value = len(params["stmts"]) if conn.done is None else conn.done
+            params["errstr"].value = conn.errstr
+            return
+        conn.queries.append((sql, params))
+        if "FROM dba_users" in sql:
+            self._rows = conn.grantees
+        elif "FROM dba_objects" in sql:
+            self._rows = [o for o in conn.objects if o[0] == params["owner"]]
+            self._rows = [(name,) for (_, name) in self._rows]
+        else:
+            self._rows = conn.granted
 
-        def var(self, typ):
-            v = _IndexedVar(self._var_idx)
-            self._var_idx += 1
-            return v
+    def fetchall(self):
+        return list(self._rows)
 
-    _err_conn = _ErrConn()
+    def fetchmany(self, size):
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
 
+    def close(self):
+        pass
+
+
+def _privs_engine_oc(conn):
     class _FakeOC:
         def __init__(self, module):
-            self.conn = _err_conn
-            self.version = _err_conn.version
+            self.conn = conn
+            self.version = conn.version
+
+    return _FakeOC
+
+
+def test_privs_object_grants_are_narrowed_and_chunked(monkeypatch):
+    """dba_tab_privs is read for the owner/grantees only, objects are granted in committed chunks."""
+    mod = _load("oracle_privs")
+    conn = _PrivsEngineConn(
+        grantees=[("APP_RO",), ("APP_RW",)],
+        granted=[("EMP", "APP_RO", "SELECT"), ("DEPT", "APP_RO", "SELECT"), ("DEPT", "APP_RW", "SELECT")],
+        objects=[("HR", "DEPT"), ("HR", "EMP"), ("HR", "JOBS"), ("SH", "SALES")],
+    )
 
     class Mod(BaseFakeModule):
-        params = _privs_params()
+        params = _privs_params(objs=["hr.%", "sh.sales"], roles=["app_ro", "app_rw", "missing"],
+                               quiet=False, chunk_size=2)
 
     monkeypatch.setattr(mod, "AnsibleModule", Mod)
-    monkeypatch.setattr(mod, "oracleConnection", _FakeOC)
+    monkeypatch.setattr(mod, "oracleConnection", _privs_engine_oc(conn))
 
-    with pytest.raises(FailJson):
+    with pytest.raises(ExitJson) as exc:
         mod.main()
-    assert rolled_back, "rollback() should have been called"
+    result = exc.value.args[0]
+    assert result["changed"] is True
+
+    (grantee_sql, grantee_params) = conn.queries[0]
+    assert "oracle_maintained = 'N'" in grantee_sql
+    assert sorted(grantee_params.values()) == ["APP_RO", "APP_RW", "MISSING"]
+    (tab_sql, tab_params) = conn.queries[1]
+    assert "FROM dba_tab_privs WHERE owner = :owner" in tab_sql
+    assert tab_params["owner"] == "HR"
+    assert "MISSING" not in tab_params.values()
+    (obj_sql, obj_params) = conn.queries[2]
+    assert "ESCAPE" in obj_sql and obj_params["o0"] == "%"
+
+    assert conn.chunks == [
+        ['GRANT SELECT ON "HR"."EMP" TO "APP_RW"'],
+        ['GRANT SELECT ON "HR"."JOBS" TO "APP_RO"', 'GRANT SELECT ON "HR"."JOBS" TO "APP_RW"'],
+        ['GRANT SELECT ON "SH"."SALES" TO "APP_RO"', 'GRANT SELECT ON "SH"."SALES" TO "APP_RW"'],
+    ]
+    assert conn.commits >= 3
+    assert result["msg"].startswith('-GRANT SELECT ON "HR"."EMP" TO "APP_RW"-GRANT')
+    stats = result["stats"]
+    assert (stats["objects"], stats["chunks"], stats["statements"]) == (4, 3, 5)
+    assert stats["objects_per_second"] > 0
+
+
+def test_privs_revoke_system_privs_only_granted(monkeypatch):
+    mod = _load("oracle_privs")
+    conn = _PrivsEngineConn(grantees=[("TESTROLE",)], granted=[("TESTROLE", "CREATE SESSION")])
+
+    class Mod(BaseFakeModule):
+        params = _privs_params(state="absent", privs=["create session", "create table"])
+
+    monkeypatch.setattr(mod, "AnsibleModule", Mod)
+    monkeypatch.setattr(mod, "oracleConnection", _privs_engine_oc(conn))
+
+    with pytest.raises(ExitJson) as exc:
+        mod.main()
+    assert exc.value.args[0]["changed"] is True
+    assert exc.value.args[0]["msg"] == ""
+    assert "FROM dba_sys_privs" in conn.queries[1][0]
+    assert conn.chunks == [['REVOKE CREATE SESSION FROM "TESTROLE"']]
+
+
+def test_privs_chunk_binds_statements_with_element_size(monkeypatch):
+    """Several statements of one chunk are bound as one array, sized by the longest statement."""
+    mod = _load("oracle_privs")
+    conn = _PrivsEngineConn(grantees=[("A",), ("APP_READONLY_ROLE",), ("B",)])
+
+    class Mod(BaseFakeModule):
+        params = _privs_params(privs=["create session", "create table"], roles=["a", "app_readonly_role", "b"])
+
+    monkeypatch.setattr(mod, "AnsibleModule", Mod)
+    monkeypatch.setattr(mod, "oracleConnection", _privs_engine_oc(conn))
+
+    with pytest.raises(ExitJson) as exc:
+        mod.main()
+    assert exc.value.args[0]["changed"] is True
+    assert conn.chunks == [['GRANT CREATE SESSION,CREATE TABLE TO "A"',
+                            'GRANT CREATE SESSION,CREATE TABLE TO "APP_READONLY_ROLE"',
+                            'GRANT CREATE SESSION,CREATE TABLE TO "B"']]
+    assert exc.value.args[0]["stats"]["statements"] == 3
@@ -331,6 +331,47 @@ def test_role_create_external(monkeypatch):
     assert exc.value.args[0]["changed"] is True
 
 
+class _RoleBatchConn(BaseFakeConn):
+    """Answers the set-based dba_roles query with rows for the existing roles."""
+
+    def __init__(self, module, existing):
+        super().__init__(module)
+        self._existing = existing
+        self.queries = []
+
+    def execute_select_to_dict(self, sql, params=None, fetchone=False, fail_on_error=True):
+        self.queries.append((sql, params))
+        wanted = set((params or {}).values())
+        return [{"role": r, "authentication_type": a} for (r, a) in self._existing.items() if r in wanted]
+
+
+def test_role_batch_reads_once_and_converges_all(monkeypatch):
+    mod = _load_role()
+
+    class Mod(BaseFakeModule):
+        params = {**_role_params(), "role": None, "roles": [
+            {"role": "app_read", "state": None, "auth": None, "auth_conf": None},
+            {"role": "app_write", "state": None, "auth": "external", "auth_conf": None},
+            {"role": "app_old", "state": "absent", "auth": None, "auth_conf": None},
+            {"role": "app_new", "state": None, "auth": None, "auth_conf": None},
+        ]}
+
+    conn = _RoleBatchConn(None, {"APP_READ": "NONE", "APP_WRITE": "NONE", "APP_OLD": "NONE"})
+    monkeypatch.setattr(mod, "AnsibleModule", Mod)
+    monkeypatch.setattr(mod, "oracleConnection", lambda m: conn, raising=False)
+
+    with pytest.raises(ExitJson) as exc:
+        mod.main()
+    payload = exc.value.args[0]
+    roles = payload["roles"]
+    assert len(conn.queries) == 1
+    assert roles["app_read"]["changed"] is False
+    assert roles["app_write"]["ddls"] == ["alter role app_write identified externally"]
+    assert roles["app_old"]["ddls"] == ["drop role app_old"]
+    assert roles["app_new"]["ddls"] == ["create role app_new"]
+    assert payload["msg"] == "3 of 4 roles changed"
+
+
 # ===========================================================================
 # oracle_awr
 # ===========================================================================
@@ -792,3 +833,53 @@ def test_profile_mismatched_attribute_lists_fails(monkeypatch):
     with pytest.raises(FailJson) as exc:
         mod.main()
     assert "same length" in exc.value.args[0]["msg"].lower()
+
+
+class _ProfileBatchConn(BaseFakeConn):
+    """Answers the set-based dba_profiles query with (profile, resource_name, limit) rows."""
+
+    def __init__(self, module, existing):
+        super().__init__(module)
+        self._existing = existing
+        self.queries = []
+
+    def execute_select(self, sql, params=None, fetchone=False):
+        self.queries.append(sql)
+        wanted = set((params or {}).values())
+        return [(p, r, l) for p in self._existing if p in wanted for (r, l) in self._existing[p]]
+
+
+def test_profile_batch_reads_once_and_converges_all(monkeypatch):
+    mod = _load_profile()
+
+    class Mod(BaseFakeModule):
+        params = {**_profile_params(), "profile": None, "profiles": [
+            {"profile": "app_profile", "state": None, "attributes": {"SESSIONS_PER_USER": "20"},
+             "attribute_name": None, "attribute_value": None},
+            {"profile": "same_profile", "state": None, "attributes": {"IDLE_TIME": "60"},
+             "attribute_name": None, "attribute_value": None},
+            {"profile": "new_profile", "state": None, "attributes": None,
+             "attribute_name": ["IDLE_TIME"], "attribute_value": ["30"]},
+            {"profile": "old_profile", "state": "absent", "attributes": None,
+             "attribute_name": None, "attribute_value": None},
+        ]}
+
+    conn = _ProfileBatchConn(None, {
+        "APP_PROFILE": [("SESSIONS_PER_USER", "UNLIMITED")],
+        "SAME_PROFILE": [("IDLE_TIME", "60")],
+        "OLD_PROFILE": [("IDLE_TIME", "10")],
+    })
+    monkeypatch.setattr(mod, "AnsibleModule", Mod)
+    monkeypatch.setattr(mod, "oracleConnection", lambda m: conn, raising=False)
+
+    with pytest.raises(ExitJson) as exc:
+        mod.main()
+    profiles = exc.value.args[0]["profiles"]
+    # one read of the current state, one read back after the changes
+    assert len(conn.queries) == 2
+    assert profiles["SAME_PROFILE"]["changed"] is False
+    assert profiles["SAME_PROFILE"]["profile"] == {"IDLE_TIME": "60"}
+    assert profiles["APP_PROFILE"]["changed"] is True
+    assert "SESSIONS_PER_USER 20" in profiles["APP_PROFILE"]["ddls"][0]
+    assert profiles["NEW_PROFILE"]["changed"] is True
+    assert profiles["OLD_PROFILE"]["changed"] is True
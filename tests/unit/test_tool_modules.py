@@ -3,7 +3,10 @@
 These modules use subprocess.Popen / module.run_command for all external calls.
 We mock Popen (for sqldba) and run_command (for datapatch).
 """
+import io
 import os
+import threading
+import time
 import pytest
 
 from conftest import ExitJson, FailJson, load_module_from_path
@@ -23,10 +26,14 @@ def _make_popen(stdout="", stderr="", returncode=0):
     class _FakePopen:
         def __init__(self, cmd, **kw):
             self.returncode = returncode
+            self.stdout = (io.BytesIO if isinstance(stdout, bytes) else io.StringIO)(stdout)
 
         def communicate(self, input=None):
             return [stdout, stderr]
 
+        def wait(self):
+            return self.returncode
+
         def kill(self):
             pass
     return _FakePopen
@@ -505,10 +512,11 @@ def test_sqldba_run_catcon_pl_with_args(monkeypatch):
     class _CapturePopen:
         def __init__(self, cmd, **kw):
             captured_cmds.append(list(cmd))
-            self.returncode = 1  # use failure path to avoid line 357 bug
+            self.returncode = 1
+            self.stdout = io.StringIO("")
 
-        def communicate(self, input=None):
-            return ["", ""]
+        def wait(self):
+            return self.returncode
 
     monkeypatch.setattr(mod, "Popen", _CapturePopen)
 
@@ -523,6 +531,140 @@ def test_sqldba_run_catcon_pl_with_args(monkeypatch):
     assert "-c" in captured_cmds[0]  # pdb_list provided
 
 
+def _catcon_popen(logs, lines, returncode=0):
+    """Popen stub writing catcon.pl spool files into the -l directory and streaming lines on stdout."""
+    class _CatconPopen:
+        cmds = []
+
+        def __init__(self, cmd, **kw):
+            _CatconPopen.cmds.append(list(cmd))
+            logdir = cmd[cmd.index("-l") + 1]
+            for (name, text) in logs.items():
+                with open(os.path.join(logdir, name), "w") as f:
+                    f.write(text)
+            self.returncode = returncode
+            self.stdout = io.StringIO("".join("line %d\n" % i for i in range(lines)))
+
+        def wait(self):
+            return self.returncode
+
+        def kill(self):
+            pass
+    return _CatconPopen
+
+
+_CATCON_LOG0 = ("==== Current Container = CDB$ROOT Id = 1 ====\nSQL> @catctx.sql\n"
+                "==== Current Container = PDB1 Id = 3 ====\nORA-00955: name is already used by an existing object\n")
+_CATCON_LOG1 = "==== Current Container = PDB2 Id = 4 ====\nPL/SQL procedure successfully completed.\n"
+
+
+def test_sqldba_catcon_streams_output_and_reports_containers(monkeypatch, tmp_path):
+    """run_catcon_pl: bounded output, per container status from spool files, logs kept on errors."""
+    mod = _load("oracle_sqldba")
+    monkeypatch.setattr(mod, "CATCON_OUTPUT_LINES", 5)
+    popen = _catcon_popen({"catcon0.log": _CATCON_LOG0, "catcon1.log": _CATCON_LOG1}, lines=50)
+    monkeypatch.setattr(mod, "Popen", popen)
+    logdir = str(tmp_path / "catcon")
+
+    class Mod(BaseFakeModule):
+        params = _sqldba_params(timeout=0, catcon_processes=4, catcon_log_dir=logdir)
+
+    m = Mod()
+    mod.changed = False
+    mod.err_msg = ""
+    mod.result = ""
+    mod.run_catcon_pl(m, ["CDB$ROOT", "PDB1", "PDB2"], "/fake/catctx.sql")
+    cmd = popen.cmds[0]
+    assert cmd[cmd.index("-n") + 1] == "4"
+    assert mod.catcon_results == {
+        "CDB$ROOT": {"status": "completed", "errors": []},
+        "PDB1": {"status": "failed", "errors": ["ORA-00955: name is already used by an existing object"]},
+        "PDB2": {"status": "completed", "errors": []},
+    }
+    assert mod.err_msg == ""
+    assert mod.changed is True
+    assert any("PDB1" in w for w in m._warnings)
+    assert mod.result.splitlines() == ["catcon.pl logs: %s" % logdir] + ["line %d" % i for i in range(45, 50)]
+    assert os.path.exists(os.path.join(logdir, "catcon0.log"))
+
+
+def test_sqldba_catcon_fails_on_spool_errors_when_requested(monkeypatch, tmp_path):
+    """run_catcon_pl: catcon_fail_on_errors turns errors in the spool files into a failure."""
+    mod = _load("oracle_sqldba")
+    monkeypatch.setattr(mod, "Popen", _catcon_popen({"catcon0.log": _CATCON_LOG0}, lines=1))
+
+    class Mod(BaseFakeModule):
+        params = _sqldba_params(timeout=0, catcon_log_dir=str(tmp_path), catcon_fail_on_errors=True)
+
+    mod.changed = False
+    mod.err_msg = ""
+    mod.result = ""
+    mod.run_catcon_pl(Mod(), [], "/fake/catctx.sql")
+    assert mod.err_msg == "catcon.pl reported errors in: PDB1"
+
+
+def test_sqldba_catcon_ignores_logs_of_earlier_runs(tmp_path):
+    """CatconLogs: spool files present before the run are skipped unless catcon.pl rewrites them."""
+    mod = _load("oracle_sqldba")
+    (tmp_path / "catcon0.log").write_text(_CATCON_LOG0)
+    (tmp_path / "catcon1.log").write_text(_CATCON_LOG0)
+    logs = mod.CatconLogs(str(tmp_path))
+    assert logs.scan() == []
+    assert logs.containers == {}
+    with open(str(tmp_path / "catcon0.log"), "a") as f:
+        f.write(_CATCON_LOG1)
+    (tmp_path / "catcon1.log").write_text("==== Current Container = PDB3 Id = 5 ====\n")
+    logs.close()
+    assert logs.containers == {
+        "PDB2": {"status": "completed", "errors": []},
+        "PDB3": {"status": "completed", "errors": []},
+    }
+    assert logs.failed() == []
+
+
+def test_sqldba_catcon_removes_temporary_logs_only_on_success(monkeypatch, tmp_path):
+    """run_catcon_pl: temporary log directory is removed on success and kept when catcon.pl fails."""
+    mod = _load("oracle_sqldba")
+    monkeypatch.setattr(mod.tempfile, "mkdtemp", lambda: str(tmp_path))
+    monkeypatch.setattr(mod, "Popen", _catcon_popen({"catcon0.log": _CATCON_LOG1}, lines=2))
+
+    class Mod(BaseFakeModule):
+        params = _sqldba_params(timeout=0)
+
+    mod.changed = False
+    mod.err_msg = ""
+    mod.result = ""
+    mod.run_catcon_pl(Mod(), [], "/fake/catctx.sql")
+    assert mod.err_msg == ""
+    assert mod.changed is True
+    assert mod.result == "line 0\nline 1\n"
+    assert mod.catcon_results["PDB2"]["status"] == "completed"
+    assert not tmp_path.exists()
+
+    tmp_path.mkdir()
+    monkeypatch.setattr(mod, "Popen", _catcon_popen({"catcon0.log": _CATCON_LOG1}, lines=2, returncode=1))
+    mod.result = ""
+    mod.run_catcon_pl(Mod(), [], "/fake/catctx.sql")
+    assert "returncode: 1" in mod.err_msg
+    assert "catcon.pl logs: %s" % tmp_path in mod.result
+    assert tmp_path.exists()
+
+
+def test_sqldba_catcon_logs_are_read_incrementally(tmp_path):
+    """CatconLogs: only appended data is parsed, incomplete lines wait for the next scan."""
+    mod = _load("oracle_sqldba")
+    logs = mod.CatconLogs(str(tmp_path))
+    log = tmp_path / "catcon0.log"
+    log.write_text("==== Current Container = PDB1 Id = 3 ====\nORA-0")
+    assert logs.scan() == []
+    assert logs.containers == {"PDB1": {"status": "running", "errors": []}}
+    with open(str(log), "a") as f:
+        f.write("1653: unable to extend table\n==== Current Container = PDB2 Id = 4 ====\n")
+    assert logs.scan() == ["PDB1"]
+    assert logs.containers["PDB1"] == {"status": "failed", "errors": ["ORA-01653: unable to extend table"]}
+    assert logs.close() == ["PDB2"]
+
+
 # ===========================================================================
 # oracle_datapatch
 # ===========================================================================
@@ -1572,6 +1714,8 @@ def test_opatch_check_patch_applied_opatchauto_found(monkeypatch):
 
     class _FakeStat:
         st_uid = 0
+        st_size = 0
+        st_mtime_ns = 0
 
     monkeypatch.setattr(mod.os.path, "exists", lambda p: True)
     monkeypatch.setattr(mod.os, "stat", lambda p: _FakeStat())
@@ -1898,6 +2042,225 @@ def test_sqldba_check_creates_sql_pdbs_branch(monkeypatch):
     assert result == ["PDB1"]
 
 
+def test_sqldba_parallel_degree_runs_pdbs_concurrently(monkeypatch):
+    """parallel_degree: PDBs run in concurrent sqlplus sessions, output and errors keep pdb_list order."""
+    mod = _load("oracle_sqldba")
+    mod.changed = False
+    mod.err_msg = ""
+    barrier = threading.Barrier(3, timeout=5)
+
+    class _FakePopen:
+        def __init__(self, cmd, **kw):
+            self.returncode = 0
+
+        def communicate(self, input=None):
+            pdb = input.split("set container = ")[1].split(";")[0]
+            barrier.wait()
+            if pdb == "PDB2":
+                return ["ORA-01031: insufficient privileges", ""]
+            return ["out_" + pdb, ""]
+
+    monkeypatch.setattr(mod, "Popen", _FakePopen)
+
+    class Mod(BaseFakeModule):
+        params = _sqldba_params(timeout=0, parallel_degree=4)
+
+    result = mod.run_sql_p(Mod(), "ALTER SYSTEM SET x = 1;", None, None, "pdbs", ["PDB1", "PDB2", "PDB3"])
+    assert result.startswith("out_PDB1[ERR]")
+    assert result.endswith("out_PDB3")
+    assert list(mod.pdb_results) == ["PDB1", "PDB2", "PDB3"]
+    assert "ORA-01031" in mod.err_msg
+    assert mod.changed is True
+
+
+def test_sqldba_parallel_creates_sql_keeps_skip_semantics(monkeypatch):
+    """check_creates_sql with parallel_degree: only PDBs returning no rows or 0 remain, in order."""
+    mod = _load("oracle_sqldba")
+    mod.changed = False
+    mod.err_msg = ""
+    answers = {"CDB$ROOT": "1", "PDB1": "0", "PDB2": "", "PDB3": "5"}
+
+    class _FakePopen:
+        def __init__(self, cmd, **kw):
+            self.returncode = 0
+
+        def communicate(self, input=None):
+            return [answers[input.split("set container = ")[1].split(";")[0]], ""]
+
+    monkeypatch.setattr(mod, "Popen", _FakePopen)
+
+    class Mod(BaseFakeModule):
+        params = _sqldba_params(timeout=0, parallel_degree=2)
+
+    result = mod.check_creates_sql(Mod(), "SELECT COUNT(*) FROM MY_TABLE", "pdbs", list(answers))
+    assert result == ["PDB1", "PDB2"]
+    assert mod.changed is False
+
+
+class _FakeOracledb:
+    """oracledb stub: one connection per connect() call, answers queries from a dict keyed by (container, sql)."""
+    SYSDBA = 2
+
+    class DatabaseError(Exception):
+        pass
+
+    def __init__(self, answers):
+        self.answers = answers
+        self.connects = []
+        self.executed = []
+
+    def connect(self, **kw):
+        self.connects.append(kw)
+        fake = self
+
+        class _Cursor:
+            description = None
+            rowcount = 0
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *a):
+                return False
+
+            def execute(self, sql):
+                if sql.startswith("alter session set container = "):
+                    conn.container = sql.split(" = ")[1]
+                fake.executed.append((conn.container, sql))
+                answer = fake.answers.get((conn.container, sql))
+                if isinstance(answer, Exception):
+                    raise answer
+                self.rows = []
+                if answer is not None:
+                    (columns, self.rows) = answer
+                    self.description = [(c,) for c in columns]
+                self.rowcount = len(self.rows)
+
+            def fetchall(self):
+                return self.rows
+
+        class _Conn:
+            container = "CDB$ROOT"
+            autocommit = False
+
+            def cursor(self):
+                return _Cursor()
+
+        conn = _Conn()
+        return conn
+
+
+def _ora_error(ora_code):
+    class _Error:
+        code = ora_code
+        message = "ORA-%05d: table or view does not exist" % ora_code
+    return _FakeOracledb.DatabaseError(_Error())
+
+
+def _no_popen(*a, **kw):
+    raise AssertionError("sqlplus must not be started")
+
+
+_ALL_PDBS_SQL = ("select listagg(pdb_name, ' ') within group (order by pdb_name) \n"
+                 "    from dba_pdbs where status = 'NORMAL' and pdb_name <> 'PDB$SEED'")
+
+
+def test_sqldba_oracledb_engine_uses_one_session(monkeypatch):
+    """engine=oracledb: discovery and per-PDB DDL run in one session switching containers, no sqlplus."""
+    mod = _load("oracle_sqldba")
+    fake = _FakeOracledb({
+        ("CDB$ROOT", "select cdb from gv$database"): (["CDB"], [("YES",)]),
+        ("CDB$ROOT", _ALL_PDBS_SQL): (["PDBS"], [("PDB1 PDB2",)]),
+    })
+    monkeypatch.setattr(mod, "oracledb", fake, raising=False)
+    monkeypatch.setattr(mod, "oracledb_exists", True)
+    monkeypatch.setattr(mod, "Popen", _no_popen)
+
+    class Mod(BaseFakeModule):
+        params = _sqldba_params(sql="alter system set open_cursors = 500 scope=both;", scope="all_pdbs",
+                                engine="oracledb")
+
+    monkeypatch.setattr(mod, "AnsibleModule", Mod)
+    with pytest.raises(ExitJson) as exc:
+        mod.main()
+    assert exc.value.args[0]["changed"] is True
+    assert fake.connects == [{"mode": 2}]
+    ddl = "alter system set open_cursors = 500 scope=both"
+    assert [e for e in fake.executed if e[1] == ddl] == [("CDB$ROOT", ddl), ("PDB1", ddl), ("PDB2", ddl)]
+    assert [r["pdb"] for r in exc.value.args[0]["results"]] == [None, None, "CDB$ROOT", "PDB1", "PDB2"]
+
+
+def test_sqldba_oracledb_engine_sets_call_timeout(monkeypatch):
+    """engine=oracledb: timeout (seconds) becomes the session call_timeout (milliseconds)."""
+    mod = _load("oracle_sqldba")
+    fake = _FakeOracledb({})
+    monkeypatch.setattr(mod, "oracledb", fake, raising=False)
+    monkeypatch.setattr(mod, "oracledb_exists", True)
+
+    class Mod(BaseFakeModule):
+        params = _sqldba_params(sql="select 1 from dual", engine="oracledb", timeout=30)
+
+    session = mod.OracledbSession(Mod())
+    assert session.conn.call_timeout == 30000
+    Mod.params = _sqldba_params(sql="select 1 from dual", engine="oracledb")
+    assert not hasattr(mod.OracledbSession(Mod()).conn, "call_timeout")
+
+
+def test_sqldba_oracledb_engine_sqlselect_rows_and_error_code(monkeypatch):
+    """engine=oracledb: sqlselect returns rows without dbms_xmlgen, ORA errors carry their code."""
+    mod = _load("oracle_sqldba")
+    fake = _FakeOracledb({
+        ("CDB$ROOT", "select name, value from v$parameter where name = 'processes'"):
+            (["NAME", "VALUE"], [("processes", 300)]),
+        ("CDB$ROOT", "select x from missing"): _ora_error(942),
+    })
+    monkeypatch.setattr(mod, "oracledb", fake, raising=False)
+    monkeypatch.setattr(mod, "oracledb_exists", True)
+    monkeypatch.setattr(mod, "Popen", _no_popen)
+
+    class Mod(BaseFakeModule):
+        params = _sqldba_params(sql=None, sqlselect="select name, value from v$parameter where name = 'processes';",
+                                engine="oracledb")
+
+    monkeypatch.setattr(mod, "AnsibleModule", Mod)
+    with pytest.raises(ExitJson) as exc:
+        mod.main()
+    assert exc.value.args[0]["state"] == {"ROW": [{"NAME": "processes", "VALUE": "300"}]}
+    assert exc.value.args[0]["results"][0]["rows"] == [["processes", 300]]
+
+    Mod.params = _sqldba_params(sql=None, sqlselect="select x from missing", engine="oracledb")
+    with pytest.raises(FailJson) as exc:
+        mod.main()
+    assert exc.value.args[0]["results"][-1]["code"] == 942
+    assert "ORA-00942" in exc.value.args[0]["msg"]
+
+
+def test_sqldba_oracledb_engine_falls_back_to_sqlplus(monkeypatch):
+    """SQL*Plus commands and multi statement scripts still go through sqlplus."""
+    mod = _load("oracle_sqldba")
+    assert mod.needs_sqlplus("set serveroutput on\nexec dbms_stats.gather_dictionary_stats;")
+    assert mod.needs_sqlplus("@?/rdbms/admin/utlrp.sql")
+    assert mod.needs_sqlplus("create table t (x number);\ninsert into t values (1);")
+    assert not mod.needs_sqlplus("update t\nset x = 1\nwhere y = 2;")
+    assert not mod.needs_sqlplus("begin\n  dbms_output.put_line('x');\n  null;\nend;\n/")
+    assert mod.oracledb_statement("begin\n  null;\nend;\n/") == "begin\n  null;\nend;"
+    assert mod.oracledb_statement("select 1 from dual;") == "select 1 from dual"
+
+    calls = []
+    monkeypatch.setattr(mod, "Popen", _make_popen(stdout="", returncode=0))
+    monkeypatch.setattr(mod, "oracledb_exec", lambda *a: calls.append(a) or ("", "", False))
+
+    class Mod(BaseFakeModule):
+        params = _sqldba_params(sql="set serveroutput on\nexec dbms_stats.gather_dictionary_stats;",
+                                engine="oracledb")
+
+    monkeypatch.setattr(mod, "AnsibleModule", Mod)
+    with pytest.raises(ExitJson) as exc:
+        mod.main()
+    assert exc.value.args[0]["changed"] is True
+    assert calls == []
+
+
 def test_sqldba_scope_cdb_with_catcon_pl_sets_pdbs(monkeypatch):
     """scope=cdb + catcon_pl → scope becomes 'pdbs' with CDB$ROOT (lines 434-436)."""
     mod = _load("oracle_sqldba")
@@ -2701,40 +3064,90 @@ def test_tablespace_ensure_state_numfiles_add_autoextend_with_maxsize(monkeypatc
     assert any("maxsize" in d.lower() for d in ddls)
 
 
-def test_tablespace_ensure_attributes_verbosity(monkeypatch):
-    """ensure_tablespace_attributes: verbosity >= 3 → warn called (line 555)."""
-    from helpers import BaseFakeConn
+def test_tablespace_plan_file_changes_from_one_read():
+    """autoextend/next/maxsize/resize deltas are computed in Python from one dba_data_files read."""
+    mod = _load_ts()
+    files = [
+        # already as wanted
+        {"file_name": "/u01/a.dbf", "bytes": 2 * 1024 ** 3, "autoextensible": "YES",
+         "next_bytes": 50 * 1024 ** 2, "maxbytes": 8 * 1024 ** 3, "block_size": 8192},
+        # autoextend off, too small
+        {"file_name": "/u01/b.dbf", "bytes": 100 * 1024 ** 2, "autoextensible": "NO",
+         "next_bytes": 0, "maxbytes": 0, "block_size": 8192},
+        # wrong next, bigger than wanted size is never shrunk
+        {"file_name": "/u01/c.dbf", "bytes": 4 * 1024 ** 3, "autoextensible": "YES",
+         "next_bytes": 1024 ** 2, "maxbytes": 8 * 1024 ** 3, "block_size": 8192},
+    ]
+    changes = mod.plan_file_changes(files, "datafile", "1G", True, "50M", "8G")
+    assert changes == [
+        ("alter database datafile '/u01/b.dbf' autoextend on next 50M maxsize 8G", 0),
+        ("alter database datafile '/u01/b.dbf' resize 1G", 1024 ** 3 - 100 * 1024 ** 2),
+        ("alter database datafile '/u01/c.dbf' autoextend on next 50M maxsize 8G", 0),
+    ]
+    assert mod.plan_file_changes(files, "tempfile", "1M", False, None, None) == [
+        ("alter database tempfile '/u01/a.dbf' autoextend off", 0),
+        ("alter database tempfile '/u01/c.dbf' autoextend off", 0),
+    ]
+    unlimited = [dict(files[0], maxbytes=mod.SMALLFILE_MAX_BLOCKS * 8192)]
+    assert mod.plan_file_changes(unlimited, "datafile", "1G", True, "50M", "unlimited") == []
+    assert mod.size_bytes("unlimited") is None
+    assert mod.size_bytes("1048576") == 1024 ** 2
+
+
+def test_tablespace_adds_files_in_parallel_sessions(monkeypatch):
+    """parallel_degree > 1: every missing file is added by its own session, bytes allocated are reported."""
     mod = _load_ts()
+    barrier = threading.Barrier(3, timeout=5)
+    executed = []
 
-    class _VerboseMod(BaseFakeModule):
-        params = _ts_params_ext()
+    class Mod(BaseFakeModule):
+        params = _ts_params_ext(bigfile=False, numfiles="4", size="1G", parallel_degree=3)
 
-    m = _VerboseMod()
-    m._verbosity = 3  # set after __init__ to override the default 0
-    conn = BaseFakeConn(m)
-    conn.module = m
-    conn.execute_statement = lambda sql, params=None: ["Changes applied"]
+    class _Cursor:
+        def __enter__(self):
+            return self
 
-    mod.ensure_tablespace_attributes(conn, "TESTTS", True, "50M", "2G")
-    assert len(m._warnings) > 0
+        def __exit__(self, *args):
+            return False
 
+        def execute(self, sql):
+            executed.append(sql)
+            barrier.wait()
 
-def test_tablespace_ensure_attributes_changed(monkeypatch):
-    """ensure_tablespace_attributes: non-empty result → conn.changed = True (line 558)."""
-    from helpers import BaseFakeConn
-    mod = _load_ts()
+    class _Session:
+        closed = []
 
-    class _Mod(BaseFakeModule):
-        params = _ts_params_ext()
-        _verbosity = 0
+        def cursor(self):
+            return _Cursor()
 
-    m = _Mod()
-    conn = BaseFakeConn(m)
-    conn.module = m
-    conn.execute_statement = lambda sql, params=None: ["Changes applied"]
+        def close(self):
+            self.closed.append(True)
 
-    mod.ensure_tablespace_attributes(conn, "TESTTS", True, "50M", "2G")
-    assert conn.changed is True
+    base = _make_ts_conn_ext([
+        {"tablespace_name": "TESTTS", "status": "ONLINE"},  # check_tablespace_exists
+        {"value": "/u01/oradata"},                          # OMF
+        {"status": "ONLINE"},                               # status
+        {"count": 1},                                       # numfiles
+    ])
+
+    class _Conn(base):
+        def __init__(self, m):
+            super().__init__(m)
+            self.conn = _Session()
+
+    monkeypatch.setattr(mod, "AnsibleModule", Mod)
+    monkeypatch.setattr(mod, "oracleConnection", _Conn, raising=False)
+
+    with pytest.raises(ExitJson) as exc:
+        mod.main()
+    payload = exc.value.args[0]
+    assert payload["changed"] is True
+    assert executed == ["alter tablespace TESTTS  add datafile  size 1G "] * 3
+    assert len(payload["ddls"]) == 3
+    assert len(_Session.closed) == 3
+    progress = payload["progress"]
+    assert (progress["statements"], progress["bytes_allocated"]) == (3, 3 * 1024 ** 3)
+    assert progress["bytes_planned"] == progress["bytes_allocated"]
 
 
 def test_tablespace_manage_tablespace_read_only(monkeypatch):
@@ -3057,6 +3470,216 @@ def test_opatch_stop_process_no_oratab(monkeypatch):
     assert result is None
 
 
+_COMPS_XML = """<?xml version="1.0" standalone="yes" ?>
+<PRD_LIST><TL_LIST><COMP NAME="oracle.server" VER="19.0.0.0.0"/></TL_LIST>
+<ONEOFF_LIST>
+<ONEOFF REF_ID="35643107" UNIQ_ID="25405995" ROLLBACK="T" XML_INV_LOC="oneoffs/35643107/" INSTALL_TIME="2023.Oct.20 10:00:00 CEST">
+<DESC>Database Release Update : 19.21.0.0.231017 (35643107)</DESC>
+<BUG_LIST><BUG>35261302</BUG><BUG>35164138</BUG></BUG_LIST>
+</ONEOFF>
+<ONEOFF REF_ID="35648110" UNIQ_ID="25365038" ROLLBACK="T" XML_INV_LOC="oneoffs/35648110/">
+<DESC></DESC>
+</ONEOFF>
+</ONEOFF_LIST>
+</PRD_LIST>
+"""
+
+_ONEOFF_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<oneoff_inventory>
+<patch_id number="35648110"/>
+<base_bugs><bug number="35074478" description="ojvm bug"/></base_bugs>
+<patch_description>OJVM RELEASE UPDATE: 19.21.0.0.231017 (35648110)</patch_description>
+<targets><target type="oracle_database"/></targets>
+</oneoff_inventory>
+"""
+
+
+def _oracle_home_inventory(tmp_path):
+    contents = tmp_path / "inventory" / "ContentsXML"
+    contents.mkdir(parents=True)
+    (contents / "comps.xml").write_text(_COMPS_XML)
+    config = tmp_path / "inventory" / "oneoffs" / "35648110" / "etc" / "config"
+    config.mkdir(parents=True)
+    (config / "inventory.xml").write_text(_ONEOFF_XML)
+    return str(tmp_path)
+
+
+def test_opatch_check_patch_applied_reads_inventory(tmp_path):
+    """check_patch_applied(): patches are read from comps.xml, opatch is not executed."""
+    mod = _load("oracle_opatch")
+    oracle_home = _oracle_home_inventory(tmp_path)
+
+    class Mod(BaseFakeModule):
+        params = _opatch_params()
+
+        def run_command(self, cmd, **kw):
+            raise AssertionError("opatch must not run: %s" % cmd)
+
+    m = Mod()
+    assert mod.check_patch_applied(m, oracle_home, "35643107", None, False) is True
+    assert mod.check_patch_applied(m, oracle_home, "35648110", "19.21.0.0.231017", False) is True
+    assert mod.check_patch_applied(m, oracle_home, "99999999", None, False) is False
+
+    with pytest.raises(ExitJson) as exc:
+        mod.list_patches(m, oracle_home)
+    patches = dict((p["patch_id"], p) for p in exc.value.args[0]["patches"])
+    assert patches["35643107"]["bugs"] == ["35261302", "35164138"]
+    # missing DESC and bugs are taken from oneoffs/<id>/etc/config/inventory.xml
+    assert patches["35648110"]["description"].startswith("OJVM RELEASE UPDATE")
+    assert patches["35648110"]["bugs"] == ["35074478"]
+    assert patches["35648110"]["targets"] == ["oracle_database"]
+
+
+def test_opatch_inventory_cache_follows_comps_xml(tmp_path):
+    """home_patches(): parsed inventory is cached until comps.xml changes."""
+    dp = load_module_from_path("plugins/module_utils/describe_patchset.py", "describe_patchset_cache")
+    oracle_home = _oracle_home_inventory(tmp_path)
+    first = dp.home_patches(oracle_home)
+    assert dp.home_patches(oracle_home) is first
+
+    comps = tmp_path / "inventory" / "ContentsXML" / "comps.xml"
+    comps.write_text(_COMPS_XML.replace("35643107", "36000000"))
+    os.utime(str(comps), ns=(0, 10 ** 18))
+    assert [p["patch_id"] for p in dp.home_patches(oracle_home)] == ["36000000", "35648110"]
+    assert dp.home_patches(str(tmp_path / "missing")) is None
+
+
+def _make_homes_mod(params, lspatches, prereq_failed=(), barrier=None):
+    """run_command answers by command, records the commands executed."""
+    commands = []
+
+    class Mod(BaseFakeModule):
+        def run_command(self, cmd, **kw):
+            commands.append(cmd)
+            home = cmd.split("/OPatch/")[0].split("/bin/")[0]
+            if "sqlplus -V" in cmd:
+                if barrier:
+                    barrier.wait()
+                return _OP_VER_OK
+            if "opatch version" in cmd:
+                return _OP_OPV_OK
+            if "lspatches" in cmd:
+                return (0, lspatches.get(home, "") + "OPatch succeeded.\n", "")
+            if "prereq" in cmd:
+                return (0, "Prereq checkConflict failed\n" if home in prereq_failed else "passed\n", "")
+            if " apply " in cmd:
+                return _OP_APPLY_OK
+            return (0, "", "")
+
+    Mod.params = params
+    Mod.check_mode = False
+    return Mod, commands
+
+
+def test_opatch_oracle_homes_analyzes_concurrently_and_applies(monkeypatch):
+    """oracle_homes: homes are inspected in parallel, patch applied only where missing."""
+    import threading
+    mod = _load("oracle_opatch")
+    homes = ["/u01/db1", "/u01/db2", "/u01/db3"]
+    Mod, commands = _make_homes_mod(
+        _opatch_params(oracle_home=None, oracle_homes=homes, apply_concurrency=2, patch_base="/patches/12345678"),
+        {"/u01/db2": "12345678;My description\n"}, barrier=threading.Barrier(3, timeout=5))
+    monkeypatch.setattr(mod, "AnsibleModule", Mod)
+    monkeypatch.setattr(mod.os.path, "exists", lambda p: True)
+
+    with pytest.raises(ExitJson) as exc:
+        mod.main()
+    result = exc.value.args[0]
+    assert result["changed"] is True
+    assert result["msg"] == "2 of 3 homes changed"
+    assert result["homes"]["/u01/db2"]["status"] == "already applied"
+    assert result["homes"]["/u01/db1"]["status"] == "applied"
+    assert set(result["homes"]["/u01/db3"]["timing"]) == {"analyze", "apply"}
+    applies = [c for c in commands if " apply " in c]
+    assert sorted(c.split("/OPatch/")[0] for c in applies) == ["/u01/db1", "/u01/db3"]
+    # prerequisites are analyzed once, the apply step does not repeat them
+    conflicts = [c for c in commands if "CheckConflictAgainstOH" in c]
+    assert sorted(c.split("/OPatch/")[0] for c in conflicts) == ["/u01/db1", "/u01/db3"]
+
+
+def test_opatch_oracle_homes_prereq_failure_changes_nothing(monkeypatch):
+    """oracle_homes: a conflict in one home fails the module before any home is patched."""
+    mod = _load("oracle_opatch")
+    homes = ["/u01/db1", "/u01/db2"]
+    Mod, commands = _make_homes_mod(
+        _opatch_params(oracle_home=None, oracle_homes=homes, apply_concurrency=2, patch_base="/patches/12345678"),
+        {}, prereq_failed=("/u01/db2",))
+    monkeypatch.setattr(mod, "AnsibleModule", Mod)
+    monkeypatch.setattr(mod.os.path, "exists", lambda p: True)
+
+    with pytest.raises(FailJson) as exc:
+        mod.main()
+    result = exc.value.args[0]
+    assert "/u01/db2" in result["msg"]
+    assert result["homes"]["/u01/db1"]["status"] == "pending"
+    assert result["homes"]["/u01/db2"]["status"] == "failed"
+    assert not [c for c in commands if " apply " in c]
+
+
+
+def test_opatch_oracle_homes_opatchauto_needs_patch_version(monkeypatch):
+    """oracle_homes: opatchauto without patch_version fails before any home is inspected."""
+    mod = _load("oracle_opatch")
+    Mod, commands = _make_homes_mod(
+        _opatch_params(oracle_home=None, oracle_homes=["/u01/db1", "/u01/db2"], opatchauto=True), {})
+    monkeypatch.setattr(mod, "AnsibleModule", Mod)
+
+    with pytest.raises(FailJson) as exc:
+        mod.main()
+    assert "patch_version" in exc.value.args[0]["msg"]
+    assert commands == []
+
+
+def test_opatch_oracle_homes_serializes_shared_inventory(monkeypatch):
+    """oracle_homes: homes of one central inventory are never patched at the same time."""
+    mod = _load("oracle_opatch")
+    homes = ["/u01/db1", "/u01/db2", "/u01/db3"]
+    inventories = {"/u01/db1": "/u01/oraInventory", "/u01/db2": "/u01/oraInventory", "/u01/db3": "/u02/oraInventory"}
+    Mod, commands = _make_homes_mod(
+        _opatch_params(oracle_home=None, oracle_homes=homes, apply_concurrency=3, patch_base="/patches/12345678"), {})
+    active = {}
+    overlaps = []
+    lock = threading.Lock()
+    run_command = Mod.run_command
+
+    def tracking_run_command(self, cmd, **kw):
+        if " apply " not in cmd:
+            return run_command(self, cmd, **kw)
+        inventory = inventories[cmd.split("/OPatch/")[0]]
+        with lock:
+            active[inventory] = active.get(inventory, 0) + 1
+            overlaps.append(active[inventory])
+        time.sleep(0.05)
+        with lock:
+            active[inventory] -= 1
+        return run_command(self, cmd, **kw)
+
+    Mod.run_command = tracking_run_command
+    monkeypatch.setattr(mod, "AnsibleModule", Mod)
+    monkeypatch.setattr(mod.os.path, "exists", lambda p: True)
+    monkeypatch.setattr(mod, "inventory_location", lambda oh: inventories[oh])
+
+    with pytest.raises(ExitJson) as exc:
+        mod.main()
+    assert exc.value.args[0]["msg"] == "3 of 3 homes changed"
+    assert max(overlaps) == 1
+    assert len(overlaps) == 3
+
+
+def test_opatch_inventory_location_prefers_home_orainst_loc(monkeypatch, tmp_path):
+    """inventory_location(): oraInst.loc of the home, else the global one, else None."""
+    mod = _load("oracle_opatch")
+    home = tmp_path / "db1"
+    home.mkdir()
+    global_loc = tmp_path / "oraInst.loc"
+    global_loc.write_text("inventory_loc=/u01/app/oraInventory\ninst_group=oinstall\n")
+    monkeypatch.setattr(mod, "ORA_INST_LOC", str(global_loc))
+    assert mod.inventory_location(str(home)) == "/u01/app/oraInventory"
+    (home / "oraInst.loc").write_text("inventory_loc=/u01/app/db1Inventory/\n")
+    assert mod.inventory_location(str(home)) == "/u01/app/db1Inventory"
+    global_loc.unlink()
+    assert mod.inventory_location(str(tmp_path / "db2")) is None
+
 # ===========================================================================
 # oracle_datapatch (additional function-level tests)
 # ===========================================================================